@@ -37,6 +37,12 @@ class KindleAutomator:
 
         cleanup_start = _time.time()
 
+        # Stop streaming the emulator's screen
+        if self.device_id:
+            from server.utils.frame_source import stop_frame_source
+
+            stop_frame_source(self.device_id)
+
         if self.driver:
             if skip_driver_quit:
                 self.driver = None
@@ -413,8 +419,9 @@ class KindleAutomator:
             # Wait for app to initialize
             time.sleep(3)
 
-            # Update the state machine
+            # Update the state machine; a restarted app may have reset its library view
             if self.state_machine:
+                self.state_machine.library_handler.forget_library_preferences()
                 self.state_machine.update_current_state()
 
             logger.info(
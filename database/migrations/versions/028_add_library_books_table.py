@@ -0,0 +1,64 @@
+"""Add library_books table for the per-user library catalog
+
+Revision ID: 028
+Revises: 027
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "028"
+down_revision = "027"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add the library_books table for the per-user library catalog."""
+    # Check if table already exists (for idempotency)
+    conn = op.get_bind()
+    result = conn.execute(
+        sa.text("SELECT EXISTS (SELECT FROM information_schema.tables WHERE table_name = 'library_books')")
+    )
+    table_exists = result.scalar()
+
+    if table_exists:
+        print("Table 'library_books' already exists, skipping creation")
+        return
+
+    print("Creating 'library_books' table...")
+
+    conn.execute(
+        sa.text(
+            """
+        CREATE TABLE library_books (
+            id SERIAL PRIMARY KEY,
+            user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+            title TEXT NOT NULL,
+            author TEXT,
+            progress VARCHAR(50),
+            size VARCHAR(50),
+            downloaded BOOLEAN,
+            position INTEGER,
+            first_seen_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+            last_seen_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+            removed_at TIMESTAMP WITH TIME ZONE,
+            CONSTRAINT uq_user_library_book UNIQUE (user_id, title)
+        )
+    """
+        )
+    )
+
+    conn.execute(sa.text("CREATE INDEX idx_library_book_user_position ON library_books(user_id, position)"))
+
+    print("Successfully created 'library_books' table with indexes")
+
+
+def downgrade():
+    """Remove the library_books table."""
+    print("Dropping 'library_books' table...")
+    conn = op.get_bind()
+    conn.execute(sa.text("DROP TABLE IF EXISTS library_books CASCADE"))
+    print("Successfully dropped 'library_books' table")
@@ -0,0 +1,60 @@
+"""Add library_changes table for the library change feed
+
+Revision ID: 029
+Revises: 028
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "029"
+down_revision = "028"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add the library_changes table for the library change feed."""
+    # Check if table already exists (for idempotency)
+    conn = op.get_bind()
+    result = conn.execute(
+        sa.text("SELECT EXISTS (SELECT FROM information_schema.tables WHERE table_name = 'library_changes')")
+    )
+    table_exists = result.scalar()
+
+    if table_exists:
+        print("Table 'library_changes' already exists, skipping creation")
+        return
+
+    print("Creating 'library_changes' table...")
+
+    conn.execute(
+        sa.text(
+            """
+        CREATE TABLE library_changes (
+            id SERIAL PRIMARY KEY,
+            user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+            change_type VARCHAR(20) NOT NULL,
+            title TEXT NOT NULL,
+            old_title TEXT,
+            old_value VARCHAR(50),
+            new_value VARCHAR(50),
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+        )
+    """
+        )
+    )
+
+    conn.execute(sa.text("CREATE INDEX idx_library_change_user_id ON library_changes(user_id, id)"))
+
+    print("Successfully created 'library_changes' table with indexes")
+
+
+def downgrade():
+    """Remove the library_changes table."""
+    print("Dropping 'library_changes' table...")
+    conn = op.get_bind()
+    conn.execute(sa.text("DROP TABLE IF EXISTS library_changes CASCADE"))
+    print("Successfully dropped 'library_changes' table")
@@ -479,3 +479,67 @@ class RequestLog(Base):
     def __repr__(self) -> str:
         user_str = self.user_email or "Anonymous"
         return f"<RequestLog(id={self.id}, {self.method} {self.path}, user={user_str}, status={self.status_code})>"
+
+
+class LibraryBook(Base):
+    """Catalog of the books in each user's Kindle library, as last seen by a library scan."""
+
+    __tablename__ = "library_books"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    title: Mapped[str] = mapped_column(Text, nullable=False)
+    author: Mapped[Optional[str]] = mapped_column(Text)
+    progress: Mapped[Optional[str]] = mapped_column(String(50))
+    size: Mapped[Optional[str]] = mapped_column(String(50))
+    downloaded: Mapped[Optional[bool]] = mapped_column(Boolean)
+    # Row position in the device's library list, in the device's sort order
+    position: Mapped[Optional[int]] = mapped_column(Integer)
+    first_seen_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False
+    )
+    last_seen_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False
+    )
+    # Set when a complete library scan no longer finds the book
+    removed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+
+    # Relationship
+    user: Mapped["User"] = relationship(foreign_keys=[user_id])
+
+    # Table constraints and indexes
+    __table_args__ = (
+        UniqueConstraint("user_id", "title", name="uq_user_library_book"),
+        Index("idx_library_book_user_position", "user_id", "position"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<LibraryBook(id={self.id}, user_id={self.user_id}, title={self.title[:30]}..., position={self.position})>"
+
+
+class LibraryChange(Base):
+    """Change log of the library catalog; the id doubles as a per-server monotonically increasing version."""
+
+    __tablename__ = "library_changes"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    # One of: added, removed, renamed, progress_changed
+    change_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    title: Mapped[str] = mapped_column(Text, nullable=False)
+    # Previous title, for renamed books
+    old_title: Mapped[Optional[str]] = mapped_column(Text)
+    old_value: Mapped[Optional[str]] = mapped_column(String(50))
+    new_value: Mapped[Optional[str]] = mapped_column(String(50))
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False
+    )
+
+    # Relationship
+    user: Mapped["User"] = relationship(foreign_keys=[user_id])
+
+    # Table constraints and indexes
+    __table_args__ = (Index("idx_library_change_user_id", "user_id", "id"),)
+
+    def __repr__(self) -> str:
+        return f"<LibraryChange(id={self.id}, user_id={self.user_id}, change_type={self.change_type}, title={self.title[:30]}...)>"
@@ -2,7 +2,7 @@
 
 import logging
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from sqlalchemy import insert, select, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
@@ -185,6 +185,33 @@ class BookPositionRepository:
             self.session.rollback()
             logger.error(f"Error setting position for {email}/{book_title}: {e}")
 
+    def get_recent_book_titles(self, email: str, limit: int = 10) -> List[Tuple[str, datetime]]:
+        """
+        Get the books whose positions were updated most recently.
+
+        Args:
+            email: The user's email address
+            limit: Maximum number of books
+
+        Returns:
+            List of (book_title, position_updated_at) tuples, most recent first
+        """
+        try:
+            user = self.session.execute(select(User).where(User.email == email)).scalar_one_or_none()
+            if not user:
+                return []
+
+            rows = self.session.execute(
+                select(BookPosition.book_title, BookPosition.position_updated_at)
+                .where(BookPosition.user_id == user.id)
+                .order_by(BookPosition.position_updated_at.desc())
+                .limit(limit)
+            ).all()
+            return [(title, at) for title, at in rows]
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting recent books for {email}: {e}")
+            return []
+
     def get_position_with_book(
         self, email: str, book_title: Optional[str] = None
     ) -> tuple[int, Optional[str]]:
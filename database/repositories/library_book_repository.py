@@ -0,0 +1,484 @@
+"""Repository for managing the per-user library catalog."""
+
+import logging
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from database.models import LibraryBook, LibraryChange, User
+
+logger = logging.getLogger(__name__)
+
+# Sort orders supported when paging through the catalog
+SORT_DEVICE = "device"
+SORT_TITLE = "title"
+SORT_AUTHOR = "author"
+SORT_MODES = (SORT_DEVICE, SORT_TITLE, SORT_AUTHOR)
+
+# Books without a known list position sort after every positioned book
+_UNKNOWN_POSITION = 2**31 - 1
+
+# Library change log event types
+CHANGE_ADDED = "added"
+CHANGE_REMOVED = "removed"
+CHANGE_RENAMED = "renamed"
+CHANGE_PROGRESS = "progress_changed"
+CHANGE_TYPES = (CHANGE_ADDED, CHANGE_REMOVED, CHANGE_RENAMED, CHANGE_PROGRESS)
+
+
+def detect_page_changes(existing: Dict, rows: Sequence[Dict]) -> List[Dict]:
+    """
+    Compare the books from one scan screen against their catalog rows.
+
+    Args:
+        existing: Catalog rows (with title, progress and removed_at) keyed by title
+        rows: Scanned books with title and progress
+
+    Returns:
+        Change dicts with change_type, title, old_value and new_value. Books that are
+        new or were previously removed are added; books whose progress text differs
+        from a known value are progress_changed.
+    """
+    changes = []
+    for row in rows:
+        known = existing.get(row["title"])
+        if known is None or known.removed_at is not None:
+            changes.append(
+                dict(
+                    change_type=CHANGE_ADDED,
+                    title=row["title"],
+                    old_value=None,
+                    new_value=row.get("progress"),
+                )
+            )
+        elif row.get("progress") and known.progress and row["progress"] != known.progress:
+            changes.append(
+                dict(
+                    change_type=CHANGE_PROGRESS,
+                    title=row["title"],
+                    old_value=known.progress,
+                    new_value=row["progress"],
+                )
+            )
+    return changes
+
+
+def pair_renames(
+    missing: Sequence, arrivals: Sequence, rename_match: Optional[Callable[[str, str], bool]] = None
+) -> List[Dict]:
+    """
+    Turn books missing from a complete scan into removed or renamed changes.
+
+    Args:
+        missing: Catalog rows (title, author, last_seen_at) the scan did not see
+        arrivals: Catalog rows (title, author, first_seen_at) the scan did see
+        rename_match: Predicate (old_title, new_title); None disables rename detection
+
+    Returns:
+        One change dict per missing book
+    """
+    changes = []
+    paired = set()
+    for old in missing:
+        new = None
+        if rename_match:
+            new = next(
+                (
+                    row
+                    for row in arrivals
+                    if row.title not in paired
+                    and row.author == old.author
+                    and row.first_seen_at > old.last_seen_at
+                    and rename_match(old.title, row.title)
+                ),
+                None,
+            )
+        if new is not None:
+            paired.add(new.title)
+            changes.append(dict(change_type=CHANGE_RENAMED, title=new.title, old_title=old.title))
+        else:
+            changes.append(dict(change_type=CHANGE_REMOVED, title=old.title))
+    return changes
+
+
+class LibraryBookRepository:
+    """Repository for library catalog operations."""
+
+    def __init__(self, session: Session):
+        """Initialize the repository with a database session.
+
+        Args:
+            session: SQLAlchemy session
+        """
+        self.session = session
+
+    def _get_user_id(self, email: str) -> Optional[int]:
+        user = self.session.execute(select(User).where(User.email == email)).scalar_one_or_none()
+        if not user:
+            logger.warning(f"User not found: {email}")
+            return None
+        return user.id
+
+    def upsert_books(
+        self, email: str, books: Sequence[Dict], start_position: int = 0, log_changes: bool = True
+    ) -> List[Dict]:
+        """
+        Insert or refresh books seen by a library scan, logging what changed.
+
+        Args:
+            email: The user's email address
+            books: Book info dicts in device list order
+            start_position: List position of the first book in books
+            log_changes: Whether to write changes to the change log; off while a
+                first scan seeds an empty catalog
+
+        Returns:
+            The changes written to the change log (see detect_page_changes)
+        """
+        try:
+            user_id = self._get_user_id(email)
+            if user_id is None:
+                return []
+
+            now = datetime.now(timezone.utc)
+            rows = []
+            for offset, book in enumerate(books):
+                if not book.get("title"):
+                    continue
+                rows.append(
+                    dict(
+                        user_id=user_id,
+                        title=book["title"],
+                        author=book.get("author"),
+                        progress=book.get("progress"),
+                        size=book.get("size"),
+                        downloaded=book.get("downloaded"),
+                        position=start_position + offset,
+                        first_seen_at=now,
+                        last_seen_at=now,
+                    )
+                )
+            if not rows:
+                return []
+
+            existing = {
+                row.title: row
+                for row in self.session.execute(
+                    select(LibraryBook.title, LibraryBook.progress, LibraryBook.removed_at).where(
+                        LibraryBook.user_id == user_id, LibraryBook.title.in_([row["title"] for row in rows])
+                    )
+                )
+            }
+            changes = detect_page_changes(existing, rows) if log_changes else []
+
+            stmt = pg_insert(LibraryBook).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["user_id", "title"],
+                set_=dict(
+                    author=func.coalesce(stmt.excluded.author, LibraryBook.author),
+                    progress=stmt.excluded.progress,
+                    size=stmt.excluded.size,
+                    downloaded=func.coalesce(stmt.excluded.downloaded, LibraryBook.downloaded),
+                    position=stmt.excluded.position,
+                    last_seen_at=now,
+                    removed_at=None,
+                ),
+            )
+            self.session.execute(stmt)
+            self._log_changes(user_id, changes, now)
+            self.session.commit()
+            logger.debug(f"Upserted {len(rows)} library books for {email} from position {start_position}")
+            return changes
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            logger.error(f"Error upserting library books for {email}: {e}")
+            return []
+
+    def mark_removed(
+        self,
+        email: str,
+        seen_titles: Iterable[str],
+        rename_match: Optional[Callable[[str, str], bool]] = None,
+    ) -> List[Dict]:
+        """
+        Mark books that a complete library scan did not see as removed, logging the changes.
+
+        A missing book is logged as renamed rather than removed when rename_match pairs it
+        with a book by the same author that was first seen after it was last seen.
+
+        Args:
+            email: The user's email address
+            seen_titles: Every title seen during the scan
+            rename_match: Optional predicate (old_title, new_title) deciding whether two titles
+                are the same book
+
+        Returns:
+            The removed and renamed changes written to the change log
+        """
+        try:
+            user_id = self._get_user_id(email)
+            if user_id is None:
+                return []
+
+            seen = set(seen_titles)
+            current = list(
+                self.session.execute(
+                    select(
+                        LibraryBook.title,
+                        LibraryBook.author,
+                        LibraryBook.first_seen_at,
+                        LibraryBook.last_seen_at,
+                    ).where(LibraryBook.user_id == user_id, LibraryBook.removed_at.is_(None))
+                )
+            )
+            missing = [row for row in current if row.title not in seen]
+            if not missing:
+                return []
+
+            arrivals = [row for row in current if row.title in seen]
+            changes = pair_renames(missing, arrivals, rename_match)
+
+            now = datetime.now(timezone.utc)
+            self.session.execute(
+                update(LibraryBook)
+                .where(LibraryBook.user_id == user_id, LibraryBook.title.in_([row.title for row in missing]))
+                .values(removed_at=now, position=None)
+            )
+            self._log_changes(user_id, changes, now)
+            self.session.commit()
+            logger.info(f"Marked {len(missing)} library books as removed or renamed for {email}")
+            return changes
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            logger.error(f"Error marking removed library books for {email}: {e}")
+            return []
+
+    def _log_changes(self, user_id: int, changes: List[Dict], now: datetime) -> None:
+        for change in changes:
+            self.session.add(LibraryChange(user_id=user_id, created_at=now, **change))
+
+    def get_changes_since(self, email: str, since_version: int = 0, limit: int = 500) -> List[LibraryChange]:
+        """
+        Get change log entries newer than a version.
+
+        Args:
+            email: The user's email address
+            since_version: Only return changes with a higher version
+            limit: Maximum number of changes to return
+
+        Returns:
+            Changes in version order
+        """
+        try:
+            user_id = self._get_user_id(email)
+            if user_id is None:
+                return []
+            return list(
+                self.session.execute(
+                    select(LibraryChange)
+                    .where(LibraryChange.user_id == user_id, LibraryChange.id > since_version)
+                    .order_by(LibraryChange.id)
+                    .limit(limit)
+                ).scalars()
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting library changes for {email}: {e}")
+            return []
+
+    def get_latest_version(self, email: str) -> int:
+        """
+        Get the version of a user's most recent library change.
+
+        Args:
+            email: The user's email address
+
+        Returns:
+            The latest version, or 0 if nothing has changed yet
+        """
+        try:
+            user_id = self._get_user_id(email)
+            if user_id is None:
+                return 0
+            return (
+                self.session.execute(
+                    select(func.max(LibraryChange.id)).where(LibraryChange.user_id == user_id)
+                ).scalar_one()
+                or 0
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting latest library version for {email}: {e}")
+            return 0
+
+    def set_downloaded(self, email: str, title: str, downloaded: bool) -> None:
+        """
+        Record whether a book is downloaded on the device.
+
+        Args:
+            email: The user's email address
+            title: The exact on-device title
+            downloaded: Whether the book is downloaded
+        """
+        try:
+            user_id = self._get_user_id(email)
+            if user_id is None:
+                return
+
+            self.session.execute(
+                update(LibraryBook)
+                .where(LibraryBook.user_id == user_id, LibraryBook.title == title)
+                .values(downloaded=downloaded)
+            )
+            self.session.commit()
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            logger.error(f"Error setting downloaded state for {email}/{title}: {e}")
+
+    def clear_downloaded(self, email: str) -> None:
+        """
+        Forget whether each of a user's books is downloaded, e.g. after the device is replaced.
+
+        Args:
+            email: The user's email address
+        """
+        try:
+            user_id = self._get_user_id(email)
+            if user_id is None:
+                return
+
+            self.session.execute(
+                update(LibraryBook).where(LibraryBook.user_id == user_id).values(downloaded=None)
+            )
+            self.session.commit()
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            logger.error(f"Error clearing downloaded state for {email}: {e}")
+
+    def get_download_info(self, email: str, titles: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Get whether books are downloaded on the device, and their sizes.
+
+        Args:
+            email: The user's email address
+            titles: Exact on-device titles
+
+        Returns:
+            Dict of title to {"downloaded", "size"}, either None when unknown, for the
+            titles in the catalog
+        """
+        titles = list(titles)
+        try:
+            user_id = self._get_user_id(email)
+            if user_id is None or not titles:
+                return {}
+            rows = self.session.execute(
+                select(LibraryBook.title, LibraryBook.downloaded, LibraryBook.size).where(
+                    LibraryBook.user_id == user_id,
+                    LibraryBook.title.in_(titles),
+                    LibraryBook.removed_at.is_(None),
+                )
+            ).all()
+            return {title: {"downloaded": downloaded, "size": size} for title, downloaded, size in rows}
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting download info for {email}: {e}")
+            return {}
+
+    def get_titles(self, email: str) -> Set[str]:
+        """
+        Get the titles currently in a user's library.
+
+        Args:
+            email: The user's email address
+
+        Returns:
+            Set of titles not marked as removed
+        """
+        try:
+            user_id = self._get_user_id(email)
+            if user_id is None:
+                return set()
+            return set(
+                self.session.execute(
+                    select(LibraryBook.title).where(
+                        LibraryBook.user_id == user_id, LibraryBook.removed_at.is_(None)
+                    )
+                ).scalars()
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting library titles for {email}: {e}")
+            return set()
+
+    def count_books(self, email: str) -> int:
+        """
+        Count the books currently in a user's library.
+
+        Args:
+            email: The user's email address
+
+        Returns:
+            Number of books not marked as removed
+        """
+        try:
+            user_id = self._get_user_id(email)
+            if user_id is None:
+                return 0
+            return self.session.execute(
+                select(func.count(LibraryBook.id)).where(
+                    LibraryBook.user_id == user_id, LibraryBook.removed_at.is_(None)
+                )
+            ).scalar_one()
+        except SQLAlchemyError as e:
+            logger.error(f"Error counting library books for {email}: {e}")
+            return 0
+
+    def get_page(
+        self, email: str, sort: str = SORT_DEVICE, after: Optional[list] = None, limit: int = 50
+    ) -> Tuple[List[LibraryBook], bool]:
+        """
+        Get one page of a user's library using keyset pagination.
+
+        Args:
+            email: The user's email address
+            sort: One of SORT_MODES
+            after: Sort key of the last book on the previous page, as returned by sort_key()
+            limit: Maximum number of books to return
+
+        Returns:
+            Tuple of (books, has_more)
+        """
+        try:
+            user_id = self._get_user_id(email)
+            if user_id is None:
+                return [], False
+
+            columns = self._sort_columns(sort)
+            stmt = select(LibraryBook).where(LibraryBook.user_id == user_id, LibraryBook.removed_at.is_(None))
+            if after:
+                stmt = stmt.where(tuple_(*columns) > tuple_(*after))
+            stmt = stmt.order_by(*columns).limit(limit + 1)
+
+            books = list(self.session.execute(stmt).scalars())
+            return books[:limit], len(books) > limit
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting library page for {email}: {e}")
+            return [], False
+
+    @staticmethod
+    def _sort_columns(sort: str) -> list:
+        if sort == SORT_TITLE:
+            return [LibraryBook.title]
+        if sort == SORT_AUTHOR:
+            return [func.coalesce(LibraryBook.author, ""), LibraryBook.title]
+        return [func.coalesce(LibraryBook.position, _UNKNOWN_POSITION), LibraryBook.title]
+
+    @staticmethod
+    def sort_key(book: LibraryBook, sort: str = SORT_DEVICE) -> list:
+        """Return the keyset pagination key of a book for the given sort."""
+        if sort == SORT_TITLE:
+            return [book.title]
+        if sort == SORT_AUTHOR:
+            return [book.author or "", book.title]
+        return [book.position if book.position is not None else _UNKNOWN_POSITION, book.title]
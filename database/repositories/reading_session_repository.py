@@ -2,9 +2,9 @@
 
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import List, Optional, Tuple
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, func, select
 from sqlalchemy.orm import Session
 
 from database.models import ReadingSession, User
@@ -82,70 +82,81 @@ class ReadingSessionRepository:
         logger.info(f"Started new reading session for {email}/{book_title} with session_key={session_key}")
         return reading_session
 
-    def update_session_navigation(
+    def apply_navigation_totals(
         self,
         email: str,
         book_title: str,
         new_position: int,
-        pages_navigated: int,
+        max_position: int,
+        navigation_count: int,
+        pages_forward: int,
+        pages_backward: int,
+        activity_at: datetime,
         session_key: Optional[str] = None,
     ) -> Optional[ReadingSession]:
-        """Update session when user navigates.
+        """Update a session with several navigations at once.
 
         Args:
             email: User's email address
             book_title: Title of the book being navigated
-            new_position: New position after navigation
-            pages_navigated: Number of pages navigated (positive for forward, negative for backward)
+            new_position: Position after the last navigation
+            max_position: Furthest position reached by the navigations
+            navigation_count: Number of navigations
+            pages_forward: Pages navigated forward in total
+            pages_backward: Pages navigated backward in total
+            activity_at: Time of the last navigation
             session_key: Client's session key to find the right session
 
         Returns:
             Updated ReadingSession or None if not found
         """
-        # Get user
-        user = self.session.query(User).filter_by(email=email).first()
-        if not user:
-            logger.warning(f"User not found: {email}")
-            return None
-
-        # Find active session
-        query = self.session.query(ReadingSession).filter_by(
-            user_id=user.id, book_title=book_title, is_active=True
-        )
-
-        # If session_key provided, prefer that session
-        if session_key:
-            query = query.filter_by(session_key=session_key)
-
-        reading_session = query.first()
-
+        reading_session = self.get_active_session(email, book_title, session_key)
         if not reading_session:
             logger.warning(f"No active reading session found for {email}/{book_title}")
             return None
 
-        # Update position and stats
         reading_session.current_position = new_position
-        reading_session.max_position = max(reading_session.max_position, new_position)
-        reading_session.navigation_count += 1
-        reading_session.last_activity_at = datetime.now(timezone.utc)
-
-        # Update navigation stats
-        if pages_navigated > 0:
-            reading_session.total_pages_forward += pages_navigated
-        else:
-            reading_session.total_pages_backward += abs(pages_navigated)
-
+        reading_session.max_position = max(reading_session.max_position, max_position)
+        reading_session.navigation_count += navigation_count
+        reading_session.total_pages_forward += pages_forward
+        reading_session.total_pages_backward += pages_backward
+        reading_session.last_activity_at = activity_at
         self.session.commit()
 
         logger.debug(
-            f"Updated session for {email}/{book_title}: "
-            f"position={new_position}, pages_navigated={pages_navigated}, "
-            f"total_forward={reading_session.total_pages_forward}, "
+            f"Applied {navigation_count} navigations to session for {email}/{book_title}: "
+            f"position={new_position}, total_forward={reading_session.total_pages_forward}, "
             f"total_backward={reading_session.total_pages_backward}"
         )
 
         return reading_session
 
+    def update_last_activity(self, email: str, activity_at: datetime) -> Optional[ReadingSession]:
+        """Set the last activity time of a user's most recent open reading session.
+
+        Args:
+            email: User's email address
+            activity_at: Time of the activity
+
+        Returns:
+            Updated ReadingSession or None if the user has no open session
+        """
+        user = self.session.query(User).filter_by(email=email).first()
+        if not user:
+            return None
+
+        reading_session = (
+            self.session.query(ReadingSession)
+            .filter_by(user_id=user.id, ended_at=None)
+            .order_by(ReadingSession.started_at.desc())
+            .first()
+        )
+        if reading_session:
+            reading_session.last_activity_at = activity_at
+            self.session.commit()
+
+        return reading_session
+
     def get_active_session(
         self, email: str, book_title: str, session_key: Optional[str] = None
     ) -> Optional[ReadingSession]:
@@ -289,3 +300,27 @@ class ReadingSessionRepository:
             "avg_pages_per_day": round(total_pages_read / max(reading_days, 1), 1),
             "avg_session_minutes": avg_session_minutes,
         }
+
+    def get_recent_book_titles(self, email: str, limit: int = 10) -> List[Tuple[str, datetime]]:
+        """Get the books a user read most recently.
+
+        Args:
+            email: User's email address
+            limit: Maximum number of books
+
+        Returns:
+            List of (book_title, last activity) tuples, most recent first
+        """
+        user = self.session.query(User).filter_by(email=email).first()
+        if not user:
+            return []
+
+        last_activity = func.max(ReadingSession.last_activity_at)
+        rows = self.session.execute(
+            select(ReadingSession.book_title, last_activity)
+            .where(ReadingSession.user_id == user.id)
+            .group_by(ReadingSession.book_title)
+            .order_by(last_activity.desc())
+            .limit(limit)
+        ).all()
+        return [(title, at) for title, at in rows]
@@ -19,6 +19,9 @@ from selenium.webdriver.support.ui import WebDriverWait
 from handlers.library_handler_scroll import LibraryHandlerScroll
 from handlers.library_handler_search import LibraryHandlerSearch
 from server.logging_config import store_page_source
+from server.utils.library_catalog import set_book_downloaded
+from server.utils.request_utils import get_sindarin_email
+from server.utils.title_index import STRATEGY_SCROLL, STRATEGY_VISIBLE, get_title_index
 from views.auth.interaction_strategies import LIBRARY_SIGN_IN_STRATEGIES
 from views.auth.view_strategies import EMAIL_VIEW_IDENTIFIERS
 from views.library.interaction_strategies import (
@@ -27,6 +30,7 @@ from views.library.interaction_strategies import (
     LIST_VIEW_OPTION_STRATEGIES,
     MENU_CLOSE_STRATEGIES,
     SAFE_TAP_AREAS,
+    SELECTION_DOWNLOAD_STRATEGIES,
     VIEW_OPTIONS_BUTTON_STRATEGIES,
 )
 from views.library.view_strategies import (
@@ -56,6 +60,15 @@ from views.view_options.view_strategies import VIEW_OPTIONS_MENU_STATE_STRATEGIE
 
 logger = logging.getLogger(__name__)
 
+# Corrective scrolls allowed after jumping to a book's remembered position
+MAX_JUMP_CORRECTIONS = 2
+
+# Outcomes of starting a background download
+DOWNLOAD_ALREADY_DOWNLOADED = "downloaded"
+DOWNLOAD_STARTED = "started"
+DOWNLOAD_NOT_FOUND = "not_found"
+DOWNLOAD_FAILED = "failed"
+
 
 class LibraryHandler:
     def __init__(self, driver):
@@ -68,6 +81,11 @@ class LibraryHandler:
         self.search_handler = LibraryHandlerSearch(driver)
         self.scroll_handler = LibraryHandlerScroll(driver, parent_handler=self)
 
+        # Set once the cached library preferences have been confirmed as list view without
+        # series grouping, so open_book can skip preference discovery on later calls. A new
+        # driver session creates a new handler, and an app restart calls forget_library_preferences
+        self._library_preferences_known_good = False
+
     def _discover_and_save_library_preferences(self):
         """Discover the current library view state and save it to preferences.
 
@@ -1392,8 +1410,13 @@ class LibraryHandler:
             logger.error(f"Error checking for search interface: {e}", exc_info=True)
             return False
 
+    def forget_library_preferences(self):
+        """Forget that the library view preferences were confirmed, after the app restarted."""
+        self._library_preferences_known_good = False
+
     def switch_to_list_view(self):
         """Switch to list view if not already in it"""
+        self._library_preferences_known_good = False
         try:
             # If we're in grid view, we must switch regardless of cache
             # (The cache might be stale/incorrect)
@@ -1638,6 +1661,7 @@ class LibraryHandler:
         Returns:
             bool: True if successfully handled the dialog, False otherwise.
         """
+        self._library_preferences_known_good = False
         try:
             logger.info("Handling Grid/List view selection dialog...")
 
@@ -2671,6 +2695,174 @@ class LibraryHandler:
             traceback.print_exc()
             return False
 
+    def _resolve_device_title(self, book_title: str) -> Optional[Dict]:
+        """Resolve a requested title against the user's title index before touching the UI.
+
+        Args:
+            book_title: The title as requested by the client
+
+        Returns:
+            dict or None: Resolution with the exact on-device "title", match "score",
+            suggested "strategy" and known "page_index", or None if the title is unknown
+        """
+        title_index = get_title_index(get_sindarin_email())
+        if title_index is None:
+            return None
+
+        resolution = title_index.resolve(book_title)
+        if resolution:
+            logger.info(
+                f"Resolved '{book_title}' to on-device title '{resolution['title']}' "
+                f"({resolution['match']}, score {resolution['score']:.2f}, strategy {resolution['strategy']})"
+            )
+        return resolution
+
+    def _find_book_at_known_offset(self, resolution: Dict):
+        """Jump to where the title index last saw a book instead of searching for it.
+
+        The list is flung blindly from the top by the calibrated number of rows, then the
+        visible titles and the book's remembered neighbours decide whether a corrective
+        scroll up or down is needed.
+
+        Args:
+            resolution: Resolution from the title index for the book
+
+        Returns:
+            tuple: (parent_container, button, book_info) or (None, None, None)
+        """
+        device_title = resolution["title"]
+        position = resolution.get("position")
+        page_index = resolution.get("page_index") or 1
+        title_index = get_title_index(get_sindarin_email())
+
+        if not self.scroll_handler.scroll_to_list_top():
+            logger.warning("Failed to scroll to top of list, continuing anyway...")
+
+        if position is None or title_index is None:
+            # Only the screen is known, so scan up to it, allowing one extra screen
+            # in case books were added above it since the last scan
+            logger.info(f"Title index places '{device_title}' on screen {page_index}, scanning up to it")
+            return self.scroll_handler._scroll_through_library(
+                device_title, title_match_func=self.search_handler._title_match, max_pages=page_index + 1
+            )
+
+        flings = title_index.flings_for(position, page_index)
+        logger.info(f"Title index places '{device_title}' at row {position}, flinging {flings} times")
+        flings = self.scroll_handler.fling_down(flings, cancellation_check=self._check_cancellation)
+
+        for attempt in range(MAX_JUMP_CORRECTIONS + 1):
+            visible_titles = self.scroll_handler.get_visible_titles()
+            known_positions = title_index.titles_at_positions(visible_titles)
+            if attempt == 0 and known_positions:
+                title_index.calibrate_flings(flings, min(known_positions.values()))
+
+            if device_title in visible_titles:
+                visible_book_result = self.search_handler._check_book_visible_on_screen(device_title)
+                if visible_book_result:
+                    logger.info(f"Found '{device_title}' after {flings} flings and {attempt} corrections")
+                    return visible_book_result
+
+            # The neighbours pin down which side of the screen the book is on, falling
+            # back to the positions of whatever else is visible
+            if resolution.get("prev_title") in visible_titles:
+                direction = "down"
+            elif resolution.get("next_title") in visible_titles:
+                direction = "up"
+            elif known_positions and max(known_positions.values()) < position:
+                direction = "down"
+            elif known_positions and min(known_positions.values()) > position:
+                direction = "up"
+            else:
+                break
+
+            if attempt == MAX_JUMP_CORRECTIONS or self._check_cancellation():
+                break
+            logger.info(f"'{device_title}' not visible, correcting by scrolling {direction}")
+            if direction == "down":
+                self.scroll_handler.fling_down(1)
+            else:
+                self.scroll_handler.scroller.scroll_up()
+
+        return None, None, None
+
+    def _record_book_opened(self, book_title: str) -> None:
+        """Tell the title index and catalog a book was opened, and so downloaded."""
+        sindarin_email = get_sindarin_email()
+        title_index = get_title_index(sindarin_email)
+        if title_index is None:
+            return
+
+        resolution = title_index.resolve(book_title)
+        if resolution:
+            title_index.note_opened(resolution["title"])
+            title_index.save()
+            set_book_downloaded(sindarin_email, resolution["title"], True)
+
+    def start_background_download(self, book_title: str) -> str:
+        """Start downloading a book from the library list without opening it.
+
+        The book is only looked for where the title index places it, so the library is
+        never searched. A book not yet downloaded is long-pressed to select it and
+        downloaded with the selection toolbar's Download action, which returns at once
+        while the app downloads in the background. The download state seen on the book's
+        row is recorded in the library catalog.
+
+        Args:
+            book_title: The title as read by the user
+
+        Returns:
+            str: One of DOWNLOAD_ALREADY_DOWNLOADED, DOWNLOAD_STARTED, DOWNLOAD_NOT_FOUND
+            and DOWNLOAD_FAILED
+        """
+        resolution = self._resolve_device_title(book_title)
+        if not resolution or resolution["strategy"] not in (STRATEGY_VISIBLE, STRATEGY_SCROLL):
+            return DOWNLOAD_NOT_FOUND
+
+        device_title = resolution["title"]
+        sindarin_email = get_sindarin_email()
+        try:
+            parent_container, button, _ = self._find_book_at_known_offset(resolution)
+            if not parent_container:
+                return DOWNLOAD_NOT_FOUND
+
+            content_desc = parent_container.get_attribute("content-desc") or ""
+            if "Book not downloaded" not in content_desc:
+                set_book_downloaded(sindarin_email, device_title, True)
+                return DOWNLOAD_ALREADY_DOWNLOADED
+
+            self.driver.execute_script("mobile: longClickGesture", {"elementId": button.id, "duration": 1000})
+            time.sleep(0.5)
+            started = False
+            for strategy, locator in SELECTION_DOWNLOAD_STRATEGIES:
+                try:
+                    download_button = self.driver.find_element(strategy, locator)
+                    if download_button.is_displayed():
+                        download_button.click()
+                        started = True
+                        break
+                except NoSuchElementException:
+                    continue
+
+            if self.scroll_handler.is_in_book_selection_mode():
+                self.scroll_handler.exit_book_selection_mode()
+
+            if not started:
+                logger.warning(f"No Download action after selecting '{device_title}'")
+                store_page_source(self.driver.page_source, "background_download_no_action")
+                return DOWNLOAD_FAILED
+
+            if self._check_unable_to_download_dialog(device_title, "background download"):
+                return DOWNLOAD_FAILED
+
+            set_book_downloaded(sindarin_email, device_title, False)
+            logger.info(f"Started background download of '{device_title}'")
+            return DOWNLOAD_STARTED
+        except Exception as e:
+            logger.warning(f"Error starting background download of '{device_title}': {e}", exc_info=True)
+            if self.scroll_handler.is_in_book_selection_mode():
+                self.scroll_handler.exit_book_selection_mode()
+            return DOWNLOAD_FAILED
+
     def find_book(self, book_title: str) -> bool:
         """Find and click a book button by title. If the book isn't downloaded, initiate download and wait for completion."""
         try:
@@ -2679,8 +2871,24 @@ class LibraryHandler:
                 logger.info("Request cancelled before searching for book")
                 return False
 
+            # Match the UI against the exact on-device title when the index knows it,
+            # but keep the requested title for sessions and positions
+            resolution = self._resolve_device_title(book_title)
+            device_title = resolution["title"] if resolution else book_title
+
+            if resolution and resolution["strategy"] in (STRATEGY_VISIBLE, STRATEGY_SCROLL):
+                parent_container, button, book_info = self._find_book_at_known_offset(resolution)
+                if parent_container:
+                    if self._check_cancellation():
+                        logger.info("Request cancelled after finding book but before clicking")
+                        return False
+                    return self._handle_book_click_and_transition(
+                        parent_container, button, book_info, book_title
+                    )
+                logger.info(f"'{device_title}' was not at its indexed position, falling back to search")
+
             # Try using the search box first to find the book
-            search_result = self.search_handler.search_for_book(book_title)
+            search_result = self.search_handler.search_for_book(device_title)
             # search_result = False  # TODO: Remove this once done testing scrolling method
 
             if search_result:
@@ -2739,7 +2947,7 @@ class LibraryHandler:
 
             # Provide the title_match_func to scroll_through_library
             parent_container, button, book_info = self.scroll_handler._scroll_through_library(
-                book_title, title_match_func=self.search_handler._title_match
+                device_title, title_match_func=self.search_handler._title_match
             )
 
             # Check for cancellation after scrolling
@@ -2896,6 +3104,58 @@ class LibraryHandler:
             return True
         return False
 
+    def _prepare_library_view_for_open_book(self) -> Optional[dict]:
+        """Discover library preferences and handle the Grid/List view dialog before opening a book.
+
+        Returns:
+            dict or None: An error result if the dialog could not be handled, None otherwise
+        """
+        # Check if we have any cached preferences at all
+        cached_view_type = self.driver.automator.profile_manager.get_style_setting("view_type")
+        cached_group_by_series = self.driver.automator.profile_manager.get_style_setting("group_by_series")
+
+        # If we have no preferences cached, try to discover the current state
+        if cached_view_type is None or cached_group_by_series is None:
+            logger.info(
+                "No cached library preferences found in open_book, attempting to discover current state"
+            )
+            self._discover_and_save_library_preferences()
+
+        # Only handle the Grid/List view dialog if cached preferences indicate we need to
+        if not self._is_library_view_preferences_correctly_set():
+            # Check if we're in the Grid/List view dialog and handle it before trying to open a book
+            if self._is_grid_list_view_dialog_open():
+                logger.info("Detected Grid/List view dialog is open before opening book, handling it first")
+                if not self.handle_grid_list_view_dialog():
+                    logger.error("Failed to handle Grid/List view dialog", exc_info=True)
+                    store_page_source(self.driver.page_source, "failed_to_handle_grid_list_dialog")
+                    return {"success": False, "error": "Failed to handle Grid/List view dialog"}
+                logger.info("Successfully handled Grid/List view dialog")
+                time.sleep(1)  # Wait for UI to stabilize
+            else:
+                # Dialog is not open but preferences aren't correctly set
+                # We need to open the dialog to check/set group_by_series
+                if cached_group_by_series is None:
+                    logger.info("group_by_series is not set, opening Grid/List dialog to check/set it")
+                    # Use force_open=True to ensure dialog opens even if view_type is already set
+                    if self.open_grid_list_view_dialog(force_open=True):
+                        logger.info("Opened Grid/List dialog, now handling it")
+                        if not self.handle_grid_list_view_dialog():
+                            logger.error(
+                                "Failed to handle Grid/List view dialog after opening", exc_info=True
+                            )
+                            return {
+                                "success": False,
+                                "error": "Failed to handle Grid/List view dialog after opening",
+                            }
+                    else:
+                        logger.warning("Failed to open Grid/List dialog to check group_by_series")
+        else:
+            logger.info("Skipping Grid/List view dialog check - cached preferences already set correctly")
+            self._library_preferences_known_good = True
+
+        return None
+
     def open_book(self, book_title: str) -> dict:
         """Open a book in the library.
 
@@ -2913,52 +3173,13 @@ class LibraryHandler:
                     "error": "Request was cancelled by higher priority operation",
                     "status": 409,
                 }
-            # Check if we have any cached preferences at all
-            cached_view_type = self.driver.automator.profile_manager.get_style_setting("view_type")
-            cached_group_by_series = self.driver.automator.profile_manager.get_style_setting(
-                "group_by_series"
-            )
-
-            # If we have no preferences cached, try to discover the current state
-            if cached_view_type is None or cached_group_by_series is None:
-                logger.info(
-                    "No cached library preferences found in open_book, attempting to discover current state"
-                )
-                self._discover_and_save_library_preferences()
-
-            # Only handle the Grid/List view dialog if cached preferences indicate we need to
-            if not self._is_library_view_preferences_correctly_set():
-                # Check if we're in the Grid/List view dialog and handle it before trying to open a book
-                if self._is_grid_list_view_dialog_open():
-                    logger.info(
-                        "Detected Grid/List view dialog is open before opening book, handling it first"
-                    )
-                    if not self.handle_grid_list_view_dialog():
-                        logger.error("Failed to handle Grid/List view dialog", exc_info=True)
-                        store_page_source(self.driver.page_source, "failed_to_handle_grid_list_dialog")
-                        return {"success": False, "error": "Failed to handle Grid/List view dialog"}
-                    logger.info("Successfully handled Grid/List view dialog")
-                    time.sleep(1)  # Wait for UI to stabilize
-                else:
-                    # Dialog is not open but preferences aren't correctly set
-                    # We need to open the dialog to check/set group_by_series
-                    if cached_group_by_series is None:
-                        logger.info("group_by_series is not set, opening Grid/List dialog to check/set it")
-                        # Use force_open=True to ensure dialog opens even if view_type is already set
-                        if self.open_grid_list_view_dialog(force_open=True):
-                            logger.info("Opened Grid/List dialog, now handling it")
-                            if not self.handle_grid_list_view_dialog():
-                                logger.error(
-                                    "Failed to handle Grid/List view dialog after opening", exc_info=True
-                                )
-                                return {
-                                    "success": False,
-                                    "error": "Failed to handle Grid/List view dialog after opening",
-                                }
-                        else:
-                            logger.warning("Failed to open Grid/List dialog to check group_by_series")
+            # Preferences confirmed earlier in this session need no rediscovery
+            if self._library_preferences_known_good:
+                logger.info("Skipping library preference discovery - cached preferences known to be good")
             else:
-                logger.info("Skipping Grid/List view dialog check - cached preferences already set correctly")
+                error = self._prepare_library_view_for_open_book()
+                if error:
+                    return error
 
             # Import dialog identifiers here to avoid circular imports
             from views.reading.interaction_strategies import (
@@ -2977,8 +3198,13 @@ class LibraryHandler:
                     "status": 409,
                 }
 
+            # Resolve the exact on-device title so the visibility check doesn't miss
+            # books whose requested title differs in case, punctuation or subtitle
+            resolution = self._resolve_device_title(book_title)
+            device_title = resolution["title"] if resolution else book_title
+
             # Check if the book is already visible on the current screen before searching
-            visible_book_result = self.search_handler._check_book_visible_on_screen(book_title)
+            visible_book_result = self.search_handler._check_book_visible_on_screen(device_title)
             if visible_book_result:
                 parent_container, button, book_info = visible_book_result
                 logger.info(f"Book '{book_title}' is already visible on the current screen")
@@ -3009,7 +3235,8 @@ class LibraryHandler:
                         logger.error("Failed to exit series/collection view")
                         return {"success": False, "error": "Failed to exit series/collection view"}
 
-                # Check for download progress bar
+                # Check for download progress bar; a stored download state can be stale after the
+                # AVD is restored or cloned, so the screen is always checked
                 if self._check_for_download_progress_bar():
                     logger.info("Download progress bar detected, waiting for download to complete...")
                     if not self._wait_for_download_completion():
@@ -3031,7 +3258,7 @@ class LibraryHandler:
                     # After download completes, we need to click the book again
                     # Re-find the book to avoid stale element reference
                     time.sleep(1)  # Brief pause after download
-                    visible_book_result = self.search_handler._check_book_visible_on_screen(book_title)
+                    visible_book_result = self.search_handler._check_book_visible_on_screen(device_title)
                     if visible_book_result:
                         _, button, _ = visible_book_result
                         # Check for cancellation before clicking after download
@@ -3385,6 +3612,7 @@ class LibraryHandler:
 
             if dialog_handled:
                 logger.info(f"Reader handler successfully handled dialogs for book '{book_title}'")
+                self._record_book_opened(book_title)
                 return {"success": True}
             else:
                 logger.error(
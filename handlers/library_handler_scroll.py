@@ -17,10 +17,13 @@ from selenium.webdriver.common.actions.pointer_input import PointerInput
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from handlers.library_scroll_engine import AdaptiveLibraryScroller, parse_library_screen
 from server.logging_config import store_page_source
 from server.utils.ansi_colors import BRIGHT_CYAN, BRIGHT_GREEN, BRIGHT_YELLOW, RESET
 from server.utils.cancellation_utils import CancellationChecker
+from server.utils.library_catalog import record_complete_scan, record_scan_page
 from server.utils.request_utils import get_sindarin_email
+from server.utils.title_index import get_title_index
 from views.common.scroll_strategies import SmartScroller
 from views.library.view_strategies import (
     BOOK_CONTAINER_RELATIONSHIPS,
@@ -40,6 +43,8 @@ class LibraryHandlerScroll:
         os.makedirs(self.screenshots_dir, exist_ok=True)
         # Initialize the smart scroller
         self.scroller = SmartScroller(driver)
+        # Sizes library scrolls from parsed row bounds; keeps its calibration across scans
+        self.adaptive_scroller = AdaptiveLibraryScroller(self.scroller)
         # Store partial matches for later retrieval
         self.partial_matches = []
 
@@ -188,18 +193,19 @@ class LibraryHandlerScroll:
                     logger.error(f"Unexpected error finding {field}: {e}", exc_info=True)
                     continue
 
-        # Extract author from content-desc if still missing
-        if not book_info["author"]:
-            try:
-                content_desc = container.get_attribute("content-desc")
-                if content_desc:
+        # The content-desc carries the download state, and the author if it is still missing
+        try:
+            content_desc = container.get_attribute("content-desc")
+            if content_desc:
+                book_info["downloaded"] = "Book not downloaded" not in content_desc
+                if not book_info["author"]:
                     self._extract_author_from_content_desc(book_info, content_desc)
-                else:
-                    logger.debug("No content-desc attribute found")
-            except StaleElementReferenceException:
-                logger.debug("Stale element reference when getting content-desc, skipping")
-            except Exception as e:
-                logger.debug(f"Error getting content-desc: {e}")
+            else:
+                logger.debug("No content-desc attribute found")
+        except StaleElementReferenceException:
+            logger.debug("Stale element reference when getting content-desc, skipping")
+        except Exception as e:
+            logger.debug(f"Error getting content-desc: {e}")
 
         return book_info
 
@@ -819,7 +825,288 @@ class LibraryHandlerScroll:
             ),  # Books whose bottom is below this are considered obscured
         }
 
-    def _scroll_through_library(self, target_title: str = None, title_match_func=None, callback=None):
+    def fling_down(self, count: int, cancellation_check=None) -> int:
+        """Scroll down a number of screens without parsing any of them.
+
+        Args:
+            count: Number of flings to perform
+            cancellation_check: Optional function to check if operation should be cancelled
+
+        Returns:
+            int: Number of flings actually performed
+        """
+        performed = 0
+        for _ in range(count):
+            if not self.scroller.scroll_down(cancellation_check=cancellation_check):
+                break
+            performed += 1
+        return performed
+
+    def get_visible_titles(self) -> List[str]:
+        """Return the titles of the book rows currently on screen, top to bottom."""
+        titles = []
+        try:
+            for element in self.driver.find_elements(AppiumBy.ID, "com.amazon.kindle:id/lib_book_row_title"):
+                try:
+                    if element.text:
+                        titles.append(element.text)
+                except StaleElementReferenceException:
+                    continue
+        except Exception as e:
+            logger.debug(f"Error collecting visible titles: {e}")
+        return titles
+
+    def _record_scan_page(self, title_index, books, start, page_count):
+        """Record the books found on one library screen in the title index and catalog."""
+        if title_index is not None:
+            title_index.record_scan_page(books, start, page_count)
+        record_scan_page(get_sindarin_email(), books, start)
+
+    def _record_complete_scan(self, title_index, seen_titles):
+        """Drop titles that a complete library scan did not see from the title index and catalog."""
+        if title_index is not None:
+            title_index.mark_complete_scan(seen_titles)
+        record_complete_scan(get_sindarin_email(), seen_titles)
+
+    def _read_library_screen(self):
+        """Parse the current library screen from a single page source dump.
+
+        Returns:
+            dict or None: Parsed screen (see parse_library_screen), or None if unavailable
+        """
+        try:
+            return parse_library_screen(self.driver.page_source)
+        except Exception as e:
+            from server.utils.appium_error_utils import is_appium_error
+
+            if is_appium_error(e):
+                raise
+            logger.debug(f"Could not read library screen: {e}")
+            return None
+
+    def _find_row_container(self, row):
+        """Find the container element for a parsed row, for clicking.
+
+        Args:
+            row: Parsed row from parse_library_screen
+
+        Returns:
+            WebElement or None
+        """
+        try:
+            containers = self.driver.find_elements(
+                AppiumBy.XPATH,
+                f"(//*[@resource-id='com.amazon.kindle:id/recycler_view']/*[@content-desc])[{row['index']}]",
+            )
+            return containers[0] if containers else None
+        except StaleElementReferenceException:
+            return None
+
+    def _scan_library_adaptive(self, target_title=None, title_match_func=None, callback=None, max_pages=None):
+        """Scan the library one parsed screen at a time, scrolling adaptively.
+
+        Each screen costs one page source dump instead of several element queries per book.
+        Scrolls are sized to keep one row of overlap, the scan stops as soon as the filter
+        count is reached, and the end of the list is read from the hierarchy. The filter
+        count is a stored setting that can be stale, so only a scan that reached the end
+        of the list is reported and recorded as complete.
+
+        Args:
+            target_title: Optional title to search for. If provided, returns early when found.
+            title_match_func: Function to check if titles match
+            callback: Optional callback receiving batches of books, as in _scroll_through_library
+            max_pages: Optional limit on the number of screens to scan
+
+        Returns:
+            The same results as _scroll_through_library, or None if the library list could not
+            be parsed from the hierarchy and the legacy scan should be used instead
+        """
+        first_screen = self._read_library_screen()
+        if not first_screen or not first_screen["rows"]:
+            logger.info("Library rows not readable from hierarchy, using element-based scanning")
+            return None
+
+        books = []
+        seen_titles = set()
+        title_index = get_title_index(get_sindarin_email())
+        engine = self.adaptive_scroller
+
+        expected_total = None
+        try:
+            expected_total = self.driver.automator.profile_manager.get_style_setting("filter_book_count")
+        except Exception:
+            pass  # No expected total available
+
+        def cancelled(message):
+            if not self._check_for_cancellation(message):
+                return False
+            if callback:
+                callback(
+                    None,
+                    error="Request cancelled by higher priority operation",
+                    done=True,
+                    total_books=len(books),
+                    complete=False,
+                )
+            return True
+
+        try:
+            screen = first_screen
+            previous_screen = None
+            page_count = 0
+            reached_end = False
+
+            while True:
+                page_count += 1
+
+                if cancelled("Library scrolling cancelled due to higher priority request"):
+                    return [] if not target_title else (None, None, None)
+
+                if page_count > 1:
+                    # Check for collapsed series and handle if needed
+                    if self.parent_handler:
+                        self.parent_handler._handle_series_grouping_if_needed()
+                    screen = self._read_library_screen()
+                    if not screen:
+                        logger.warning("Lost the library list while scrolling, stopping scan")
+                        break
+
+                overlap = engine.measure(previous_screen, screen)
+                books_before_page = len(books)
+                new_books_batch = []
+
+                for row in engine.fully_visible_rows(screen):
+                    title = row["title"]
+                    book_info = {
+                        "title": title,
+                        "progress": row["progress"],
+                        "size": row["size"],
+                        "author": row["author"],
+                    }
+                    if row["downloaded"] is not None:
+                        book_info["downloaded"] = row["downloaded"]
+                    if not book_info["author"] and row["content_desc"]:
+                        self._extract_author_from_content_desc(book_info, row["content_desc"])
+
+                    if target_title and title_match_func and title_match_func(title, target_title):
+                        container = self._find_row_container(row)
+                        if container is not None:
+                            matched, parent_container, button = self._try_match_target(
+                                book_info, container, target_title, title_match_func
+                            )
+                            if matched:
+                                if title_index is not None:
+                                    title_index.record_scan_page(
+                                        books + [book_info], books_before_page, page_count
+                                    )
+                                    title_index.save()
+                                return parent_container, button, book_info
+
+                    if title in seen_titles:
+                        continue
+                    seen_titles.add(title)
+                    books.append(book_info)
+                    new_books_batch.append(book_info)
+
+                    # Collect partial matches for the caller's fallback
+                    if target_title and (
+                        target_title.lower() in title.lower() or title.lower() in target_title.lower()
+                    ):
+                        self.partial_matches.append((None, None, book_info))
+                        logger.info(f"Stored partial match: '{title}' for target '{target_title}'")
+
+                self._log_page_summary(page_count, new_books_batch, len(books))
+                logger.debug(f"Screen {page_count} overlapped the previous one by {overlap} rows")
+
+                if new_books_batch:
+                    self._record_scan_page(title_index, books, books_before_page, page_count)
+
+                if callback and new_books_batch:
+                    callback(new_books_batch)
+                    if cancelled(
+                        "Library scrolling cancelled after callback detected higher priority request"
+                    ):
+                        return [] if not target_title else (None, None, None)
+
+                end_of_list = engine.is_end_of_list(previous_screen, screen)
+
+                if expected_total and len(books) >= expected_total:
+                    logger.info(f"Found all expected books ({len(books)}/{expected_total}), stopping scroll")
+                    reached_end = end_of_list
+                    break
+
+                if end_of_list:
+                    if expected_total and len(books) < expected_total:
+                        logger.info(
+                            f"Reached the end of the library with {len(books)}/{expected_total} books"
+                        )
+                    reached_end = True
+                    break
+
+                if max_pages and page_count >= max_pages:
+                    logger.info(f"Scanned {page_count} screens (limit {max_pages}), stopping scroll")
+                    break
+
+                if not engine.scroll(screen):
+                    self._default_page_scroll(
+                        None, None, cancellation_check=lambda: self._check_for_cancellation()
+                    )
+
+                # Check for and handle selection mode after scroll
+                self._maybe_exit_selection_mode()
+                previous_screen = screen
+
+            logger.info(f"Found total of {len(books)} unique books in {page_count} screens")
+
+            if reached_end:
+                if callback:
+                    callback(None, done=True, total_books=len(books), complete=True)
+
+                # Save scroll book count to database
+                try:
+                    if get_sindarin_email():
+                        self.driver.automator.profile_manager.save_style_setting(
+                            "scroll_book_count", len(books)
+                        )
+                        logger.info(f"Saved scroll book count to database: {len(books)}")
+                except Exception as e:
+                    logger.error(f"Error saving scroll book count: {e}", exc_info=True)
+
+                # A full scan is authoritative, so drop titles that have left the library
+                if not expected_total or len(books) >= expected_total:
+                    self._record_complete_scan(title_index, seen_titles)
+
+            if title_index is not None:
+                title_index.save()
+
+            if target_title:
+                result = self._final_result_handling(
+                    target_title, books, seen_titles, title_match_func, callback
+                )
+                if result[0] is None and self.partial_matches:
+                    logger.info(
+                        f"No exact match for '{target_title}', but {len(self.partial_matches)} partial matches found"
+                    )
+                return result
+
+            if callback and not reached_end:
+                callback(None, done=True, total_books=len(books), complete=False)
+            return books
+
+        except Exception as e:
+            from server.utils.appium_error_utils import is_appium_error
+
+            if is_appium_error(e):
+                raise
+
+            logger.error(f"Error scanning library: {e}", exc_info=True)
+            if callback:
+                callback(None, error=str(e), done=True, total_books=len(books), complete=False)
+            return (None, None, None) if target_title else []
+
+    def _scroll_through_library(
+        self, target_title: str = None, title_match_func=None, callback=None, max_pages: int = None
+    ):
         """Scroll through library collecting book info, optionally looking for a specific title.
 
         Args:
@@ -827,6 +1114,8 @@ class LibraryHandlerScroll:
             title_match_func: Function to check if titles match
             callback: Optional callback function to receive books as they're found.
                      The callback should accept a list of book dictionaries.
+            max_pages: Optional limit on the number of screens to scan. Used when the title
+                     index already knows roughly where the target sits in the list.
 
         Returns:
             If target_title provided: (found_container, found_button, book_info) or (None, None, None)
@@ -840,6 +1129,14 @@ class LibraryHandlerScroll:
         """
         # Clear partial matches at the start of each search
         self.partial_matches = []
+
+        # Read whole screens from the hierarchy when possible, falling back to
+        # per-element scanning when the list can't be parsed
+        adaptive_result = self._scan_library_adaptive(target_title, title_match_func, callback, max_pages)
+        if adaptive_result is not None:
+            return adaptive_result
+        self.partial_matches = []
+
         try:
             # Get screen metrics
             metrics = self._get_screen_metrics()
@@ -851,6 +1148,7 @@ class LibraryHandlerScroll:
             # Initialize tracking variables
             books = []
             seen_titles = set()
+            title_index = get_title_index(get_sindarin_email())
             # No normalization needed for exact matching
             page_count = 0
             use_hook_for_current_scroll = True
@@ -883,6 +1181,7 @@ class LibraryHandlerScroll:
 
                 # Store titles from previous scroll position
                 previous_titles = set(seen_titles)
+                books_before_page = len(books)
                 books_added_in_current_page_processing = False
                 new_titles_on_page = []
                 new_books_batch = []
@@ -912,6 +1211,11 @@ class LibraryHandlerScroll:
                                     book_info, container, target_title, title_match_func
                                 )
                                 if matched:
+                                    if title_index is not None:
+                                        title_index.record_scan_page(
+                                            books + [book_info], books_before_page, page_count
+                                        )
+                                        title_index.save()
                                     return parent_container, button, book_info
 
                             # Update collections
@@ -993,6 +1297,10 @@ class LibraryHandlerScroll:
                     # else: found_new_titles is False - no new books found in double-check
                     # We'll handle this in the main decision logic below
 
+                # Remember which screen each new title was found on
+                if len(books) > books_before_page:
+                    self._record_scan_page(title_index, books, books_before_page, page_count)
+
                 # Check if we have an expected total for logging purposes
                 expected_total = None
                 try:
@@ -1078,6 +1386,14 @@ class LibraryHandlerScroll:
                     except Exception as e:
                         logger.error(f"Error saving scroll book count: {e}", exc_info=True)
 
+                    # A full scan is authoritative, so drop titles that have left the library
+                    if not expected_total or len(books) >= expected_total:
+                        self._record_complete_scan(title_index, seen_titles)
+
+                    break
+
+                if max_pages and page_count >= max_pages:
+                    logger.info(f"Scanned {page_count} screens (limit {max_pages}), stopping scroll")
                     break
 
                 # Find scroll reference and perform scrolling
@@ -1100,6 +1416,9 @@ class LibraryHandlerScroll:
 
             logger.info(f"Found total of {len(books)} unique books")
 
+            if title_index is not None:
+                title_index.save()
+
             # Handle final results for target title searches
             if target_title:
                 result = self._final_result_handling(
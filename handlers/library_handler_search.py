@@ -15,6 +15,16 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 from server.logging_config import store_page_source
+from server.utils.request_utils import get_sindarin_email
+from server.utils.title_index import (
+    FUZZY_MATCH_MARGIN,
+    FUZZY_MATCH_THRESHOLD,
+    STOP_WORDS,
+    get_title_index,
+    normalize_title,
+    strip_subtitle,
+    title_similarity,
+)
 from views.common.scroll_strategies import SmartScroller
 from views.library.view_strategies import (
     SEARCH_BACK_BUTTON_IDENTIFIERS,
@@ -27,6 +37,11 @@ from views.library.view_strategies import (
 logger = logging.getLogger(__name__)
 
 
+def _significant_words(title):
+    """Return the words of a title that identify it, ignoring case, punctuation and stop words."""
+    return set(normalize_title(title).split()) - STOP_WORDS
+
+
 class LibraryHandlerSearch:
     def __init__(self, driver):
         self.driver = driver
@@ -38,7 +53,7 @@ class LibraryHandlerSearch:
 
     def _title_match(self, title1: str, title2: str) -> bool:
         """
-        Check if titles match exactly.
+        Check if titles match exactly, ignoring case, punctuation and diacritics.
         """
         if not title1 or not title2:
             return False
@@ -48,6 +63,10 @@ class LibraryHandlerSearch:
             logger.info("Exact match found")
             return True
 
+        if normalize_title(title1) == normalize_title(title2):
+            logger.info(f"Normalized match found: '{title1}' -> '{title2}'")
+            return True
+
         return False
 
     def _check_book_visible_on_screen(self, book_title: str):
@@ -157,6 +176,20 @@ class LibraryHandlerSearch:
         logger.info(f"Attempting to find book by partial matching: '{book_title}'")
 
         try:
+            # The title index may already know the closest on-device titles, which
+            # the search box can find without scrolling the whole library
+            title_index = get_title_index(get_sindarin_email())
+            if title_index is not None:
+                for candidate, score in title_index.search(book_title, limit=2):
+                    if candidate == book_title:
+                        continue
+                    logger.info(
+                        f"Trying indexed candidate '{candidate}' (score {score:.2f}) for '{book_title}'"
+                    )
+                    result = self.search_for_book(candidate)
+                    if result and result[0]:
+                        return result
+
             # Try to find books with similar titles first
             all_books = scroll_through_library_func()
 
@@ -164,6 +197,11 @@ class LibraryHandlerSearch:
             book_titles = [book.get("title", "") for book in all_books if book.get("title")]
             logger.info(f"Found {len(book_titles)} books in library: {book_titles}")
 
+            # Try the most similar titles first
+            all_books = sorted(
+                all_books, key=lambda book: title_similarity(book_title, book.get("title")), reverse=True
+            )
+
             # Try different matching strategies
             for book in all_books:
                 if not book.get("title"):
@@ -921,45 +959,95 @@ class LibraryHandlerSearch:
 
         return buttons, buttons_with_content
 
+    def _unique_content_desc_match(self, matching, book_title, kind):
+        """Return the only (element, content_desc) in matching, or None if there are none or several."""
+        if len(matching) == 1:
+            element, content_desc = matching[0]
+            logger.info(f"Found {kind} match in content-desc: '{content_desc}'")
+            return element, element, self._parse_book_info_from_content_desc(content_desc, book_title)
+        if matching:
+            logger.info(f"Ignoring {len(matching)} ambiguous {kind} matches for '{book_title}'")
+        return None
+
     def _match_book_by_exact_content_desc(self, buttons_with_content, book_title):
-        """Direct substring / _title_match on content-desc."""
+        """Normalized title equality, then a unique subtitle-less or substring match on content-desc."""
+        # An exact title beats one that merely contains it ("Dune" vs "Dune Messiah")
+        wanted = normalize_title(book_title)
         for element, content_desc in buttons_with_content:
-            if book_title.lower() in content_desc.lower():
+            if normalize_title(content_desc.split(",")[0]) == wanted:
                 logger.info(f"Found exact match in content-desc: '{content_desc}'")
                 book_info = self._parse_book_info_from_content_desc(content_desc, book_title)
                 return element, element, book_info
-        return None, None, None
 
-    def _match_book_by_relaxed_content_desc(self, buttons_with_content, book_title):
-        """Word-set & prefix matching."""
-        for element, content_desc in buttons_with_content:
-            # Word-level matching
-            book_parts = book_title.lower().split()
-            content_parts = content_desc.lower().split()
-            matches = set(book_parts) & set(content_parts)
+        wanted_base = normalize_title(strip_subtitle(book_title))
+        matching = [
+            (element, content_desc)
+            for element, content_desc in buttons_with_content
+            if normalize_title(strip_subtitle(content_desc.split(",")[0])) == wanted_base
+        ]
+        result = self._unique_content_desc_match(matching, book_title, "subtitle-less title")
+        if result:
+            return result
+
+        matching = [
+            (element, content_desc)
+            for element, content_desc in buttons_with_content
+            if book_title.lower() in content_desc.lower()
+        ]
+        return self._unique_content_desc_match(matching, book_title, "substring") or (None, None, None)
 
-            if len(matches) >= max(1, len(book_parts) // 2):
-                logger.info(f"Found word-level match: {matches}")
-                book_info = self._parse_book_info_from_content_desc(content_desc, book_title)
-                return element, element, book_info
+    def _match_book_by_relaxed_content_desc(self, buttons_with_content, book_title):
+        """Unique word-set matching, then a clear fuzzy winner, then unique word & prefix matching.
 
+        Runs after _match_book_by_exact_content_desc, so an exact or normalized title
+        always wins over anything found here.
+        """
+        wanted_words = _significant_words(book_title)
+        matching = [
+            (element, content_desc)
+            for element, content_desc in buttons_with_content
+            if wanted_words and _significant_words(content_desc.split(",")[0]) == wanted_words
+        ]
+        result = self._unique_content_desc_match(matching, book_title, "word-set")
+        if result:
+            return result
+
+        # Only take the most similar title when it is clearly ahead of the next one
+        scored = sorted(
+            (
+                (title_similarity(book_title, content_desc.split(",")[0]), i)
+                for i, (_, content_desc) in enumerate(buttons_with_content)
+            ),
+            reverse=True,
+        )
+        if scored and scored[0][0] >= FUZZY_MATCH_THRESHOLD:
+            best_score, best = scored[0]
+            runner_up = scored[1][0] if len(scored) > 1 else 0.0
+            if best_score - runner_up >= FUZZY_MATCH_MARGIN:
+                logger.info(f"Fuzzy match scored {best_score:.2f}, next best {runner_up:.2f}")
+                return self._unique_content_desc_match([buttons_with_content[best]], book_title, "fuzzy")
+            logger.info(f"Fuzzy match score {best_score:.2f} is too close to {runner_up:.2f}, not guessing")
+
+        book_parts = normalize_title(book_title).split()
+
+        def loose_match(content_desc):
+            content_parts = normalize_title(content_desc).split()
+            # Word-level matching
+            if len(set(book_parts) & set(content_parts)) >= max(1, len(book_parts) // 2):
+                return True
             # Prefix matching
-            strong_match = True
-            for book_word in book_parts:
-                if len(book_word) < 3:
-                    continue
-
-                found = any(book_word[:3] == cw[:3] for cw in content_parts if len(cw) >= 3)
-                if not found:
-                    strong_match = False
-                    break
-
-            if strong_match:
-                logger.info(f"Found prefix match: '{content_desc}'")
-                book_info = self._parse_book_info_from_content_desc(content_desc, book_title)
-                return element, element, book_info
+            return all(
+                any(book_word[:3] == cw[:3] for cw in content_parts if len(cw) >= 3)
+                for book_word in book_parts
+                if len(book_word) >= 3
+            )
 
-        return None, None, None
+        matching = [
+            (element, content_desc)
+            for element, content_desc in buttons_with_content
+            if loose_match(content_desc)
+        ]
+        return self._unique_content_desc_match(matching, book_title, "word/prefix") or (None, None, None)
 
     def _match_book_in_generic_buttons(self, buttons, book_title):
         """Checks any button even w/o content-desc."""
@@ -0,0 +1,255 @@
+"""
+Adaptive scrolling for library enumeration.
+
+The legacy library scan queries every book container element one attribute at a
+time, scrolls a fixed 80%->20% of the screen, and only gives up after several
+screens with nothing new. This module reads a whole library screen from a single
+hierarchy dump, sizes each scroll from the parsed row bounds so that exactly one
+row of overlap is kept between screens, and detects the end of the list from the
+hierarchy itself.
+
+Usage:
+    engine = AdaptiveLibraryScroller(SmartScroller(driver))
+    screen = parse_library_screen(driver.page_source)
+    for row in engine.fully_visible_rows(screen):
+        ...
+    if not engine.is_end_of_list(previous_screen, screen):
+        engine.scroll(screen)
+"""
+
+import logging
+import re
+import statistics
+import time
+import xml.etree.ElementTree as ET
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+RECYCLER_VIEW_ID = "com.amazon.kindle:id/recycler_view"
+ROW_FIELD_IDS = {
+    "com.amazon.kindle:id/lib_book_row_title": "title",
+    "com.amazon.kindle:id/lib_book_row_author": "author",
+    "com.amazon.kindle:id/lib_book_row_reading_progress": "progress",
+    "com.amazon.kindle:id/lib_book_row_file_size": "size",
+}
+
+# Rows of the previous screen kept visible after each scroll
+OVERLAP_ROWS = 1
+
+# Pixels kept clear of the list edges when placing the scroll gesture
+EDGE_MARGIN = 12
+
+_BOUNDS_PATTERN = re.compile(r"\[(-?\d+),(-?\d+)\]\[(-?\d+),(-?\d+)\]")
+
+
+def parse_bounds(value: Optional[str]) -> Optional[Tuple[int, int, int, int]]:
+    """Parse an Android bounds attribute like "[0,352][1079,2177]" into (left, top, right, bottom)."""
+    if not value:
+        return None
+    match = _BOUNDS_PATTERN.match(value)
+    if not match:
+        return None
+    return tuple(int(part) for part in match.groups())
+
+
+def parse_library_screen(page_source: str) -> Optional[Dict]:
+    """
+    Parse the visible library list rows from a hierarchy dump.
+
+    Args:
+        page_source: The UiAutomator XML page source
+
+    Returns:
+        dict or None: {"list_top", "list_bottom", "center_x", "rows"} where each row has
+        title, author, progress, size, content_desc, downloaded, top, bottom and index
+        (the 1-based position among the list children with a content-desc, matching the
+        legacy container XPath). None if the page has no library list.
+    """
+    if not page_source:
+        return None
+
+    try:
+        root = ET.fromstring(page_source.encode("utf-8"))
+    except ET.ParseError as e:
+        logger.debug(f"Could not parse library page source: {e}")
+        return None
+
+    recycler = next((node for node in root.iter() if node.get("resource-id") == RECYCLER_VIEW_ID), None)
+    if recycler is None:
+        return None
+
+    list_bounds = parse_bounds(recycler.get("bounds"))
+    if not list_bounds:
+        return None
+
+    rows = []
+    index = 0
+    for child in recycler:
+        if "content-desc" not in child.attrib:
+            continue
+        index += 1
+
+        bounds = parse_bounds(child.get("bounds"))
+        if not bounds:
+            continue
+
+        row = {"title": None, "author": None, "progress": None, "size": None}
+        for node in child.iter():
+            field = ROW_FIELD_IDS.get(node.get("resource-id"))
+            if field and not row[field] and node.get("text"):
+                row[field] = node.get("text")
+
+        # Grid covers and other non-book children have no title row
+        if not row["title"]:
+            continue
+
+        content_desc = child.get("content-desc") or ""
+        row.update(
+            {
+                "content_desc": content_desc,
+                "downloaded": "Book not downloaded" not in content_desc if content_desc else None,
+                "top": bounds[1],
+                "bottom": bounds[3],
+                "index": index,
+            }
+        )
+        rows.append(row)
+
+    return {
+        "list_top": list_bounds[1],
+        "list_bottom": list_bounds[3],
+        "center_x": (list_bounds[0] + list_bounds[2]) // 2,
+        "rows": rows,
+    }
+
+
+class AdaptiveLibraryScroller:
+    """
+    Sizes library scrolls from parsed row bounds.
+
+    Each scroll moves the last fully visible row to the top of the list, so the next
+    screen overlaps the previous one by exactly one row. The distance actually
+    travelled is measured on the next screen and used to correct later requests,
+    since touch slop and deceleration make gestures fall short of their nominal length.
+    """
+
+    def __init__(self, scroller, duration_ms: int = 1000):
+        self.scroller = scroller
+        self.duration_ms = duration_ms
+        self.efficiency = 1.0
+        self._pending = None  # (anchor_title, anchor_top, requested_distance)
+
+    @staticmethod
+    def fully_visible_rows(screen: Dict) -> List[Dict]:
+        """Return the rows that are entirely inside the list viewport."""
+        return [
+            row
+            for row in screen["rows"]
+            if row["top"] >= screen["list_top"] and row["bottom"] <= screen["list_bottom"]
+        ]
+
+    @staticmethod
+    def row_height(screen: Dict) -> int:
+        """Return the median row height on a screen."""
+        heights = [row["bottom"] - row["top"] for row in screen["rows"] if row["bottom"] > row["top"]]
+        return int(statistics.median(heights)) if heights else 0
+
+    def measure(self, previous: Optional[Dict], screen: Dict) -> int:
+        """
+        Measure how far the last scroll moved the list and how many rows carried over.
+
+        Updates the gesture efficiency estimate from the anchor row's displacement.
+
+        Returns:
+            int: Number of rows visible on both screens
+        """
+        if not previous:
+            return 0
+
+        previous_titles = {row["title"] for row in previous["rows"]}
+        overlap = sum(1 for row in screen["rows"] if row["title"] in previous_titles)
+
+        if self._pending:
+            anchor_title, anchor_top, requested = self._pending
+            self._pending = None
+            anchor = next((row for row in screen["rows"] if row["title"] == anchor_title), None)
+            if anchor and requested > 0:
+                travelled = anchor_top - anchor["top"]
+                if travelled > 0:
+                    observed = min(1.5, max(0.3, travelled / requested))
+                    self.efficiency = 0.5 * self.efficiency + 0.5 * observed
+                    logger.debug(
+                        f"Scroll travelled {travelled}px of {requested}px requested, "
+                        f"efficiency now {self.efficiency:.2f}"
+                    )
+            elif not anchor:
+                logger.warning(f"Overlap row '{anchor_title}' not on the new screen, scroll overshot")
+                self.efficiency = min(1.5, self.efficiency * 1.15)
+
+        return overlap
+
+    def is_end_of_list(self, previous: Optional[Dict], screen: Dict) -> bool:
+        """
+        Detect the end of the library list from the hierarchy.
+
+        The list has ended when a scroll left every row exactly where it was, or when
+        there is blank space below the last row.
+        """
+        if not screen["rows"]:
+            return previous is not None
+
+        if previous and previous["rows"]:
+            before = [(row["title"], row["top"]) for row in previous["rows"]]
+            after = [(row["title"], row["top"]) for row in screen["rows"]]
+            if before == after:
+                logger.info("Library list did not move after scrolling, reached the end")
+                return True
+
+        last = screen["rows"][-1]
+        gap = screen["list_bottom"] - last["bottom"]
+        if gap > self.row_height(screen) // 2:
+            logger.info(f"Blank space of {gap}px below the last row, reached the end of the library")
+            return True
+
+        return False
+
+    def plan(self, screen: Dict) -> Optional[Tuple[int, int, Dict]]:
+        """
+        Plan a scroll that keeps OVERLAP_ROWS rows of overlap with the current screen.
+
+        Returns:
+            tuple or None: (start_y, end_y, anchor_row), or None if the screen has
+            too few fully visible rows to plan from
+        """
+        visible = self.fully_visible_rows(screen)
+        if len(visible) <= OVERLAP_ROWS:
+            return None
+
+        anchor = visible[-OVERLAP_ROWS]
+        desired = anchor["top"] - screen["list_top"]
+        if desired <= 0:
+            return None
+
+        requested = int(desired / self.efficiency)
+        start_y = screen["list_bottom"] - EDGE_MARGIN
+        end_y = max(start_y - requested, EDGE_MARGIN)
+        return start_y, end_y, anchor
+
+    def scroll(self, screen: Dict) -> bool:
+        """
+        Scroll the list as far as possible while keeping one row of overlap.
+
+        Returns:
+            bool: True if a planned scroll was performed, False if the caller should
+            fall back to a default page scroll
+        """
+        planned = self.plan(screen)
+        if not planned:
+            return False
+
+        start_y, end_y, anchor = planned
+        self._pending = (anchor["title"], anchor["top"], start_y - end_y)
+        self.scroller._perform_hook_scroll(screen["center_x"], start_y, end_y, self.duration_ms)
+        time.sleep(0.3)
+        return True
@@ -17,13 +17,29 @@ from typing import Dict, Optional, Tuple, Union
 from flask import request
 
 from handlers.about_book_popover_handler import AboutBookPopoverHandler
-from handlers.reader_page_handler import process_screenshot_response
+from handlers.page_jump_handler import JUMP_MIN_TURNS, PageJumpHandler
+from handlers.reader_page_handler import (
+    MAIN_TEXT_REGION,
+    PAGE_INDICATOR_REGION,
+    cycle_page_indicator_if_needed,
+    parse_page_indicators,
+    process_screenshot_response,
+)
 from server.middleware.response_handler import get_image_path
+from server.utils.footer_recognizer import read_page_indicator
 from server.utils.ocr_utils import KindleOCR, is_base64_requested, is_ocr_requested
+from server.utils.page_text_cache import get_page_text_cache
+from server.utils.read_ahead import PAGE_SETTLE_SECONDS, get_read_ahead_manager
+from server.utils.screenshot_utils import capture_screen, image_to_bytes
 from views.core.app_state import AppState
 
 logger = logging.getLogger(__name__)
 
+# Turn pages with back-to-back swipes and verify the position once at the end
+BATCH_NAVIGATION = os.getenv("NAVIGATION_BATCH", "true").lower() == "true"
+# Navigations shorter than this many page turns confirm every turn
+BATCH_MIN_PAGES = int(os.getenv("NAVIGATION_BATCH_MIN_PAGES", 3))
+
 
 class NavigationResourceHandler:
     """Handler for navigation-related requests in the Kindle Automator."""
@@ -37,6 +53,8 @@ class NavigationResourceHandler:
         """
         self.automator = automator
         self.screenshots_dir = screenshots_dir
+        # Page turns seen to change the page, counted by _navigate_pages
+        self.verified_turns = 0
         os.makedirs(self.screenshots_dir, exist_ok=True)
 
     def navigate(
@@ -80,6 +98,11 @@ class NavigationResourceHandler:
         preview_direction_forward = preview_count >= 0
         abs_preview_count = abs(preview_count)
 
+        # Pages an interrupted read-ahead left the device ahead of the user's position
+        profile = self.automator.profile_manager.get_current_profile()
+        sindarin_email = profile.get("email") if profile else None
+        device_offset = get_read_ahead_manager().take_offset(sindarin_email) if sindarin_email else 0
+
         logger.info(
             f"Navigation request: navigate={navigate_count}, preview={preview_count}, "
             f"direction={'forward' if direction_forward else 'backward'}, "
@@ -121,6 +144,9 @@ class NavigationResourceHandler:
         if not self.automator.state_machine.is_reading_view():
             logger.warning("Not in reading view - checking if we need to reopen book")
 
+            # Reopening restores the position separately, so any read-ahead offset no longer applies
+            device_offset = 0
+
             # If book_title is provided, try to reopen the book
             if book_title:
                 logger.info(f"Book title provided: {book_title}, attempting to reopen book")
@@ -276,6 +302,12 @@ class NavigationResourceHandler:
                 logger.error("Not in reading view and no book_title provided to reopen", exc_info=True)
                 return {"error": "Not in reading view. Please provide title parameter to reopen book."}, 400
 
+        # Only plain navigation absorbs the read-ahead offset; other requests start from the user's page
+        if device_offset and (navigate_count == 0 or preview_count != 0):
+            if not self._navigate_pages(forward=False, count=device_offset):
+                return {"error": "Failed to return to reading position after read-ahead"}, 500
+            device_offset = 0
+
         # If navigate_count is 0 and no preview is requested, just return current page info
         if navigate_count == 0 and preview_count == 0:
             # Get current page info without navigation
@@ -323,6 +355,11 @@ class NavigationResourceHandler:
                         if updated_progress:
                             screenshot_data["progress"] = updated_progress
 
+                if perform_ocr:
+                    self._remember_page_text(
+                        0, screenshot_data.get("ocr_text"), screenshot_data.get("progress")
+                    )
+
                 # If only OCR was requested (not screenshot), only include OCR text in response
                 if perform_ocr and not include_screenshot:
                     # Only include OCR-related fields
@@ -379,12 +416,26 @@ class NavigationResourceHandler:
             else:
                 return self._preview_pages_backward(abs_preview_count, show_placemark)
 
-        # First handle regular navigation
-        success = self._navigate_pages(direction_forward, abs_navigate_count)
+        # First handle regular navigation, less any pages read-ahead already turned
+        if device_offset:
+            logger.info(
+                f"Navigating {navigate_count - device_offset} pages after read-ahead of {device_offset}"
+            )
+        success = self._navigate_by(navigate_count - device_offset)
 
         if not success:
             return {"error": "Navigation failed"}, 500
 
+        # Pages OCR'd before, by read-ahead or an earlier visit, only need the page turn
+        if perform_ocr and not include_screenshot and preview_count == 0 and sindarin_email:
+            cached_response = self._response_from_page_cache(sindarin_email, navigate_count)
+            if cached_response:
+                cached_response["verified_turns"] = self.verified_turns
+                if book_session_key_after_reopen:
+                    cached_response["book_session_key"] = book_session_key_after_reopen
+                    cached_response["book_was_reopened"] = True
+                return cached_response, 200
+
         # After navigation, capture page info at the user's actual position (not preview position)
         # This is only needed when we're doing a preview, to get the correct page number
         navigation_page_info = None
@@ -396,10 +447,12 @@ class NavigationResourceHandler:
         preview_ocr_text = None
         if success and preview_count != 0:
             if preview_direction_forward:
-                preview_success, preview_ocr_text, _ = self._preview_multiple_pages_forward(abs_preview_count)
+                preview_success, preview_ocr_text, _ = self._preview_multiple_pages_forward(
+                    abs_preview_count, position_offset=navigate_count
+                )
             else:
                 preview_success, preview_ocr_text, _ = self._preview_multiple_pages_backward(
-                    abs_preview_count
+                    abs_preview_count, position_offset=navigate_count
                 )
 
             if preview_success and preview_ocr_text:
@@ -431,6 +484,7 @@ class NavigationResourceHandler:
         response_data = {
             "success": True,
             "progress": progress,
+            "verified_turns": self.verified_turns,
         }
 
         # Handle screenshot and/or OCR if requested
@@ -469,6 +523,11 @@ class NavigationResourceHandler:
                     if updated_progress:
                         screenshot_data["progress"] = updated_progress
 
+            if perform_ocr:
+                self._remember_page_text(
+                    navigate_count, screenshot_data.get("ocr_text"), screenshot_data.get("progress")
+                )
+
             # If only OCR was requested (not screenshot), only include OCR text in response
             if perform_ocr and not include_screenshot:
                 # Only include OCR-related fields
@@ -597,29 +656,317 @@ class NavigationResourceHandler:
 
         logger.info(f"Navigating {count} pages {'forward' if forward else 'backward'}")
 
+        reader_handler = self.automator.state_machine.reader_handler
         success = True
+        verified = 0
         for i in range(count):
             if forward:
-                page_success = self.automator.state_machine.reader_handler.turn_page_forward()
+                page_success = reader_handler.turn_page_forward()
             else:
-                page_success = self.automator.state_machine.reader_handler.turn_page_backward()
+                page_success = reader_handler.turn_page_backward()
 
             if not page_success:
                 logger.error(f"Failed to navigate on page {i+1} of {count}", exc_info=True)
                 success = False
                 break
 
-            # Add a small delay between page turns
-            if i < count - 1:
+            # A turn seen to settle needs no delay before the next one
+            if reader_handler.last_turn_verified:
+                verified += 1
+            elif i < count - 1:
                 time.sleep(0.5)
 
+        self.verified_turns += verified
+        logger.info(f"{verified} of {count} page turns verified by the page changing")
         return success
 
-    def _preview_multiple_pages_forward(self, count: int) -> Tuple[bool, Optional[str], Optional[dict]]:
+    def _navigate_by(self, turns: int) -> bool:
+        """Navigate a signed number of pages, jumping with the page scrubber when it is far.
+
+        Args:
+            turns: Pages to navigate, negative for backward
+
+        Returns:
+            bool: True if navigation was successful, False otherwise.
+        """
+        if abs(turns) >= JUMP_MIN_TURNS:
+            page = self._page_position()
+            jump_handler = PageJumpHandler(self.automator)
+            jump_plan = jump_handler.plan(page[0], page[1], turns) if page else None
+            if jump_plan:
+                remaining = jump_handler.jump(turns, *jump_plan)
+                if jump_handler.moved:
+                    # The jump lands within an estimate of the target, so cached positions of
+                    # this book may no longer be the pages the device shows there
+                    get_page_text_cache().forget(page[0], page[1])
+                    if remaining is None:
+                        logger.warning(f"Page jump of {turns} pages landed on an unreadable position")
+                        return False
+                if remaining is not None:
+                    turns = remaining
+
+        if BATCH_NAVIGATION and abs(turns) >= BATCH_MIN_PAGES:
+            success = self._navigate_pages_batched(turns >= 0, abs(turns))
+            if success is not None:
+                return success
+
+        return self._navigate_pages(turns >= 0, abs(turns))
+
+    def _navigate_pages_batched(self, forward: bool, count: int) -> Optional[bool]:
+        """Navigate multiple pages with back-to-back swipes, verifying the position once at the end.
+
+        Only books whose footer shows page numbers are batched, since their page
+        difference converts to turns reliably. The page indicator is read before and after
+        the swipes and the difference is converted to page turns with the estimate the
+        page jump uses. Swipes the reader missed, or extra ones, are made up with confirmed
+        page turns. A landing further off than the swipes could have moved is read again,
+        and if it still is, the position is reported as unverified.
+
+        Args:
+            forward: True to navigate forward, False to navigate backward
+            count: Number of pages to navigate.
+
+        Returns:
+            bool or None: Whether navigation succeeded, or None if the position could not be
+            verified and nothing moved, so the caller should turn pages one at a time
+        """
+        page = self._page_position()
+        estimate = PageJumpHandler(self.automator).units_per_turn(page[0], page[1]) if page else None
+        if not estimate or estimate[0] != "current_page":
+            logger.info(f"No page number estimate to verify a batch of {count} pages, turning one at a time")
+            return None
+        unit, units_per_turn = estimate
+
+        self._handle_last_read_page_dialog(click_yes_to_navigate=True)
+        start = self._read_page_indicator().get(unit)
+        if not start:
+            logger.info(f"Could not read {unit} before a batch of {count} pages, turning one at a time")
+            return None
+
+        reader_handler = self.automator.state_machine.reader_handler
+        if not reader_handler.swipe_pages(1 if forward else -1, count):
+            return False
+
+        shortfall = None
+        for _ in range(2):
+            time.sleep(PAGE_SETTLE_SECONDS)
+            landed = self._read_page_indicator().get(unit)
+            if not landed:
+                # The swipes already moved the book, so turning the pages again would overshoot
+                logger.warning(
+                    f"Could not read {unit} after a batch of {count} pages, position is unverified"
+                )
+                return False
+
+            turned = round((landed - start) / units_per_turn) * (1 if forward else -1)
+            logger.info(
+                f"Batch of {count} page turns moved {unit} from {start} to {landed}, about {turned} turns"
+            )
+            if abs(count - turned) <= count:
+                shortfall = count - turned
+                break
+            # Further off than the swipes could have moved, so the indicator was misread
+            logger.warning(f"Implausible move of {turned} turns after a batch of {count}, reading again")
+
+        if shortfall is None:
+            logger.warning(
+                f"Page indicator misread twice after a batch of {count} pages, position is unverified"
+            )
+            return False
+        if shortfall == 0:
+            return True
+        logger.info(f"Correcting batch navigation by {shortfall} page turns")
+        return self._navigate_pages(forward == (shortfall > 0), abs(shortfall))
+
+    def _read_page_indicator(self) -> Dict:
+        """Read the page indicator on screen.
+
+        Returns:
+            dict: Parsed page indicator values, empty if it could not be read
+        """
+        page_indicator_img = capture_screen(self.automator.driver, region=PAGE_INDICATOR_REGION)
+        page_text = (
+            read_page_indicator(image_to_bytes(page_indicator_img))[0]
+            if page_indicator_img is not None
+            else None
+        )
+        return parse_page_indicators(page_text)
+
+    def _page_position(self, offset: int = 0) -> Optional[Tuple[str, str, int]]:
+        """Find the page text cache key of the page a number of pages from the tracked position.
+
+        Args:
+            offset: Pages from the user's server-tracked position, negative for earlier pages
+
+        Returns:
+            tuple or None: (email, book, position), or None without a user or open book
+        """
+        from server.core.automation_server import AutomationServer
+
+        profile = self.automator.profile_manager.get_current_profile()
+        sindarin_email = profile.get("email") if profile else None
+        if not sindarin_email:
+            return None
+        server = AutomationServer.get_instance()
+        book = server.get_current_book(sindarin_email)
+        if not book:
+            return None
+        return sindarin_email, book, server.get_position(sindarin_email, book) + offset
+
+    def _remember_page_text(
+        self, offset: int, text: Optional[str], progress: Optional[Dict] = None, source: str = "navigate"
+    ) -> None:
+        """Store OCR text of the page a number of pages from the tracked position in the page text cache.
+
+        Args:
+            offset: Pages from the user's server-tracked position
+            text: The page's main text OCR
+            progress: Progress read from the page's own indicator, if any
+            source: What captured the page, for logging
+        """
+        if not text:
+            return
+        try:
+            page = self._page_position(offset)
+            if page:
+                get_page_text_cache().put(*page, text, progress, source=source)
+        except Exception as e:
+            logger.warning(f"Failed to cache page text: {e}")
+
+    @staticmethod
+    def _compare_progress(cached_progress: Dict, live_progress: Dict) -> Optional[bool]:
+        """Compare a cached page's indicator values with the ones on screen.
+
+        Args:
+            cached_progress: Progress captured with the cached page
+            live_progress: Progress read from the screen
+
+        Returns:
+            bool or None: False if any value differs, True if at least one matches,
+            None if there is nothing to compare
+        """
+        matched = None
+        for key in ("current_page", "current_location"):
+            if cached_progress.get(key) and live_progress.get(key):
+                if cached_progress[key] != live_progress[key]:
+                    return False
+                matched = True
+        return matched
+
+    def _cached_preview_text(self, offset: int, position_offset: int = 0) -> Optional[str]:
+        """Look up the text of a previewed page in the page text cache.
+
+        The cache is keyed by tracked position, so a hit is only served once the page on
+        screen is confirmed to be where the cache thinks it is: the cached record of the
+        current page must match the live page indicator, and the previewed page's own
+        indicator must lie on the right side of it.
+
+        Args:
+            offset: Pages from the user's server-tracked position
+            position_offset: Pages the device is from the user's tracked position
+
+        Returns:
+            str or None: The cached OCR text, or None on a miss
+        """
+        try:
+            page = self._page_position(offset)
+            current = self._page_position(position_offset)
+        except Exception as e:
+            logger.warning(f"Failed to look up cached page text: {e}")
+            return None
+        if not page or not current:
+            return None
+        cache = get_page_text_cache()
+        entry = cache.get(*page)
+        if not entry:
+            return None
+
+        anchor = cache.get(*current)
+        live_progress = self._read_page_indicator()
+        verified = self._compare_progress(anchor["progress"], live_progress) if anchor else None
+        if verified is False:
+            logger.warning(
+                f"Cached page for position {current[2]} shows {anchor['progress']} but the device shows "
+                f"{live_progress}, discarding it"
+            )
+            cache.discard(*current)
+        if not verified:
+            logger.info(
+                f"Could not confirm the device is at position {current[2]}, previewing from the device"
+            )
+            return None
+
+        forward = offset > position_offset
+        for key in ("current_page", "current_location"):
+            cached_value, live_value = entry["progress"].get(key), live_progress.get(key)
+            if (
+                cached_value
+                and live_value
+                and (cached_value < live_value if forward else cached_value > live_value)
+            ):
+                logger.warning(
+                    f"Cached page for position {page[2]} shows {key}={cached_value}, on the wrong side of "
+                    f"{live_value} on screen, discarding it"
+                )
+                cache.discard(*page)
+                return None
+
+        logger.info(f"Previewed position {page[2]} of {page[1]} from the page text cache ({entry['source']})")
+        return entry["text"]
+
+    def _response_from_page_cache(self, sindarin_email: str, navigate_count: int) -> Optional[Dict]:
+        """Build the navigation response from the page text cache, if the new page was OCR'd before.
+
+        The cached page is only used when the page indicator on screen agrees with the one
+        captured with it, so drift between the tracked position and the device is a miss,
+        and so is a page indicator that cannot be read.
+
+        Args:
+            sindarin_email: The user's email address
+            navigate_count: Pages navigated, to find the new position
+
+        Returns:
+            dict or None: Response data with the cached OCR text, or None on a miss
+        """
+        page = self._page_position(navigate_count)
+        if not page:
+            return None
+        _, book, position = page
+        cache = get_page_text_cache()
+        entry = cache.get(sindarin_email, book, position)
+        if not entry:
+            return None
+
+        # Check the page on screen against the cached page using only the page indicator
+        time.sleep(PAGE_SETTLE_SECONDS)
+        live_progress = self._read_page_indicator()
+        cached_progress = entry["progress"]
+        matches = self._compare_progress(cached_progress, live_progress)
+        if matches is False:
+            logger.warning(
+                f"Cached page for position {position} shows {cached_progress} but the device "
+                f"shows {live_progress}, discarding it"
+            )
+            cache.discard(sindarin_email, book, position)
+            return None
+        if matches is None:
+            logger.info(f"Could not confirm the cached page for position {position} on screen, not using it")
+            return None
+
+        logger.info(f"Answered position {position} of {book} from the page text cache ({entry['source']})")
+        return {"success": True, "progress": live_progress, "ocr_text": entry["text"]}
+
+    def _preview_multiple_pages_forward(
+        self, count: int, position_offset: int = 0
+    ) -> Tuple[bool, Optional[str], Optional[dict]]:
         """Preview multiple pages forward, then return to original position.
 
+        Pages already in the page text cache are answered from it without turning any pages.
+
         Args:
             count: Number of pages to preview forward.
+            position_offset: Pages the device is from the user's tracked position, when
+                previewing after a navigation that has not been recorded yet.
 
         Returns:
             Tuple of (success, ocr_text, page_info)
@@ -627,6 +974,10 @@ class NavigationResourceHandler:
         if count <= 0:
             return False, None, None
 
+        cached_text = self._cached_preview_text(position_offset + count, position_offset)
+        if cached_text:
+            return True, cached_text, None
+
         logger.info(f"Previewing {count} pages forward")
 
         # Navigate forward the specified number of pages
@@ -636,7 +987,10 @@ class NavigationResourceHandler:
             return False, None, None
 
         # Capture OCR from the preview page (text only, no page info)
-        ocr_text, error_msg = self._extract_text_only_for_preview(f"preview_forward_{count}")
+        ocr_text, error_msg = self._extract_text_only_for_preview(
+            f"preview_forward_{count}", self._ocr_cache_context(position_offset + count)
+        )
+        self._remember_page_text(position_offset + count, ocr_text, source="preview")
 
         # Now navigate back to original position
         backward_success = self._navigate_pages(forward=False, count=count)
@@ -652,11 +1006,17 @@ class NavigationResourceHandler:
             logger.error(f"Failed to extract OCR text from preview: {error_msg}", exc_info=True)
             return False, None, None
 
-    def _preview_multiple_pages_backward(self, count: int) -> Tuple[bool, Optional[str], Optional[dict]]:
+    def _preview_multiple_pages_backward(
+        self, count: int, position_offset: int = 0
+    ) -> Tuple[bool, Optional[str], Optional[dict]]:
         """Preview multiple pages backward, then return to original position.
 
+        Pages already in the page text cache are answered from it without turning any pages.
+
         Args:
             count: Number of pages to preview backward.
+            position_offset: Pages the device is from the user's tracked position, when
+                previewing after a navigation that has not been recorded yet.
 
         Returns:
             Tuple of (success, ocr_text, page_info)
@@ -664,6 +1024,10 @@ class NavigationResourceHandler:
         if count <= 0:
             return False, None, None
 
+        cached_text = self._cached_preview_text(position_offset - count, position_offset)
+        if cached_text:
+            return True, cached_text, None
+
         logger.info(f"Previewing {count} pages backward")
 
         # Navigate backward the specified number of pages
@@ -673,7 +1037,10 @@ class NavigationResourceHandler:
             return False, None, None
 
         # Capture OCR from the preview page (text only, no page info)
-        ocr_text, error_msg = self._extract_text_only_for_preview(f"preview_backward_{count}")
+        ocr_text, error_msg = self._extract_text_only_for_preview(
+            f"preview_backward_{count}", self._ocr_cache_context(position_offset - count)
+        )
+        self._remember_page_text(position_offset - count, ocr_text, source="preview")
 
         # Now navigate forward to original position
         forward_success = self._navigate_pages(forward=True, count=count)
@@ -755,13 +1122,21 @@ class NavigationResourceHandler:
         else:
             return {"error": f"Failed to preview {count} pages backward"}, 500
 
-    def _extract_text_only_for_preview(self, prefix: str) -> Tuple[Optional[str], Optional[str]]:
-        """Take a screenshot and extract ONLY the main text (top 94%) for preview.
+    def _ocr_cache_context(self, offset: int) -> Optional[Dict]:
+        """Describe the page a number of pages from the tracked position for the OCR cache."""
+        page = self._page_position(offset)
+        return {"user": page[0], "book": page[1], "position": page[2]} if page else None
+
+    def _extract_text_only_for_preview(
+        self, prefix: str, cache_context: Optional[Dict] = None
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Capture the screen and extract ONLY the main text (top 94%) for preview.
 
         Used when previewing pages - we only want text content, not page numbers.
 
         Args:
-            prefix: Prefix for the screenshot filename
+            prefix: Label of the capture for logging
+            cache_context: Optional OCR cache context of the previewed page
 
         Returns:
             tuple: (ocr_text, error_message) - OCR text if successful, error message if failed
@@ -770,134 +1145,45 @@ class NavigationResourceHandler:
             # Give the page a moment to render fully
             time.sleep(0.5)
 
-            # Get the user email for unique screenshot naming
-            profile = self.automator.profile_manager.get_current_profile()
-            sindarin_email = profile.get("email") if profile else None
-            if sindarin_email:
-                # Sanitize email for filename
-                email_safe = sindarin_email.replace("@", "_").replace(".", "_")
-                screenshot_id = f"{email_safe}_{prefix}_{int(time.time())}"
-            else:
-                screenshot_id = f"{prefix}_{int(time.time())}"
-
-            # Take screenshot
-            screenshot_path = os.path.join(self.screenshots_dir, f"{screenshot_id}.png")
-            self.automator.driver.save_screenshot(screenshot_path)
-
-            # Extract ONLY main text for preview (no page indicators)
-            ocr_text = None
-            error_msg = None
-
-            try:
-                with open(screenshot_path, "rb") as img_file:
-                    image_data = img_file.read()
-
-                # Import PIL to crop just the main text area
-                from io import BytesIO
-
-                from PIL import Image
-
-                # Load the image
-                img = Image.open(BytesIO(image_data))
-                width, height = img.size
-
-                # Crop main text area (top 94%, excluding page numbers which are in bottom 6%)
-                main_text_box = (
-                    0,  # Left edge
-                    0,  # Top edge
-                    width,  # Right edge
-                    int(height * 0.94),  # Stop at 94% from top (excludes bottom 6% where page numbers are)
-                )
-                main_text_img = img.crop(main_text_box)
-
-                # Convert to bytes for OCR
-                main_text_bytes = BytesIO()
-                main_text_img.save(main_text_bytes, format="PNG")
-                main_text_data = main_text_bytes.getvalue()
-
-                # OCR just the main text
-                ocr_text, ocr_error = KindleOCR.process_ocr(main_text_data)
-
-                if ocr_error:
-                    error_msg = ocr_error
-
-                # Delete the screenshot file after processing
-                try:
-                    os.remove(screenshot_path)
-                    logger.info(f"Deleted screenshot after text OCR processing: {screenshot_path}")
-                except Exception as del_e:
-                    logger.error(f"Failed to delete screenshot {screenshot_path}: {del_e}", exc_info=True)
-
-            except Exception as e:
-                logger.error(f"Error processing OCR: {e}", exc_info=True)
-                error_msg = str(e)
+            # Capture ONLY the main text area in memory (no page indicators)
+            main_text_img = capture_screen(self.automator.driver, region=MAIN_TEXT_REGION)
+            if main_text_img is None:
+                return None, f"Failed to capture screen for {prefix}"
 
-            # Return OCR text only (no page info)
-            return ocr_text, error_msg
+            # OCR just the main text
+            return KindleOCR.process_ocr(image_to_bytes(main_text_img), cache_context=cache_context)
 
         except Exception as e:
-            logger.error(f"Error taking screenshot for text OCR: {e}", exc_info=True)
+            logger.error(f"Error capturing screen for text OCR: {e}", exc_info=True)
             return None, str(e)
 
     def _extract_page_info_only(self, prefix="page_only"):
         """Extract only page indicator information from current screen position.
 
         Args:
-            prefix: Prefix for screenshot naming.
+            prefix: Label of the capture for logging.
 
         Returns:
             dict: Page progress information (current_page, total_pages, etc.) or None if failed
         """
         try:
-            # Take a screenshot
-            screenshot_id = f"{prefix}_{int(time.time())}"
-            screenshot_path = os.path.join(self.screenshots_dir, f"{screenshot_id}.png")
-            self.automator.driver.save_screenshot(screenshot_path)
-
-            # Read the screenshot
-            with open(screenshot_path, "rb") as img_file:
-                image_data = img_file.read()
-
-            # Import functions from reader_page_handler
-            from handlers.reader_page_handler import (
-                cycle_page_indicator_if_needed,
-                extract_page_indicator_region,
-            )
+            # Capture only the page indicator region
+            page_indicator_img = capture_screen(self.automator.driver, region=PAGE_INDICATOR_REGION)
+            if page_indicator_img is None:
+                logger.warning(f"Failed to capture page indicator for {prefix}")
+                return None
 
-            # Extract only the page indicator region
-            page_indicator_bytes = extract_page_indicator_region(image_data)
+            # Read just the page indicator region, locally when the footer font is known
+            page_text, page_error = read_page_indicator(image_to_bytes(page_indicator_img))
 
-            if page_indicator_bytes:
-                # OCR just the page indicator region
-                page_text, page_error = KindleOCR.process_ocr(page_indicator_bytes, clean_ui_elements=False)
+            if page_text:
+                logger.info(f"Extracted page indicator at navigation position: '{page_text}'")
 
-                if page_text:
-                    # Clean up the text
-                    page_text = " ".join(page_text.split())
-                    logger.info(f"Extracted page indicator at navigation position: '{page_text}'")
-
-                    # Parse and potentially cycle the page indicator
-                    # Pass the reader_handler instead of driver
-                    page_info = cycle_page_indicator_if_needed(
-                        self.automator.state_machine.reader_handler, page_text
-                    )
-
-                    # Clean up screenshot
-                    try:
-                        os.remove(screenshot_path)
-                    except Exception:
-                        pass
-
-                    return page_info
-                else:
-                    logger.warning(f"Failed to OCR page indicator: {page_error}")
-
-            # Clean up screenshot on failure
-            try:
-                os.remove(screenshot_path)
-            except Exception:
-                pass
+                # Parse and potentially cycle the page indicator
+                # Pass the reader_handler instead of driver
+                return cycle_page_indicator_if_needed(self.automator.state_machine.reader_handler, page_text)
 
+            logger.warning(f"Failed to OCR page indicator: {page_error}")
             return None
 
         except Exception as e:
@@ -924,6 +1210,7 @@ class NavigationResourceHandler:
             "title": None,  # Book title for fallback if not in reading view
             "navigate_to": None,  # Absolute navigation position
             "preview_to": None,  # Absolute preview position
+            "read_ahead": None,  # Pages to read ahead for this book (None keeps the current setting)
         }
 
         # Check for navigate_to parameter (absolute position)
@@ -974,6 +1261,14 @@ class NavigationResourceHandler:
         screenshot_param = request_obj.args.get("screenshot", "0")
         params["include_screenshot"] = screenshot_param.lower() in ("1", "true", "yes")
 
+        # Check for read_ahead parameter (pages to read ahead for this book, 0 disables)
+        read_ahead_param = request_obj.args.get("read_ahead")
+        if read_ahead_param is not None:
+            try:
+                params["read_ahead"] = int(read_ahead_param)
+            except ValueError:
+                logger.warning(f"Invalid read_ahead value: {read_ahead_param}, ignoring")
+
         # Check for title parameter (same as /open-book endpoint)
         title = request_obj.args.get("title")
         if title:
@@ -1061,6 +1356,13 @@ class NavigationResourceHandler:
                     elif isinstance(screenshot_param, int):
                         params["include_screenshot"] = screenshot_param == 1
 
+                # Override read_ahead if provided in JSON
+                if "read_ahead" in json_data:
+                    try:
+                        params["read_ahead"] = int(json_data["read_ahead"])
+                    except (ValueError, TypeError):
+                        logger.warning(f"Invalid read_ahead in JSON: {json_data['read_ahead']}, ignoring")
+
                 # Override title if provided in JSON (same as /open-book endpoint)
                 if "title" in json_data and json_data["title"]:
                     # URL decode the book title to handle plus signs and other encoded characters
@@ -0,0 +1,184 @@
+"""
+Page jump handler for Kindle Automator.
+
+Turning pages one at a time costs a page turn and half a second of settling per page, so
+navigating 50 pages takes about a minute. This handler jumps most of the distance with
+the page scrubber in the page position popover, which takes about the same time for any
+distance, and leaves the last few pages to ordinary page turns.
+
+Navigation positions count page turns while the scrubber works in the book's page
+numbers or locations, so the ratio between the two is estimated from the page indicators
+of pages already in the page text cache for the book. Without an estimate the caller
+turns pages one at a time as before.
+"""
+
+import logging
+import os
+import time
+from typing import Dict, Optional, Tuple
+
+from selenium.common.exceptions import NoSuchElementException
+
+from handlers.table_of_contents_handler import TableOfContentsHandler
+from server.utils.page_text_cache import get_page_text_cache
+from views.reading.interaction_strategies import PAGE_SCRUBBER_SEEKBAR
+
+logger = logging.getLogger(__name__)
+
+# Navigations shorter than this many page turns always turn pages
+JUMP_MIN_TURNS = int(os.getenv("NAVIGATION_JUMP_MIN_PAGES", 10))
+
+# Cached pages must span at least this many positions to estimate page numbers per turn
+MIN_ESTIMATE_SPAN = 3
+
+# Scrubber taps used to get within FINISH_TURNS page turns of the target
+MAX_SCRUB_ATTEMPTS = 3
+FINISH_TURNS = 3
+
+# Time for the popover to show the position after a scrubber tap
+SCRUB_SETTLE_SECONDS = 0.4
+
+# Progress field holding the total for each unit the scrubber can work in
+UNIT_TOTALS = {"current_page": "total_pages", "current_location": "total_locations"}
+
+
+def estimate_units_per_turn(values: Dict[int, int]) -> Optional[float]:
+    """
+    Estimate how far one page turn moves in page numbers or locations.
+
+    Args:
+        values: {position: page number or location} for cached pages of one book
+
+    Returns:
+        float or None: Units per page turn, or None if the cached pages are too close together
+    """
+    if len(values) < 2:
+        return None
+    first, last = min(values), max(values)
+    if last - first < MIN_ESTIMATE_SPAN:
+        return None
+    rate = (values[last] - values[first]) / (last - first)
+    return rate if rate > 0 else None
+
+
+class PageJumpHandler:
+    """Handler for jumping to a distant page with the page position scrubber."""
+
+    def __init__(self, automator):
+        """Initialize the page jump handler.
+
+        Args:
+            automator: The Kindle Automator instance.
+        """
+        self.automator = automator
+        self.driver = automator.driver
+        self.toc_handler = TableOfContentsHandler(automator)
+        # Whether the last jump tapped the scrubber, moving the book
+        self.moved = False
+
+    def plan(self, sindarin_email: str, book: str, turns: int) -> Optional[Tuple[str, float]]:
+        """Decide whether a navigation should jump instead of turning every page.
+
+        Args:
+            sindarin_email: The user's email address
+            book: The open book's title
+            turns: Signed number of page turns requested
+
+        Returns:
+            tuple or None: (progress unit, units per page turn) to jump with, or None to turn pages
+        """
+        if abs(turns) < JUMP_MIN_TURNS:
+            return None
+        estimate = self.units_per_turn(sindarin_email, book)
+        if estimate:
+            logger.info(f"Planning jump of {turns} pages at {estimate[1]:.2f} {estimate[0]} per page turn")
+            return estimate
+        logger.info(f"Not enough cached pages of {book} to plan a jump of {turns} pages")
+        return None
+
+    def units_per_turn(self, sindarin_email: str, book: str) -> Optional[Tuple[str, float]]:
+        """Estimate how far a page turn moves the page indicator, from the book's cached pages.
+
+        Args:
+            sindarin_email: The user's email address
+            book: The open book's title
+
+        Returns:
+            tuple or None: (progress unit, units per page turn), or None without an estimate
+        """
+        cache = get_page_text_cache()
+        for unit in UNIT_TOTALS:
+            rate = estimate_units_per_turn(cache.indicator_values(sindarin_email, book, unit))
+            if rate:
+                return unit, rate
+        return None
+
+    def jump(self, turns: int, unit: str, units_per_turn: float) -> Optional[int]:
+        """Jump about a number of page turns with the page scrubber.
+
+        Args:
+            turns: Signed number of page turns requested
+            unit: Progress unit the scrubber is read in, "current_page" or "current_location"
+            units_per_turn: Estimated units per page turn
+
+        Returns:
+            int or None: Signed page turns still needed to reach the target, or None if the
+            jump could not start or its landing could not be read. The moved attribute tells
+            the two apart.
+        """
+        self.moved = False
+        total_key = UNIT_TOTALS[unit]
+        if not self.toc_handler._ensure_reading_controls_visible():
+            return None
+        if not self.toc_handler._open_page_position_popover():
+            self.toc_handler._hide_reading_controls()
+            return None
+
+        start = self.toc_handler._get_popover_page_position() or {}
+        seekbar = self._find_seekbar()
+        if not (start.get(unit) and start.get(total_key, 0) > 1 and seekbar):
+            logger.info(f"Page scrubber or its {unit} is not available, turning pages instead")
+            self.toc_handler._hide_reading_controls()
+            return None
+
+        total = start[total_key]
+        target = min(max(start[unit] + round(turns * units_per_turn), 1), total)
+        rect = seekbar.rect
+        units_per_pixel = (total - 1) / rect["width"]
+        y = rect["y"] + rect["height"] // 2
+        x = rect["x"] + (target - 1) / units_per_pixel
+        remaining = turns
+
+        for attempt in range(MAX_SCRUB_ATTEMPTS):
+            x = min(max(x, rect["x"]), rect["x"] + rect["width"] - 1)
+            self.driver.tap([(int(x), y)])
+            self.moved = True
+            time.sleep(SCRUB_SETTLE_SECONDS)
+            landed = (self.toc_handler._get_popover_page_position() or {}).get(unit)
+            if not landed:
+                logger.warning(f"Could not read {unit} after scrubbing to {target}, landing is unverified")
+                self.toc_handler._hide_reading_controls()
+                return None
+            remaining = round((target - landed) / units_per_turn)
+            logger.info(
+                f"Scrub {attempt + 1} landed on {unit} {landed} for target {target}, "
+                f"{remaining} page turns left"
+            )
+            if abs(remaining) <= FINISH_TURNS:
+                break
+            x += (target - landed) / units_per_pixel
+
+        self.toc_handler._hide_reading_controls()
+        logger.info(f"Jumped from {unit} {start[unit]} towards {target} for {turns} page turns")
+        return remaining
+
+    def _find_seekbar(self):
+        """Find the page scrubber seekbar in the page position popover."""
+        for strategy, locator in PAGE_SCRUBBER_SEEKBAR:
+            try:
+                element = self.driver.find_element(strategy, locator)
+                if element.is_displayed():
+                    return element
+            except NoSuchElementException:
+                continue
+        return None
@@ -0,0 +1,86 @@
+"""
+Tracking of the reader's chrome: the toolbar, the placemark ribbon and their overlays.
+
+Before every swipe, turn_page probed each placemark and toolbar locator with
+find_element and is_displayed and asked the driver for the window size. The tracker
+lets consecutive page turns skip all of that:
+
+1. After a confirmed page turn it remembers the fingerprint of the settled page
+2. If the screen before the next turn still matches it, nothing has opened the chrome
+   since and the swipe goes ahead at once
+3. Otherwise one XPath query over all chrome locators checks the hierarchy, and only
+   if it finds something visible is the chrome dismissed
+
+The window size is read once per driver session.
+"""
+
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from appium.webdriver.common.appiumby import AppiumBy
+from PIL import Image
+
+from server.utils.frame_diff import STABLE_THRESHOLD, frame_difference
+from views.reading.view_strategies import (
+    PLACEMARK_IDENTIFIERS,
+    READING_TOOLBAR_IDENTIFIERS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def union_xpath(strategies: List[Tuple[str, str]]) -> str:
+    """Combine ID and XPath locators into one XPath matching any of them."""
+    paths = []
+    for strategy, locator in strategies:
+        if strategy == AppiumBy.ID:
+            paths.append(f"//*[@resource-id='{locator}']")
+        elif strategy == AppiumBy.XPATH:
+            paths.append(locator)
+    return " | ".join(paths)
+
+
+# Any placemark or toolbar element
+CHROME_XPATH = union_xpath(PLACEMARK_IDENTIFIERS + READING_TOOLBAR_IDENTIFIERS)
+
+
+class ReaderChromeState:
+    """What the automator knows about the reader's chrome and screen."""
+
+    def __init__(self):
+        # Fingerprint of the page as it settled after the last confirmed turn
+        self.settled_page: Optional[Image.Image] = None
+        self._window_size: Optional[Dict] = None
+        self._session_id: Optional[str] = None
+
+    def window_size(self, driver) -> Dict:
+        """Return the window size, asking the driver once per session."""
+        session_id = getattr(driver, "session_id", None)
+        if self._window_size is None or session_id != self._session_id:
+            self._window_size = driver.get_window_size()
+            self._session_id = session_id
+        return self._window_size
+
+    def page_settled(self, page: Optional[Image.Image]):
+        """Remember the fingerprint of a page the automator turned to and saw settle."""
+        self.settled_page = page
+
+    def forget(self):
+        """Forget the settled page, e.g. when the automator is about to change the screen."""
+        self.settled_page = None
+
+    def is_unchanged(self, page: Optional[Image.Image]) -> bool:
+        """Whether a fingerprint of the screen shows the settled page, so no chrome was opened."""
+        if self.settled_page is None or page is None or self.settled_page.size != page.size:
+            return False
+        return frame_difference(self.settled_page, page) < STABLE_THRESHOLD
+
+    def chrome_visible(self, driver) -> bool:
+        """Check the hierarchy for visible chrome with a single query."""
+        try:
+            return any(
+                element.is_displayed() for element in driver.find_elements(AppiumBy.XPATH, CHROME_XPATH)
+            )
+        except Exception as e:
+            logger.debug(f"Could not check for reader chrome, assuming it is visible: {e}")
+            return True
@@ -4,6 +4,7 @@ import re
 import subprocess
 import time
 from io import BytesIO
+from typing import Optional
 
 from appium.webdriver.common.appiumby import AppiumBy
 from PIL import Image
@@ -11,9 +12,26 @@ from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from handlers.reader_chrome_state import ReaderChromeState
+from handlers.reader_page_handler import (
+    MAIN_TEXT_REGION,
+    PAGE_INDICATOR_REGION,
+    parse_page_indicators,
+)
+from handlers.reading_progress_provider import ReadingProgressProvider
 from server.logging_config import store_page_source
+from server.utils.footer_recognizer import read_page_indicator
+from server.utils.frame_diff import fingerprint, wait_for_change
+from server.utils.frame_source import get_frame_source
 from server.utils.request_utils import get_sindarin_email
-from server.utils.screenshot_utils import take_adb_screenshot
+from server.utils.screenshot_utils import (
+    capture_screen,
+    crop_region,
+    get_driver_device_id,
+    grab_screen,
+    image_to_bytes,
+    take_adb_screenshot,
+)
 from views.reading.interaction_strategies import (
     ABOUT_BOOK_SLIDEOVER_IDENTIFIERS,
     BOTTOM_SHEET_IDENTIFIERS,
@@ -69,11 +87,25 @@ PAGE_FORMAT_PATTERNS = {
     "percentage_only": (r"^\s*(\d{1,3})%\s*$", "percent"),
 }
 
+# Confirm page turns by watching the page change instead of sleeping a fixed time
+PAGE_TURN_CONFIRMATION = os.getenv("PAGE_TURN_CONFIRMATION", "true").lower() == "true"
+# Longest wait for the page to change and settle after a swipe
+PAGE_TURN_TIMEOUT_SECONDS = float(os.getenv("PAGE_TURN_TIMEOUT_SECONDS", 2))
+# Swipes repeated when the page did not change
+PAGE_TURN_RETRIES = int(os.getenv("PAGE_TURN_RETRIES", 1))
+# Shortest time between swipes the reader registers as separate page turns
+BATCH_SWIPE_INTERVAL_SECONDS = float(os.getenv("BATCH_SWIPE_INTERVAL_SECONDS", 0.25))
+
 
 class ReaderHandler:
     def __init__(self, driver):
         self.driver = driver
         self.screenshots_dir = "screenshots"
+        # Whether the last page turn was seen to change the page, None if it was not checked
+        self.last_turn_verified = None
+        # Settled page and window size, so consecutive page turns only swipe
+        self.chrome = ReaderChromeState()
+        self.progress = ReadingProgressProvider(self)
         # Ensure screenshots directory exists
         os.makedirs(self.screenshots_dir, exist_ok=True)
 
@@ -260,7 +292,7 @@ class ReaderHandler:
                 # Fallback to coordinate-based tap if direct method fails
                 try:
                     # Get screen dimensions to calculate tap position
-                    window_size = self.driver.get_window_size()
+                    window_size = self.chrome.window_size(self.driver)
                     width = window_size["width"]
 
                     # Calculate position for first device (based on XML layout)
@@ -329,7 +361,7 @@ class ReaderHandler:
             if not remove_button_tapped:
                 try:
                     # Button is at bounds="[81,2132][999,2227]" in the XML
-                    window_size = self.driver.get_window_size()
+                    window_size = self.chrome.window_size(self.driver)
                     width = window_size["width"]
 
                     x = width // 2  # Center horizontally
@@ -477,7 +509,7 @@ class ReaderHandler:
 
             if about_book_visible:
                 # Try tapping near the top of the screen to dismiss
-                window_size = self.driver.get_window_size()
+                window_size = self.chrome.window_size(self.driver)
                 center_x = window_size["width"] // 2
                 top_y = int(window_size["height"] * 0.05)  # Tap at 5% from the top
                 self.driver.tap([(center_x, top_y)])
@@ -1060,7 +1092,7 @@ class ReaderHandler:
                     logger.debug("Pill not found - trying alternative dismissal method")
 
                     # Try tapping near the top of the screen
-                    window_size = self.driver.get_window_size()
+                    window_size = self.chrome.window_size(self.driver)
                     center_x = window_size["width"] // 2
                     top_y = int(window_size["height"] * 0.10)  # Tap at approx. 10% from the top
                     self.driver.tap([(center_x, top_y)])
@@ -1081,7 +1113,7 @@ class ReaderHandler:
                 if still_visible:
                     logger.debug("Slideover still visible - trying another approach")
                     # Try swiping down to dismiss
-                    window_size = self.driver.get_window_size()
+                    window_size = self.chrome.window_size(self.driver)
                     center_x = window_size["width"] // 2
                     start_y = int(window_size["height"] * 0.3)
                     end_y = int(window_size["height"] * 0.7)
@@ -1118,21 +1150,16 @@ class ReaderHandler:
 
         # Check if we need to update reading styles for this profile
         if hasattr(self.driver, "automator") and hasattr(self.driver.automator, "profile_manager"):
-            profile_manager = self.driver.automator.profile_manager
             if hasattr(self.driver.automator, "state_machine") and hasattr(
                 self.driver.automator.state_machine, "style_handler"
             ):
                 style_handler = self.driver.automator.state_machine.style_handler
 
-                # Update styles if needed
-                if not profile_manager.is_styles_updated():
-                    logger.debug("First-time reading with this profile, updating reading styles...")
-                    if style_handler.update_reading_style(show_placemark=show_placemark):
-                        logger.debug("Updated reading styles")
-                    else:
-                        logger.warning("Failed to update reading styles")
+                # Update styles if the settings applied in this boot of the AVD don't match
+                if style_handler.update_reading_style(show_placemark=show_placemark):
+                    logger.debug("Reading styles are up to date")
                 else:
-                    logger.debug("Reading styles already updated for this profile, skipping")
+                    logger.warning("Failed to update reading styles")
             else:
                 logger.warning("Cannot update reading styles - style_handler not available")
         else:
@@ -1142,7 +1169,7 @@ class ReaderHandler:
         if show_placemark:
             logger.debug("Placemark mode enabled - tapping to show placemark ribbon")
             try:
-                window_size = self.driver.get_window_size()
+                window_size = self.chrome.window_size(self.driver)
                 center_x = window_size["width"] // 2
                 center_y = window_size["height"] // 2
                 self.driver.tap([(center_x, center_y)])
@@ -1258,64 +1285,220 @@ class ReaderHandler:
 
         self.driver.swipe(start_x, start_y, end_x, end_y, duration)
 
-    def turn_page(self, direction: int):
-        """Turn to the next/previous page."""
+    def _page_turn_device_id(self):
+        """Device to confirm page turns on, or None, streaming its screen while the book is read."""
+        if not PAGE_TURN_CONFIRMATION:
+            return None
+        device_id = get_driver_device_id(self.driver)
+        if device_id:
+            # Closing the book or leaving the source idle stops it again
+            get_frame_source(device_id)
+        return device_id
+
+    def _grab_page_fingerprint(self, device_id):
+        """Grab the screen and fingerprint the page text, or None without a device or frame."""
+        return self._grab_page(device_id)[1]
+
+    def _grab_page(self, device_id):
+        """Grab the screen, returning (frame, page text fingerprint), both None without a device or frame."""
+        frame = grab_screen(device_id) if device_id else None
+        return frame, fingerprint(frame, MAIN_TEXT_REGION) if frame is not None else None
+
+    def _footer_progress(self, frame) -> dict:
+        """Read the page indicator from a grabbed frame, empty if it cannot be read."""
+        if frame is None:
+            return {}
+        try:
+            text = read_page_indicator(image_to_bytes(crop_region(frame, PAGE_INDICATOR_REGION)))[0]
+        except Exception as e:
+            logger.debug(f"Could not read the page indicator from the frame: {e}")
+            return {}
+        return parse_page_indicators(text)
+
+    def _turn_advanced(self, before_frame, frame) -> Optional[bool]:
+        """Compare the page indicator before a swipe with the one on screen now.
+
+        Returns:
+            bool or None: True if it moved, False if it shows the same page, None if
+            either could not be read
+        """
+        before, after = self._footer_progress(before_frame), self._footer_progress(frame)
+        for key in ("current_page", "current_location"):
+            if before.get(key) and after.get(key):
+                return before[key] != after[key]
+        return None
+
+    def _dismiss_reader_chrome(self):
+        """Close the placemark ribbon and the reading toolbar if they are showing."""
+        window_size = self.chrome.window_size(self.driver)
+
+        # First check if a placemark is active and close it by tapping in the top area
+        # which won't interfere with navigation
         try:
-            # First check if a placemark is active and close it by tapping in the top area
-            # which won't interfere with navigation
+            placemark_visible, _ = self._check_element_visibility(PLACEMARK_IDENTIFIERS, "placemark ribbon")
+            if placemark_visible:
+                logger.debug("Found placemark ribbon - removing it before page turn")
+                center_x = window_size["width"] // 2
+                top_y = int(window_size["height"] * 0.05)  # 5% from top
+                self.driver.tap([(center_x, top_y)])
+                logger.info(f"Tapped near top ({center_x}, {top_y}) to close placemark before page turn")
+                time.sleep(0.5)  # Wait for placemark to disappear
+        except Exception as e:
+            logger.warning(f"Error checking/closing placemark: {e}")
+
+        # Check if we're in reading toolbar view
+        for strategy, locator in READING_TOOLBAR_IDENTIFIERS:
             try:
-                placemark_visible, _ = self._check_element_visibility(
-                    PLACEMARK_IDENTIFIERS, "placemark ribbon"
-                )
-                if placemark_visible:
-                    logger.debug("Found placemark ribbon - removing it before page turn")
-                    window_size = self.driver.get_window_size()
-                    center_x = window_size["width"] // 2
-                    top_y = int(window_size["height"] * 0.05)  # 5% from top
-                    self.driver.tap([(center_x, top_y)])
-                    logger.info(f"Tapped near top ({center_x}, {top_y}) to close placemark before page turn")
-                    time.sleep(0.5)  # Wait for placemark to disappear
-            except Exception as e:
-                logger.warning(f"Error checking/closing placemark: {e}")
+                toolbar = self.driver.find_element(strategy, locator)
+                if toolbar.is_displayed():
+                    # Tap center to exit toolbar view
+                    logger.info("Tapping center to exit toolbar view")
+                    center_x = int(window_size["width"] * PAGE_NAVIGATION_ZONES["center"])
+                    center_y = window_size["height"] // 2
+                    self.driver.tap([(center_x, center_y)])
+                    time.sleep(0.5)  # Wait for toolbar to hide
+                    break
+            except NoSuchElementException:
+                continue  # Try the next strategy
 
-            # Check if we're in reading toolbar view
-            for strategy, locator in READING_TOOLBAR_IDENTIFIERS:
-                try:
-                    toolbar = self.driver.find_element(strategy, locator)
-                    if toolbar.is_displayed():
-                        # Tap center to exit toolbar view
-                        logger.info("Tapping center to exit toolbar view")
-                        window_size = self.driver.get_window_size()
-                        center_x = int(window_size["width"] * PAGE_NAVIGATION_ZONES["center"])
-                        center_y = window_size["height"] // 2
-                        self.driver.tap([(center_x, center_y)])
-                        time.sleep(0.5)  # Wait for toolbar to hide
-                        break
-                except NoSuchElementException:
-                    continue  # Try the next strategy
+    def turn_page(self, direction: int):
+        """Turn to the next/previous page.
+
+        When the device's screen can be grabbed, the page is compared before and after
+        the swipe: the turn returns once the page has changed and settled. If the page
+        text did not change in time, the page indicator is compared with the one before
+        the swipe, and the swipe is only repeated (up to PAGE_TURN_RETRIES times) once
+        the indicator confirms the page did not advance. If it can't be told, even after
+        dismissing the chrome, the turn is left unverified rather than risk turning twice. Without frames the turn waits a
+        fixed time for the animation. The reader's chrome is only looked for when the
+        screen no longer shows the page the last turn settled on.
+
+        Args:
+            direction: 1 to turn forward, -1 to turn backward
+
+        Returns:
+            bool: True if the page was turned or may have been (last_turn_verified is None),
+            False if the page indicator shows it did not change, or on error
+        """
+        self.last_turn_verified = None
+        try:
+            # Grab the page before swiping to see it change
+            device_id = self._page_turn_device_id()
+            before_frame, before = self._grab_page(device_id)
+
+            # The settled page of the last turn means no chrome has opened since
+            if not self.chrome.is_unchanged(before) and self.chrome.chrome_visible(self.driver):
+                self._dismiss_reader_chrome()
+                before_frame, before = self._grab_page(device_id)
+            self.chrome.forget()
 
             # Get screen dimensions and calculate tap coordinates
-            window_size = self.driver.get_window_size()
+            window_size = self.chrome.window_size(self.driver)
             tap_x = int(window_size["width"] * PAGE_NAVIGATION_ZONES["next"])  # 90% of screen width
             end_x = tap_x * 0.2
             tap_y = window_size["height"] // 2
 
-            # Gesture swipe left
-            if direction == 1:
-                self.swipe(tap_x, tap_y, end_x, tap_y, 200)
-                logger.info(f"Swiped left ({tap_x}, {tap_y}) to turn page forward")
-            else:
-                self.swipe(end_x, tap_y, tap_x, tap_y, 200)
-                logger.info(f"Swiped right ({tap_x}, {tap_y}) to turn page backward")
+            for attempt in range(1 + PAGE_TURN_RETRIES):
+                if attempt and self.chrome.chrome_visible(self.driver):
+                    # The lost swipe may have opened the chrome instead
+                    self._dismiss_reader_chrome()
+                    frame, fingerprinted = self._grab_page(device_id)
+                    if fingerprinted is not None:
+                        before_frame, before = frame, fingerprinted
+
+                # Gesture swipe left
+                if direction == 1:
+                    self.swipe(tap_x, tap_y, end_x, tap_y, 200)
+                    logger.info(f"Swiped left ({tap_x}, {tap_y}) to turn page forward")
+                else:
+                    self.swipe(end_x, tap_y, tap_x, tap_y, 200)
+                    logger.info(f"Swiped right ({tap_x}, {tap_y}) to turn page backward")
 
-            # Short wait for page turn animation
-            time.sleep(0.5)
-            return True
+                if before is None:
+                    # Short wait for page turn animation
+                    time.sleep(0.5)
+                    return True
+
+                started = time.time()
+                changed, frame = wait_for_change(
+                    lambda: grab_screen(device_id), before, PAGE_TURN_TIMEOUT_SECONDS, MAIN_TEXT_REGION
+                )
+                if changed:
+                    logger.debug(f"Page changed and settled {time.time() - started:.2f}s after swipe")
+                    self.last_turn_verified = True
+                    self.chrome.page_settled(fingerprint(frame, MAIN_TEXT_REGION))
+                    return True
+                if frame is None:
+                    # Without frames there is no telling, so don't risk turning twice
+                    logger.warning("Could not grab the screen to confirm the page turn")
+                    return True
+
+                # The page text may be slow to redraw, or look alike, so ask the page indicator
+                advanced = self._turn_advanced(before_frame, frame)
+                if advanced is None and self.chrome.chrome_visible(self.driver):
+                    # The chrome may have taken the swipe and can cover the indicator
+                    self._dismiss_reader_chrome()
+                    frame, fingerprinted = self._grab_page(device_id)
+                    if fingerprinted is not None:
+                        advanced = self._turn_advanced(before_frame, frame)
+                if advanced:
+                    logger.info("Page indicator moved though the page text did not visibly change")
+                    self.last_turn_verified = True
+                    self.chrome.page_settled(fingerprint(frame, MAIN_TEXT_REGION))
+                    return True
+                if advanced is None:
+                    logger.warning(
+                        "Page did not visibly change and its indicator can't be read, not swiping again"
+                    )
+                    return True
+                logger.warning(f"Page did not change after swipe {attempt + 1} of {1 + PAGE_TURN_RETRIES}")
+
+            self.last_turn_verified = False
+            return False
 
         except Exception as e:
             logger.error(f"Error turning page forward: {e}", exc_info=True)
             return False
 
+    def swipe_pages(self, direction: int, count: int) -> bool:
+        """Turn several pages with back-to-back swipes, without confirming each turn.
+
+        The chrome is dismissed once beforehand, then the swipes are issued
+        BATCH_SWIPE_INTERVAL_SECONDS apart. The caller verifies where the reader ended up.
+
+        Args:
+            direction: 1 to turn forward, -1 to turn backward
+            count: Number of swipes
+
+        Returns:
+            bool: True if every swipe was issued, False on error
+        """
+        self.last_turn_verified = None
+        try:
+            device_id = self._page_turn_device_id()
+            if not self.chrome.is_unchanged(self._grab_page_fingerprint(device_id)) and (
+                self.chrome.chrome_visible(self.driver)
+            ):
+                self._dismiss_reader_chrome()
+            self.chrome.forget()
+
+            window_size = self.chrome.window_size(self.driver)
+            tap_x = int(window_size["width"] * PAGE_NAVIGATION_ZONES["next"])
+            end_x = tap_x * 0.2
+            tap_y = window_size["height"] // 2
+            start, end = (tap_x, end_x) if direction == 1 else (end_x, tap_x)
+
+            for i in range(count):
+                if i:
+                    time.sleep(BATCH_SWIPE_INTERVAL_SECONDS)
+                self.swipe(start, tap_y, end, tap_y, 200)
+            logger.info(f"Swiped {count} pages {'forward' if direction == 1 else 'backward'}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error swiping {count} pages: {e}", exc_info=True)
+            return False
+
     def turn_page_forward(self):
         """Turn to the next page."""
 
@@ -1327,10 +1510,10 @@ class ReaderHandler:
         return self.turn_page(-1)
 
     def _extract_screenshot_for_ocr(self, prefix):
-        """Take a screenshot and perform OCR on it.
+        """Capture the screen in memory and perform OCR on it.
 
         Args:
-            prefix: Prefix for the screenshot filename
+            prefix: Label for the capture in log messages
 
         Returns:
             tuple: (ocr_text, error_message) - OCR text if successful, error message if failed
@@ -1339,38 +1522,20 @@ class ReaderHandler:
             # Give the page a moment to render fully
             time.sleep(0.5)
 
-            # Take screenshot
-            # Get the user email for unique screenshot naming
-            profile = self.driver.automator.profile_manager.get_current_profile()
-            sindarin_email = profile.get("email") if profile else None
-            if sindarin_email:
-                # Sanitize email for filename
-                email_safe = sindarin_email.replace("@", "_").replace(".", "_")
-                screenshot_id = f"{email_safe}_{prefix}_{int(time.time())}"
-            else:
-                screenshot_id = f"{prefix}_{int(time.time())}"
-            screenshot_path = os.path.join(self.screenshots_dir, f"{screenshot_id}.png")
-            self.driver.save_screenshot(screenshot_path)
+            image = capture_screen(self.driver)
+            if image is None:
+                return None, "Failed to capture screen"
 
-            # Get OCR text from screenshot
+            # Get OCR text from the capture
             ocr_text = None
             error_msg = None
 
             try:
-                with open(screenshot_path, "rb") as img_file:
-                    image_data = img_file.read()
-
                 # Import the OCR processor
                 from server.server import KindleOCR
 
-                ocr_text, error_msg = KindleOCR.process_ocr(image_data)
-
-                # Delete the screenshot file after processing
-                try:
-                    os.remove(screenshot_path)
-                    logger.debug(f"Deleted screenshot after OCR processing: {screenshot_path}")
-                except Exception as del_e:
-                    logger.error(f"Failed to delete screenshot {screenshot_path}: {del_e}", exc_info=True)
+                ocr_text, error_msg = KindleOCR.process_ocr(image_to_bytes(image))
+                logger.debug(f"Processed {prefix} capture with OCR")
 
             except Exception as e:
                 logger.error(f"Error processing OCR: {e}", exc_info=True)
@@ -1379,7 +1544,7 @@ class ReaderHandler:
             return ocr_text, error_msg
 
         except Exception as e:
-            logger.error(f"Error taking screenshot for OCR: {e}", exc_info=True)
+            logger.error(f"Error capturing screen for OCR: {e}", exc_info=True)
             return None, str(e)
 
     def preview_page_forward(self):
@@ -1640,7 +1805,7 @@ class ReaderHandler:
         """Get reading progress using OCR on the page number area without opening dialog.
 
         Args:
-            screenshot_bytes (bytes, optional): Screenshot to use. If None, takes a new screenshot.
+            screenshot_bytes (bytes or Image, optional): Screenshot to use. If None, captures the screen.
 
         Returns:
             dict: Dictionary containing:
@@ -1653,32 +1818,26 @@ class ReaderHandler:
             or None if progress info couldn't be retrieved
         """
         try:
-            # Take screenshot if not provided
-            if screenshot_bytes is None:
-                screenshot_path = os.path.join(self.screenshots_dir, f"progress_ocr_{int(time.time())}.png")
-                self.driver.save_screenshot(screenshot_path)
-                with open(screenshot_path, "rb") as f:
-                    screenshot_bytes = f.read()
-                # Clean up
-                try:
-                    os.remove(screenshot_path)
-                except Exception:
-                    pass
-
-            # Import OCR utils and page indicator extraction
-            from handlers.reader_page_handler import extract_page_indicator_region
-            from server.utils.ocr_utils import KindleOCR
+            # Import page indicator extraction and recognition
+            from handlers.reader_page_handler import (
+                PAGE_INDICATOR_REGION,
+                extract_page_indicator_region,
+            )
+            from server.utils.footer_recognizer import read_page_indicator
 
-            # Extract and OCR the page indicator region
-            page_indicator_bytes = extract_page_indicator_region(screenshot_bytes)
+            # Extract the page indicator region, capturing only the footer if no screenshot was provided
+            if screenshot_bytes is None:
+                indicator = capture_screen(self.driver, region=PAGE_INDICATOR_REGION)
+                page_indicator_bytes = image_to_bytes(indicator) if indicator is not None else None
+            else:
+                page_indicator_bytes = extract_page_indicator_region(screenshot_bytes)
 
             page_text = None
 
-            # OCR the page indicator
+            # Read the page indicator, locally when the footer font is known
             if page_indicator_bytes:
-                page_text, _ = KindleOCR.process_ocr(page_indicator_bytes)
+                page_text, _ = read_page_indicator(page_indicator_bytes)
                 if page_text:
-                    page_text = " ".join(page_text.split())  # Clean up whitespace
                     logger.info(f"Page indicator OCR: '{page_text}'")
 
             # Parse the text
@@ -1737,7 +1896,7 @@ class ReaderHandler:
                 # Tap the page number area to rotate format
                 # The page indicator is in the bottom-left, but we need to avoid triggering page flip
                 # Page flip seems to trigger around 85-95% height, so tap closer to the very bottom
-                window_size = self.driver.get_window_size()
+                window_size = self.chrome.window_size(self.driver)
                 tap_x = int(window_size["width"] * 0.10)  # 10% from left (left side for page indicator)
                 tap_y = int(window_size["height"] * 0.97)  # 97% from top (very bottom to avoid page flip)
 
@@ -1754,7 +1913,20 @@ class ReaderHandler:
             return None
 
     def get_reading_progress(self, show_placemark=False):
-        """Get reading progress information
+        """Get reading progress, reading passive sources before touching the UI.
+
+        Args:
+            show_placemark (bool): Whether the UI fallback may use the center tap that could
+                                   trigger placemark.
+
+        Returns:
+            dict: Dictionary containing current_page and total_pages, or None if progress
+            info couldn't be retrieved
+        """
+        return self.progress.reading_progress(show_placemark=show_placemark)
+
+    def _get_reading_progress_with_ui(self, show_placemark=False):
+        """Get reading progress information from the footer and reading controls
 
         Args:
             show_placemark (bool): Whether to use center tap that could trigger placemark.
@@ -1813,7 +1985,7 @@ class ReaderHandler:
             except NoSuchElementException:
                 logger.debug("Progress element not found initially - will need to tap")
                 # Only tap if explicitly requested via show_placemark=True
-                window_size = self.driver.get_window_size()
+                window_size = self.chrome.window_size(self.driver)
                 center_x = int(window_size["width"] * PAGE_NAVIGATION_ZONES["center"])
                 center_y = window_size["height"] // 2
                 self.driver.tap([(center_x, center_y)])
@@ -1914,7 +2086,7 @@ class ReaderHandler:
             if opened_controls and show_placemark:
                 # Only try to close controls by tapping if we're in placemark mode
                 # Otherwise we'd be showing placemark when trying to hide controls
-                window_size = self.driver.get_window_size()
+                window_size = self.chrome.window_size(self.driver)
                 center_x = int(window_size["width"] * PAGE_NAVIGATION_ZONES["center"])
                 center_y = window_size["height"] // 2
                 logger.debug("Closing reading controls")
@@ -1951,28 +2123,21 @@ class ReaderHandler:
         return False, None
 
     def get_book_title(self):
-        """Get the title of the book currently being read.
+        """Get the title of the book currently being read, preferring cached titles.
 
         Returns:
             str: Book title if found, None otherwise
         """
-        try:
-            logger.debug("Trying to get current book title")
+        return self.progress.book_title()
 
-            # First try to get the cached title from profile settings
-            try:
-                from server.utils.request_utils import get_sindarin_email
+    def _get_book_title_with_ui(self):
+        """Get the title of the book currently being read from the reading toolbar's menu.
 
-                sindarin_email = get_sindarin_email()
-                if sindarin_email and hasattr(self.driver, "automator"):
-                    actively_reading = self.driver.automator.profile_manager.get_style_setting(
-                        "actively_reading_title", email=sindarin_email
-                    )
-                    if actively_reading:
-                        logger.debug(f"Using cached book title: '{actively_reading}'")
-                        return actively_reading
-            except Exception as e:
-                logger.debug(f"Could not get cached title: {e}")
+        Returns:
+            str: Book title if found, None otherwise
+        """
+        try:
+            logger.debug("Trying to get current book title from the reader UI")
 
             # Check if toolbar is already visible (don't tap to show it)
             visible, _ = self._check_element_visibility(READING_TOOLBAR_IDENTIFIERS, "reading toolbar")
@@ -1986,20 +2151,8 @@ class ReaderHandler:
                 # Return None or cached title - don't tap to show toolbar
                 return None
 
-            # Try different strategies to get the book title
-
-            # Strategy 1: Try to find title from the reader screen
-            try:
-                # Look for the title in the reader view toolbar
-                title_element = self.driver.find_element(AppiumBy.ID, "com.amazon.kindle:id/ToolbarTitleBar")
-                if title_element.is_displayed():
-                    title = title_element.text
-                    logger.debug(f"Found book title from toolbar: '{title}'")
-                    return title
-            except NoSuchElementException:
-                pass
-
-            # Strategy 2: Show book details by clicking menu button and look for title there
+            # The toolbar's own title was already read passively, so show book details by
+            # clicking the menu button and look for the title there
             try:
                 # First check if the toolbar is visible
                 visible, toolbar = self._check_element_visibility(
@@ -2260,7 +2413,7 @@ class ReaderHandler:
             cancellation_check: Optional function to check if operation should be cancelled
         """
         # Get screen dimensions
-        window_size = self.driver.get_window_size()
+        window_size = self.chrome.window_size(self.driver)
         center_x = window_size["width"] // 2
         tap_y = window_size["height"] // 2
 
@@ -2628,7 +2781,7 @@ class ReaderHandler:
                         logger.debug("User has style dialog disabled - will tap twice to dismiss tutorial")
 
                         # Get screen dimensions
-                        window_size = self.driver.get_window_size()
+                        window_size = self.chrome.window_size(self.driver)
                         center_x = window_size["width"] // 2
                         center_y = window_size["height"] // 2
 
@@ -2664,7 +2817,7 @@ class ReaderHandler:
                         logger.debug("User has style dialog enabled - single tap will open style dialog")
 
                         # Single tap to open toolbar/style dialog
-                        window_size = self.driver.get_window_size()
+                        window_size = self.chrome.window_size(self.driver)
                         center_x = window_size["width"] // 2
                         center_y = window_size["height"] // 2
 
@@ -2691,7 +2844,7 @@ class ReaderHandler:
                             return True
 
             # Fallback: just do a single tap if we can't determine preference
-            window_size = self.driver.get_window_size()
+            window_size = self.chrome.window_size(self.driver)
             center_x = window_size["width"] // 2
             center_y = window_size["height"] // 2
 
@@ -4,59 +4,44 @@ import base64
 import logging
 import os
 import re
-from io import BytesIO
 
-from PIL import Image
+from server.utils.screenshot_utils import crop_region, image_to_bytes, load_image
 
 logger = logging.getLogger(__name__)
 
+# Screen regions as (left, top, right, bottom) fractions: the page text and the
+# page/location indicator at the bottom left
+MAIN_TEXT_REGION = (0, 0, 1, 0.94)
+PAGE_INDICATOR_REGION = (0, 0.94, 0.5, 1)
+
 
 def extract_page_indicator_region(image_bytes):
     """Extract the page indicator region from a screenshot.
 
     Args:
-        image_bytes: The screenshot as bytes
+        image_bytes: The screenshot as encoded bytes or an in-memory image
 
     Returns:
         bytes: page_indicator_bytes - Cropped region as bytes
     """
     try:
-        # Load the image
-        img = Image.open(BytesIO(image_bytes))
-        width, height = img.size
-
-        # Define crop region based on proportions
         # Bottom-left for page/location indicator
         # The page number is in the bottom 6% of screen (bottom 80px of 1400px)
-        page_indicator_box = (
-            0,  # Left edge
-            int(height * 0.94),  # Start at 94% from top (bottom 6%)
-            int(width * 0.5),  # Left 50% of width
-            height,  # Bottom edge
-        )
-
-        # Crop the region
-        page_indicator_img = img.crop(page_indicator_box)
-
-        # Convert back to bytes
-        page_indicator_bytes = BytesIO()
-        page_indicator_img.save(page_indicator_bytes, format="PNG")
-        page_indicator_bytes = page_indicator_bytes.getvalue()
-
-        logger.debug(f"Cropped page indicator region: {page_indicator_box}")
-
-        return page_indicator_bytes
+        page_indicator_img = crop_region(load_image(image_bytes), PAGE_INDICATOR_REGION)
+        logger.debug(f"Cropped page indicator region: {PAGE_INDICATOR_REGION}")
+        return image_to_bytes(page_indicator_img)
 
     except Exception as e:
         logger.error(f"Error extracting page indicator region: {e}", exc_info=True)
         return None
 
 
-def process_screenshot_with_regions(image_bytes):
+def process_screenshot_with_regions(image_bytes, cache_context=None):
     """Process a screenshot to extract both main text and page information.
 
     Args:
-        image_bytes: The screenshot as bytes
+        image_bytes: The screenshot as encoded bytes or an in-memory image
+        cache_context: Optional OCR cache context of the page, see KindleOCR.process_ocr
 
     Returns:
         dict: Contains 'main_text', 'page_indicator_text', and any errors
@@ -65,41 +50,38 @@ def process_screenshot_with_regions(image_bytes):
 
     try:
         # Import OCR processor
+        from server.utils.footer_recognizer import read_page_indicator
+        from server.utils.ocr_executor import submit_region
         from server.utils.ocr_utils import KindleOCR
 
         # Load the image once
-        img = Image.open(BytesIO(image_bytes))
-        width, height = img.size
+        img = load_image(image_bytes)
 
         # Crop main text area (top 94%, excluding page numbers which are in bottom 6%)
-        main_text_box = (
-            0,  # Left edge
-            0,  # Top edge
-            width,  # Right edge
-            int(height * 0.94),  # Stop at 94% from top (excludes bottom 6% where page numbers are)
-        )
-        main_text_img = img.crop(main_text_box)
+        main_text_data = image_to_bytes(crop_region(img, MAIN_TEXT_REGION))
 
-        # Convert main text to bytes and OCR
-        main_text_bytes = BytesIO()
-        main_text_img.save(main_text_bytes, format="PNG")
-        main_text_data = main_text_bytes.getvalue()
+        # Extract page indicator region
+        page_indicator_bytes = extract_page_indicator_region(img)
+
+        # OCR both regions concurrently so the page costs about one provider round trip;
+        # the page indicator is usually read locally and only falls back to the cloud
+        main_future = submit_region(KindleOCR.process_ocr, main_text_data, cache_context=cache_context)
+        page_future = (
+            submit_region(read_page_indicator, page_indicator_bytes, cache_context=cache_context)
+            if page_indicator_bytes
+            else None
+        )
 
-        main_ocr_text, main_error = KindleOCR.process_ocr(main_text_data)
+        main_ocr_text, main_error = main_future.result()
         if main_ocr_text:
             result["main_text"] = main_ocr_text
         elif main_error:
             result["errors"].append(f"Main text OCR error: {main_error}")
 
-        # Extract page indicator region
-        page_indicator_bytes = extract_page_indicator_region(image_bytes)
-
         # OCR page indicator
-        if page_indicator_bytes:
-            page_text, page_error = KindleOCR.process_ocr(page_indicator_bytes, clean_ui_elements=False)
+        if page_future:
+            page_text, page_error = page_future.result()
             if page_text:
-                # Clean up the text - remove any extra whitespace
-                page_text = " ".join(page_text.split())
                 result["page_indicator_text"] = page_text
                 logger.info(f"OCR: Page indicator extracted: '{page_text}'")
             elif page_error:
@@ -113,17 +95,24 @@ def process_screenshot_with_regions(image_bytes):
         return result
 
 
-def parse_page_indicators(page_indicator_text):
+def parse_page_indicators(page_indicator_text, page_indicator_image=None):
     """Parse page indicator text to extract structured progress data.
 
     Args:
         page_indicator_text: OCR text from page indicator region (e.g., "Page 123 of 456", "8 mins left in chapter")
+        page_indicator_image: Optional page indicator region bytes, read with the footer recognizer
+            when no text is given
 
     Returns:
         dict: Progress information with current_page/location, total_pages/locations, and/or time_left
     """
     progress = {}
 
+    if not page_indicator_text and page_indicator_image:
+        from server.utils.footer_recognizer import read_page_indicator
+
+        page_indicator_text, _ = read_page_indicator(page_indicator_image)
+
     # Parse page indicator text
     if page_indicator_text:
         # Check for "Learning reading speed" - Kindle's initial state before showing time/page
@@ -156,18 +145,19 @@ def parse_page_indicators(page_indicator_text):
     return progress
 
 
-def cycle_page_indicator_if_needed(reader_handler, page_indicator_text):
+def cycle_page_indicator_if_needed(reader_handler, page_indicator_text, page_indicator_image=None):
     """If time-based indicator is detected, tap to cycle through formats to get page/location.
 
     Args:
         reader_handler: The ReaderHandler instance
         page_indicator_text: The OCR'd text from the page indicator region
+        page_indicator_image: Optional page indicator region bytes, used when no text is given
 
     Returns:
         dict: Updated progress information with page/location data if found
     """
     # First parse what we have
-    progress = parse_page_indicators(page_indicator_text)
+    progress = parse_page_indicators(page_indicator_text, page_indicator_image)
 
     # Check if we got a time-based indicator or "Learning reading speed" instead of page/location
     if (
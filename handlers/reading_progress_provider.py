@@ -0,0 +1,216 @@
+"""
+Reading progress and book title from the cheapest source that knows them.
+
+get_reading_progress and get_book_title run on most navigate and open responses, and
+both could tap the reader to show its toolbar, wait for it and hide it again. The
+provider asks passive sources first and only touches the UI when none of them is
+confident:
+
+1. Progress is read from the footer text in the view hierarchy, with one XPath query
+   over all footer locators
+2. If the hierarchy has no page number, the footer strip is captured and read by the
+   local footer recognizer, accepted only at MIN_CONFIDENCE and without cloud OCR
+3. The title is taken from the profile's actively reading title or the user's book
+   session, then from the toolbar title if the toolbar is already showing
+4. Only then does the reader fall back to cycling the footer, showing the toolbar or
+   opening About This Book
+
+Every source records its latency and hit rate, which /ocr-stats reports.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Optional
+
+from appium.webdriver.common.appiumby import AppiumBy
+
+from handlers.reader_chrome_state import union_xpath
+from handlers.reader_page_handler import PAGE_INDICATOR_REGION
+from server.utils.footer_recognizer import MIN_CONFIDENCE, get_footer_recognizer
+from server.utils.page_indicator_utils import parse_page_indicators
+from server.utils.request_utils import get_sindarin_email
+from server.utils.screenshot_utils import capture_screen, image_to_bytes
+from views.reading.view_strategies import (
+    PAGE_NUMBER_IDENTIFIERS,
+    READING_POSITION_INDICATOR_IDENTIFIERS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Any footer element that can show the page, location or time left
+FOOTER_XPATH = union_xpath(READING_POSITION_INDICATOR_IDENTIFIERS + PAGE_NUMBER_IDENTIFIERS)
+
+TOOLBAR_TITLE_ID = "com.amazon.kindle:id/ToolbarTitleBar"
+
+# Latency samples kept per source
+LATENCY_WINDOW = 100
+
+
+class SourceStats:
+    """Rolling latency and hit rate of one progress or title source."""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.hits = 0
+
+    def record(self, latency: float, hit: bool) -> None:
+        """Record one lookup."""
+        with self._lock:
+            self.calls += 1
+            self.hits += int(hit)
+            self._latencies.append(latency)
+
+    def snapshot(self) -> Dict:
+        """Return the statistics as a dict."""
+        with self._lock:
+            calls, hits, samples = self.calls, self.hits, sorted(self._latencies)
+
+        def percentile(q):
+            if not samples:
+                return None
+            return round(samples[min(len(samples) - 1, int(round(q / 100 * (len(samples) - 1))))], 3)
+
+        return {
+            "calls": calls,
+            "hits": hits,
+            "hit_rate": round(hits / calls, 3) if calls else 0.0,
+            "p50_seconds": percentile(50),
+            "p90_seconds": percentile(90),
+        }
+
+
+_stats: Dict[str, SourceStats] = {}
+_stats_lock = threading.Lock()
+
+
+def get_source_stats(name: str) -> SourceStats:
+    """Return the statistics for a source, creating them on first use."""
+    with _stats_lock:
+        if name not in _stats:
+            _stats[name] = SourceStats()
+        return _stats[name]
+
+
+def all_source_stats() -> Dict[str, Dict]:
+    """Return a snapshot of every source's statistics."""
+    with _stats_lock:
+        sources = dict(_stats)
+    return {name: stats.snapshot() for name, stats in sorted(sources.items())}
+
+
+def _timed(name: str, lookup: Callable, accept: Callable = bool):
+    started = time.time()
+    try:
+        result = lookup()
+    except Exception as e:
+        logger.debug(f"Progress source {name} failed: {e}")
+        result = None
+    get_source_stats(name).record(time.time() - started, bool(result) and accept(result))
+    return result
+
+
+def _has_page(progress: Optional[Dict]) -> bool:
+    return bool(progress and progress.get("current_page"))
+
+
+class ReadingProgressProvider:
+    """Reads the open book's progress and title for a ReaderHandler."""
+
+    def __init__(self, reader):
+        self.reader = reader
+
+    @property
+    def driver(self):
+        return self.reader.driver
+
+    def reading_progress(self, show_placemark: bool = False) -> Optional[Dict]:
+        """
+        Get the reading progress, from the UI only when no passive source has the page.
+
+        Args:
+            show_placemark: Passed to the UI fallback, which may then tap to show the toolbar
+
+        Returns:
+            dict: current_page and total_pages, or whatever the UI fallback returns
+        """
+        for name, lookup in (
+            ("progress.hierarchy", self._progress_from_hierarchy),
+            ("progress.recognizer", self._progress_from_recognizer),
+        ):
+            progress = _timed(name, lookup, _has_page)
+            if _has_page(progress):
+                logger.debug(f"Reading progress from {name}: {progress}")
+                return {"current_page": progress["current_page"], "total_pages": progress.get("total_pages")}
+
+        return _timed(
+            "progress.ui",
+            lambda: self.reader._get_reading_progress_with_ui(show_placemark=show_placemark),
+            _has_page,
+        )
+
+    def book_title(self) -> Optional[str]:
+        """
+        Get the open book's title, from the UI only when no cached source has it.
+
+        Returns:
+            str: The book title, or None if it could not be determined
+        """
+        for name, lookup in (
+            ("title.profile", self._title_from_profile),
+            ("title.session", self._title_from_session),
+            ("title.toolbar", self._title_from_toolbar),
+            ("title.ui", self.reader._get_book_title_with_ui),
+        ):
+            title = _timed(name, lookup)
+            if title:
+                logger.debug(f"Book title from {name}: '{title}'")
+                return title
+        return None
+
+    def _progress_from_hierarchy(self) -> Optional[Dict]:
+        """Parse the first footer element in the hierarchy that shows a page, location or time."""
+        best = None
+        for element in self.driver.find_elements(AppiumBy.XPATH, FOOTER_XPATH):
+            progress = parse_page_indicators((element.text or "").strip())
+            if _has_page(progress):
+                return progress
+            best = best or progress or None
+        return best
+
+    def _progress_from_recognizer(self) -> Optional[Dict]:
+        """Read the captured footer strip with the local recognizer only."""
+        indicator = capture_screen(self.driver, region=PAGE_INDICATOR_REGION)
+        if indicator is None:
+            return None
+        text, confidence = get_footer_recognizer().recognize(image_to_bytes(indicator))
+        if not text or confidence < MIN_CONFIDENCE:
+            return None
+        return parse_page_indicators(text)
+
+    def _automator(self):
+        return getattr(self.driver, "automator", None)
+
+    def _title_from_profile(self) -> Optional[str]:
+        automator = self._automator()
+        sindarin_email = get_sindarin_email()
+        if not automator or not sindarin_email:
+            return None
+        return automator.profile_manager.get_style_setting("actively_reading_title", email=sindarin_email)
+
+    def _title_from_session(self) -> Optional[str]:
+        server = getattr(self._automator(), "server_ref", None)
+        sindarin_email = get_sindarin_email()
+        if not server or not sindarin_email:
+            return None
+        return server.get_current_book(sindarin_email)
+
+    def _title_from_toolbar(self) -> Optional[str]:
+        """Read the toolbar title if the toolbar is already showing, without tapping."""
+        for element in self.driver.find_elements(AppiumBy.ID, TOOLBAR_TITLE_ID):
+            if element.is_displayed() and element.text:
+                return element.text
+        return None
@@ -1,11 +1,19 @@
+import hashlib
+import json
 import logging
 import os
+import subprocess
+import threading
 import time
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
 
 from appium.webdriver.common.appiumby import AppiumBy
 from selenium.common.exceptions import NoSuchElementException
 
 from server.logging_config import store_page_source
+from server.utils.screenshot_utils import get_driver_device_id
 from views.common.dialog_handler import DialogHandler
 from views.reading.view_strategies import (
     ABOUT_BOOK_CHECKBOX,
@@ -22,6 +30,87 @@ from views.reading.view_strategies import (
 
 logger = logging.getLogger(__name__)
 
+# Reading settings applied to every profile
+DEFAULT_READING_SETTINGS = {
+    "font_size": "smallest",
+    "real_time_highlighting": False,
+    "about_book": False,
+    "page_turn_animation": False,
+    "popular_highlights": False,
+    "highlight_menu": False,
+}
+
+# Toggles in the More tab of the style slideover, in the order they appear
+READING_TOGGLES = {
+    "real_time_highlighting": (REALTIME_HIGHLIGHTING_CHECKBOX, "Real-time Text Highlighting"),
+    "about_book": (ABOUT_BOOK_CHECKBOX, "About this Book"),
+    "page_turn_animation": (PAGE_TURN_ANIMATION_CHECKBOX, "Page Turn Animation"),
+    "popular_highlights": (POPULAR_HIGHLIGHTS_CHECKBOX, "Popular Highlights"),
+    "highlight_menu": (HIGHLIGHT_MENU_CHECKBOX, "Highlight Menu"),
+}
+
+# User preference holding the fingerprint of the reading settings applied on the user's emulator
+SETTINGS_FINGERPRINT_PREFERENCE = "reading_settings_fingerprint"
+
+# Legacy user field set once styles were applied, before fingerprints were recorded
+LEGACY_STYLES_UPDATED_FIELD = "styles_updated"
+
+BOOT_ID_TIMEOUT_SECONDS = 5
+
+# Fingerprints this process applied or read, by email
+_applied_fingerprints: Dict[str, str] = {}
+_applied_fingerprints_lock = threading.Lock()
+
+
+def reading_settings_fingerprint(
+    settings: Dict, app_version: Optional[str], avd_name: Optional[str], boot_id: Optional[str]
+) -> str:
+    """Fingerprint reading settings as applied by one app version in one boot of an AVD.
+
+    Args:
+        settings: Reading settings, as passed to apply_reading_settings
+        app_version: The Kindle app's version name
+        avd_name: The AVD the settings were applied on
+        boot_id: The kernel boot ID of the emulator when they were applied
+
+    Returns:
+        str: A short hash that changes with any setting, the app version, the AVD or the boot
+    """
+    payload = json.dumps(
+        {"settings": settings, "app_version": app_version, "avd": avd_name, "boot": boot_id}, sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def parse_toggle_states(page_source: str, toggles: Dict[str, List[Tuple[str, str]]]) -> Dict[str, bool]:
+    """Read the state of toggles from one hierarchy snapshot.
+
+    Args:
+        page_source: The UiAutomator XML page source
+        toggles: {name: locator strategies}, of which the resource ids are matched
+
+    Returns:
+        dict: {name: checked} for the toggles found in the snapshot
+    """
+    try:
+        root = ET.fromstring(page_source.encode("utf-8"))
+    except (ET.ParseError, AttributeError) as e:
+        logger.debug(f"Could not parse style slideover page source: {e}")
+        return {}
+
+    names_by_id = {
+        locator: name
+        for name, strategies in toggles.items()
+        for strategy, locator in strategies
+        if strategy == AppiumBy.ID
+    }
+    states = {}
+    for node in root.iter():
+        name = names_by_id.get(node.get("resource-id"))
+        if name and name not in states and node.get("checked") in ("true", "false"):
+            states[name] = node.get("checked") == "true"
+    return states
+
 
 class StyleHandler:
     def __init__(self, driver):
@@ -184,28 +273,46 @@ class StyleHandler:
             # Expand the slideover
             self._expand_style_slideover()
 
-            # 5. Apply reading settings
-            self._toggle_checkbox(
-                REALTIME_HIGHLIGHTING_CHECKBOX, real_time_highlighting, "Real-time Text Highlighting"
+            # 5. Read every toggle the open slideover shows from one hierarchy snapshot
+            desired = {
+                "real_time_highlighting": real_time_highlighting,
+                "about_book": about_book,
+                "page_turn_animation": page_turn_animation,
+                "popular_highlights": popular_highlights,
+                "highlight_menu": highlight_menu,
+            }
+            states = parse_toggle_states(
+                self.driver.page_source,
+                {name: strategies for name, (strategies, _) in READING_TOGGLES.items()},
+            )
+            pending = [name for name, value in desired.items() if states.get(name) != value]
+            logger.info(
+                f"Reading toggles already set: {sorted(set(desired) - set(pending))}, to set: {pending}"
             )
 
-            # Store page source after toggling highlighting
-            store_page_source(self.driver.page_source, "style_update_after_highlight_toggle")
+            # 6. Apply reading settings
+            if "real_time_highlighting" in pending:
+                strategies, description = READING_TOGGLES["real_time_highlighting"]
+                self._toggle_checkbox(strategies, real_time_highlighting, description)
+
+                # Store page source after toggling highlighting
+                store_page_source(self.driver.page_source, "style_update_after_highlight_toggle")
 
-            # 6. Scroll down to see more options
-            self._scroll_for_more_options()
+            below = [name for name in pending if name != "real_time_highlighting"]
+            if below:
+                # 7. Scroll down to see more options
+                self._scroll_for_more_options()
 
-            # Store page source after scrolling
-            store_page_source(self.driver.page_source, "style_update_after_scrolling")
+                # Store page source after scrolling
+                store_page_source(self.driver.page_source, "style_update_after_scrolling")
 
-            # 7. Apply other settings
-            self._toggle_checkbox(ABOUT_BOOK_CHECKBOX, about_book, "About this Book")
-            self._toggle_checkbox(PAGE_TURN_ANIMATION_CHECKBOX, page_turn_animation, "Page Turn Animation")
-            self._toggle_checkbox(POPULAR_HIGHLIGHTS_CHECKBOX, popular_highlights, "Popular Highlights")
-            self._toggle_checkbox(HIGHLIGHT_MENU_CHECKBOX, highlight_menu, "Highlight Menu")
+                # 8. Apply other settings
+                for name in below:
+                    strategies, description = READING_TOGGLES[name]
+                    self._toggle_checkbox(strategies, desired[name], description)
 
-            # Store page source after all toggles
-            store_page_source(self.driver.page_source, "style_update_after_all_toggles")
+                # Store page source after all toggles
+                store_page_source(self.driver.page_source, "style_update_after_all_toggles")
 
             # 11. Close the style slideover
             self._close_style_slideover()
@@ -214,14 +321,7 @@ class StyleHandler:
             store_page_source(self.driver.page_source, "style_update_complete")
 
             # Update profile preferences
-            self._save_reading_preferences(
-                font_size,
-                real_time_highlighting,
-                about_book,
-                page_turn_animation,
-                popular_highlights,
-                highlight_menu,
-            )
+            self._record_applied_settings({"font_size": font_size, **desired})
 
             return True
 
@@ -236,7 +336,13 @@ class StyleHandler:
     def update_reading_style(self, show_placemark: bool = False) -> bool:
         """
         Update reading styles for the current profile. Should be called after a book is opened.
-        This will only update styles if they have not already been updated for this profile.
+        This will only update styles if the settings last applied on the profile's emulator, as
+        recorded by their fingerprint, differ from the defaults, or the app version or the boot
+        changed.
+
+        The boot ID survives loading a snapshot, since the snapshot restores the boot it was
+        taken in, but changes on a cold boot or when the AVD is recreated under the same name,
+        which are when settings applied earlier may be gone.
 
         This delegates to the new apply_reading_settings with default values.
 
@@ -247,23 +353,98 @@ class StyleHandler:
         Returns:
             bool: True if the styles were updated successfully or were already updated, False otherwise
         """
-        # First check if styles have already been updated for this profile
-        if self.profile_manager and self.profile_manager.is_styles_updated():
-            logger.debug("Reading styles already updated for this profile, skipping")
-            return True
+        from server.utils.request_utils import get_sindarin_email
+
+        email = get_sindarin_email()
+        boot_id = self._boot_id()
+        if email and self.profile_manager and boot_id:
+            expected = self._settings_fingerprint(email, DEFAULT_READING_SETTINGS, boot_id)
+            applied = self._applied_fingerprint(email)
+            if applied == expected:
+                logger.debug("Reading settings already applied in this boot of the profile's AVD, skipping")
+                return True
+            if applied is None and self.profile_manager.get_user_field(email, LEGACY_STYLES_UPDATED_FIELD):
+                # Profiles styled before fingerprints were recorded keep their styles until the next boot
+                logger.info(f"Adopting reading settings applied before fingerprints for {email}")
+                self._store_fingerprint(email, expected)
+                return True
 
         logger.info("Updating reading styles for the current profile")
 
         # Call the refactored method with default settings
-        return self.apply_reading_settings(
-            font_size="smallest",
-            real_time_highlighting=False,
-            about_book=False,
-            page_turn_animation=False,
-            popular_highlights=False,
-            highlight_menu=False,
-            show_placemark=show_placemark,
+        return self.apply_reading_settings(**DEFAULT_READING_SETTINGS, show_placemark=show_placemark)
+
+    def _boot_id(self) -> Optional[str]:
+        """Return the kernel boot ID of the emulator, or None if it cannot be read."""
+        device_id = get_driver_device_id(self.driver)
+        if not device_id:
+            return None
+        try:
+            result = subprocess.run(
+                ["adb", "-s", device_id, "shell", "cat", "/proc/sys/kernel/random/boot_id"],
+                capture_output=True,
+                text=True,
+                timeout=BOOT_ID_TIMEOUT_SECONDS,
+                check=True,
+            )
+        except Exception as e:
+            logger.warning(f"Could not read boot ID of {device_id}: {e}")
+            return None
+        return result.stdout.strip() or None
+
+    def _settings_fingerprint(self, email: str, settings: Dict, boot_id: Optional[str]) -> str:
+        """Fingerprint reading settings for the user's AVD, installed app version and boot."""
+        app_version = self.profile_manager.get_user_field(email, "kindle_version_name")
+        avd_name = self.profile_manager.get_avd_for_email(email)
+        return reading_settings_fingerprint(settings, app_version, avd_name, boot_id)
+
+    def _applied_fingerprint(self, email: str) -> Optional[str]:
+        """Return the fingerprint of the reading settings last applied for a user, if any."""
+        with _applied_fingerprints_lock:
+            if email in _applied_fingerprints:
+                return _applied_fingerprints[email]
+        fingerprint = self.profile_manager.get_user_field(
+            email, SETTINGS_FINGERPRINT_PREFERENCE, section="preferences"
+        )
+        if fingerprint:
+            with _applied_fingerprints_lock:
+                _applied_fingerprints[email] = fingerprint
+        return fingerprint
+
+    def _store_fingerprint(self, email: str, fingerprint: str):
+        """Save the fingerprint of the reading settings applied for a user."""
+        self.profile_manager.set_user_field(
+            email, SETTINGS_FINGERPRINT_PREFERENCE, fingerprint, section="preferences"
         )
+        with _applied_fingerprints_lock:
+            _applied_fingerprints[email] = fingerprint
+
+    def _record_applied_settings(self, settings: Dict):
+        """Record the fingerprint of applied reading settings and mark the AVD snapshot stale.
+
+        The snapshot is marked dirty so the next boot does not restore one taken before the
+        settings were applied, and the snapshot taken at shutdown includes them.
+        """
+        try:
+            from server.utils.request_utils import get_sindarin_email
+
+            email = get_sindarin_email()
+            if not email or not self.profile_manager:
+                return
+
+            fingerprint = self._settings_fingerprint(email, settings, self._boot_id())
+            self._store_fingerprint(email, fingerprint)
+
+            from database.connection import get_db
+            from database.repositories.user_repository import UserRepository
+
+            with get_db() as session:
+                UserRepository(session).update_snapshot_dirty_status(
+                    email, is_dirty=True, dirty_since=datetime.now(timezone.utc)
+                )
+            logger.info(f"Recorded reading settings fingerprint {fingerprint} for {email}")
+        except Exception as e:
+            logger.error(f"Error recording applied reading settings: {e}", exc_info=True)
 
     def _adjust_font_size(self, size):
         """Adjust the font size to the specified setting."""
@@ -554,40 +735,6 @@ class StyleHandler:
         logger.info(f"Tapped near top of screen at ({top_tap_x}, {top_tap_y}) to hide style slideover")
         time.sleep(1)
 
-    def _save_reading_preferences(
-        self,
-        font_size,
-        real_time_highlighting,
-        about_book,
-        page_turn_animation,
-        popular_highlights,
-        highlight_menu,
-    ):
-        """Save the reading style preferences to the profile."""
-        try:
-            # Import here to avoid circular imports
-            from server.utils.request_utils import get_sindarin_email
-
-            # Get email from the request using standard utility function
-            email = get_sindarin_email()
-
-            if email:
-                if self.profile_manager:
-                    try:
-                        # Make sure style_updated preference is set properly
-                        if self.profile_manager.update_style_preference(True, email):
-                            logger.info(f"Successfully updated style preference in profile for {email}")
-                        else:
-                            logger.warning(f"Standard update_style_preference failed for {email}")
-                    except Exception as update_e:
-                        logger.error(f"Error during style preference update: {update_e}", exc_info=True)
-                else:
-                    logger.warning(f"No profile_manager available to update style preference for {email}")
-            else:
-                logger.warning("No email available from get_sindarin_email() to update style preference")
-        except Exception as e:
-            logger.error(f"Error updating style preference in profile: {e}", exc_info=True)
-
     def _toggle_checkbox(self, checkbox_strategies, desired_state, description):
         """
         Toggle a checkbox to the desired state.
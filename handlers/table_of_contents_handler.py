@@ -16,6 +16,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 
 from handlers.about_book_popover_handler import AboutBookPopoverHandler
 from server.logging_config import store_page_source
+from server.utils.toc_cache import get_toc_cache, normalize_chapter_title
 from views.reading.interaction_strategies import (
     FOOTER_PAGE_NUMBER_TAP_TARGET,
     PAGE_POSITION_TEXT,
@@ -63,11 +64,44 @@ class TableOfContentsHandler:
             return self.cancellation_check()
         return False
 
-    def get_table_of_contents(self, title: Optional[str] = None) -> Tuple[Dict, int]:
+    def _toc_cache_key(self, title: Optional[str] = None) -> Optional[Tuple[str, str, Optional[str]]]:
+        """Get the (email, book, app version) the current book's ToC is cached under.
+
+        Args:
+            title: Book title to use if the current book is not known.
+
+        Returns:
+            The cache key, or None if the user or book is not known.
+        """
+        profile = self.automator.profile_manager.get_current_profile()
+        sindarin_email = profile.get("email") if profile else None
+        if not sindarin_email:
+            return None
+
+        book = None
+        if hasattr(self.automator, "server_ref") and self.automator.server_ref:
+            book = self.automator.server_ref.get_current_book(sindarin_email)
+        book = book or title
+        if not book:
+            return None
+
+        app_version = self.automator.profile_manager.get_user_field(sindarin_email, "kindle_version_name")
+        return sindarin_email, book, app_version
+
+    @staticmethod
+    def _without_scroll_offsets(chapters: List[Dict]) -> List[Dict]:
+        """Return chapters as they are sent to clients, without their ToC scroll offsets."""
+        return [{key: value for key, value in chapter.items() if key != "scroll"} for chapter in chapters]
+
+    def get_table_of_contents(self, title: Optional[str] = None, refresh: bool = False) -> Tuple[Dict, int]:
         """Get the table of contents for the current book.
 
+        Chapters are read from the ToC cache unless it has none for this book and app
+        version. Chapters read from the Kindle app are cached for the next request.
+
         Args:
             title: Optional book title to ensure we're in the correct book.
+            refresh: Read the chapters from the Kindle app even if they are cached.
 
         Returns:
             Tuple of (response_data, status_code)
@@ -113,7 +147,7 @@ class TableOfContentsHandler:
                 response_data = {
                     "success": True,
                     "position": current_position or {"note": "Position not available"},
-                    "chapters": chapters,
+                    "chapters": self._without_scroll_offsets(chapters),
                     "chapter_count": len(chapters),
                 }
 
@@ -154,6 +188,21 @@ class TableOfContentsHandler:
                         if not self._open_book_if_needed(title):
                             return {"error": f"Failed to open book: {title}"}, 500
 
+            toc_cache_key = self._toc_cache_key(title)
+            if toc_cache_key and not refresh:
+                cached_chapters = get_toc_cache().get(*toc_cache_key)
+                if cached_chapters is not None:
+                    logger.info(
+                        f"Serving {len(cached_chapters)} chapters of '{toc_cache_key[1]}' from ToC cache"
+                    )
+                    return {
+                        "success": True,
+                        "position": self._get_current_page_position() or {"note": "Position not available"},
+                        "chapters": self._without_scroll_offsets(cached_chapters),
+                        "chapter_count": len(cached_chapters),
+                        "cached": True,
+                    }, 200
+
             # Make sure we have the reading controls visible
             if not self._ensure_reading_controls_visible():
                 return {"error": "Failed to show reading controls"}, 500
@@ -200,6 +249,10 @@ class TableOfContentsHandler:
             # Collect all chapters
             chapters = self._collect_all_chapters()
 
+            # Scroll offsets are counted from the top, so only chapters collected from there are cached
+            if toc_cache_key:
+                get_toc_cache().put(*toc_cache_key, chapters)
+
             # Close the Table of Contents
             if not self._close_table_of_contents():
                 logger.warning("Failed to close Table of Contents cleanly")
@@ -228,7 +281,7 @@ class TableOfContentsHandler:
             response_data = {
                 "success": True,
                 "position": final_position,
-                "chapters": chapters,
+                "chapters": self._without_scroll_offsets(chapters),
                 "chapter_count": len(chapters),
             }
 
@@ -638,11 +691,21 @@ class TableOfContentsHandler:
         """Scroll to the top of the Table of Contents list."""
         self._scroll_toc_in_direction("up", num_swipes=3)
 
+    def _swipe_toc_down(self, window_size: Dict):
+        """Scroll the Table of Contents down by one swipe, as when collecting chapters."""
+        start_x = window_size["width"] // 2
+        start_y = int(window_size["height"] * 0.7)
+        end_y = int(window_size["height"] * 0.3)
+        self.driver.swipe(start_x, start_y, start_x, end_y, duration=300)
+        # Small delay for scroll to complete
+        time.sleep(0.1)
+
     def _collect_all_chapters(self) -> List[Dict]:
         """Collect all chapters from the Table of Contents.
 
         Returns:
-            List of chapter dictionaries with title and optional page number.
+            List of chapter dictionaries with title, optional page number and the
+            number of swipes down after which the chapter came into view.
         """
         chapters = []
         seen_chapters = set()
@@ -650,9 +713,6 @@ class TableOfContentsHandler:
         try:
             # Setup scrolling parameters
             window_size = self.driver.get_window_size()
-            start_x = window_size["width"] // 2
-            start_y = int(window_size["height"] * 0.7)
-            end_y = int(window_size["height"] * 0.3)
             no_new_chapters_count = 0
             max_scrolls = 20  # Prevent infinite scrolling
 
@@ -707,6 +767,7 @@ class TableOfContentsHandler:
                                 break
 
                         if self._add_chapter_if_new(chapters, seen_chapters, title_text, page_text):
+                            chapters[-1]["scroll"] = scroll_count
                             new_chapters_found = True
 
                     except Exception:
@@ -723,9 +784,7 @@ class TableOfContentsHandler:
 
                 # Scroll down to see more chapters
                 if scroll_count < max_scrolls - 1:
-                    self.driver.swipe(start_x, start_y, start_x, end_y, duration=300)
-                    # Small delay for scroll to complete
-                    time.sleep(0.1)
+                    self._swipe_toc_down(window_size)
 
             logger.info(f"Collected {len(chapters)} chapters from Table of Contents")
 
@@ -829,9 +888,7 @@ class TableOfContentsHandler:
 
                         title_text = title_elem.text.strip()
                         # Normalize the chapter title for comparison
-                        normalized_title = (
-                            "".join(c for c in title_text if c.isalnum() or c.isspace()).lower().strip()
-                        )
+                        normalized_title = normalize_chapter_title(title_text)
 
                         # Check for exact normalized match only
                         if normalized_requested == normalized_title:
@@ -851,9 +908,7 @@ class TableOfContentsHandler:
 
                         title_text = title_elem.text.strip()
                         # Normalize the chapter title for comparison
-                        normalized_title = (
-                            "".join(c for c in title_text if c.isalnum() or c.isspace()).lower().strip()
-                        )
+                        normalized_title = normalize_chapter_title(title_text)
 
                         # Check for exact normalized match only
                         if normalized_requested == normalized_title:
@@ -871,9 +926,38 @@ class TableOfContentsHandler:
             logger.debug(f"Error in quick chapter find: {e}")
             return False
 
+    def _scroll_to_cached_chapter(
+        self, chapter_name: str, normalized_requested: str, scroll_offset: int
+    ) -> bool:
+        """Scroll from the top of the ToC to where a cached chapter was seen and click it.
+
+        Args:
+            chapter_name: Original chapter name
+            normalized_requested: Normalized version for comparison
+            scroll_offset: Swipes down from the top after which the chapter came into view
+
+        Returns:
+            bool: True if chapter was found and clicked
+        """
+        logger.info(f"Scrolling {scroll_offset} swipes to cached position of chapter '{chapter_name}'")
+        self._scroll_to_top_of_toc()
+        window_size = self.driver.get_window_size()
+        for _ in range(scroll_offset):
+            self._swipe_toc_down(window_size)
+
+        if self._try_find_and_click_chapter(chapter_name, normalized_requested):
+            return True
+
+        # Allow for a swipe that scrolled a little less than when the chapter was cached
+        self._swipe_toc_down(window_size)
+        return self._try_find_and_click_chapter(chapter_name, normalized_requested)
+
     def navigate_to_chapter(self, chapter_name: str, target_page: Optional[int] = None) -> Dict:
         """Navigate to a specific chapter from the table of contents.
 
+        If the book's ToC is cached, the ToC is scrolled straight to the chapter's
+        cached offset before falling back to searching it.
+
         Args:
             chapter_name: The name of the chapter to navigate to.
             target_page: Optional page number of the target chapter to optimize scrolling.
@@ -885,14 +969,20 @@ class TableOfContentsHandler:
             logger.info(f"Attempting to navigate to chapter: {chapter_name}, target page: {target_page}")
 
             # Normalize the requested chapter name for comparison
-            normalized_requested = (
-                "".join(c for c in chapter_name if c.isalnum() or c.isspace()).lower().strip()
-            )
+            normalized_requested = normalize_chapter_title(chapter_name)
 
             # Check if we're in reading view
             if not self.automator.state_machine.is_reading_view():
                 return {"success": False, "error": "Not in reading view"}
 
+            # Look up where the chapter is in the cached ToC
+            cached_chapter = None
+            toc_cache_key = self._toc_cache_key()
+            if toc_cache_key:
+                cached_chapter = get_toc_cache().find_chapter(*toc_cache_key, chapter_name)
+            if cached_chapter and target_page is None:
+                target_page = cached_chapter.get("page")
+
             # Ensure reading controls are visible
             if not self._ensure_reading_controls_visible():
                 return {"success": False, "error": "Failed to show reading controls"}
@@ -925,6 +1015,11 @@ class TableOfContentsHandler:
 
             if found_chapter:
                 logger.info("Chapter found immediately without scrolling")
+            elif cached_chapter and self._scroll_to_cached_chapter(
+                chapter_name, normalized_requested, cached_chapter.get("scroll", 0)
+            ):
+                found_chapter = True
+                logger.info("Chapter found at its cached ToC position")
             else:
                 # Decide scroll strategy based on page numbers
                 scroll_strategy = "both"  # default: search from top then bottom
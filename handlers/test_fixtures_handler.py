@@ -3,6 +3,8 @@ import os
 import subprocess
 import time
 
+from appium.webdriver.common.appiumby import AppiumBy
+
 logger = logging.getLogger(__name__)
 
 from handlers.library_handler import LibraryHandler
@@ -46,6 +48,16 @@ class TestFixturesHandler:
             logger.info("Navigating to Library view...")
             if self.library_handler.navigate_to_library():
                 self._capture_view("library")
+
+                # Long-press the first book and capture the selection action bar
+                books = self.driver.find_elements(AppiumBy.ID, "com.amazon.kindle:id/badgeable_cover")
+                if books:
+                    self.driver.execute_script(
+                        "mobile: longClickGesture", {"elementId": books[0].id, "duration": 1000}
+                    )
+                    time.sleep(1)
+                    self._capture_view("library_selection")
+                    self.library_handler.scroll_handler.exit_book_selection_mode()
             else:
                 logger.error("Failed to navigate to Library view", exc_info=True)
 
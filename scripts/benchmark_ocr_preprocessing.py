@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark OCR uploads with and without preprocessing over a folder of reader screenshots.
+
+For every screenshot the main text region is cropped as for /navigate?ocr=1 and encoded
+two ways: the PNG that used to be uploaded, and the output of prepare_ocr_image(). The
+script reports upload bytes for both and, unless --bytes-only is given, the latency of
+each configured provider and the accuracy of its text. Accuracy is the similarity to a
+<name>.txt transcript next to the screenshot, or to the provider's PNG result when there
+is no transcript.
+
+Usage:
+    python scripts/benchmark_ocr_preprocessing.py screenshots/corpus --format WEBP --quality 75
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+
+# Add the parent directory to Python path so we can import from server.utils
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from handlers.reader_page_handler import MAIN_TEXT_REGION
+from server.utils.ocr_preprocessing import prepare_ocr_image
+from server.utils.ocr_providers import get_ocr_providers
+from server.utils.screenshot_utils import crop_region, image_to_bytes, load_image
+
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".webp"}
+
+
+def similarity(text, reference):
+    """Character similarity of two texts, ignoring differences in whitespace."""
+    if text is None or reference is None:
+        return 0.0
+    return SequenceMatcher(None, " ".join(text.split()), " ".join(reference.split())).ratio()
+
+
+def timed_recognize(provider, upload):
+    """OCR an upload, returning (text, seconds)."""
+    started = time.time()
+    text, _ = provider.recognize(upload)
+    return text, time.time() - started
+
+
+def benchmark(corpus, image_format, quality, target_dpi, bytes_only, providers):
+    screenshots = sorted(path for path in Path(corpus).iterdir() if path.suffix.lower() in IMAGE_SUFFIXES)
+    if not screenshots:
+        print(f"No screenshots found in {corpus}")
+        return
+
+    png_sizes, prepared_sizes = [], []
+    results = {provider.name: {"png": [], "prepared": []} for provider in providers}
+
+    for path in screenshots:
+        region = crop_region(load_image(str(path)), MAIN_TEXT_REGION)
+        png = image_to_bytes(region)
+        prepared, mime_type = prepare_ocr_image(region, image_format, quality, target_dpi)
+        png_sizes.append(len(png))
+        prepared_sizes.append(len(prepared))
+        print(f"{path.name}: PNG {len(png):,} bytes, {mime_type} {len(prepared):,} bytes")
+
+        if bytes_only:
+            continue
+
+        transcript_path = path.with_suffix(".txt")
+        transcript = transcript_path.read_text() if transcript_path.exists() else None
+        for provider in providers:
+            png_text, png_seconds = timed_recognize(provider, png)
+            prepared_text, prepared_seconds = timed_recognize(provider, prepared)
+            reference = transcript if transcript is not None else png_text
+            results[provider.name]["png"].append((png_seconds, similarity(png_text, reference)))
+            results[provider.name]["prepared"].append(
+                (prepared_seconds, similarity(prepared_text, reference))
+            )
+            print(
+                f"  {provider.name}: PNG {png_seconds:.2f}s, preprocessed {prepared_seconds:.2f}s, "
+                f"accuracy {similarity(prepared_text, reference):.1%}"
+            )
+
+    print(f"\n{len(screenshots)} screenshots, {image_format} at quality {quality}, {target_dpi} DPI")
+    print(
+        f"Median upload: PNG {statistics.median(png_sizes):,.0f} bytes, "
+        f"preprocessed {statistics.median(prepared_sizes):,.0f} bytes "
+        f"({sum(prepared_sizes) / sum(png_sizes):.0%} of PNG)"
+    )
+    for name, runs in results.items():
+        for label, samples in runs.items():
+            if samples:
+                latencies = [seconds for seconds, _ in samples]
+                accuracy = statistics.mean(score for _, score in samples)
+                print(
+                    f"{name} {label}: median {statistics.median(latencies):.2f}s, "
+                    f"max {max(latencies):.2f}s, accuracy {accuracy:.1%}"
+                )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark OCR upload preprocessing")
+    parser.add_argument("corpus", help="Folder of reader screenshots, with optional <name>.txt transcripts")
+    parser.add_argument("--format", default="JPEG", choices=["JPEG", "WEBP"], help="Upload encoding")
+    parser.add_argument("--quality", type=int, default=85, help="Encoder quality")
+    parser.add_argument("--target-dpi", type=int, default=300, help="Upload density")
+    parser.add_argument("--providers", help="Comma-separated providers, defaulting to OCR_PROVIDERS")
+    parser.add_argument("--bytes-only", action="store_true", help="Compare upload sizes without OCR requests")
+    args = parser.parse_args()
+
+    providers = [] if args.bytes_only else get_ocr_providers(args.providers)
+    benchmark(args.corpus, args.format, args.quality, args.target_dpi, args.bytes_only, providers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of the single-pass OCR text cleaner against the previous implementation.
+
+Runs both cleaners over the golden OCR samples in fixtures/ocr, or over a folder of raw
+OCR output given as *.txt files, checks their results are identical and reports the
+time per page of each.
+
+Usage:
+    python scripts/benchmark_ocr_text_cleaner.py [folder of OCR .txt files] [--repeat 2000]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import timeit
+from pathlib import Path
+
+# Add the parent directory to Python path so we can import from server.utils
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from server.utils.ocr_text_cleaner import clean_ocr_text
+
+GOLDEN_PATH = Path(__file__).parent.parent / "fixtures" / "ocr" / "clean_ocr_text_golden.json"
+
+
+def previous_clean_ocr_text(text):
+    """The cleaner before the single-pass rewrite, kept as the benchmark baseline."""
+    if not text:
+        return text
+    lines = text.strip().split("\n")
+    cleaned_lines = []
+    for line in lines:
+        if re.search(r"learning\s+reading\s+speed", line, re.IGNORECASE):
+            continue
+        if re.match(r"^\s*\d{1,3}%\s*$", line):
+            continue
+        if re.search(r"location\s+\d+\s+of\s+\d+", line, re.IGNORECASE):
+            continue
+        if re.match(r"^\s*(page\s+)?\d+\s*$", line, re.IGNORECASE):
+            continue
+        if re.search(r"\d+\s*mins?\s*left\s*in\s*(chapter|book)", line, re.IGNORECASE):
+            continue
+        cleaned_lines.append(line)
+    cleaned_text = "\n".join(cleaned_lines)
+    cleaned_text = re.sub(r"-\n([a-zA-Z])", r"\1", cleaned_text)
+    cleaned_text = re.sub(r"\n\n+", "\x00", cleaned_text)
+    cleaned_text = re.sub(r"\n", " ", cleaned_text)
+    cleaned_text = cleaned_text.replace("\x00", "\n\n")
+    cleaned_text = re.sub(r" +", " ", cleaned_text)
+    return cleaned_text.strip()
+
+
+def load_pages(folder):
+    if folder:
+        return [path.read_text() for path in sorted(Path(folder).glob("*.txt"))]
+    return [sample["input"] for sample in json.loads(GOLDEN_PATH.read_text())]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the OCR text cleaner")
+    parser.add_argument("folder", nargs="?", help="Folder of raw OCR output as .txt files")
+    parser.add_argument("--repeat", type=int, default=2000, help="Passes over the pages")
+    args = parser.parse_args()
+
+    pages = load_pages(args.folder)
+    if not pages:
+        print("No OCR pages found")
+        return
+
+    mismatches = [page for page in pages if clean_ocr_text(page) != previous_clean_ocr_text(page)]
+    print(f"{len(pages)} pages, {len(mismatches)} with different output")
+
+    timings = {}
+    for name, cleaner in (("previous", previous_clean_ocr_text), ("single-pass", clean_ocr_text)):
+        seconds = min(timeit.repeat(lambda: [cleaner(page) for page in pages], number=args.repeat, repeat=3))
+        timings[name] = seconds / (args.repeat * len(pages))
+        print(f"{name}: {timings[name] * 1e6:.1f} µs per page")
+    print(f"Speedup: {timings['previous'] / timings['single-pass']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
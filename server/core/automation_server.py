@@ -6,11 +6,12 @@ import platform
 import signal
 import subprocess
 import time
-from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from automator import KindleAutomator
+from server.utils.frame_source import stop_frame_source
+from server.utils.position_tracker import get_position_tracker
 from views.core.app_state import AppState
 from views.core.avd_profile_manager import AVDProfileManager
 
@@ -26,21 +27,6 @@ class AutomationServer:
             cls._instance._initialized = False
         return cls._instance
 
-    @contextmanager
-    def _book_position_repo(self):
-        """Context manager for BookPositionRepository operations.
-
-        Yields:
-            BookPositionRepository: Repository instance for book position operations
-        """
-        from database.connection import get_db
-        from database.repositories.book_position_repository import (
-            BookPositionRepository,
-        )
-
-        with get_db() as session:
-            yield BookPositionRepository(session)
-
     def __init__(self):
         if self._initialized:
             return
@@ -285,6 +271,10 @@ class AutomationServer:
             logger.error("Email parameter is required for set_current_book", exc_info=True)
             return None
 
+        # Write pending navigation first, so it cannot land on top of a reset session,
+        # and stop keeping the positions of the user's other books in memory
+        get_position_tracker().forget(email, keep=book_title)
+
         # Handle book sessions in database
         from database.connection import get_db
         from database.repositories.book_session_repository import BookSessionRepository
@@ -360,6 +350,12 @@ class AutomationServer:
             return
 
         # Session key is cleared from database when book session ends
+        get_position_tracker().forget(email)
+
+        # The screen is only streamed while a book is read
+        automator = self.automators.get(email)
+        if automator and getattr(automator, "device_id", None):
+            stop_frame_source(automator.device_id)
 
     def get_current_book(self, email):
         """Get the current book for the specified email from the database.
@@ -476,28 +472,13 @@ class AutomationServer:
     def update_activity(self, email):
         """Update the last activity timestamp for an email in the database.
 
+        The timestamp is written behind by the position tracker.
+
         Args:
             email: The email address to update activity for
         """
         if email:
-            from datetime import datetime, timezone
-
-            from database.connection import get_db
-            from database.models import ReadingSession, User
-
-            with get_db() as db_session:
-                # Find the most recent active reading session for this user
-                user = db_session.query(User).filter_by(email=email).first()
-                if user:
-                    session = (
-                        db_session.query(ReadingSession)
-                        .filter_by(user_id=user.id, ended_at=None)
-                        .order_by(ReadingSession.started_at.desc())
-                        .first()
-                    )
-                    if session:
-                        session.last_activity_at = datetime.now(timezone.utc)
-                        db_session.commit()
+            get_position_tracker().record_activity(email)
 
     def get_last_activity_time(self, email):
         """Get the last activity timestamp for an email from the database.
@@ -546,11 +527,15 @@ class AutomationServer:
             return
 
         try:
-            with self._book_position_repo() as repo:
-                repo.reset_position(email, book_title)
+            get_position_tracker().set_position(email, book_title, 0)
         except Exception as e:
             logger.error(f"Error resetting position for {email}: {e}", exc_info=True)
 
+        # Cached pages are keyed by position, which now refers to different pages
+        from server.utils.page_text_cache import get_page_text_cache
+
+        get_page_text_cache().forget(email, book_title)
+
     def get_position(self, email: str, book_title: str = None) -> int:
         """Get the current page position for a given email.
 
@@ -570,8 +555,7 @@ class AutomationServer:
             return 0
 
         try:
-            with self._book_position_repo() as repo:
-                return repo.get_position(email, book_title)
+            return get_position_tracker().get_position(email, book_title)
         except Exception as e:
             logger.error(f"Error getting position for {email}: {e}", exc_info=True)
             return 0
@@ -596,8 +580,7 @@ class AutomationServer:
             return 0
 
         try:
-            with self._book_position_repo() as repo:
-                return repo.update_position(email, book_title, delta)
+            return get_position_tracker().update_position(email, book_title, delta)
         except Exception as e:
             logger.error(f"Error updating position for {email}: {e}", exc_info=True)
             return 0
@@ -619,8 +602,7 @@ class AutomationServer:
             return
 
         try:
-            with self._book_position_repo() as repo:
-                repo.set_position(email, book_title, position)
+            get_position_tracker().set_position(email, book_title, position)
         except Exception as e:
             logger.error(f"Error setting position for {email}: {e}", exc_info=True)
 
@@ -55,6 +55,10 @@ PRIORITY_LEVELS = {
     # "/screenshot" has priority 0 (default) - lowest priority, can be cancelled
 }
 
+# Background jobs (library rescans, read-ahead, download prefetch, book extraction)
+# run below every client request, so any request cancels them
+BACKGROUND_PRIORITY = -1
+
 # Endpoints where newer requests should cancel older ones (last-one-wins)
 # These endpoints use path-only request keys for proper cancellation
 LAST_ONE_WINS_ENDPOINTS = {
@@ -448,6 +452,55 @@ class RequestManager:
         except Exception as e:
             logger.error(f"Error setting active request: {e}")
 
+    def claim_background_request(self) -> bool:
+        """
+        Record this background job as the user's active request, below every client request.
+
+        Unlike a client request, a background job never replaces or waits on an active
+        request; it simply doesn't run.
+
+        Returns:
+            bool: True if the job may use the device, False if another request is active
+        """
+        self.priority = BACKGROUND_PRIORITY
+        if not self.redis_client:
+            return True
+
+        try:
+            active_key = f"kindle:user:{self.user_email}:active_request"
+            active_data = {
+                "request_key": self.request_key,
+                "priority": self.priority,
+                "path": self.path,
+                "started_at": time.time(),
+                "request_number": self.request_number,
+            }
+            claimed = self.redis_client.set(active_key, json.dumps(active_data), ex=DEFAULT_TTL, nx=True)
+            if not claimed:
+                logger.debug(
+                    f"Not starting background {self.path} for {self.user_email}: a request is active"
+                )
+                return False
+
+            # Background keys repeat from run to run, so drop any flag left from an earlier one
+            self.redis_client.delete(f"{self.request_key}:cancelled")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error claiming background request: {e}")
+            return False
+
+    def release_background_request(self):
+        """Clear this background job from the user's active request, and its cancellation flag."""
+        self._clear_active_request()
+        if not self.redis_client:
+            return
+
+        try:
+            self.redis_client.delete(f"{self.request_key}:cancelled")
+        except Exception as e:
+            logger.error(f"Error releasing background request: {e}")
+
     def wait_for_deduplicated_response(self) -> Optional[Tuple[Any, int]]:
         """Wait for a deduplicated response from another request."""
         if not self.redis_client:
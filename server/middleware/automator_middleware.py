@@ -14,13 +14,22 @@ from server.utils.request_utils import get_sindarin_email
 logger = logging.getLogger(__name__)
 
 
-def ensure_automator_healthy(f):
+def ensure_automator_healthy(f=None, *, skip_if=None):
     """Decorator to ensure automator is initialized and healthy before each operation.
     Works with the multi-emulator approach by getting the sindarin_email from the request.
+
+    Args:
+        skip_if: Optional callable that returns True for requests the resource answers
+            without the device (e.g. from the library catalog), which then skip the checks
     """
+    if f is None:
+        return lambda func: ensure_automator_healthy(func, skip_if=skip_if)
 
     @wraps(f)
     def wrapper(*args, **kwargs):
+        if skip_if and skip_if():
+            return f(*args, **kwargs)
+
         # Get server instance using singleton
         server = AutomationServer.get_instance()
 
@@ -44,6 +53,29 @@ def ensure_automator_healthy(f):
         # Update activity timestamp for this email
         server.update_activity(sindarin_email)
 
+        # Stop any read-ahead before this request drives the device; navigation requests
+        # take over the pages the device is ahead, everything else gets the user's page back
+        try:
+            from server.utils.read_ahead import NAVIGATION_PATHS, get_read_ahead_manager
+
+            get_read_ahead_manager().settle(
+                sindarin_email, keep_offset=flask.request.path in NAVIGATION_PATHS
+            )
+        except Exception as e:
+            logger.warning(f"Error settling read-ahead for {sindarin_email}: {e}")
+
+        # Pause any book extraction before driving the device; it resumes once the user is idle
+        try:
+            from server.utils.book_extractor import (
+                NON_DRIVING_PATHS,
+                get_book_extractor,
+            )
+
+            if flask.request.path not in NON_DRIVING_PATHS:
+                get_book_extractor().pause(sindarin_email, by_request=True)
+        except Exception as e:
+            logger.warning(f"Error pausing book extraction for {sindarin_email}: {e}")
+
         # Proactively check for stale Appium processes before attempting operations
         try:
             from server.utils.appium_driver import AppiumDriver
@@ -0,0 +1,80 @@
+"""Book text extraction resource."""
+
+import logging
+
+from flask import request
+from flask_restful import Resource
+
+from server.core.automation_server import AutomationServer
+from server.middleware.automator_middleware import ensure_automator_healthy
+from server.middleware.profile_middleware import ensure_user_profile_loaded
+from server.utils.book_extractor import get_book_extractor
+from server.utils.request_utils import get_sindarin_email
+
+logger = logging.getLogger(__name__)
+
+
+def _get_param(name, default=None):
+    """Read a parameter from the JSON body of a POST, falling back to the query string."""
+    if request.is_json and request.json and name in request.json:
+        return request.json[name]
+    return request.args.get(name, default)
+
+
+class BookExtractionResource(Resource):
+    """
+    Server-side extraction of the open book's text.
+
+    POST /extract-book starts extracting the open book from the page on screen, or resumes
+    from its checkpoint. Optional max_pages limits the run and restart=1 discards stored
+    pages. Any other request that drives the user's device pauses the job, which resumes by
+    itself once the user is idle with the book still open, or when POSTed again. A job only
+    resumes while the device still shows its last extracted page.
+
+    GET /extract-book?title=<book> reports status, pages and pages per minute, and with
+    text=1 also returns the stored pages. DELETE /extract-book pauses a running job.
+    """
+
+    @ensure_user_profile_loaded
+    @ensure_automator_healthy
+    def post(self):
+        server = AutomationServer.get_instance()
+        sindarin_email = get_sindarin_email()
+        book = server.get_current_book(sindarin_email)
+        if not book:
+            return {"error": "No book is open. Open the book to extract first."}, 400
+
+        max_pages = _get_param("max_pages")
+        try:
+            max_pages = int(max_pages) if max_pages is not None else None
+        except (TypeError, ValueError):
+            return {"error": f"Invalid max_pages '{max_pages}'"}, 400
+        restart = str(_get_param("restart", "0")).lower() in ("1", "true")
+
+        progress = get_book_extractor().start(server, sindarin_email, book, max_pages, restart)
+        return progress, 202
+
+    def get(self):
+        sindarin_email = get_sindarin_email()
+        if not sindarin_email:
+            return {"error": "No email provided to identify which profile to use"}, 400
+
+        extractor = get_book_extractor()
+        book = request.args.get("title")
+        progress = extractor.get_progress(sindarin_email, book)
+        if not progress:
+            return {"error": "No extraction found"}, 404
+
+        if request.args.get("text", "0").lower() in ("1", "true"):
+            progress["page_records"] = extractor.get_pages(sindarin_email, progress["book"])
+        return progress, 200
+
+    def delete(self):
+        sindarin_email = get_sindarin_email()
+        if not sindarin_email:
+            return {"error": "No email provided to identify which profile to use"}, 400
+
+        extractor = get_book_extractor()
+        if not extractor.pause(sindarin_email):
+            return {"error": "No extraction is running"}, 404
+        return extractor.get_progress(sindarin_email), 200
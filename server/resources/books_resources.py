@@ -6,7 +6,7 @@ import os
 import time
 import traceback
 
-from flask import Response, request, stream_with_context
+from flask import Response, g, request, stream_with_context
 from flask_restful import Resource
 
 from server.core.automation_server import AutomationServer
@@ -27,7 +27,15 @@ from server.utils.cover_utils import (
     add_cover_urls_to_books,
     extract_book_covers_from_screen,
 )
+from server.utils.library_catalog import (
+    SORT_MODES,
+    InvalidCursorError,
+    clamp_page_size,
+    get_catalog_page,
+    get_catalog_titles,
+)
 from server.utils.request_utils import email_override, get_sindarin_email
+from server.utils.screenshot_utils import capture_screen
 from views.core.app_state import AppState
 
 logger = logging.getLogger(__name__)
@@ -184,17 +192,18 @@ class BooksResource(Resource):
                 "emulator_id": emulator_id,
             }, 401
 
-        # Take a screenshot to use for extracting book covers
-        timestamp = int(time.time())
-        screenshot_filename = f"library_view_{timestamp}.png"
-        screenshot_path = os.path.join(automator.screenshots_dir, screenshot_filename)
-        automator.driver.save_screenshot(screenshot_path)
+        # Capture the screen in memory to use for extracting book covers
+        screenshot = capture_screen(automator.driver)
+        if screenshot is None:
+            timestamp = int(time.time())
+            screenshot = os.path.join(automator.screenshots_dir, f"library_view_{timestamp}.png")
+            automator.driver.save_screenshot(screenshot)
 
         # Extract book covers using the simplified utility function
         try:
             # Extract covers from the current screen and get list of successful extractions
             cover_info_dict = extract_book_covers_from_screen(
-                automator.driver, books, sindarin_email, screenshot_path
+                automator.driver, books, sindarin_email, screenshot
             )
 
             num_successful_covers = sum(1 for info in cover_info_dict.values() if info.get("success"))
@@ -232,10 +241,171 @@ class BooksResource(Resource):
         return self._get_books()
 
 
+def _streams_from_catalog() -> bool:
+    """
+    Whether a /books-stream request is answered from the library catalog instead of a live scan.
+
+    Requests with ?cursor= read the catalog, except an empty cursor while the catalog
+    is still empty, which needs a first scan of the device. The answer is kept for the
+    request, as both the automator health check and the resource ask.
+    """
+    if "books_from_catalog" not in g:
+        from_catalog = "cursor" in request.args
+        if from_catalog and not request.args.get("cursor"):
+            sindarin_email = get_sindarin_email()
+            try:
+                from_catalog = bool(sindarin_email and get_catalog_titles(sindarin_email))
+            except Exception as e:
+                logger.error(f"Error reading library catalog for {sindarin_email}: {e}", exc_info=True)
+                from_catalog = False
+            if not from_catalog:
+                logger.info(f"Library catalog is empty for {sindarin_email}, falling back to a live scan")
+        g.books_from_catalog = from_catalog
+    return g.books_from_catalog
+
+
 class BooksStreamResource(Resource):
     @ensure_user_profile_loaded
-    @ensure_automator_healthy
+    @ensure_automator_healthy(skip_if=_streams_from_catalog)
     def get(self):
+        """Stream books from the library catalog when a cursor is given, otherwise from a live scan"""
+        if _streams_from_catalog():
+            return self._get_catalog_stream()
+        return self._get_live_stream()
+
+    def _get_catalog_stream(self):
+        """
+        Stream one page of the persisted library catalog without touching the emulator.
+
+        The page starts after the opaque cursor given in ?cursor= (an empty cursor starts
+        at the top); the final message carries the cursor for the next page. The body is
+        newline-delimited JSON (application/x-ndjson). When a library scan is running and
+        this is the last page, books the scan finds that were not in the catalog are
+        appended as they arrive.
+
+        Returns:
+            A streaming Response or an error tuple
+        """
+        sindarin_email = get_sindarin_email()
+        if not sindarin_email:
+            logger.warning("No email provided to identify which profile to use")
+            return {"error": "No email provided to identify which profile to use"}, 400
+
+        cursor = request.args.get("cursor") or None
+        page_size = clamp_page_size(request.args.get("page_size"))
+        sort = request.args.get("sort")
+        if sort and sort not in SORT_MODES:
+            return {"error": f"Invalid sort '{sort}', expected one of {', '.join(SORT_MODES)}"}, 400
+
+        try:
+            known_titles = get_catalog_titles(sindarin_email)
+            page = get_catalog_page(sindarin_email, cursor=cursor, page_size=page_size, sort=sort)
+        except InvalidCursorError as e:
+            return {"error": str(e)}, 400
+        except Exception as e:
+            logger.error(f"Error reading library catalog for {sindarin_email}: {e}", exc_info=True)
+            return {
+                "error": "The library catalog is unavailable, retry without a cursor for a live scan"
+            }, 503
+
+        redis_client = get_redis_client()
+        stream_key = f"kindle:stream:{sindarin_email}:books"
+        stream_active_key = f"kindle:stream:{sindarin_email}:active"
+        scan_active = bool(redis_client and redis_client.get(stream_active_key))
+
+        def encode_message(msg_dict):
+            return (json.dumps(msg_dict) + "\n").encode("utf-8")
+
+        def generate_catalog_stream():
+            try:
+                total_books = page["total_books"]
+                yield encode_message(
+                    {
+                        "status": "started",
+                        "source": "catalog",
+                        "sort": page["sort"],
+                        "total_books": total_books,
+                        "scan_active": scan_active,
+                    }
+                )
+
+                batch_num = 0
+                if page["books"]:
+                    batch_num += 1
+                    yield encode_message(
+                        {"books": page["books"], "batch_num": batch_num, "cursor": page["cursor"]}
+                    )
+
+                # Append books a running scan finds that the catalog did not have yet
+                if scan_active and not page["has_more"]:
+                    sent_index = 0
+                    consecutive_empty = 0
+                    max_consecutive_empty = 20  # Stop after 20 consecutive empty polls (10 seconds)
+                    while consecutive_empty < max_consecutive_empty:
+                        messages = redis_client.lrange(stream_key, sent_index, -1)
+                        if not messages:
+                            if not redis_client.get(stream_active_key):
+                                break
+                            consecutive_empty += 1
+                            time.sleep(0.5)
+                            continue
+
+                        consecutive_empty = 0
+                        sent_index += len(messages)
+                        scan_finished = False
+                        for msg in messages:
+                            try:
+                                data = json.loads(msg)
+                            except (TypeError, ValueError):
+                                continue
+                            if data.get("done") or data.get("error"):
+                                scan_finished = True
+                                continue
+                            added = [
+                                book
+                                for book in data.get("books") or []
+                                if book.get("title") and book.get("title") not in known_titles
+                            ]
+                            if added:
+                                known_titles.update(book["title"] for book in added)
+                                total_books += len(added)
+                                batch_num += 1
+                                yield encode_message({"books": added, "batch_num": batch_num, "live": True})
+                        if scan_finished:
+                            break
+
+                logger.info(
+                    f"Catalog stream finished for {sindarin_email}: {batch_num} batches, has_more={page['has_more']}"
+                )
+                yield encode_message(
+                    {
+                        "done": True,
+                        "total_books": total_books,
+                        "complete": not page["has_more"],
+                        "has_more": page["has_more"],
+                        "cursor": page["cursor"],
+                    }
+                )
+            except Exception as e:
+                logger.error(f"Error in catalog stream for {sindarin_email}: {e}", exc_info=True)
+                yield encode_message({"error": str(e), "done": True, "cursor": page["cursor"]})
+
+        response = Response(
+            generate_catalog_stream(),
+            mimetype="application/x-ndjson",
+            headers={
+                "Cache-Control": "no-cache",
+                "X-Accel-Buffering": "no",
+                "Content-Type": "application/x-ndjson; charset=utf-8",
+                "Transfer-Encoding": "chunked",
+                "Access-Control-Allow-Origin": "*",
+            },
+            direct_passthrough=True,
+        )
+        response.implicit_sequence_conversion = False
+        return response
+
+    def _get_live_stream(self):
         """Stream book results as they're found using Flask streaming"""
         from server.core.request_manager import RequestManager
 
@@ -509,14 +679,16 @@ class BooksStreamResource(Resource):
                         server.update_activity(sindarin_email)
 
                         # At this point, the UI should be stable for raw_books_batch
-                        timestamp = int(time.time())
-                        screenshot_filename = f"library_view_stream_{timestamp}.png"
-                        screenshot_path = os.path.join(automator.screenshots_dir, screenshot_filename)
-                        automator.driver.save_screenshot(screenshot_path)
+                        screenshot = capture_screen(automator.driver)
+                        if screenshot is None:
+                            timestamp = int(time.time())
+                            screenshot_filename = f"library_view_stream_{timestamp}.png"
+                            screenshot = os.path.join(automator.screenshots_dir, screenshot_filename)
+                            automator.driver.save_screenshot(screenshot)
 
                         # Extract covers from the current screen for this batch
                         cover_info_for_batch = extract_book_covers_from_screen(
-                            automator.driver, raw_books_batch, sindarin_email, screenshot_path
+                            automator.driver, raw_books_batch, sindarin_email, screenshot
                         )
                         successful_covers_accumulator.update(cover_info_for_batch)  # Merge dicts
 
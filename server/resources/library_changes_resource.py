@@ -0,0 +1,102 @@
+"""Library change feed resource."""
+
+import json
+import logging
+import time
+
+from flask import Response, request
+from flask_restful import Resource
+
+from server.utils.library_catalog import get_changes, wait_for_changes
+from server.utils.request_utils import get_sindarin_email
+
+logger = logging.getLogger(__name__)
+
+# Longest a long-poll request may wait for a change
+MAX_WAIT_SECONDS = 60
+
+# Longest an SSE connection stays open before the client should reconnect
+STREAM_MAX_SECONDS = 300
+
+# Interval between SSE keepalive comments
+KEEPALIVE_SECONDS = 15
+
+
+class LibraryChangesResource(Resource):
+    """
+    Feed of added, removed, renamed and progress-changed library books.
+
+    GET /library-changes?since=<version>&wait=<seconds> long-polls for changes after
+    a version. With stream=1 it serves Server-Sent Events instead, one event per
+    change with the version as the event id, so clients resume with Last-Event-ID.
+
+    This endpoint reads the catalog only. It never touches the emulator and does not
+    count as user activity, so polling it does not keep an idle emulator alive.
+    """
+
+    def get(self):
+        sindarin_email = get_sindarin_email()
+        if not sindarin_email:
+            return {"error": "No email provided to identify which profile to use"}, 400
+
+        since = request.args.get("since") or request.headers.get("Last-Event-ID") or 0
+        try:
+            since = int(since)
+        except (TypeError, ValueError):
+            return {"error": f"Invalid since version '{since}'"}, 400
+
+        if request.args.get("stream", "0").lower() in ("1", "true"):
+            return self._stream_changes(sindarin_email, since)
+
+        try:
+            wait = min(max(float(request.args.get("wait", 0)), 0), MAX_WAIT_SECONDS)
+        except (TypeError, ValueError):
+            return {"error": "Invalid wait"}, 400
+
+        try:
+            if wait:
+                result = wait_for_changes(sindarin_email, since, wait)
+            else:
+                result = get_changes(sindarin_email, since)
+        except Exception as e:
+            logger.error(f"Error reading library changes for {sindarin_email}: {e}", exc_info=True)
+            return {"error": str(e)}, 500
+
+        return result, 200
+
+    def _stream_changes(self, sindarin_email, since):
+        """Serve changes after since as Server-Sent Events."""
+
+        def generate():
+            version = since
+            started = time.time()
+            yield f"retry: 5000\n: library changes after {version}\n\n".encode("utf-8")
+            try:
+                while time.time() - started < STREAM_MAX_SECONDS:
+                    result = wait_for_changes(sindarin_email, version, KEEPALIVE_SECONDS)
+                    if not result["changes"]:
+                        yield b": keepalive\n\n"
+                        continue
+                    for change in result["changes"]:
+                        yield f"id: {change['version']}\nevent: {change['type']}\ndata: {json.dumps(change)}\n\n".encode(
+                            "utf-8"
+                        )
+                    version = result["version"]
+            except Exception as e:
+                logger.error(f"Error in library change stream for {sindarin_email}: {e}", exc_info=True)
+                yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n".encode("utf-8")
+
+        response = Response(
+            generate(),
+            mimetype="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "X-Accel-Buffering": "no",
+                "Content-Type": "text/event-stream; charset=utf-8",
+                "Transfer-Encoding": "chunked",
+                "Access-Control-Allow-Origin": "*",
+            },
+            direct_passthrough=True,
+        )
+        response.implicit_sequence_conversion = False
+        return response
@@ -12,6 +12,8 @@ from server.middleware.automator_middleware import ensure_automator_healthy
 from server.middleware.profile_middleware import ensure_user_profile_loaded
 from server.middleware.request_deduplication_middleware import deduplicate_request
 from server.middleware.response_handler import handle_automator_response
+from server.utils.position_tracker import get_position_tracker
+from server.utils.read_ahead import get_read_ahead_manager
 from server.utils.request_utils import get_sindarin_email
 
 logger = logging.getLogger(__name__)
@@ -62,6 +64,10 @@ class NavigationResource(Resource):
             # Get the current book title to work with sessions
             current_book = server.get_current_book(sindarin_email)
 
+            # Book sessions are read from the database, so write any navigation still pending
+            if book_session_key and current_book:
+                get_position_tracker().flush(sindarin_email)
+
             # If navigate_to is specified, handle with session tracking
             if params.get("navigate_to") is not None:
                 target_position = params["navigate_to"]
@@ -212,45 +218,19 @@ class NavigationResource(Resource):
             # Always update the book session position after successful navigation
             current_book = server.get_current_book(sindarin_email)
             if current_book:
-                from database.connection import get_db
-                from database.repositories.book_session_repository import (
-                    BookSessionRepository,
+                # If using navigate_to, use the target position, otherwise use calculated position
+                final_position = (
+                    params.get("navigate_to") if params.get("navigate_to") is not None else new_position
                 )
-                from database.repositories.reading_session_repository import (
-                    ReadingSessionRepository,
+                # Update the existing book and reading sessions, written behind the response
+                get_position_tracker().record_navigation(
+                    sindarin_email,
+                    current_book,
+                    final_position,
+                    navigate_count,
+                    params.get("book_session_key"),
                 )
-
-                with get_db() as session:
-                    book_session_repo = BookSessionRepository(session)
-                    reading_session_repo = ReadingSessionRepository(session)
-                    # If using navigate_to, use the target position, otherwise use calculated position
-                    final_position = (
-                        params.get("navigate_to") if params.get("navigate_to") is not None else new_position
-                    )
-                    # Update the existing session's position (don't create new sessions during navigation)
-                    updated = book_session_repo.update_position(sindarin_email, current_book, final_position)
-                    if updated:
-                        logger.debug(
-                            f"Updated book session position to {final_position} for {sindarin_email}"
-                        )
-
-                        # Update the reading session with navigation info
-                        if navigate_count != 0:
-                            try:
-                                # Get session key
-                                session_key = params.get("book_session_key")
-
-                                reading_session_repo.update_session_navigation(
-                                    sindarin_email,
-                                    current_book,
-                                    final_position,
-                                    navigate_count,
-                                    session_key,
-                                )
-                            except Exception as e:
-                                logger.error(f"Failed to update reading session: {e}", exc_info=True)
-                    else:
-                        logger.warning(f"No book session found to update for {sindarin_email}/{current_book}")
+                logger.debug(f"Recorded book session position {final_position} for {sindarin_email}")
 
             if navigate_count != 0:
                 if preview_count != 0:
@@ -261,6 +241,13 @@ class NavigationResource(Resource):
                     logger.info(
                         f"Updated position for {sindarin_email} by {navigate_count} to {new_position}"
                     )
+
+            # Read the following pages while the user reads this one
+            if current_book and params.get("perform_ocr") and preview_count == 0:
+                read_ahead = get_read_ahead_manager()
+                if params.get("read_ahead") is not None:
+                    read_ahead.configure(sindarin_email, current_book, params["read_ahead"])
+                read_ahead.schedule(server, sindarin_email, current_book, new_position)
         elif navigate_count != 0:
             logger.info(
                 f"Navigation failed or returned non-success, not updating position for {sindarin_email}"
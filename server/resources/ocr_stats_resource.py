@@ -0,0 +1,38 @@
+"""OCR statistics resource."""
+
+import logging
+
+from flask import request
+from flask_restful import Resource
+
+from handlers.reading_progress_provider import all_source_stats
+from server.utils.footer_recognizer import get_footer_recognizer
+from server.utils.ocr_cache import get_ocr_cache
+from server.utils.ocr_executor import all_provider_stats
+from server.utils.ocr_providers import describe_providers
+from server.utils.page_text_cache import get_page_text_cache
+from server.utils.staff_token_manager import validate_token
+
+logger = logging.getLogger(__name__)
+
+
+class OcrStatsResource(Resource):
+    """Resource exposing OCR cache hit rates, local footer reads, cached pages, per-provider latency and error statistics and reading progress sources."""
+
+    def get(self):
+        """Get OCR statistics for this server process."""
+        token = request.cookies.get("staff_token")
+        if not token or not validate_token(token):
+            return {"error": "Staff authentication required"}, 401
+
+        providers = all_provider_stats()
+        for name, limits in describe_providers().items():
+            providers.setdefault(name, {}).update(limits)
+
+        return {
+            "cache": get_ocr_cache().stats(),
+            "footer": get_footer_recognizer().stats(),
+            "pages": get_page_text_cache().stats(),
+            "progress": all_source_stats(),
+            "providers": providers,
+        }, 200
@@ -55,6 +55,7 @@ class TableOfContentsResource(Resource):
             title (str): Optional book title to ensure we're in the correct book.
             chapter (str): Optional chapter name to navigate to. If provided, navigates to that chapter.
             page (int): Optional page number of the target chapter to optimize scroll direction.
+            refresh (bool): Optional - read the table of contents from the app instead of the cache.
             sindarin_email (str): Required - email to identify which automator to use.
 
         Returns:
@@ -88,10 +89,13 @@ class TableOfContentsResource(Resource):
             title = data.get("title") or request.args.get("title")
             chapter_name = data.get("chapter") or request.args.get("chapter")
             page = data.get("page") or request.args.get("page")
+            refresh = data.get("refresh") or request.args.get("refresh", "0")
         else:
             title = request.args.get("title")
             chapter_name = request.args.get("chapter")
             page = request.args.get("page")
+            refresh = request.args.get("refresh", "0")
+        refresh = str(refresh).lower() in ("1", "true")
 
         if title:
             # URL decode the book title
@@ -183,7 +187,7 @@ class TableOfContentsResource(Resource):
             toc_handler = TableOfContentsHandler(automator)
             # Pass cancellation check to the handler
             toc_handler.set_cancellation_check(self._check_cancellation)
-            response_data, status_code = toc_handler.get_table_of_contents(title=title)
+            response_data, status_code = toc_handler.get_table_of_contents(title=title, refresh=refresh)
 
             # Add user email to response for consistency
             response_data["user_email"] = sindarin_email
@@ -197,6 +201,7 @@ class TableOfContentsResource(Resource):
             title (str): Optional book title to ensure we're in the correct book.
             chapter (str): Optional chapter name to navigate to. If provided, navigates to that chapter.
             page (int): Optional page number of the target chapter to optimize scroll direction.
+            refresh (bool): Optional - read the table of contents from the app instead of the cache.
             sindarin_email (str): Required - email to identify which automator to use.
 
         Returns:
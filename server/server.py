@@ -265,15 +265,18 @@ app.config["server_instance"] = server
 # Import resource modules
 from server.resources.auth_check_resource import AuthCheckResource
 from server.resources.auth_resource import AuthResource
+from server.resources.book_extraction_resource import BookExtractionResource
 from server.resources.book_open_resource import BookOpenResource
 from server.resources.books_resources import BooksResource, BooksStreamResource
 from server.resources.fixtures_resource import FixturesResource
 from server.resources.idle_check_resources import IdleCheckResource
 from server.resources.image_resources import CoverImageResource, ImageResource
 from server.resources.last_read_page_dialog_resource import LastReadPageDialogResource
+from server.resources.library_changes_resource import LibraryChangesResource
 from server.resources.log_timeline_resource import LogTimelineResource
 from server.resources.logout_resource import LogoutResource
 from server.resources.navigation_resource import NavigationResource
+from server.resources.ocr_stats_resource import OcrStatsResource
 from server.resources.screenshot_resource import ScreenshotResource
 from server.resources.sentry_debug_resource import SentryDebugResource
 from server.resources.shutdown_resources import ShutdownResource
@@ -287,6 +290,8 @@ from server.resources.user_activity_resource import UserActivityResource
 api.add_resource(StateResource, "/state")
 api.add_resource(BooksResource, "/books")
 api.add_resource(BooksStreamResource, "/books-stream")  # New streaming endpoint for books
+api.add_resource(LibraryChangesResource, "/library-changes")  # Change feed from background rescans
+api.add_resource(BookExtractionResource, "/extract-book")  # Resumable server-side book text extraction
 api.add_resource(StaffAuthResource, "/staff-auth")
 api.add_resource(StaffTokensResource, "/staff-tokens")
 api.add_resource(ScreenshotResource, "/screenshot")
@@ -369,6 +374,7 @@ api.add_resource(
     resource_class_kwargs={"server_instance": server},
 )
 api.add_resource(UserActivityResource, "/log")
+api.add_resource(OcrStatsResource, "/ocr-stats")
 api.add_resource(SentryDebugResource, "/sentry-debug")
 
 
@@ -402,6 +408,36 @@ def check_and_restart_adb_server():
             logger.warning(f"Error restarting ADB server: {adb_e}", exc_info=True)
 
 
+def run_library_rescan():
+    """Rescan idle active users' libraries to feed /library-changes."""
+    try:
+        from server.utils.library_rescanner import run_library_rescans
+
+        run_library_rescans(server)
+    except Exception as e:
+        logger.error(f"Error during background library rescan: {e}", exc_info=True)
+
+
+def run_download_prefetch():
+    """Start downloads of idle active users' recently read books."""
+    try:
+        from server.utils.download_prefetcher import run_download_prefetches
+
+        run_download_prefetches(server)
+    except Exception as e:
+        logger.error(f"Error during background download prefetch: {e}", exc_info=True)
+
+
+def run_extraction_resume():
+    """Resume book extractions that requests paused, once their users are idle."""
+    try:
+        from server.utils.book_extractor import get_book_extractor
+
+        get_book_extractor().resume_idle(server)
+    except Exception as e:
+        logger.error(f"Error resuming book extractions: {e}", exc_info=True)
+
+
 def run_idle_check():
     """Run idle check using the IdleCheckResource directly."""
     try:
@@ -474,6 +510,22 @@ def cleanup_resources():
     except Exception as e:
         logger.warning(f"Error cleaning up WebSocket proxies: {e}", exc_info=True)
 
+    # Write reading positions still pending
+    try:
+        from server.utils.position_tracker import get_position_tracker
+
+        get_position_tracker().stop()
+    except Exception as e:
+        logger.warning(f"Error writing pending reading positions: {e}", exc_info=True)
+
+    # Stop streaming emulator screens
+    try:
+        from server.utils.frame_source import stop_all_frame_sources
+
+        stop_all_frame_sources()
+    except Exception as e:
+        logger.warning(f"Error stopping frame sources: {e}", exc_info=True)
+
     # Mark all running emulators for restart and shutdown gracefully with preserved state
     from server.utils.emulator_shutdown_manager import EmulatorShutdownManager
     from server.utils.vnc_instance_manager import VNCInstanceManager
@@ -571,6 +623,11 @@ def main():
     # Save Flask server PID
     server.save_pid("flask", os.getpid())
 
+    # Write reading positions journaled but not written before the last shutdown
+    from server.utils.position_tracker import get_position_tracker
+
+    get_position_tracker().start()
+
     # Schedule emulator restart after server is ready using background thread
     from server.utils.server_startup_utils import auto_restart_emulators_after_startup
 
@@ -596,9 +653,40 @@ def main():
         name="Idle Emulator Check",
         replace_existing=True,
     )
+    scheduler.add_job(
+        func=run_library_rescan,
+        trigger=CronTrigger(minute="*/5"),
+        id="library_rescan",
+        name="Background Library Rescan",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+    # Offset from the library rescans so the two don't compete for an idle emulator
+    scheduler.add_job(
+        func=run_download_prefetch,
+        trigger=CronTrigger(minute="2-59/5"),
+        id="download_prefetch",
+        name="Background Download Prefetch",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
+    scheduler.add_job(
+        func=run_extraction_resume,
+        trigger=CronTrigger(minute="*"),
+        id="extraction_resume",
+        name="Resume Paused Book Extractions",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
     scheduler.start()
     app.scheduler = scheduler
-    logger.info(f"Started APScheduler for idle checks ({idle_schedule_desc})")
+    logger.info(
+        f"Started APScheduler for idle checks ({idle_schedule_desc}), library rescans and download "
+        "prefetches (every 5 minutes) and extraction resumes (every minute)"
+    )
 
     # Clear Redis deduplication keys after all initialization is complete
     from server.core.redis_connection import clear_deduplication_keys_on_startup
@@ -0,0 +1,501 @@
+"""
+Server-side whole-book text extraction.
+
+Extracting a book's text used to mean calling /navigate?ocr=1 once per page from
+outside, paying an HTTP round trip and a blocking OCR call for every page. An
+extraction job instead pages through the open book on the emulator itself:
+
+1. Screenshot the page and hand it to a pool of OCR workers
+2. Turn the page while earlier pages are still being OCR'd
+3. Write each OCR'd page, in order, as a gzip-compressed record, then checkpoint
+
+The records and checkpoint live under extractions/, kept apart from the disposable
+ocr_cache/, so a job that is cancelled, preempted by a user request or cut short by an
+emulator restart resumes from the stored pages when it is started again. A job only turns the page right before
+capturing the next one, so a stopped job leaves the device on its last stored page. A
+resumed job first checks that page is still on screen and refuses to resume otherwise,
+rather than storing pages out of order.
+
+Jobs register as the user's active request with the lowest priority. Every request that
+drives the device pauses them first, waiting only for the current page turn or capture;
+pages already captured are OCR'd and written by the job's own thread. A job paused by a
+request resumes by itself once the user has been idle for EXTRACTION_RESUME_IDLE_SECONDS
+with the same book open.
+"""
+
+import collections
+import concurrent.futures
+import functools
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from server.core.request_manager import RequestManager
+from server.logging_config import clear_email_context, set_email_context
+from server.utils.cancellation_utils import get_active_request_info, should_cancel
+from server.utils.ocr_executor import submit_in_context
+from server.utils.request_utils import email_override
+from server.utils.screenshot_utils import capture_screen
+
+logger = logging.getLogger(__name__)
+
+EXTRACTION_PATH = "/extract-book"
+
+EXTRACTIONS_DIR = Path(
+    os.getenv("EXTRACTIONS_DIR", Path(__file__).resolve().parent.parent.parent / "extractions")
+)
+
+OCR_WORKERS = int(os.getenv("EXTRACTION_OCR_WORKERS", 4))
+
+# Pages screenshotted ahead of the last page written
+MAX_IN_FLIGHT = OCR_WORKERS * 2
+
+# Time for a turned page to render before it is captured
+PAGE_SETTLE_SECONDS = 0.5
+
+# Identical pages in a row that mean page turns no longer move, at the end of the book
+END_OF_BOOK_REPEATS = 2
+
+# Longest a job waits for the request that started it to finish
+START_TIMEOUT_SECONDS = 10
+
+# Longest a pausing request waits for the job to stop driving the device
+RELEASE_TIMEOUT_SECONDS = 10
+
+# Idle time after which a job paused by a request resumes
+RESUME_IDLE_SECONDS = int(os.getenv("EXTRACTION_RESUME_IDLE_SECONDS", 120))
+
+# Requests that only look at the device and don't pause extraction
+NON_DRIVING_PATHS = {"/screenshot", "/state", "/web-vnc"}
+
+_ocr_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=OCR_WORKERS, thread_name_prefix="extraction-ocr"
+)
+
+
+def _safe_name(name: str) -> str:
+    """Make a file name from a title or email that stays unique after sanitizing."""
+    digest = hashlib.sha1(name.encode("utf-8")).hexdigest()[:8]
+    return f"{re.sub(r'[^A-Za-z0-9._-]+', '_', name)[:80]}-{digest}"
+
+
+class ExtractionStore:
+    """Compressed page records and checkpoint of one user's extraction of one book."""
+
+    def __init__(self, email: str, book: str, root: Path = EXTRACTIONS_DIR):
+        self.directory = Path(root) / _safe_name(email) / _safe_name(book)
+        self.pages_path = self.directory / "pages.jsonl.gz"
+        self.checkpoint_path = self.directory / "checkpoint.json"
+
+    def append_page(self, record: Dict) -> None:
+        """Append one page record as its own gzip member, so earlier pages survive a crash mid-write."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with gzip.open(self.pages_path, "at", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+
+    def read_pages(self) -> List[Dict]:
+        """Read the stored page records, ignoring a record cut off by a crash."""
+        pages = []
+        if not self.pages_path.exists():
+            return pages
+        try:
+            with gzip.open(self.pages_path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    pages.append(json.loads(line))
+        except (EOFError, OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring truncated extraction record in {self.pages_path}: {e}")
+        return pages
+
+    def load_checkpoint(self) -> Dict:
+        """Load the checkpoint, or an empty dict if the book was never extracted."""
+        try:
+            with open(self.checkpoint_path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not read extraction checkpoint {self.checkpoint_path}: {e}")
+            return {}
+
+    def save_checkpoint(self, checkpoint: Dict) -> None:
+        """Replace the checkpoint atomically."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.checkpoint_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def clear(self) -> None:
+        """Delete the stored pages and checkpoint to start over."""
+        for path in (self.pages_path, self.checkpoint_path):
+            path.unlink(missing_ok=True)
+
+
+class ExtractionJob:
+    """One run of an extraction, resuming from the pages already stored."""
+
+    def __init__(self, email: str, book: str, store: ExtractionStore, max_pages: Optional[int] = None):
+        self.email = email
+        self.book = book
+        self.store = store
+        self.max_pages = max_pages
+        self.cancel = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+        # Set once the job no longer turns pages or captures the screen
+        self.device_released = threading.Event()
+        self.paused_by_request = False
+        self.status = "starting"
+        self.error: Optional[str] = None
+        self.pages = 0
+        self.failed_pages = 0
+        self.pages_this_run = 0
+        self.last_progress: Dict = {}
+        self.run_started = time.time()
+        self.end_reached = False
+        self._repeats = 0
+        self._last_text: Optional[str] = None
+
+    def resume_from(self, records: List[Dict], checkpoint: Dict) -> None:
+        """Continue counting from the stored records; they win over a checkpoint written before a crash."""
+        self.pages = len(records)
+        self.failed_pages = sum(1 for record in records if not record.get("text"))
+        texts = [record["text"] for record in records if record.get("text")]
+        self._last_text = texts[-1] if texts else None
+        self.last_progress = (
+            records[-1].get("progress", {}) if records else checkpoint.get("last_progress", {})
+        )
+
+    def record_page(self, result: Dict) -> bool:
+        """
+        Store an OCR'd page unless it repeats the previous one.
+
+        Args:
+            result: process_screenshot_with_regions() output for the page
+
+        Returns:
+            bool: True if the page was stored
+        """
+        from handlers.reader_page_handler import parse_page_indicators
+
+        text = result.get("main_text")
+        if text and text == self._last_text:
+            self._repeats += 1
+            if self._repeats >= END_OF_BOOK_REPEATS:
+                self.end_reached = True
+            return False
+        self._repeats = 0
+
+        progress = parse_page_indicators(result.get("page_indicator_text"))
+        record = {"page": self.pages, "text": text, "progress": progress, "captured_at": time.time()}
+        if not text:
+            record["error"] = "; ".join(result.get("errors") or []) or "No text extracted"
+            self.failed_pages += 1
+        else:
+            self._last_text = text
+        self.store.append_page(record)
+        self.pages += 1
+        self.pages_this_run += 1
+        if progress:
+            self.last_progress = progress
+        self.save_checkpoint()
+        return True
+
+    def save_checkpoint(self) -> None:
+        self.store.save_checkpoint(
+            {
+                "book": self.book,
+                "status": self.status,
+                "pages": self.pages,
+                "failed_pages": self.failed_pages,
+                "last_progress": self.last_progress,
+                "error": self.error,
+                "updated_at": time.time(),
+            }
+        )
+
+    def progress(self) -> Dict:
+        """Return the job's status, page counts and throughput."""
+        elapsed = time.time() - self.run_started
+        return {
+            "book": self.book,
+            "status": self.status,
+            "pages": self.pages,
+            "failed_pages": self.failed_pages,
+            "pages_this_run": self.pages_this_run,
+            "pages_per_minute": round(self.pages_this_run * 60 / elapsed, 1) if elapsed > 0 else 0.0,
+            "elapsed_seconds": round(elapsed, 1),
+            "last_progress": self.last_progress,
+            "error": self.error,
+        }
+
+
+class BookExtractor:
+    """Runs at most one extraction job per user."""
+
+    def __init__(self, root: Path = EXTRACTIONS_DIR):
+        self.root = root
+        self._jobs: Dict[str, ExtractionJob] = {}
+        self._lock = threading.Lock()
+
+    def is_running(self, email: str) -> bool:
+        """Check whether an extraction is driving the user's device."""
+        job = self._jobs.get(email)
+        return bool(job and job.thread and job.thread.is_alive())
+
+    def start(
+        self, server, email: str, book: str, max_pages: Optional[int] = None, restart: bool = False
+    ) -> Dict:
+        """
+        Start or resume extracting the user's open book.
+
+        Args:
+            server: The AutomationServer instance
+            email: The user's email address
+            book: The open book's title
+            max_pages: Stop after this many new pages, or None for the whole book
+            restart: Discard stored pages and start from the page on screen
+
+        Returns:
+            dict: The job's progress
+        """
+        with self._lock:
+            if self.is_running(email):
+                running = self._jobs[email]
+                if not running.cancel.is_set():
+                    return running.progress()
+                # A paused job is still writing its captured pages, which the new run resumes after
+                running.thread.join()
+
+            store = ExtractionStore(email, book, self.root)
+            if restart:
+                store.clear()
+            job = ExtractionJob(email, book, store, max_pages)
+            job.resume_from(store.read_pages(), store.load_checkpoint())
+            self._jobs[email] = job
+            job.thread = threading.Thread(
+                target=self._run, args=(server, job), name=f"extract-{email}", daemon=True
+            )
+            job.thread.start()
+        logger.info(f"Started extraction of {book} for {email} from page record {job.pages}")
+        return job.progress()
+
+    def pause(self, email: str, timeout: float = RELEASE_TIMEOUT_SECONDS, by_request: bool = False) -> bool:
+        """
+        Stop a running extraction so another request can use the device.
+
+        Only waits for the job to stop driving the device. Pages already captured are
+        OCR'd and written by the job's thread afterwards.
+
+        Args:
+            email: The user's email address
+            timeout: Longest to wait for the device to be released
+            by_request: Whether another request is pausing the job, which then resumes once
+                the user is idle again
+
+        Returns:
+            bool: True if a running job was stopped
+        """
+        job = self._jobs.get(email)
+        if not self.is_running(email):
+            return False
+        logger.info(f"Pausing extraction of {job.book} for {email}")
+        job.paused_by_request = by_request
+        job.cancel.set()
+        if not job.device_released.wait(timeout=timeout):
+            logger.warning(f"Extraction of {job.book} for {email} did not release the device in {timeout}s")
+        return True
+
+    def resume_idle(self, server) -> int:
+        """
+        Resume the jobs that requests paused, for users idle with the same book open.
+
+        Args:
+            server: The AutomationServer instance
+
+        Returns:
+            int: Number of jobs resumed
+        """
+        resumed = 0
+        for email, job in list(self._jobs.items()):
+            if not job.paused_by_request or job.status != "paused" or self.is_running(email):
+                continue
+            try:
+                last_activity = server.get_last_activity_time(email)
+                if not last_activity or time.time() - last_activity < RESUME_IDLE_SECONDS:
+                    continue
+                if get_active_request_info(email) or server.get_current_book(email) != job.book:
+                    continue
+                max_pages = max(job.max_pages - job.pages_this_run, 1) if job.max_pages else None
+                self.start(server, email, job.book, max_pages)
+                resumed += 1
+            except Exception as e:
+                logger.warning(f"Error resuming extraction for {email}: {e}", exc_info=True)
+        return resumed
+
+    def get_progress(self, email: str, book: Optional[str] = None) -> Optional[Dict]:
+        """
+        Return the progress of the user's current job, or of a book's stored checkpoint.
+
+        Args:
+            email: The user's email address
+            book: A book title to report on if it is not the current job's book
+
+        Returns:
+            dict or None: Progress, or None if the book was never extracted
+        """
+        job = self._jobs.get(email)
+        if job and (book is None or job.book == book):
+            return job.progress()
+        if book:
+            checkpoint = ExtractionStore(email, book, self.root).load_checkpoint()
+            return dict(checkpoint, pages_per_minute=0.0) if checkpoint else None
+        return None
+
+    def get_pages(self, email: str, book: str) -> List[Dict]:
+        """Return the stored page records of a book."""
+        return ExtractionStore(email, book, self.root).read_pages()
+
+    def _run(self, server, job: ExtractionJob) -> None:
+        email = job.email
+        deadline = time.time() + START_TIMEOUT_SECONDS
+        while get_active_request_info(email) and time.time() < deadline:
+            if job.cancel.wait(0.2):
+                break
+
+        automator = server.automators.get(email)
+        manager = RequestManager(email, EXTRACTION_PATH, "POST")
+        if (
+            job.cancel.is_set()
+            or not getattr(automator, "driver", None)
+            or not manager.claim_background_request()
+        ):
+            job.status = "paused"
+            job.error = None if job.cancel.is_set() else "Device busy or unavailable"
+            job.device_released.set()
+            job.save_checkpoint()
+            return
+
+        def cancelled():
+            return job.cancel.is_set() or should_cancel(email, manager.request_key)
+
+        from handlers.reader_page_handler import process_screenshot_with_regions
+
+        ocr_page = functools.partial(
+            process_screenshot_with_regions, cache_context={"user": email, "book": job.book}
+        )
+        reader = automator.state_machine.reader_handler
+        pending = collections.deque()
+        captured = 0
+        job.status = "running"
+        job.run_started = time.time()
+        set_email_context(email)
+        try:
+            with email_override(email):
+                # A resumed job continues from the last stored page, which must still be on screen
+                turn_first = bool(job.pages)
+                if turn_first and not self._on_last_page(job, automator, ocr_page):
+                    job.status = "paused"
+                    job.error = (
+                        "The device is no longer on the last extracted page. Navigate back to it "
+                        "or restart the extraction."
+                    )
+                while not job.end_reached and job.status == "running":
+                    if cancelled():
+                        job.status = "paused"
+                        break
+                    if job.max_pages and captured >= job.max_pages:
+                        break
+                    if turn_first and not reader.turn_page_forward():
+                        logger.info(f"Could not turn past page record {job.pages} of {job.book}")
+                        job.end_reached = True
+                        break
+                    turn_first = True
+                    # A turn seen to settle is ready to capture
+                    if not reader.last_turn_verified:
+                        time.sleep(PAGE_SETTLE_SECONDS)
+                    screenshot = capture_screen(automator.driver)
+                    if screenshot is None:
+                        raise RuntimeError("Failed to capture the screen")
+                    pending.append(submit_in_context(_ocr_executor, ocr_page, screenshot))
+                    captured += 1
+
+                    # Write finished pages in order, waiting once too many are in flight
+                    while pending and (pending[0].done() or len(pending) >= MAX_IN_FLIGHT):
+                        if not pending[0].done():
+                            # Stop waiting on OCR as soon as the device is needed elsewhere
+                            concurrent.futures.wait([pending[0]], timeout=0.2)
+                            if not pending[0].done():
+                                if cancelled():
+                                    break
+                                continue
+                        self._write_page(job, pending.popleft())
+
+            if job.status == "running":
+                job.status = "finished" if job.end_reached else "stopped"
+        except Exception as e:
+            logger.error(f"Extraction of {job.book} failed for {email}: {e}", exc_info=True)
+            job.status = "failed"
+            job.error = str(e)
+        finally:
+            job.device_released.set()
+            manager.release_background_request()
+            try:
+                # Pages already captured are kept whenever the job stops, as the device is past them
+                while pending:
+                    self._write_page(job, pending.popleft())
+            finally:
+                job.save_checkpoint()
+                progress = job.progress()
+                logger.info(
+                    f"Extraction of {job.book} for {email} {job.status}: {progress['pages_this_run']} pages "
+                    f"this run, {progress['pages']} total, {progress['pages_per_minute']} pages/min"
+                )
+                clear_email_context()
+
+    @staticmethod
+    def _write_page(job: ExtractionJob, future: concurrent.futures.Future) -> None:
+        """Store an OCR'd page, recording a failed page if its OCR raised."""
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.warning(f"OCR of page record {job.pages} of {job.book} failed: {e}")
+            result = {"main_text": None, "errors": [str(e)]}
+        job.record_page(result)
+
+    @staticmethod
+    def _on_last_page(job: ExtractionJob, automator, process_screenshot) -> bool:
+        """Check that the screen shows the job's last stored page, by its text or page indicator."""
+        from handlers.reader_page_handler import parse_page_indicators
+
+        screenshot = capture_screen(automator.driver)
+        if screenshot is None:
+            return False
+        result = process_screenshot(screenshot)
+        text = result.get("main_text")
+        if text and job._last_text:
+            return text == job._last_text
+        progress = parse_page_indicators(result.get("page_indicator_text"))
+        if progress and job.last_progress:
+            return progress == job.last_progress
+        logger.warning(f"Could not compare the screen with the last extracted page of {job.book}")
+        return False
+
+
+_extractor: Optional[BookExtractor] = None
+_extractor_lock = threading.Lock()
+
+
+def get_book_extractor() -> BookExtractor:
+    """Return the process-wide book extractor."""
+    global _extractor
+    with _extractor_lock:
+        if _extractor is None:
+            _extractor = BookExtractor()
+        return _extractor
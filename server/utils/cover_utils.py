@@ -24,6 +24,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 from server.logging_config import store_page_source
+from server.utils.screenshot_utils import load_image
 
 logger = logging.getLogger(__name__)
 
@@ -130,14 +131,14 @@ def ensure_covers_directory(sindarin_email: str) -> str:
     return str(user_covers_dir)
 
 
-def extract_book_cover(driver, book_element, screenshot_path: str, max_retries: int = 3) -> Optional[Dict]:
+def extract_book_cover(driver, book_element, screenshot, max_retries: int = 3) -> Optional[Dict]:
     """
     Extract the book cover from a screenshot based on the book element's location.
 
     Args:
         driver: The Appium WebDriver
         book_element: The WebElement representing the book
-        screenshot_path: Path to the screenshot image
+        screenshot: The screenshot as an in-memory image or a path to the image file
         max_retries: Maximum number of retries for stale element exceptions
 
     Returns:
@@ -268,60 +269,52 @@ def extract_book_cover(driver, book_element, screenshot_path: str, max_retries:
             #     logger.warning(f"Unusual aspect ratio: {aspect_ratio:0.2f} - width={width}, height={height}")
             # Don't outright reject, but log the warning
 
-            # Verify the screenshot exists
-            if not os.path.exists(screenshot_path):
-                logger.error(f"Screenshot does not exist at path: {screenshot_path}", exc_info=True)
+            # Use the in-memory capture, or open the screenshot file
+            if not isinstance(screenshot, Image.Image) and not os.path.exists(screenshot):
+                logger.error(f"Screenshot does not exist at path: {screenshot}", exc_info=True)
+                return None
+            img = load_image(screenshot)
+            img_width, img_height = img.size
+
+            # Make sure the coordinates are within the image bounds
+            left = max(0, left)
+            top = max(0, top)
+            right = min(img_width, right)
+            bottom = min(img_height, bottom)
+
+            # Check that we have valid dimensions after adjustments
+            if right <= left or bottom <= top:
+                logger.error(f"Invalid crop dimensions: ({left}, {top}, {right}, {bottom})", exc_info=True)
                 return None
 
-            # Log screenshot details
-            screenshot_size = os.path.getsize(screenshot_path)
-
-            # Open the screenshot with Pillow
-            with Image.open(screenshot_path) as img:
-                # Log the screenshot dimensions
-                img_width, img_height = img.size
-
-                # Make sure the coordinates are within the image bounds
-                left = max(0, left)
-                top = max(0, top)
-                right = min(img_width, right)
-                bottom = min(img_height, bottom)
+            # Crop the image to the cover coordinates
+            try:
+                cover_img = img.crop((left, top, right, bottom))
 
-                # Check that we have valid dimensions after adjustments
-                if right <= left or bottom <= top:
-                    logger.error(
-                        f"Invalid crop dimensions: ({left}, {top}, {right}, {bottom})", exc_info=True
+                # Verify cropped image has reasonable dimensions
+                if cover_img.width < min_width or cover_img.height < min_height:
+                    logger.warning(
+                        f"Cropped cover image small: {cover_img.width}x{cover_img.height} - continuing anyway"
                     )
-                    return None
-
-                # Crop the image to the cover coordinates
-                try:
-                    cover_img = img.crop((left, top, right, bottom))
-
-                    # Verify cropped image has reasonable dimensions
-                    if cover_img.width < min_width or cover_img.height < min_height:
-                        logger.warning(
-                            f"Cropped cover image small: {cover_img.width}x{cover_img.height} - continuing anyway"
-                        )
-                        # Continue processing despite small size
-
-                    # Check for reasonable aspect ratio
-                    aspect_ratio = cover_img.height / cover_img.width
-                    # if aspect_ratio < 1.0:
-                    #     logger.warning(
-                    #         f"Suspicious aspect ratio: {aspect_ratio:0.2f} - width={cover_img.width}, height={cover_img.height}"
-                    #     )
-                    # Continue processing despite unusual aspect ratio
-
-                    return {
-                        "image": cover_img,
-                        "width": cover_img.width,
-                        "height": cover_img.height,
-                        "coordinates": (left, top, right, bottom),
-                    }
-                except Exception as crop_err:
-                    logger.error(f"Error cropping image: {crop_err}", exc_info=True)
-                    return None
+                    # Continue processing despite small size
+
+                # Check for reasonable aspect ratio
+                aspect_ratio = cover_img.height / cover_img.width
+                # if aspect_ratio < 1.0:
+                #     logger.warning(
+                #         f"Suspicious aspect ratio: {aspect_ratio:0.2f} - width={cover_img.width}, height={cover_img.height}"
+                #     )
+                # Continue processing despite unusual aspect ratio
+
+                return {
+                    "image": cover_img,
+                    "width": cover_img.width,
+                    "height": cover_img.height,
+                    "coordinates": (left, top, right, bottom),
+                }
+            except Exception as crop_err:
+                logger.error(f"Error cropping image: {crop_err}", exc_info=True)
+                return None
 
             # If we reached this point, the current retry attempt failed
             retries += 1
@@ -451,7 +444,7 @@ def get_cover_url(filename: str, sindarin_email: str) -> str:
 
 
 def extract_book_covers_from_screen(
-    driver, books, sindarin_email: str, screenshot_path: str, max_retries: int = 3
+    driver, books, sindarin_email: str, screenshot, max_retries: int = 3
 ) -> dict:
     """
     Extract book covers from the current screen and save them to disk.
@@ -460,7 +453,7 @@ def extract_book_covers_from_screen(
         driver: The Appium WebDriver
         books: List of book dictionaries
         sindarin_email: The email of the user
-        screenshot_path: Path to the screenshot image
+        screenshot: The screen as an in-memory image or a path to the screenshot image
         max_retries: Maximum number of retries for stale element references
 
     Returns:
@@ -580,14 +573,15 @@ def extract_book_covers_from_screen(
         # Extract covers for visible books and return successful extractions
         cover_results = {}  # Store detailed results for debugging
 
-        # Save one more full screenshot right before extraction
-        pre_extract_screenshot = f"screenshots/pre_extract_covers_{int(time.time())}.png"
-        driver.save_screenshot(pre_extract_screenshot)
+        # Decode the screenshot once and crop every cover from the same image
+        if not isinstance(screenshot, Image.Image) and os.path.exists(screenshot):
+            screenshot = load_image(screenshot)
+            screenshot.load()
 
         for title, element in title_element_map.items():
             try:
                 # Extract cover image with retry capability
-                cover_data = extract_book_cover(driver, element, screenshot_path, max_retries)
+                cover_data = extract_book_cover(driver, element, screenshot, max_retries)
 
                 if cover_data and "image" in cover_data:
                     # Save the cover image
@@ -0,0 +1,264 @@
+"""
+Background downloads of the books users read recently.
+
+Opening a book that is not downloaded on the device waits for the download, for up to
+two minutes. That is common right after an AVD was cloned from the seed or restored from
+cold storage. The prefetcher downloads those books before they are asked for:
+
+1. A scheduler job picks each active user whose emulator is sitting idle on the library
+   screen and was not prefetched for within DOWNLOAD_PREFETCH_INTERVAL_SECONDS
+2. The user's most recently read books are taken from their reading sessions and book
+   positions, and books the library catalog knows are downloaded are skipped
+3. Each remaining book is located where the title index places it, and its download is
+   started from the selection toolbar without opening the book or waiting for it
+
+At most DOWNLOAD_PREFETCH_MAX_STARTED downloads, totalling DOWNLOAD_PREFETCH_MAX_MB by
+catalog size, are started per user and run, so the emulator's bandwidth stays free for
+the user. Like library rescans, prefetches register as the user's active request with
+the lowest priority, so any client request cancels them.
+"""
+
+import logging
+import os
+import re
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from server.core.redis_connection import get_redis_client
+from server.core.request_manager import RequestManager
+from server.logging_config import clear_email_context, set_email_context
+from server.utils.cancellation_utils import get_active_request_info, should_cancel
+from server.utils.library_catalog import get_download_info
+from server.utils.request_utils import email_override
+from server.utils.title_index import get_title_index
+from views.core.app_state import AppState
+
+logger = logging.getLogger(__name__)
+
+PREFETCH_PATH = "/download-prefetch"
+
+# Minimum time between prefetch runs for the same user
+PREFETCH_INTERVAL_SECONDS = int(os.getenv("DOWNLOAD_PREFETCH_INTERVAL_SECONDS", 30 * 60))
+
+# A user must have been quiet this long before their emulator is used for a prefetch
+IDLE_SECONDS = int(os.getenv("DOWNLOAD_PREFETCH_IDLE_SECONDS", 60))
+
+# Users who have not made a request for this long are no longer considered active
+ACTIVE_WINDOW_SECONDS = int(os.getenv("DOWNLOAD_PREFETCH_ACTIVE_WINDOW_SECONDS", 2 * 60 * 60))
+
+# Most recently read books considered for each user
+RECENT_BOOKS = int(os.getenv("DOWNLOAD_PREFETCH_RECENT_BOOKS", 5))
+
+# Downloads started per user and run, and their total size by the catalog
+MAX_STARTED = int(os.getenv("DOWNLOAD_PREFETCH_MAX_STARTED", 2))
+MAX_MB = float(os.getenv("DOWNLOAD_PREFETCH_MAX_MB", 100))
+
+SIZE_PATTERN = re.compile(r"([\d.,]+)\s*(KB|MB|GB)", re.IGNORECASE)
+SIZE_UNITS_MB = {"KB": 1 / 1024, "MB": 1, "GB": 1024}
+
+
+def _last_prefetch_key(email: str) -> str:
+    return f"kindle:downloads:{email}:last_prefetch"
+
+
+def parse_size_mb(size: Optional[str]) -> Optional[float]:
+    """Parse a library row's file size, like "1.2 MB", into megabytes."""
+    match = SIZE_PATTERN.search(size or "")
+    if not match:
+        return None
+    try:
+        return float(match.group(1).replace(",", "")) * SIZE_UNITS_MB[match.group(2).upper()]
+    except ValueError:
+        return None
+
+
+def recent_titles(email: str, limit: int = RECENT_BOOKS) -> List[str]:
+    """
+    Find the books a user read most recently.
+
+    Args:
+        email: The user's email address
+        limit: Maximum number of books
+
+    Returns:
+        list: Titles as read by the user, most recent first
+    """
+    from database.connection import get_db
+    from database.repositories.book_position_repository import BookPositionRepository
+    from database.repositories.reading_session_repository import (
+        ReadingSessionRepository,
+    )
+
+    last_read: Dict[str, datetime] = {}
+    with get_db() as session:
+        rows = ReadingSessionRepository(session).get_recent_book_titles(email, limit)
+        rows += BookPositionRepository(session).get_recent_book_titles(email, limit)
+    for title, at in rows:
+        if at is None:
+            continue
+        if at.tzinfo is None:
+            at = at.replace(tzinfo=timezone.utc)
+        if title not in last_read or at > last_read[title]:
+            last_read[title] = at
+    return sorted(last_read, key=last_read.get, reverse=True)[:limit]
+
+
+def plan_prefetch(email: str, titles: List[str]) -> List[str]:
+    """
+    Choose which recently read books to download.
+
+    Books the catalog knows are downloaded are skipped, as are books the title index
+    cannot place. The rest are taken in order, up to MAX_STARTED books and MAX_MB of
+    known sizes.
+
+    Args:
+        email: The user's email address
+        titles: Recently read titles, most recent first
+
+    Returns:
+        list: Titles to start downloading, as read by the user
+    """
+    title_index = get_title_index(email)
+    if title_index is None:
+        return []
+
+    device_titles = {}
+    for title in titles:
+        resolution = title_index.resolve(title)
+        if resolution:
+            device_titles[title] = resolution["title"]
+    info = get_download_info(email, set(device_titles.values()))
+
+    planned = []
+    total_mb = 0.0
+    for title, device_title in device_titles.items():
+        book = info.get(device_title)
+        if not book or book["downloaded"]:
+            continue
+        if len(planned) >= MAX_STARTED:
+            break
+        size_mb = parse_size_mb(book["size"]) or 0.0
+        if total_mb + size_mb > MAX_MB:
+            continue
+        planned.append(title)
+        total_mb += size_mb
+    return planned
+
+
+def is_due_for_prefetch(server, email: str) -> bool:
+    """
+    Check whether a user's recent books should be prefetched now.
+
+    Args:
+        server: The AutomationServer instance
+        email: The user's email address
+
+    Returns:
+        bool: True if the user is active, idle, on the library screen and not prefetched recently
+    """
+    automator = server.automators.get(email)
+    if not automator or not getattr(automator, "driver", None):
+        return False
+
+    if get_active_request_info(email):
+        logger.debug(f"Skipping download prefetch for {email}: a request is in progress")
+        return False
+
+    last_activity = server.get_last_activity_time(email)
+    if not last_activity:
+        return False
+    quiet_for = time.time() - last_activity
+    if quiet_for < IDLE_SECONDS or quiet_for > ACTIVE_WINDOW_SECONDS:
+        return False
+
+    redis_client = get_redis_client()
+    if redis_client and redis_client.get(_last_prefetch_key(email)):
+        return False
+
+    # Only use an emulator that is already showing the library, never leave an open book
+    if automator.state_machine.current_state != AppState.LIBRARY:
+        return False
+
+    return True
+
+
+def prefetch_downloads(server, email: str) -> int:
+    """
+    Start downloading one user's recently read books at low priority.
+
+    Args:
+        server: The AutomationServer instance
+        email: The user's email address
+
+    Returns:
+        int: Number of downloads started
+    """
+    automator = server.automators.get(email)
+    if not automator:
+        return 0
+
+    redis_client = get_redis_client()
+    if redis_client:
+        redis_client.set(_last_prefetch_key(email), int(time.time()), ex=PREFETCH_INTERVAL_SECONDS)
+
+    try:
+        titles = plan_prefetch(email, recent_titles(email))
+    except Exception as e:
+        logger.warning(f"Could not plan download prefetch for {email}: {e}", exc_info=True)
+        return 0
+    if not titles:
+        return 0
+
+    from handlers.library_handler import DOWNLOAD_STARTED
+
+    manager = RequestManager(email, PREFETCH_PATH, "GET")
+    if not manager.claim_background_request():
+        return 0
+
+    def check_cancellation():
+        return should_cancel(email, manager.request_key)
+
+    set_email_context(email)
+    automator.state_machine.set_cancellation_check(check_cancellation)
+    started = 0
+    try:
+        with email_override(email):
+            for title in titles:
+                if check_cancellation():
+                    logger.info(f"Download prefetch for {email} was cancelled")
+                    break
+                outcome = automator.state_machine.library_handler.start_background_download(title)
+                logger.info(f"Download prefetch of '{title}' for {email}: {outcome}")
+                if outcome == DOWNLOAD_STARTED:
+                    started += 1
+        return started
+    except Exception as e:
+        logger.warning(f"Download prefetch failed for {email}: {e}", exc_info=True)
+        return started
+    finally:
+        automator.state_machine.clear_cancellation_check(check_cancellation)
+        manager.release_background_request()
+        clear_email_context()
+
+
+def run_download_prefetches(server) -> int:
+    """
+    Prefetch the recent books of every due user, one at a time.
+
+    Args:
+        server: The AutomationServer instance
+
+    Returns:
+        int: Number of downloads started
+    """
+    started = 0
+    for email in list(server.automators.keys()):
+        try:
+            if is_due_for_prefetch(server, email):
+                started += prefetch_downloads(server, email)
+        except Exception as e:
+            logger.warning(f"Error checking download prefetch for {email}: {e}", exc_info=True)
+    if started:
+        logger.info(f"Background download prefetch started {started} downloads")
+    return started
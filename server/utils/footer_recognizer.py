@@ -0,0 +1,397 @@
+"""
+Local recognition of the reader's page indicator footer.
+
+Reading the page or location number used to cost a cloud OCR call on the bottom
+strip of every page, although the footer only ever shows a handful of short phrases
+in one font. This module reads it locally with glyph templates:
+
+1. The footer line is binarized against its background and split into glyphs at
+   blank columns, with wide gaps becoming spaces
+2. Each glyph is scaled into a fixed frame relative to the line's ascender height and
+   baseline, so digits, capitals and descenders keep their relative positions
+3. Glyphs are matched against templates learned from footers the cloud provider read,
+   and the weakest glyph match is the confidence of the whole line
+
+Templates are learned per font size, since the user can change it, and persisted next
+to the OCR cache. A line is only read locally once every digit has a template and the
+result parses as a page indicator; anything else falls back to the cloud, which in
+turn teaches the recognizer.
+
+Usage:
+    text, error = read_page_indicator(page_indicator_bytes)
+"""
+
+import io
+import json
+import logging
+import os
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from PIL import Image
+
+from server.utils.ocr_cache import CACHE_DIR
+from server.utils.page_indicator_utils import parse_page_indicators
+
+logger = logging.getLogger(__name__)
+
+TEMPLATES_PATH = CACHE_DIR / "footer_glyphs.json"
+
+# Size of the frame each glyph is scaled into
+GLYPH_WIDTH = 12
+GLYPH_HEIGHT = 18
+
+# Space below the baseline included in a glyph's frame, relative to the ascender height
+DESCENDER_RATIO = 0.35
+
+# Smallest ascender height in pixels worth recognizing
+MIN_LINE_HEIGHT = 6
+
+# Fraction of the strongest ink contrast a pixel needs to count as ink
+INK_CONTRAST_FRACTION = 0.4
+MIN_INK_CONTRAST = 32
+
+# Gap between glyphs, relative to the ascender height, treated as a space until learned
+DEFAULT_SPACE_GAP = 0.22
+
+# Templates kept per character and font size
+MAX_SAMPLES_PER_GLYPH = 4
+
+# Lowest glyph match score accepted for a local read
+MIN_CONFIDENCE = float(os.getenv("FOOTER_RECOGNIZER_MIN_CONFIDENCE", 0.8))
+
+# Score lead a glyph's best character needs over the next best character
+MIN_MARGIN = 0.05
+
+# Every this many local reads is also sent to the cloud to check the templates
+AUDIT_INTERVAL = int(os.getenv("FOOTER_RECOGNIZER_AUDIT_INTERVAL", 25))
+
+DIGITS = "0123456789"
+
+
+class _Glyph:
+    """One segmented glyph: its scaled bitmap and shape features."""
+
+    __slots__ = ("bits", "ink", "width", "gap_before")
+
+    def __init__(self, bits: int, width: float, gap_before: float):
+        self.bits = bits
+        self.ink = bits.bit_count()
+        self.width = width
+        self.gap_before = gap_before
+
+
+def _segment(image_content: bytes) -> Optional[Tuple[int, List[_Glyph]]]:
+    """
+    Split the bottom text line of a footer strip into glyphs.
+
+    Args:
+        image_content: Encoded image bytes of the footer strip
+
+    Returns:
+        tuple or None: (ascender height in pixels, glyphs left to right), or None if no
+        usable text line was found
+    """
+    try:
+        with Image.open(io.BytesIO(image_content)) as image:
+            gray = image.convert("L")
+    except Exception as e:
+        logger.debug(f"Could not decode footer strip: {e}")
+        return None
+
+    width, height = gray.size
+    pixels = gray.tobytes()
+    background = sorted(pixels)[len(pixels) // 2]
+    contrast = max(abs(min(pixels) - background), abs(max(pixels) - background))
+    threshold = max(MIN_INK_CONTRAST, contrast * INK_CONTRAST_FRACTION)
+    if contrast <= threshold:
+        return None
+    ink_table = bytes(1 if abs(value - background) > threshold else 0 for value in range(256))
+    mask = pixels.translate(ink_table)
+    rows = [mask[y * width : (y + 1) * width] for y in range(height)]
+
+    # The indicator is the bottom-most band of inked rows; anything above is page text
+    band = None
+    y = height - 1
+    while y >= 0:
+        if 1 in rows[y]:
+            bottom = y
+            while y >= 0 and 1 in rows[y]:
+                y -= 1
+            if bottom - y >= MIN_LINE_HEIGHT:
+                band = (y + 1, bottom + 1)
+                break
+        y -= 1
+    if band is None:
+        return None
+    band_rows = rows[band[0] : band[1]]
+
+    # Glyphs are runs of columns with ink anywhere in the band
+    columns = [any(row[x] for row in band_rows) for x in range(width)]
+    spans = []
+    x = 0
+    while x < width:
+        if columns[x]:
+            start = x
+            while x < width and columns[x]:
+                x += 1
+            spans.append((start, x))
+        x += 1
+    if not spans:
+        return None
+
+    # Ascender top and baseline; most glyphs sit on the baseline, so it is the commonest bottom
+    bottoms = Counter()
+    top = band[1]
+    for start, end in spans:
+        inked = [band[0] + i for i, row in enumerate(band_rows) if 1 in row[start:end]]
+        top = min(top, inked[0])
+        bottoms[inked[-1] + 1] += 1
+    baseline = bottoms.most_common(1)[0][0]
+    line_height = baseline - top
+    if line_height < MIN_LINE_HEIGHT:
+        return None
+
+    frame_bottom = baseline + round(line_height * DESCENDER_RATIO)
+    glyphs = []
+    previous_end = None
+    for start, end in spans:
+        crop = gray.crop((start, top, end, frame_bottom))
+        if frame_bottom > height:
+            padded = Image.new("L", (end - start, frame_bottom - top), background)
+            padded.paste(crop.crop((0, 0, end - start, height - top)), (0, 0))
+            crop = padded
+        scaled = crop.resize((GLYPH_WIDTH, GLYPH_HEIGHT), Image.BILINEAR).tobytes().translate(ink_table)
+        bits = int.from_bytes(scaled, "big") if any(scaled) else 0
+        gap = (start - previous_end) / line_height if previous_end is not None else 0.0
+        glyphs.append(_Glyph(bits, (end - start) / line_height, gap))
+        previous_end = end
+    return line_height, glyphs
+
+
+def _score(glyph: _Glyph, template: List) -> float:
+    """Score a glyph against one template: bitmap overlap scaled by width agreement."""
+    bits, width = int(template[0], 16), template[1]
+    total = glyph.ink + bits.bit_count()
+    if not total:
+        return 0.0
+    overlap = 2 * (glyph.bits & bits).bit_count() / total
+    return overlap * min(glyph.width, width) / max(glyph.width, width, 1e-6)
+
+
+class FooterRecognizer:
+    """Glyph-template recognizer for the page indicator footer."""
+
+    def __init__(self, path: Path = TEMPLATES_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._fonts: Dict[str, Dict] = self._load()
+        self._stats = {"local_reads": 0, "rejected": 0, "learned": 0, "skipped": 0, "audit_failures": 0}
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            return json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable footer glyph templates {self.path}: {e}")
+            return {}
+
+    def _save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_suffix(".tmp")
+            with self._lock:
+                temp_path.write_text(json.dumps(self._fonts))
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save footer glyph templates {self.path}: {e}")
+
+    def _font(self, line_height: int) -> Optional[Dict]:
+        # The ascender height of one font size can measure a pixel either way between lines
+        for key in (line_height, line_height - 1, line_height + 1):
+            font = self._fonts.get(str(key))
+            if font:
+                return font
+        return None
+
+    def learn(self, image_content: bytes, text: str) -> bool:
+        """
+        Learn glyph templates from a footer strip and its cloud OCR text.
+
+        The strip is only used when it segments into exactly one glyph per non-space
+        character of the text, so glyphs can be paired with characters unambiguously.
+
+        Args:
+            image_content: Encoded image bytes of the footer strip
+            text: The text the cloud provider read from the strip
+
+        Returns:
+            bool: True if templates were learned from the strip
+        """
+        text = " ".join((text or "").split())
+        segmented = _segment(image_content) if text else None
+        characters = text.replace(" ", "")
+        if not segmented or len(segmented[1]) != len(characters):
+            with self._lock:
+                self._stats["skipped"] += 1
+            return False
+
+        line_height, glyphs = segmented
+        word_starts = set()
+        index = 0
+        for word in text.split(" "):
+            word_starts.add(index)
+            index += len(word)
+        letter_gaps = [g.gap_before for i, g in enumerate(glyphs) if i and i not in word_starts]
+        word_gaps = [g.gap_before for i, g in enumerate(glyphs) if i and i in word_starts]
+        if letter_gaps and word_gaps and max(letter_gaps) >= min(word_gaps):
+            with self._lock:
+                self._stats["skipped"] += 1
+            return False
+
+        with self._lock:
+            font = self._font(line_height) or self._fonts.setdefault(
+                str(line_height), {"space_gap": DEFAULT_SPACE_GAP, "glyphs": {}}
+            )
+            if letter_gaps and word_gaps:
+                font["space_gap"] = round((max(letter_gaps) + min(word_gaps)) / 2, 4)
+            changed = False
+            for character, glyph in zip(characters, glyphs):
+                samples = font["glyphs"].setdefault(character, [])
+                if len(samples) >= MAX_SAMPLES_PER_GLYPH or any(
+                    _score(glyph, sample) > 0.97 for sample in samples
+                ):
+                    continue
+                samples.append([f"{glyph.bits:x}", round(glyph.width, 4)])
+                changed = True
+            self._stats["learned"] += 1
+        if changed:
+            self._save()
+        return True
+
+    def recognize(self, image_content: bytes) -> Tuple[Optional[str], float]:
+        """
+        Read a footer strip with the learned templates.
+
+        Args:
+            image_content: Encoded image bytes of the footer strip
+
+        Returns:
+            tuple: (text, confidence). Text is None when the font size has no complete
+            digit templates yet, or when the line could not be segmented
+        """
+        segmented = _segment(image_content)
+        if not segmented:
+            return None, 0.0
+        line_height, glyphs = segmented
+        with self._lock:
+            font = self._font(line_height)
+            templates = {c: list(samples) for c, samples in font["glyphs"].items()} if font else {}
+            space_gap = font["space_gap"] if font else DEFAULT_SPACE_GAP
+        if not templates or not all(digit in templates for digit in DIGITS):
+            return None, 0.0
+
+        text = []
+        confidence = 1.0
+        for i, glyph in enumerate(glyphs):
+            scores = sorted(
+                ((max(_score(glyph, sample) for sample in samples), c) for c, samples in templates.items()),
+                reverse=True,
+            )
+            best, character = scores[0]
+            margin = best - scores[1][0] if len(scores) > 1 else best
+            if margin < MIN_MARGIN:
+                best *= margin / MIN_MARGIN
+            confidence = min(confidence, best)
+            if i and glyph.gap_before > space_gap:
+                text.append(" ")
+            text.append(character)
+        return "".join(text), round(confidence, 3)
+
+    def forget(self, image_content: bytes) -> None:
+        """Drop the templates for the font size of a strip the recognizer misread."""
+        segmented = _segment(image_content)
+        if not segmented:
+            return
+        with self._lock:
+            for key in (segmented[0], segmented[0] - 1, segmented[0] + 1):
+                self._fonts.pop(str(key), None)
+        self._save()
+
+    def count(self, counter: str) -> None:
+        """Increment one of the recognizer's counters."""
+        with self._lock:
+            self._stats[counter] += 1
+
+    def stats(self) -> Dict:
+        """Return local-read counters and the number of learned font sizes."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["font_sizes"] = len(self._fonts)
+        return stats
+
+
+_recognizer: Optional[FooterRecognizer] = None
+_recognizer_lock = threading.Lock()
+
+
+def get_footer_recognizer() -> FooterRecognizer:
+    """Return the process-wide footer recognizer."""
+    global _recognizer
+    with _recognizer_lock:
+        if _recognizer is None:
+            _recognizer = FooterRecognizer()
+        return _recognizer
+
+
+def read_page_indicator(
+    page_indicator_bytes: bytes, cache_context: Optional[Dict] = None
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Read the page indicator strip, locally when possible and with cloud OCR otherwise.
+
+    A local read is used when its confidence reaches MIN_CONFIDENCE and it parses as a
+    page, location or time indicator. Cloud results are fed back to the recognizer,
+    and every AUDIT_INTERVAL local reads is checked against the cloud so templates
+    that drift are discarded.
+
+    Args:
+        page_indicator_bytes: Encoded image bytes of the page indicator region
+        cache_context: Optional OCR cache context for the cloud read, see KindleOCR.process_ocr
+
+    Returns:
+        tuple: (whitespace-normalized text or None, error message or None)
+    """
+    from server.utils.ocr_utils import KindleOCR
+
+    recognizer = get_footer_recognizer()
+    text, confidence = recognizer.recognize(page_indicator_bytes)
+    local_text = None
+    if text and confidence >= MIN_CONFIDENCE and parse_page_indicators(text):
+        local_text = text
+        recognizer.count("local_reads")
+        if AUDIT_INTERVAL <= 0 or recognizer.stats()["local_reads"] % AUDIT_INTERVAL:
+            logger.debug(f"Read page indicator locally: '{text}' (confidence {confidence})")
+            return text, None
+    elif text:
+        recognizer.count("rejected")
+        logger.debug(f"Local page indicator read '{text}' rejected (confidence {confidence})")
+
+    cloud_text, error = KindleOCR.process_ocr(
+        page_indicator_bytes, clean_ui_elements=False, cache_context=cache_context
+    )
+    if not cloud_text:
+        # The cloud failing is no reason to discard an audited local read
+        return (local_text, None) if local_text else (None, error)
+
+    cloud_text = " ".join(cloud_text.split())
+    if local_text and local_text != cloud_text:
+        logger.warning(f"Footer templates misread '{cloud_text}' as '{local_text}', discarding them")
+        recognizer.count("audit_failures")
+        recognizer.forget(page_indicator_bytes)
+    if parse_page_indicators(cloud_text):
+        recognizer.learn(page_indicator_bytes, cloud_text)
+    return cloud_text, None
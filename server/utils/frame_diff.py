@@ -0,0 +1,86 @@
+"""
+Detecting screen changes by comparing small fingerprints of frames.
+
+Page turns were assumed to work after a fixed sleep. To confirm one instead, a region of
+the screen is captured before the swipe and shrunk to a small grayscale fingerprint,
+then frames are compared against it until the content has changed and stopped changing:
+
+1. Each frame's fingerprint is compared with the one before the swipe; a mean difference
+   above CHANGE_THRESHOLD means the page changed
+2. Once changed, two consecutive frames differing by less than STABLE_THRESHOLD mean the
+   page turn animation has finished
+
+Fingerprints are small enough that comparing two costs well under a millisecond, so how
+fast a change is confirmed depends only on how fast frames arrive.
+"""
+
+import time
+from typing import Callable, Optional, Tuple
+
+from PIL import Image, ImageChops, ImageStat
+
+from server.utils.screenshot_utils import Region, crop_region
+
+# Width of a fingerprint in pixels; the height keeps the region's aspect ratio
+FINGERPRINT_WIDTH = 96
+
+# Mean difference, as a fraction of full scale, above which fingerprints show different pages
+CHANGE_THRESHOLD = 0.005
+# Mean difference below which consecutive frames show the same, settled content
+STABLE_THRESHOLD = 0.001
+
+
+def fingerprint(image: Image.Image, region: Optional[Region] = None) -> Image.Image:
+    """Shrink a region of a frame to a small grayscale image for comparison.
+
+    Args:
+        image: The frame
+        region: Optional (left, top, right, bottom) fractions of the frame to compare
+
+    Returns:
+        Image.Image: Grayscale fingerprint FINGERPRINT_WIDTH pixels wide
+    """
+    if region:
+        image = crop_region(image, region)
+    height = max(1, round(image.height * FINGERPRINT_WIDTH / image.width))
+    return image.convert("L").resize((FINGERPRINT_WIDTH, height), Image.BOX)
+
+
+def frame_difference(first: Image.Image, second: Image.Image) -> float:
+    """Return the mean difference of two fingerprints, from 0 (identical) to 1."""
+    return ImageStat.Stat(ImageChops.difference(first, second)).mean[0] / 255
+
+
+def wait_for_change(
+    grab: Callable[[], Optional[Image.Image]],
+    before: Image.Image,
+    timeout: float,
+    region: Optional[Region] = None,
+) -> Tuple[bool, Optional[Image.Image]]:
+    """Wait for the screen to change from a fingerprint and settle.
+
+    Args:
+        grab: Returns a frame captured after it is called, or None
+        before: Fingerprint of the screen before the change
+        timeout: Seconds to wait for the change to happen and settle
+        region: Region the fingerprint was taken of
+
+    Returns:
+        tuple: (changed, frame) - whether the screen changed, and the last frame grabbed,
+        None if grabbing failed. A change still animating at the timeout counts as changed.
+    """
+    deadline = time.time() + timeout
+    changed = False
+    previous = None
+    frame = None
+    while time.time() < deadline:
+        frame = grab()
+        if frame is None:
+            break
+        current = fingerprint(frame, region)
+        if not changed:
+            changed = frame_difference(before, current) > CHANGE_THRESHOLD
+        elif frame_difference(previous, current) < STABLE_THRESHOLD:
+            return True, frame
+        previous = current
+    return changed, frame
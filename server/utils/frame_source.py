@@ -0,0 +1,268 @@
+"""
+Persistent frame source for an emulator's screen.
+
+Every in-memory capture ran `adb exec-out screencap`, paying for a new adb process and
+connection each time. A frame source keeps one adb process that runs screencap in a loop
+on the device and decodes the raw frames in a background thread, so the latest frame is
+always in memory:
+
+- latest() returns the most recent frame without waiting
+- wait_for_frame(since) returns the first frame the device grabbed after `since`, which
+  is what a capture after a page turn needs
+
+Only the reader starts a source, when it turns pages, since that is where captures come
+in quick succession. Other captures use a source that is already running and otherwise
+take a one-off screencap. A source stops when the book is closed or after
+FRAME_SOURCE_IDLE_SECONDS without reads, so emulators nobody is reading on are not
+streamed. Screens protected by FLAG_SECURE still need take_secure_screenshot().
+"""
+
+import logging
+import os
+import struct
+import subprocess
+import threading
+import time
+from typing import Dict, NamedTuple, Optional
+
+from PIL import Image
+
+from server.utils.screenshot_utils import RAW_PIXEL_FORMATS, raw_screencap_header_size
+
+logger = logging.getLogger(__name__)
+
+FRAME_SOURCE_ENABLED = os.getenv("FRAME_SOURCE_ENABLED", "true").lower() == "true"
+
+# Pause between frames on the device, trading CPU for frame freshness
+FRAME_INTERVAL_SECONDS = float(os.getenv("FRAME_SOURCE_INTERVAL_SECONDS", 0.1))
+
+# Time without reads after which a source stops streaming
+FRAME_SOURCE_IDLE_SECONDS = int(os.getenv("FRAME_SOURCE_IDLE_SECONDS", 60))
+
+# Longest a capture waits for a fresh frame before falling back to a one-off screencap
+FRAME_WAIT_TIMEOUT_SECONDS = 2
+
+# Time before a device whose stream failed is streamed again
+RESTART_BACKOFF_SECONDS = 30
+
+PROBE_TIMEOUT_SECONDS = 5
+
+
+class Frame(NamedTuple):
+    """A decoded frame and when the device could have grabbed it."""
+
+    image: Image.Image
+    # The previous frame had been read by then, so the device grabbed this one after it
+    started_at: float
+    # When the frame had been read completely
+    captured_at: float
+
+
+def _read_exactly(stream, size: int) -> Optional[bytes]:
+    """Read size bytes from a stream, or None if it ends first."""
+    data = stream.read(size)
+    if data is None or len(data) < size:
+        return None
+    return data
+
+
+class FrameSource:
+    """One emulator's continuous screen stream, holding its latest frame."""
+
+    def __init__(self, device_id: str, interval: float = FRAME_INTERVAL_SECONDS):
+        self.device_id = device_id
+        self.interval = interval
+        self._process: Optional[subprocess.Popen] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._condition = threading.Condition()
+        self._frame: Optional[Frame] = None
+        self._streaming = False
+        self.frames = 0
+        self.last_used = time.time()
+        self.failed_at: Optional[float] = None
+        self._start_lock = threading.Lock()
+
+    def is_running(self) -> bool:
+        return self._streaming
+
+    def failed_recently(self) -> bool:
+        return self.failed_at is not None and time.time() - self.failed_at < RESTART_BACKOFF_SECONDS
+
+    def start(self) -> bool:
+        """Start streaming frames.
+
+        Returns:
+            bool: True if the stream is running
+        """
+        with self._start_lock:
+            if self.is_running():
+                return True
+            return self._start()
+
+    def _start(self) -> bool:
+        # A single screencap tells whether frames carry a color space after the header
+        try:
+            probe = subprocess.run(
+                ["adb", "-s", self.device_id, "exec-out", "screencap"],
+                capture_output=True,
+                timeout=PROBE_TIMEOUT_SECONDS,
+                check=True,
+            )
+            header_size = raw_screencap_header_size(probe.stdout)
+        except Exception as e:
+            logger.warning(f"Could not start frame source for {self.device_id}: {e}")
+            self.failed_at = time.time()
+            return False
+
+        loop = f"while true; do screencap; sleep {self.interval}; done"
+        self._process = subprocess.Popen(
+            ["adb", "-s", self.device_id, "exec-out", loop],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        self._stop.clear()
+        self._streaming = True
+        self.failed_at = None
+        self.last_used = time.time()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(self._process, header_size),
+            name=f"frame-source-{self.device_id}",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info(f"Started frame source for {self.device_id}")
+        return True
+
+    def stop(self):
+        """Stop streaming and end the adb process."""
+        self._stop.set()
+        process = self._process
+        if process and process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+        with self._condition:
+            self._condition.notify_all()
+
+    def latest(self) -> Optional[Frame]:
+        """Return the most recent frame without waiting."""
+        self.last_used = time.time()
+        return self._frame
+
+    def wait_for_frame(self, since: float, timeout: float = FRAME_WAIT_TIMEOUT_SECONDS) -> Optional[Frame]:
+        """Wait for a frame the device grabbed after a point in time.
+
+        Args:
+            since: time.time() value the frame must be grabbed after
+            timeout: Seconds to wait for the frame
+
+        Returns:
+            Frame or None: The first frame started after `since`, or None if the stream
+            stopped or none arrived in time
+        """
+        self.last_used = time.time()
+        deadline = time.time() + timeout
+        with self._condition:
+            while True:
+                frame = self._frame
+                if frame and frame.started_at >= since:
+                    return frame
+                remaining = deadline - time.time()
+                if remaining <= 0 or not self.is_running():
+                    return None
+                self._condition.wait(remaining)
+
+    def _run(self, process: subprocess.Popen, header_size: int):
+        """Decode frames from the stream until stopped, idle or the stream ends."""
+        started_at = time.time()
+        try:
+            while not self._stop.is_set():
+                if time.time() - self.last_used > FRAME_SOURCE_IDLE_SECONDS:
+                    logger.info(f"Stopping idle frame source for {self.device_id}")
+                    break
+
+                header = _read_exactly(process.stdout, header_size)
+                if header is None:
+                    if not self._stop.is_set():
+                        logger.warning(f"Frame stream ended for {self.device_id}")
+                        self.failed_at = time.time()
+                    break
+                width, height, pixel_format = struct.unpack_from("<III", header)
+                pixels = _read_exactly(process.stdout, width * height * 4)
+                if pixels is None or pixel_format not in RAW_PIXEL_FORMATS:
+                    logger.warning(f"Unreadable frame from {self.device_id}, stopping frame source")
+                    self.failed_at = time.time()
+                    break
+
+                image = Image.frombuffer(
+                    "RGBA", (width, height), pixels, "raw", RAW_PIXEL_FORMATS[pixel_format], 0, 1
+                )
+                captured_at = time.time()
+                with self._condition:
+                    self._frame = Frame(image, started_at, captured_at)
+                    self.frames += 1
+                    self._condition.notify_all()
+                started_at = captured_at
+        except Exception as e:
+            logger.warning(f"Error reading frames from {self.device_id}: {e}")
+            self.failed_at = time.time()
+        finally:
+            if process.poll() is None:
+                process.terminate()
+            with self._condition:
+                self._streaming = False
+                self._condition.notify_all()
+
+
+_sources: Dict[str, FrameSource] = {}
+_sources_lock = threading.Lock()
+
+
+def get_frame_source(device_id: str, start: bool = True) -> Optional[FrameSource]:
+    """Get the running frame source for a device, starting it if needed.
+
+    Args:
+        device_id: The Android device/emulator ID
+        start: Whether to start a source that is not running
+
+    Returns:
+        FrameSource or None: The running source, or None if streaming is disabled, was
+        not requested to start, or failed recently
+    """
+    if not FRAME_SOURCE_ENABLED or not device_id:
+        return None
+    with _sources_lock:
+        source = _sources.get(device_id)
+        if source is None:
+            if not start:
+                return None
+            source = _sources[device_id] = FrameSource(device_id)
+
+    if source.is_running():
+        return source
+    if not start or source.failed_recently():
+        return None
+    return source if source.start() else None
+
+
+def stop_frame_source(device_id: str):
+    """Stop a device's frame source, e.g. when its book is closed or its driver goes away."""
+    with _sources_lock:
+        source = _sources.pop(device_id, None)
+    if source:
+        source.stop()
+
+
+def stop_all_frame_sources():
+    """Stop every frame source on shutdown."""
+    with _sources_lock:
+        sources = list(_sources.values())
+        _sources.clear()
+    for source in sources:
+        source.stop()
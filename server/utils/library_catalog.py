@@ -0,0 +1,350 @@
+"""
+Persisted per-user library catalog.
+
+Library scans write every screen of books to the library_books table as they go, so
+/books-stream can serve the library page by page from the database without
+touching the emulator. Pages are addressed by an opaque cursor that encodes the sort
+order and the keyset position of the last book sent, which lets a client resume an
+interrupted stream from where it left off.
+
+Each write is also diffed against the catalog and logged to library_changes as
+added, removed, renamed and progress-changed events, which /library-changes serves
+by version.
+
+Usage:
+    page = get_catalog_page(email, cursor=request.args.get("cursor"), page_size=50)
+    for book in page["books"]:
+        ...
+    next_cursor = page["cursor"]
+"""
+
+import base64
+import binascii
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+from database.connection import get_db
+from database.repositories.library_book_repository import (
+    SORT_DEVICE,
+    SORT_MODES,
+    LibraryBookRepository,
+)
+from server.core.redis_connection import get_redis_client
+from server.utils.cover_utils import get_cover_url, slugify
+from server.utils.title_index import get_title_index, title_similarity
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+COVERS_DIR = Path(__file__).resolve().parent.parent.parent / "covers"
+
+# Minimum title similarity for a book that vanished and one that appeared to count as a rename
+RENAME_SIMILARITY_THRESHOLD = 0.75
+
+# How long the latest change version stays published in Redis
+CHANGE_VERSION_TTL = 24 * 60 * 60
+
+# Users whose first scan is seeding an empty catalog
+_seeding_emails: Set[str] = set()
+_seeding_lock = threading.Lock()
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a catalog cursor cannot be decoded."""
+
+
+def encode_cursor(sort: str, key: Optional[list]) -> str:
+    """
+    Encode a catalog position as an opaque, URL-safe cursor.
+
+    Args:
+        sort: The sort order the key belongs to
+        key: Sort key of the last book sent, or None for the start of the catalog
+
+    Returns:
+        str: The cursor
+    """
+    payload = json.dumps({"s": sort, "k": key}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Dict:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    An empty cursor means the start of the catalog in device order.
+
+    Returns:
+        dict: {"sort": str, "key": list or None}
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    if not cursor:
+        return {"sort": SORT_DEVICE, "key": None}
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise InvalidCursorError(f"Malformed cursor: {e}")
+
+    if not isinstance(payload, dict) or payload.get("s") not in SORT_MODES:
+        raise InvalidCursorError("Malformed cursor: unknown sort order")
+    key = payload.get("k")
+    if key is not None and not isinstance(key, list):
+        raise InvalidCursorError("Malformed cursor: bad key")
+    return {"sort": payload["s"], "key": key}
+
+
+def clamp_page_size(value) -> int:
+    """Parse a page_size query parameter, falling back to DEFAULT_PAGE_SIZE."""
+    try:
+        page_size = int(value)
+    except (TypeError, ValueError):
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(page_size, MAX_PAGE_SIZE))
+
+
+def book_to_dict(book, email: str) -> Dict:
+    """
+    Convert a LibraryBook row to the book shape sent by /books-stream.
+
+    Covers extracted by earlier scans are linked when their file still exists.
+    """
+    result = {"title": book.title}
+    for field in ("author", "progress", "size"):
+        value = getattr(book, field)
+        if value:
+            result[field] = value
+    if book.downloaded is not None:
+        result["downloaded"] = book.downloaded
+
+    filename = f"{slugify(book.title)}.png"
+    if (COVERS_DIR / slugify(email) / filename).exists():
+        result["cover_url"] = get_cover_url(filename, email)
+    return result
+
+
+def record_scan_page(email: str, books: Sequence[Dict], start: int) -> List[Dict]:
+    """
+    Write the books a scan found on one screen to the catalog.
+
+    The first scan into an empty catalog seeds it without logging every book as added.
+
+    Args:
+        email: The user's email address
+        books: All books found so far, in device order
+        start: Index in books of the first book found on this screen
+
+    Returns:
+        list: Changes written to the change log
+    """
+    if not email or start >= len(books):
+        return []
+    try:
+        with get_db() as session:
+            repo = LibraryBookRepository(session)
+            if start == 0:
+                with _seeding_lock:
+                    if repo.count_books(email) == 0:
+                        _seeding_emails.add(email)
+                    else:
+                        _seeding_emails.discard(email)
+            changes = repo.upsert_books(email, books[start:], start, log_changes=email not in _seeding_emails)
+            if changes:
+                _publish_version(email, repo.get_latest_version(email))
+            return changes
+    except Exception as e:
+        logger.warning(f"Could not record library page in catalog for {email}: {e}")
+        return []
+
+
+def record_complete_scan(email: str, seen_titles: Iterable[str]) -> List[Dict]:
+    """
+    Mark books that a complete scan did not see as removed or renamed in the catalog.
+
+    Returns:
+        list: Changes written to the change log
+    """
+    if not email:
+        return []
+    _seeding_emails.discard(email)
+    try:
+        with get_db() as session:
+            repo = LibraryBookRepository(session)
+            changes = repo.mark_removed(email, seen_titles, rename_match=_is_rename)
+            if changes:
+                _publish_version(email, repo.get_latest_version(email))
+            return changes
+    except Exception as e:
+        logger.warning(f"Could not record complete library scan in catalog for {email}: {e}")
+        return []
+
+
+def _is_rename(old_title: str, new_title: str) -> bool:
+    return title_similarity(old_title, new_title) >= RENAME_SIMILARITY_THRESHOLD
+
+
+def _version_key(email: str) -> str:
+    return f"kindle:library:{email}:version"
+
+
+def _publish_version(email: str, version: int) -> None:
+    """Publish a user's latest change version so waiting change-feed requests wake up."""
+    redis_client = get_redis_client()
+    if not redis_client:
+        return
+    try:
+        redis_client.set(_version_key(email), version, ex=CHANGE_VERSION_TTL)
+    except Exception as e:
+        logger.debug(f"Could not publish library version for {email}: {e}")
+
+
+def get_changes(email: str, since_version: int = 0, limit: int = 500) -> Dict:
+    """
+    Read the change log after a version.
+
+    Returns:
+        dict: {"changes": [...], "version": int}, where version is the version of the
+        last change returned (or since_version when there are none)
+    """
+    with get_db() as session:
+        rows = LibraryBookRepository(session).get_changes_since(email, since_version, limit)
+        changes = [change_to_dict(row) for row in rows]
+    return {"changes": changes, "version": changes[-1]["version"] if changes else since_version}
+
+
+def change_to_dict(change) -> Dict:
+    """Convert a LibraryChange row to the shape sent by the change feed."""
+    result = {"version": change.id, "type": change.change_type, "title": change.title}
+    if change.old_title:
+        result["old_title"] = change.old_title
+    if change.old_value is not None:
+        result["old_value"] = change.old_value
+    if change.new_value is not None:
+        result["new_value"] = change.new_value
+    if change.created_at:
+        result["at"] = change.created_at.isoformat()
+    return result
+
+
+def wait_for_changes(email: str, since_version: int, timeout: float, cancelled=None) -> Dict:
+    """
+    Long-poll the change log.
+
+    Waits until a change newer than since_version exists or the timeout passes. Uses the
+    version published to Redis to avoid querying the database while nothing changes,
+    falling back to polling the database every few seconds without Redis.
+
+    Args:
+        email: The user's email address
+        since_version: Version the client has already seen
+        timeout: Maximum seconds to wait
+        cancelled: Optional callable returning True to stop waiting early
+
+    Returns:
+        dict: Same as get_changes
+    """
+    result = get_changes(email, since_version)
+    deadline = time.time() + timeout
+    redis_client = get_redis_client()
+    interval = 0.5 if redis_client else 3.0
+
+    while not result["changes"] and time.time() < deadline:
+        if cancelled and cancelled():
+            break
+        time.sleep(min(interval, max(0.0, deadline - time.time())))
+        if redis_client:
+            try:
+                published = redis_client.get(_version_key(email))
+                if not published or int(published) <= since_version:
+                    continue
+            except Exception:
+                pass  # Fall through to the database
+        result = get_changes(email, since_version)
+    return result
+
+
+def get_catalog_page(
+    email: str, cursor: Optional[str] = None, page_size: int = DEFAULT_PAGE_SIZE, sort: Optional[str] = None
+) -> Dict:
+    """
+    Read one page of a user's catalog.
+
+    Args:
+        email: The user's email address
+        cursor: Cursor from a previous page, or None to start at the beginning
+        page_size: Maximum number of books to return
+        sort: Sort order for a fresh listing; ignored when resuming from a cursor
+
+    Returns:
+        dict: {"books", "cursor", "has_more", "total_books", "sort"}, where cursor
+        resumes after the last book returned
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    position = decode_cursor(cursor)
+    if not cursor and sort in SORT_MODES:
+        position["sort"] = sort
+
+    with get_db() as session:
+        repo = LibraryBookRepository(session)
+        rows, has_more = repo.get_page(email, position["sort"], position["key"], page_size)
+        total_books = repo.count_books(email)
+        books = [book_to_dict(row, email) for row in rows]
+        last_key = repo.sort_key(rows[-1], position["sort"]) if rows else position["key"]
+
+    return {
+        "books": books,
+        "cursor": encode_cursor(position["sort"], last_key),
+        "has_more": has_more,
+        "total_books": total_books,
+        "sort": position["sort"],
+    }
+
+
+def get_catalog_titles(email: str) -> Set[str]:
+    """Return every title currently in a user's catalog."""
+    with get_db() as session:
+        return LibraryBookRepository(session).get_titles(email)
+
+
+def get_download_info(email: str, titles: Iterable[str]) -> Dict[str, Dict]:
+    """Return whether each of a user's books is downloaded and its size, each None when unknown."""
+    with get_db() as session:
+        return LibraryBookRepository(session).get_download_info(email, titles)
+
+
+def set_book_downloaded(email: str, title: str, downloaded: bool) -> None:
+    """Record in the catalog whether a book is downloaded on the device."""
+    try:
+        with get_db() as session:
+            LibraryBookRepository(session).set_downloaded(email, title, downloaded)
+    except Exception as e:
+        logger.warning(f"Could not record download state of {title} for {email}: {e}")
+
+
+def reset_download_state(email: str) -> None:
+    """
+    Forget which of a user's books are downloaded, for when their device starts over.
+
+    A freshly created or cloned AVD has no books downloaded, so both the catalog and
+    the title index are cleared back to unknown until the next library scan.
+    """
+    try:
+        with get_db() as session:
+            LibraryBookRepository(session).clear_downloaded(email)
+    except Exception as e:
+        logger.warning(f"Could not reset download state for {email}: {e}")
+
+    title_index = get_title_index(email)
+    if title_index is not None:
+        title_index.forget_downloads()
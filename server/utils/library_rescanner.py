@@ -0,0 +1,147 @@
+"""
+Background library rescans for the library change feed.
+
+Clients used to detect new purchases and progress changes by polling /books, which
+costs a full emulator scan per poll. Instead, a scheduler job rescans the library of
+each recently active user whose emulator is sitting idle on the library screen. The
+scan writes the catalog, which logs added, removed, renamed and progress-changed
+events for /library-changes.
+
+Rescans register as the user's active request with the lowest priority, so any client
+request cancels them, and they never leave a book the user has open.
+"""
+
+import logging
+import os
+import time
+
+from server.core.redis_connection import get_redis_client
+from server.core.request_manager import RequestManager
+from server.logging_config import clear_email_context, set_email_context
+from server.utils.cancellation_utils import get_active_request_info, should_cancel
+from server.utils.request_utils import email_override
+from views.core.app_state import AppState
+
+logger = logging.getLogger(__name__)
+
+RESCAN_PATH = "/library-rescan"
+
+# Minimum time between rescans of the same library
+RESCAN_INTERVAL_SECONDS = int(os.getenv("LIBRARY_RESCAN_INTERVAL_SECONDS", 30 * 60))
+
+# A user must have been quiet this long before their emulator is used for a rescan
+IDLE_SECONDS = int(os.getenv("LIBRARY_RESCAN_IDLE_SECONDS", 120))
+
+# Users who have not made a request for this long are no longer considered active
+ACTIVE_WINDOW_SECONDS = int(os.getenv("LIBRARY_RESCAN_ACTIVE_WINDOW_SECONDS", 2 * 60 * 60))
+
+
+def _last_rescan_key(email: str) -> str:
+    return f"kindle:library:{email}:last_rescan"
+
+
+def is_due_for_rescan(server, email: str) -> bool:
+    """
+    Check whether a user's library should be rescanned now.
+
+    Args:
+        server: The AutomationServer instance
+        email: The user's email address
+
+    Returns:
+        bool: True if the user is active, idle, on the library screen and not rescanned recently
+    """
+    automator = server.automators.get(email)
+    if not automator or not getattr(automator, "driver", None):
+        return False
+
+    if get_active_request_info(email):
+        logger.debug(f"Skipping library rescan for {email}: a request is in progress")
+        return False
+
+    last_activity = server.get_last_activity_time(email)
+    if not last_activity:
+        return False
+    quiet_for = time.time() - last_activity
+    if quiet_for < IDLE_SECONDS or quiet_for > ACTIVE_WINDOW_SECONDS:
+        return False
+
+    redis_client = get_redis_client()
+    if redis_client and redis_client.get(_last_rescan_key(email)):
+        return False
+
+    # Only scan an emulator that is already showing the library, never leave an open book
+    if automator.state_machine.current_state != AppState.LIBRARY:
+        return False
+
+    return True
+
+
+def rescan_library(server, email: str) -> bool:
+    """
+    Rescan one user's library at low priority.
+
+    Args:
+        server: The AutomationServer instance
+        email: The user's email address
+
+    Returns:
+        bool: True if the scan ran to completion without being cancelled
+    """
+    automator = server.automators.get(email)
+    if not automator:
+        return False
+
+    manager = RequestManager(email, RESCAN_PATH, "GET")
+    if not manager.claim_background_request():
+        return False
+
+    redis_client = get_redis_client()
+    if redis_client:
+        redis_client.set(_last_rescan_key(email), int(time.time()), ex=RESCAN_INTERVAL_SECONDS)
+
+    def check_cancellation():
+        return should_cancel(email, manager.request_key)
+
+    set_email_context(email)
+    automator.state_machine.set_cancellation_check(check_cancellation)
+    started = time.time()
+    try:
+        with email_override(email):
+            logger.info(f"Starting background library rescan for {email}")
+            automator.state_machine.library_handler.get_book_titles()
+        cancelled = check_cancellation()
+        logger.info(
+            f"Background library rescan for {email} {'was cancelled' if cancelled else 'finished'} "
+            f"after {time.time() - started:.1f}s"
+        )
+        return not cancelled
+    except Exception as e:
+        logger.warning(f"Background library rescan failed for {email}: {e}", exc_info=True)
+        return False
+    finally:
+        automator.state_machine.clear_cancellation_check(check_cancellation)
+        manager.release_background_request()
+        clear_email_context()
+
+
+def run_library_rescans(server) -> int:
+    """
+    Rescan the libraries of every due user, one at a time.
+
+    Args:
+        server: The AutomationServer instance
+
+    Returns:
+        int: Number of libraries rescanned
+    """
+    rescanned = 0
+    for email in list(server.automators.keys()):
+        try:
+            if is_due_for_rescan(server, email) and rescan_library(server, email):
+                rescanned += 1
+        except Exception as e:
+            logger.warning(f"Error checking library rescan for {email}: {e}", exc_info=True)
+    if rescanned:
+        logger.info(f"Background library rescans completed for {rescanned} users")
+    return rescanned
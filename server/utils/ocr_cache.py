@@ -0,0 +1,377 @@
+"""
+Perceptual-hash cache of OCR results.
+
+The same page image is often OCR'd several times within seconds: previews that step
+forward and back, repeated /navigate?ocr=1 at one position, and retries. This module
+caches OCR results keyed by a difference hash of the image, so a repeat costs a
+thumbnail and a dictionary lookup instead of a provider round trip.
+
+There are two tiers:
+1. An in-memory LRU of recent results
+2. A persistent tier of zlib-compressed entries on disk, evicted least recently used
+   once it exceeds a size budget
+
+The hash is an ink bitmap of a 160 pixel wide thumbnail, which is fine enough that two
+different pages of text never collide but ignores encoder noise. When the book is known,
+near matches differing in a handful of pixels are also accepted from the memory tier,
+which absorbs small rendering differences such as a highlight or status bar clock.
+
+Entries are scoped to the user in the context. Another user's text is never served, even
+for an identical image, since the image may show their annotations or account details.
+
+Entries hold the raw provider text, before UI elements are cleaned from it, so one entry
+serves both cleaned and raw OCR requests.
+
+Usage:
+    cache = get_ocr_cache()
+    context = {"user": email, "book": title, "position": 1234}
+    text = cache.get(image_bytes, variant="raw", context=context)
+    if text is None:
+        text = run_ocr(image_bytes)
+        cache.put(image_bytes, text, variant="raw", context=context, latency=elapsed)
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(__file__).resolve().parent.parent.parent / "ocr_cache"
+
+# Width of the thumbnail the hash is computed on; height follows the aspect ratio
+HASH_WIDTH = 160
+
+# Brightness distance from the page background for a thumbnail pixel to count as ink
+INK_THRESHOLD = 48
+
+# Largest fraction of differing pixels for a near match against a cached image of the same book
+NEAR_MATCH_MAX_FRACTION = 0.004
+
+MEMORY_MAX_ENTRIES = int(os.getenv("OCR_CACHE_MEMORY_ENTRIES", 512))
+DISK_MAX_BYTES = int(os.getenv("OCR_CACHE_DISK_MAX_MB", 200)) * 1024 * 1024
+
+# Check the disk budget after this many writes rather than on every write
+EVICTION_CHECK_INTERVAL = 50
+
+
+def perceptual_hash(image_content: bytes) -> Optional[int]:
+    """
+    Compute an ink-bitmap hash of an image.
+
+    The image is reduced to a HASH_WIDTH-wide grayscale thumbnail and every pixel
+    that differs clearly from the page background becomes a set bit. At this
+    resolution words and line breaks are still distinct, so different pages of text
+    differ in thousands of bits, while re-encoding the same page flips almost none.
+    The background is the median brightness, so light, sepia and dark themes all work.
+
+    Args:
+        image_content: Encoded image bytes
+
+    Returns:
+        int or None: The bitmap as an integer with a leading 1 bit so its size is
+        preserved, or None if the image could not be decoded
+    """
+    try:
+        with Image.open(io.BytesIO(image_content)) as image:
+            width, height = image.size
+            thumb_height = max(1, round(height * HASH_WIDTH / width))
+            thumbnail = image.convert("L").resize((HASH_WIDTH, thumb_height), Image.BILINEAR)
+            pixels = thumbnail.tobytes()
+    except Exception as e:
+        logger.debug(f"Could not hash image for OCR cache: {e}")
+        return None
+
+    background = sorted(pixels)[len(pixels) // 2]
+    bits = bytes(1 if abs(pixel - background) > INK_THRESHOLD else 0 for pixel in pixels)
+    return int("1" + bits.translate(_BIT_CHARS).decode("ascii"), 2)
+
+
+_BIT_CHARS = bytes.maketrans(b"\x00\x01", b"01")
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Count the bits that differ between two hashes."""
+    return (a ^ b).bit_count()
+
+
+def is_near_match(a: int, b: int) -> bool:
+    """Check whether two hashes are of the same size and differ in at most NEAR_MATCH_MAX_FRACTION of pixels."""
+    return (
+        a.bit_length() == b.bit_length()
+        and hamming_distance(a, b) <= a.bit_length() * NEAR_MATCH_MAX_FRACTION
+    )
+
+
+class OcrCache:
+    """Two-tier OCR result cache keyed by perceptual image hash."""
+
+    def __init__(
+        self,
+        cache_dir: Path = CACHE_DIR,
+        memory_max_entries: int = MEMORY_MAX_ENTRIES,
+        disk_max_bytes: int = DISK_MAX_BYTES,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.memory_max_entries = memory_max_entries
+        self.disk_max_bytes = disk_max_bytes
+        self._memory: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._writes_since_eviction = 0
+        self._stats = {
+            "memory_hits": 0,
+            "near_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "saved_seconds": 0.0,
+        }
+
+    @staticmethod
+    def _key(image_hash: int, variant: str, user: Optional[str]) -> str:
+        digest = hashlib.sha1(f"{user or ''}:{variant}:{image_hash:x}".encode("utf-8")).hexdigest()
+        return digest
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.zlib"
+
+    def get(
+        self, image_content: bytes, variant: str = "raw", context: Optional[Dict] = None
+    ) -> Optional[str]:
+        """
+        Look up the OCR text for an image.
+
+        Args:
+            image_content: Encoded image bytes
+            variant: Distinguishes results post-processed differently from the same image
+            context: Optional {"user", "book", "position"} metadata; the user scopes the
+                lookup and the book enables near matches within it
+
+        Returns:
+            str or None: The cached text, or None on a miss
+        """
+        image_hash = perceptual_hash(image_content)
+        if image_hash is None:
+            return None
+        return self.get_by_hash(image_hash, variant, context)
+
+    def get_by_hash(
+        self, image_hash: int, variant: str = "raw", context: Optional[Dict] = None
+    ) -> Optional[str]:
+        """Look up the OCR text for a precomputed image hash; see get()."""
+        context = context or {}
+        key = self._key(image_hash, variant, context.get("user"))
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return self._hit(entry, "memory_hits")
+
+            book = context.get("book")
+            if book:
+                for candidate in reversed(self._memory.values()):
+                    if (
+                        candidate["variant"] == variant
+                        and candidate.get("user") == context.get("user")
+                        and candidate.get("book") == book
+                        and is_near_match(candidate["hash"], image_hash)
+                    ):
+                        return self._hit(candidate, "near_hits")
+
+        entry = self._read_disk(key)
+        with self._lock:
+            if entry is not None:
+                self._remember(key, entry)
+                return self._hit(entry, "disk_hits")
+            self._stats["misses"] += 1
+        return None
+
+    def put(
+        self,
+        image_content: bytes,
+        text: str,
+        variant: str = "raw",
+        context: Optional[Dict] = None,
+        latency: float = 0.0,
+    ) -> Optional[int]:
+        """
+        Store the OCR text for an image in both tiers.
+
+        Args:
+            image_content: Encoded image bytes
+            text: The OCR text
+            variant: Distinguishes results post-processed differently from the same image
+            context: Optional {"user", "book", "position"} metadata
+            latency: Seconds the provider took, credited as saved on later hits
+
+        Returns:
+            int or None: The image hash, or None if the image could not be hashed
+        """
+        image_hash = perceptual_hash(image_content)
+        if image_hash is None or not text:
+            return image_hash
+        self.put_by_hash(image_hash, text, variant, context, latency)
+        return image_hash
+
+    def put_by_hash(
+        self,
+        image_hash: int,
+        text: str,
+        variant: str = "raw",
+        context: Optional[Dict] = None,
+        latency: float = 0.0,
+    ) -> None:
+        """Store the OCR text for a precomputed image hash; see put()."""
+        if not text:
+            return
+        context = context or {}
+        key = self._key(image_hash, variant, context.get("user"))
+        entry = {
+            "hash": image_hash,
+            "variant": variant,
+            "user": context.get("user"),
+            "text": text,
+            "latency": round(latency, 3),
+            "book": context.get("book"),
+            "position": context.get("position"),
+            "stored_at": time.time(),
+        }
+        with self._lock:
+            self._remember(key, entry)
+            self._stats["stores"] += 1
+        self._write_disk(key, entry)
+
+    def stats(self) -> Dict:
+        """
+        Return hit-rate and saved-latency metrics.
+
+        Returns:
+            dict: Counters plus hit_rate, memory_entries and disk_bytes
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        hits = stats["memory_hits"] + stats["near_hits"] + stats["disk_hits"]
+        lookups = hits + stats["misses"]
+        stats["hits"] = hits
+        stats["hit_rate"] = round(hits / lookups, 3) if lookups else 0.0
+        stats["saved_seconds"] = round(stats["saved_seconds"], 3)
+        return stats
+
+    def clear(self) -> None:
+        """Drop the memory tier; the disk tier is left to eviction."""
+        with self._lock:
+            self._memory.clear()
+
+    def _hit(self, entry: Dict, counter: str) -> str:
+        self._stats[counter] += 1
+        self._stats["saved_seconds"] += entry.get("latency") or 0.0
+        return entry["text"]
+
+    def _remember(self, key: str, entry: Dict) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_max_entries:
+            self._memory.popitem(last=False)
+
+    def _read_disk(self, key: str) -> Optional[Dict]:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.debug(f"Could not read OCR cache entry {path}: {e}")
+            return None
+
+        try:
+            entry = json.loads(zlib.decompress(data))
+            entry["hash"] = int(entry["hash"], 16)
+        except (zlib.error, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Discarding corrupt OCR cache entry {path}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        # Refresh the modification time so eviction treats the entry as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def _write_disk(self, key: str, entry: Dict) -> None:
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            payload = dict(entry, hash=f"{entry['hash']:x}")
+            temp_path = path.with_suffix(".tmp")
+            temp_path.write_bytes(zlib.compress(json.dumps(payload).encode("utf-8"), 6))
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write OCR cache entry {path}: {e}")
+            return
+
+        with self._lock:
+            self._writes_since_eviction += 1
+            due = self._writes_since_eviction >= EVICTION_CHECK_INTERVAL
+            if due:
+                self._writes_since_eviction = 0
+        if due:
+            self.evict()
+
+    def evict(self) -> int:
+        """
+        Delete the least recently used disk entries until the tier fits its budget.
+
+        Returns:
+            int: Number of entries deleted
+        """
+        try:
+            files = [(path.stat(), path) for path in self.cache_dir.glob("*/*.zlib")]
+        except OSError as e:
+            logger.warning(f"Could not list OCR cache directory: {e}")
+            return 0
+
+        total = sum(stat.st_size for stat, _ in files)
+        if total <= self.disk_max_bytes:
+            return 0
+
+        removed = 0
+        for stat, path in sorted(files, key=lambda item: item[0].st_mtime):
+            if total <= self.disk_max_bytes * 0.9:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= stat.st_size
+            removed += 1
+
+        with self._lock:
+            self._stats["evictions"] += removed
+        logger.info(f"Evicted {removed} OCR cache entries, disk tier now {total / 1024 / 1024:.1f}MB")
+        return removed
+
+
+_cache: Optional[OcrCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_ocr_cache() -> OcrCache:
+    """Return the process-wide OCR cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = OcrCache()
+        return _cache
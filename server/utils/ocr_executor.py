@@ -0,0 +1,252 @@
+"""
+Concurrent and hedged OCR execution.
+
+Page OCR used to run the main text region and the page indicator region one after
+the other, and each region tried Mistral to completion (or timeout) before starting
+Google. This module provides:
+
+1. A region executor for OCR'ing several crops of one screenshot concurrently
+2. A provider executor and run_hedged(), which starts the secondary provider once the
+   primary has taken longer than its recent p90 latency and returns the first good
+   result
+3. Per-provider latency and error statistics, which drive the hedge delay
+
+Provider clients, concurrency limits and timeouts live in ocr_providers.
+
+The two executors are separate so region tasks that block on provider calls can never
+starve the provider pool.
+
+Usage:
+    text, errors, provider = run_hedged(
+        ("mistral", lambda: call_mistral(image)),
+        ("google", lambda: call_google(image)),
+    )
+"""
+
+import concurrent.futures
+import contextvars
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Optional, Tuple
+
+from server.logging_config import clear_email_context, set_email_context
+from server.utils.request_utils import email_override, get_sindarin_email
+
+logger = logging.getLogger(__name__)
+
+REGION_WORKERS = int(os.getenv("OCR_REGION_WORKERS", 4))
+PROVIDER_WORKERS = int(os.getenv("OCR_PROVIDER_WORKERS", 8))
+
+# Hedge delay bounds; the delay itself is the primary provider's recent p90 latency
+DEFAULT_HEDGE_DELAY = 2.5
+MIN_HEDGE_DELAY = 0.5
+MAX_HEDGE_DELAY = 5.0
+
+# Successful calls needed before the observed p90 replaces DEFAULT_HEDGE_DELAY
+MIN_SAMPLES_FOR_P90 = 5
+
+# Latency samples kept per provider
+LATENCY_WINDOW = 100
+
+ProviderCall = Tuple[str, Callable[[], Tuple[Optional[str], Optional[str]]]]
+
+
+class ProviderStats:
+    """Rolling latency and error statistics for one OCR provider."""
+
+    def __init__(self, name: str, window: int = LATENCY_WINDOW):
+        self.name = name
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+        self.hedged = 0
+        self.wins = 0
+
+    def record(self, latency: float, ok: bool) -> None:
+        """Record the outcome of one call."""
+        with self._lock:
+            self.calls += 1
+            if ok:
+                self._latencies.append(latency)
+            else:
+                self.errors += 1
+
+    def record_hedge(self) -> None:
+        """Record that this provider was started as a hedge."""
+        with self._lock:
+            self.hedged += 1
+
+    def record_win(self) -> None:
+        """Record that this provider supplied the result that was used."""
+        with self._lock:
+            self.wins += 1
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Return the q-th percentile (0-100) of recent successful latencies, or None without samples."""
+        with self._lock:
+            samples = sorted(self._latencies)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, max(0, int(round(q / 100 * (len(samples) - 1)))))
+        return samples[index]
+
+    def hedge_delay(self) -> float:
+        """Return how long to wait for this provider before starting a hedge request."""
+        with self._lock:
+            enough = len(self._latencies) >= MIN_SAMPLES_FOR_P90
+        p90 = self.percentile(90) if enough else None
+        delay = p90 if p90 is not None else DEFAULT_HEDGE_DELAY
+        return min(MAX_HEDGE_DELAY, max(MIN_HEDGE_DELAY, delay))
+
+    def snapshot(self) -> Dict:
+        """Return the statistics as a dict."""
+        p50 = self.percentile(50)
+        p90 = self.percentile(90)
+        with self._lock:
+            calls, errors, hedged, wins = self.calls, self.errors, self.hedged, self.wins
+        return {
+            "calls": calls,
+            "errors": errors,
+            "error_rate": round(errors / calls, 3) if calls else 0.0,
+            "hedged": hedged,
+            "wins": wins,
+            "p50_seconds": round(p50, 3) if p50 is not None else None,
+            "p90_seconds": round(p90, 3) if p90 is not None else None,
+            "hedge_delay_seconds": round(self.hedge_delay(), 3),
+        }
+
+
+_stats: Dict[str, ProviderStats] = {}
+_stats_lock = threading.Lock()
+
+_region_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=REGION_WORKERS, thread_name_prefix="ocr-region"
+)
+_provider_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=PROVIDER_WORKERS, thread_name_prefix="ocr-provider"
+)
+
+
+def get_provider_stats(name: str) -> ProviderStats:
+    """Return the statistics for a provider, creating them on first use."""
+    with _stats_lock:
+        if name not in _stats:
+            _stats[name] = ProviderStats(name)
+        return _stats[name]
+
+
+def all_provider_stats() -> Dict[str, Dict]:
+    """Return a snapshot of every provider's statistics."""
+    with _stats_lock:
+        providers = list(_stats.values())
+    return {stats.name: stats.snapshot() for stats in providers}
+
+
+def submit_in_context(executor: concurrent.futures.Executor, fn: Callable, *args, **kwargs):
+    """
+    Submit a task that keeps the caller's request, email and logging context.
+
+    Flask's request context travels with contextvars; the email override and log
+    context are thread-local and are re-applied in the worker.
+    """
+    context = contextvars.copy_context()
+    try:
+        email = get_sindarin_email()
+    except Exception:
+        email = None
+
+    def run():
+        if not email:
+            return fn(*args, **kwargs)
+        set_email_context(email)
+        try:
+            with email_override(email):
+                return fn(*args, **kwargs)
+        finally:
+            clear_email_context()
+
+    return executor.submit(context.run, run)
+
+
+def submit_region(fn: Callable, *args, **kwargs) -> concurrent.futures.Future:
+    """Submit an OCR task for one screenshot region."""
+    return submit_in_context(_region_executor, fn, *args, **kwargs)
+
+
+def _timed_call(name: str, fn: Callable[[], Tuple[Optional[str], Optional[str]]]):
+    started = time.time()
+    try:
+        text, error = fn()
+    except Exception as e:
+        logger.error(f"OCR provider {name} raised: {e}", exc_info=True)
+        text, error = None, f"{name} failed: {e}"
+    get_provider_stats(name).record(time.time() - started, bool(text))
+    return text, error
+
+
+def run_hedged(
+    primary: ProviderCall, secondary: Optional[ProviderCall] = None, timeout: Optional[float] = None
+) -> Tuple[Optional[str], Dict, Optional[str]]:
+    """
+    Run an OCR request against the primary provider, hedging with the secondary.
+
+    The secondary starts when the primary fails, or when it has not answered within its
+    recent p90 latency. The first successful result wins; the slower call is left to
+    finish in the background and only updates statistics.
+
+    Args:
+        primary: (provider name, callable returning (text, error))
+        secondary: Optional fallback in the same form
+        timeout: Optional overall seconds to wait; providers still running then count as timed out
+
+    Returns:
+        tuple: (text or None, {provider name: error} for providers that failed, winning provider name)
+    """
+    primary_name, primary_fn = primary
+    futures = {submit_in_context(_provider_executor, _timed_call, primary_name, primary_fn): primary_name}
+    errors = {}
+    hedge_started = secondary is None
+    deadline = time.time() + timeout if timeout is not None else None
+
+    def remaining(limit=None):
+        if deadline is None:
+            return limit
+        left = max(0.0, deadline - time.time())
+        return left if limit is None else min(limit, left)
+
+    delay = get_provider_stats(primary_name).hedge_delay()
+    done, _ = concurrent.futures.wait(futures, timeout=remaining(delay))
+    if not done and not hedge_started:
+        logger.info(f"OCR provider {primary_name} slower than {delay:.2f}s, hedging with {secondary[0]}")
+        get_provider_stats(secondary[0]).record_hedge()
+
+    while futures:
+        if not hedge_started and (not done or any(not f.result()[0] for f in done)):
+            secondary_name, secondary_fn = secondary
+            futures[submit_in_context(_provider_executor, _timed_call, secondary_name, secondary_fn)] = (
+                secondary_name
+            )
+            hedge_started = True
+
+        done, _ = concurrent.futures.wait(
+            futures, timeout=remaining(), return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        if not done:
+            for name in futures.values():
+                errors[name] = f"{name} timed out after {timeout:g} seconds"
+                logger.warning(f"OCR provider {name} timed out after {timeout:g} seconds")
+            break
+        for future in done:
+            name = futures.pop(future)
+            text, error = future.result()
+            if text:
+                get_provider_stats(name).record_win()
+                return text, errors, name
+            errors[name] = error
+            logger.warning(f"OCR provider {name} failed: {error}")
+
+    return None, errors, None
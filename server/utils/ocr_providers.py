@@ -0,0 +1,354 @@
+"""
+Registry of OCR providers with persistent, pooled clients.
+
+Every OCR request used to build its provider client from scratch: Google Document AI
+decoded the base64 service account into a temporary credentials file, created a new
+gRPC client and a thread pool for its timeout, and Mistral created a new HTTP client.
+Providers registered here create their authenticated client once and reuse it, so
+connections stay open between requests. Each provider also has:
+
+1. A concurrency limit, so a burst of page OCR cannot open unbounded connections
+2. A timeout passed to the client itself, which cancels the request on the wire
+
+Calls are run on the shared provider executor by run_hedged(). The provider order
+comes from OCR_PROVIDERS, and tests or local setups can register a LocalOcrProvider
+in place of the cloud providers.
+
+Usage:
+    provider = get_provider("mistral")
+    text, error = provider.recognize(image_bytes)
+"""
+
+import base64
+import json
+import logging
+import os
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from server.utils.ocr_preprocessing import image_mime_type
+
+logger = logging.getLogger(__name__)
+
+# Provider names tried in order; the first is primary, the second hedges it
+PROVIDER_ORDER = os.getenv("OCR_PROVIDERS", "mistral,google")
+
+MISTRAL_TIMEOUT_SECONDS = float(os.getenv("OCR_MISTRAL_TIMEOUT_SECONDS", 6))
+MISTRAL_MAX_CONCURRENCY = int(os.getenv("OCR_MISTRAL_MAX_CONCURRENCY", 4))
+GOOGLE_TIMEOUT_SECONDS = float(os.getenv("OCR_GOOGLE_TIMEOUT_SECONDS", 5))
+GOOGLE_MAX_CONCURRENCY = int(os.getenv("OCR_GOOGLE_MAX_CONCURRENCY", 4))
+
+OcrResult = Tuple[Optional[str], Optional[str]]
+
+
+class OcrProvider:
+    """
+    Base class for an OCR provider with a shared client, concurrency limit and timeout.
+
+    Subclasses implement _create_client() and _recognize(). The client is created on
+    first use and kept for the life of the process.
+    """
+
+    name = "provider"
+    label = "Provider"
+
+    def __init__(self, max_concurrency: int = 4, timeout: float = 5.0):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._client = None
+        self._client_lock = threading.Lock()
+        self._in_flight = 0
+        self._in_flight_lock = threading.Lock()
+
+    @property
+    def client(self):
+        """Return the provider client, creating it on first use."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._create_client()
+                    logger.info(f"Created {self.label} OCR client")
+        return self._client
+
+    def _create_client(self):
+        raise NotImplementedError
+
+    def _recognize(self, image_bytes: bytes) -> OcrResult:
+        raise NotImplementedError
+
+    def recognize(self, image_bytes: bytes) -> OcrResult:
+        """
+        OCR an image, waiting at most the provider timeout for a concurrency slot.
+
+        Args:
+            image_bytes: Encoded image bytes
+
+        Returns:
+            A tuple of (OCR text result or None if processing failed, error message if an error occurred)
+        """
+        if not self._slots.acquire(timeout=self.timeout):
+            error_msg = f"{self.label} OCR concurrency limit of {self.max_concurrency} reached"
+            logger.warning(error_msg)
+            return None, error_msg
+
+        with self._in_flight_lock:
+            self._in_flight += 1
+        try:
+            return self._recognize(image_bytes)
+        except Exception as e:
+            error_msg = f"Error processing {self.label} OCR: {e}"
+            logger.error(error_msg, exc_info=True)
+            return None, error_msg
+        finally:
+            with self._in_flight_lock:
+                self._in_flight -= 1
+            self._slots.release()
+
+    def describe(self) -> Dict:
+        """Return the provider's limits and current load."""
+        with self._in_flight_lock:
+            in_flight = self._in_flight
+        return {
+            "max_concurrency": self.max_concurrency,
+            "timeout_seconds": self.timeout,
+            "in_flight": in_flight,
+            "client_ready": self._client is not None,
+        }
+
+
+class MistralOcrProvider(OcrProvider):
+    """Mistral OCR over a persistent HTTP client."""
+
+    name = "mistral"
+    label = "MistralAI"
+    MODEL = "mistral-ocr-latest"
+
+    def __init__(
+        self, max_concurrency: int = MISTRAL_MAX_CONCURRENCY, timeout: float = MISTRAL_TIMEOUT_SECONDS
+    ):
+        super().__init__(max_concurrency, timeout)
+
+    def _create_client(self):
+        from mistralai import Mistral
+
+        # Get API key from environment variables (loaded from .env)
+        api_key = os.getenv("MISTRAL_API_KEY")
+        if not api_key:
+            raise ValueError(
+                "MISTRAL_API_KEY not found in environment variables. Please add it to your .env file."
+            )
+        return Mistral(api_key=api_key, timeout_ms=int(self.timeout * 1000))
+
+    def _recognize(self, image_bytes: bytes) -> OcrResult:
+        try:
+            client = self.client
+        except ValueError as e:
+            logger.error(str(e))
+            return None, str(e)
+
+        base64_image = base64.b64encode(image_bytes).decode("utf-8")
+        try:
+            ocr_response = client.ocr.process(
+                model=self.MODEL,
+                document={
+                    "type": "image_url",
+                    "image_url": f"data:{image_mime_type(image_bytes)};base64,{base64_image}",
+                },
+            )
+        except Exception as e:
+            # This will catch timeout errors from the HTTP client
+            error_msg = f"MistralAI OCR request failed: {str(e)}"
+            if "timeout" in str(e).lower() or "timed out" in str(e).lower():
+                error_msg = f"MistralAI OCR request timed out after {self.timeout:g} seconds"
+            logger.error(error_msg, exc_info=True)
+            return None, error_msg
+
+        if ocr_response and hasattr(ocr_response, "pages") and len(ocr_response.pages) > 0:
+            ocr_text = ocr_response.pages[0].markdown
+            if ocr_text and ocr_text.strip():
+                logger.info(f"MistralAI OCR processing successful, extracted text: '{ocr_text[:100]}'...")
+                return ocr_text, None
+            # Log but don't treat empty text as error for page regions
+            logger.info(f"MistralAI OCR returned empty text (markdown: '{ocr_text}')")
+            return None, "No text extracted from MistralAI OCR response"
+
+        error_msg = f"No MistralAI OCR response or no pages found: {ocr_response}"
+        logger.error(error_msg)
+        return None, error_msg
+
+
+class GoogleDocumentAiProvider(OcrProvider):
+    """Google Document AI OCR over a persistent gRPC client."""
+
+    name = "google"
+    label = "Google"
+    PROCESSOR_ID = "cfe27fea8a15b664"
+    PROJECT_ID = "313170199812"
+    LOCATION = "us"
+
+    def __init__(
+        self, max_concurrency: int = GOOGLE_MAX_CONCURRENCY, timeout: float = GOOGLE_TIMEOUT_SECONDS
+    ):
+        super().__init__(max_concurrency, timeout)
+        self._processor_name = None
+
+    @staticmethod
+    def _load_credentials():
+        """
+        Load service account credentials from the environment without touching disk.
+
+        Returns:
+            Credentials from GOOGLE_SERVICE_ACCOUNT_JSON_BASE64, or None to let the client
+            use GOOGLE_APPLICATION_CREDENTIALS
+
+        Raises:
+            ValueError: If neither variable is set or the base64 credentials are invalid
+        """
+        from google.oauth2 import service_account
+
+        base64_creds = os.getenv("GOOGLE_SERVICE_ACCOUNT_JSON_BASE64")
+        if base64_creds:
+            try:
+                info = json.loads(base64.b64decode(base64_creds).decode("utf-8"))
+            except Exception as e:
+                raise ValueError(f"Failed to decode base64 Google credentials: {e}") from e
+            return service_account.Credentials.from_service_account_info(info)
+
+        if os.getenv("GOOGLE_APPLICATION_CREDENTIALS"):
+            logger.info("Using existing GOOGLE_APPLICATION_CREDENTIALS")
+            return None
+
+        raise ValueError(
+            "No Google credentials found. Please set GOOGLE_SERVICE_ACCOUNT_JSON_BASE64 or GOOGLE_APPLICATION_CREDENTIALS"
+        )
+
+    def _create_client(self):
+        from google.cloud import documentai
+
+        client = documentai.DocumentProcessorServiceClient(credentials=self._load_credentials())
+        self._processor_name = client.processor_path(self.PROJECT_ID, self.LOCATION, self.PROCESSOR_ID)
+        return client
+
+    def _recognize(self, image_bytes: bytes) -> OcrResult:
+        from google.api_core import exceptions as google_exceptions
+        from google.cloud import documentai
+
+        try:
+            client = self.client
+        except ValueError as e:
+            logger.error(str(e))
+            return None, str(e)
+
+        request = documentai.ProcessRequest(
+            name=self._processor_name,
+            raw_document=documentai.RawDocument(content=image_bytes, mime_type=image_mime_type(image_bytes)),
+        )
+        try:
+            result = client.process_document(request=request, timeout=self.timeout)
+        except google_exceptions.DeadlineExceeded:
+            error_msg = f"Google Document AI OCR request timed out after {self.timeout:g} seconds"
+            logger.error(error_msg)
+            return None, error_msg
+
+        if result and result.document and result.document.text:
+            logger.info("Google Document AI OCR processing successful")
+            return result.document.text.strip(), None
+        error_msg = "No text found in Google Document AI response"
+        logger.error(error_msg)
+        return None, error_msg
+
+
+class LocalOcrProvider(OcrProvider):
+    """
+    Provider backed by a local function, for tests and offline setups.
+
+    Args:
+        name: Registry name of the provider
+        recognize_fn: Callable taking image bytes and returning (text, error)
+        max_concurrency: Concurrent calls allowed
+        timeout: Seconds to wait for a concurrency slot
+    """
+
+    def __init__(
+        self,
+        name: str,
+        recognize_fn: Callable[[bytes], OcrResult],
+        max_concurrency: int = 4,
+        timeout: float = 5.0,
+    ):
+        super().__init__(max_concurrency, timeout)
+        self.name = name
+        self.label = name
+        self._recognize_fn = recognize_fn
+
+    def _create_client(self):
+        return self._recognize_fn
+
+    def _recognize(self, image_bytes: bytes) -> OcrResult:
+        return self.client(image_bytes)
+
+
+_providers: Dict[str, OcrProvider] = {}
+_providers_lock = threading.Lock()
+
+_DEFAULT_PROVIDERS = {
+    MistralOcrProvider.name: MistralOcrProvider,
+    GoogleDocumentAiProvider.name: GoogleDocumentAiProvider,
+}
+
+
+def register_provider(provider: OcrProvider) -> Optional[OcrProvider]:
+    """
+    Register a provider under its name, replacing any provider of that name.
+
+    Returns:
+        OcrProvider or None: The provider that was replaced
+    """
+    with _providers_lock:
+        previous = _providers.get(provider.name)
+        _providers[provider.name] = provider
+    logger.info(f"Registered OCR provider {provider.name}")
+    return previous
+
+
+def unregister_provider(name: str) -> Optional[OcrProvider]:
+    """Remove a provider from the registry, returning it if it was registered."""
+    with _providers_lock:
+        return _providers.pop(name, None)
+
+
+def get_provider(name: str) -> Optional[OcrProvider]:
+    """Return the registered provider with this name, creating a built-in provider on first use."""
+    with _providers_lock:
+        if name not in _providers and name in _DEFAULT_PROVIDERS:
+            _providers[name] = _DEFAULT_PROVIDERS[name]()
+        return _providers.get(name)
+
+
+def get_ocr_providers(order: Optional[str] = None) -> List[OcrProvider]:
+    """
+    Return the providers to try, primary first.
+
+    Args:
+        order: Comma-separated provider names, defaulting to OCR_PROVIDERS
+
+    Returns:
+        list: The registered providers among the names, in order
+    """
+    names = [name.strip() for name in (order or PROVIDER_ORDER).split(",") if name.strip()]
+    providers = []
+    for name in names:
+        provider = get_provider(name)
+        if provider:
+            providers.append(provider)
+        else:
+            logger.warning(f"Unknown OCR provider '{name}' in OCR_PROVIDERS")
+    return providers
+
+
+def describe_providers() -> Dict[str, Dict]:
+    """Return the limits and load of every registered provider."""
+    with _providers_lock:
+        providers = list(_providers.values())
+    return {provider.name: provider.describe() for provider in providers}
@@ -0,0 +1,121 @@
+"""
+Single-pass cleaner for OCR text of Kindle pages.
+
+OCR of a page includes the reader's UI text: reading speed notices, percentages,
+"Location X of Y", time left and page numbers. clean_ocr_text() drops those lines and
+reflows the page text in one scan over the lines:
+
+1. Each line is classified with one precompiled pattern combining the UI patterns of
+   the enabled locales
+2. A line ending in a hyphen is joined to a next line starting with a letter
+3. Single line breaks become spaces and runs of blank lines become paragraph breaks
+
+Locales add UI patterns with register_ui_patterns(); OCR_UI_LOCALES chooses the
+locales whose patterns are enabled by default.
+"""
+
+import os
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
+
+# Locales whose UI lines are removed, comma-separated
+DEFAULT_LOCALES = tuple(
+    locale.strip() for locale in os.getenv("OCR_UI_LOCALES", "en").split(",") if locale.strip()
+)
+
+# Patterns matched anywhere in a line, case-insensitively, that mark it as reader UI
+UI_PATTERNS: Dict[str, List[str]] = {
+    "en": [
+        # Reading speed notice, e.g. "Learning reading speed"
+        r"learning\s+reading\s+speed",
+        # Just a percentage, e.g. "87%"
+        r"^\s*\d{1,3}%\s*$",
+        # Location, e.g. "Location 123 of 456"
+        r"location\s+\d+\s+of\s+\d+",
+        # Just a page number or location, e.g. "Page 12" or "12"
+        r"^\s*(?:page\s+)?\d+\s*$",
+        # Time left, e.g. "5 min left in chapter" or "2 mins left in book"
+        r"\d+\s*mins?\s*left\s*in\s*(?:chapter|book)",
+    ],
+}
+
+_patterns_lock = threading.Lock()
+_compiled: Dict[Tuple[str, ...], Pattern] = {}
+
+_ASCII_LETTERS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ")
+
+
+def register_ui_patterns(locale: str, patterns: Iterable[str]):
+    """Add patterns that mark a line as reader UI for a locale.
+
+    Args:
+        locale: Locale code, e.g. "de"
+        patterns: Regular expressions searched in each line, case-insensitively
+    """
+    with _patterns_lock:
+        UI_PATTERNS.setdefault(locale, []).extend(patterns)
+        _compiled.clear()
+
+
+def ui_line_pattern(locales: Optional[Iterable[str]] = None) -> Pattern:
+    """Return the combined, compiled UI line pattern for some locales."""
+    key = tuple(locales) if locales is not None else DEFAULT_LOCALES
+    pattern = _compiled.get(key)
+    if pattern is None:
+        with _patterns_lock:
+            alternatives = [f"(?:{p})" for locale in key for p in UI_PATTERNS.get(locale, [])]
+            pattern = re.compile("|".join(alternatives) or r"(?!)", re.IGNORECASE)
+            _compiled[key] = pattern
+    return pattern
+
+
+_MULTIPLE_SPACES = re.compile(r" {2,}")
+
+
+def clean_ocr_text(text: Optional[str], locales: Optional[Iterable[str]] = None) -> Optional[str]:
+    """
+    Remove Kindle UI lines from OCR text and join its lines into paragraphs.
+
+    Args:
+        text: Raw OCR text
+        locales: Locales whose UI patterns apply, defaulting to OCR_UI_LOCALES
+
+    Returns:
+        Cleaned text without UI elements
+    """
+    if not text:
+        return text
+
+    is_ui_line = ui_line_pattern(locales).search
+    pieces: List[str] = []
+    # Line breaks since the last piece of text, counted across blank lines
+    pending_breaks = 0
+    previous = None
+
+    for line in text.strip().split("\n"):
+        if is_ui_line(line):
+            continue
+
+        if previous is not None:
+            if previous.endswith("-") and line[:1] in _ASCII_LETTERS:
+                # Join a hyphenated word, dropping the hyphen ending the previous line
+                pieces[-1] = pieces[-1][:-1]
+            else:
+                pending_breaks += 1
+
+        if line:
+            if pending_breaks:
+                # One break joins lines with a space, more separate paragraphs
+                pieces.append("\n\n" if pending_breaks > 1 else " ")
+                pending_breaks = 0
+            pieces.append(line)
+        previous = line
+
+    cleaned_text = "".join(pieces)
+    # NUL characters end up as paragraph breaks, as they always have
+    if "\x00" in cleaned_text:
+        cleaned_text = cleaned_text.replace("\x00", "\n\n")
+    if "  " in cleaned_text:
+        cleaned_text = _MULTIPLE_SPACES.sub(" ", cleaned_text)
+    return cleaned_text.strip()
@@ -2,24 +2,23 @@
 Utility functions for OCR (Optical Character Recognition) on Kindle screenshots.
 
 This module provides functions to:
-1. Process screenshots with OCR
+1. Process screenshots with OCR, caching results by perceptual image hash
 2. Handle base64 image encoding/decoding
 3. Manage OCR requests from the API
 """
 
 import base64
-import concurrent.futures
-import json
 import logging
-import os
-import re
-import tempfile
-from typing import Optional, Tuple
+import time
+from typing import Dict, Optional, Tuple
 
 from flask import request
-from google.cloud import documentai
-from google.oauth2 import service_account
-from mistralai import Mistral
+
+from server.utils.ocr_cache import get_ocr_cache, perceptual_hash
+from server.utils.ocr_executor import run_hedged
+from server.utils.ocr_preprocessing import preprocess_for_upload
+from server.utils.ocr_providers import get_ocr_providers
+from server.utils.ocr_text_cleaner import clean_ocr_text
 
 logger = logging.getLogger(__name__)
 
@@ -27,312 +26,109 @@ logger = logging.getLogger(__name__)
 class KindleOCR:
     """Utility class for OCR processing of Kindle screenshots."""
 
-    GOOGLE_PROCESSOR_ID = "cfe27fea8a15b664"
-    GOOGLE_PROJECT_ID = "313170199812"
-    GOOGLE_LOCATION = "us"
-
-    @staticmethod
-    def _setup_google_credentials():
-        """Setup Google credentials from environment, supporting both file path and base64-encoded JSON."""
-        # First check for base64-encoded JSON
-        base64_creds = os.getenv("GOOGLE_SERVICE_ACCOUNT_JSON_BASE64")
-        if base64_creds:
-            try:
-                # Decode the base64 string
-                json_str = base64.b64decode(base64_creds).decode("utf-8")
-                # Parse the JSON to validate it
-                json.loads(json_str)
-
-                # Create a temporary file for the credentials
-                with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as temp_file:
-                    temp_file.write(json_str)
-                    temp_path = temp_file.name
-
-                # Set the environment variable to point to the temp file
-                os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = temp_path
-                logger.info(f"Created temporary credentials file at {temp_path}")
-                return temp_path
-            except Exception as e:
-                logger.error(f"Failed to decode base64 Google credentials: {e}", exc_info=True)
-                return None
-
-        # Check if GOOGLE_APPLICATION_CREDENTIALS is already set
-        if os.getenv("GOOGLE_APPLICATION_CREDENTIALS"):
-            logger.info("Using existing GOOGLE_APPLICATION_CREDENTIALS")
-            return os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
-
-        return None
-
     @staticmethod
-    def _process_with_google_document_ai(image_content) -> Tuple[Optional[str], Optional[str]]:
+    def _clean_ocr_text(text: str) -> str:
         """
-        Process an image with Google Document AI.
+        Clean OCR text by removing Kindle UI elements like reading speed and progress.
 
         Args:
-            image_content: Either binary content (bytes) or a base64-encoded string
+            text: Raw OCR text
 
         Returns:
-            A tuple of (OCR text result or None if processing failed, error message if an error occurred)
+            Cleaned text without UI elements
         """
-        temp_creds_path = None
-        try:
-            # Setup credentials
-            temp_creds_path = KindleOCR._setup_google_credentials()
+        return clean_ocr_text(text)
 
-            if not temp_creds_path and not os.getenv("GOOGLE_APPLICATION_CREDENTIALS"):
-                error_msg = "No Google credentials found. Please set GOOGLE_SERVICE_ACCOUNT_JSON_BASE64 or GOOGLE_APPLICATION_CREDENTIALS"
-                logger.error(error_msg, exc_info=True)
-                return None, error_msg
-
-            # Initialize the Document AI client
-            client = documentai.DocumentProcessorServiceClient()
-
-            # The full resource name of the processor
-            processor_name = client.processor_path(
-                KindleOCR.GOOGLE_PROJECT_ID, KindleOCR.GOOGLE_LOCATION, KindleOCR.GOOGLE_PROCESSOR_ID
-            )
-
-            # Convert image to bytes if it's a base64 string
-            if isinstance(image_content, str):
-                try:
-                    image_bytes = base64.b64decode(image_content)
-                except Exception:
-                    error_msg = "Invalid base64 string provided for Google Document AI"
-                    logger.error(error_msg, exc_info=True)
-                    return None, error_msg
-            else:
-                image_bytes = image_content
-
-            # Create a raw document from the image
-            raw_document = documentai.RawDocument(
-                content=image_bytes, mime_type="image/jpeg"  # Assuming JPEG, adjust if needed
-            )
-
-            # Configure the process request
-            request = documentai.ProcessRequest(name=processor_name, raw_document=raw_document)
-
-            # Use ThreadPoolExecutor for timeout handling
-            TIMEOUT_SECONDS = 5
-
-            def run_google_ocr():
-                try:
-                    result = client.process_document(request=request)
-                    return result
-                except Exception as e:
-                    logger.error(f"Error processing Google Document AI OCR: {e}", exc_info=True)
-                    return None
-
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(run_google_ocr)
-                try:
-                    result = future.result(timeout=TIMEOUT_SECONDS)
-                    if result and result.document and result.document.text:
-                        logger.info("Google Document AI OCR processing successful")
-                        return result.document.text.strip(), None
-                    else:
-                        error_msg = "No text found in Google Document AI response"
-                        logger.error(error_msg, exc_info=True)
-                        return None, error_msg
-                except concurrent.futures.TimeoutError:
-                    future.cancel()
-                    error_msg = f"Google Document AI OCR request timed out after {TIMEOUT_SECONDS} seconds"
-                    logger.error(error_msg, exc_info=True)
-                    return None, error_msg
+    @staticmethod
+    def _current_cache_context() -> Optional[Dict]:
+        """Scope OCR cache entries to the current request's user, without a database read."""
+        try:
+            from server.utils.request_utils import get_sindarin_email
 
+            sindarin_email = get_sindarin_email()
+            if sindarin_email:
+                return {"user": sindarin_email}
         except Exception as e:
-            error_msg = f"Error processing Google Document AI OCR: {e}"
-            logger.error(error_msg, exc_info=True)
-            return None, error_msg
-        finally:
-            # Clean up temporary credentials file if created
-            if temp_creds_path and temp_creds_path.startswith(tempfile.gettempdir()):
-                try:
-                    os.remove(temp_creds_path)
-                    logger.info(f"Cleaned up temporary credentials file: {temp_creds_path}")
-                except Exception as e:
-                    logger.warning(f"Failed to clean up temp credentials file: {e}")
+            logger.debug(f"Could not determine OCR cache context: {e}")
+        return None
 
     @staticmethod
-    def _process_with_mistral(image_content) -> Tuple[Optional[str], Optional[str]]:
+    def process_ocr(
+        image_content, clean_ui_elements=True, cache_context: Optional[Dict] = None
+    ) -> Tuple[Optional[str], Optional[str]]:
         """
-        Process an image with Mistral's OCR API.
+        Process an image with OCR using the registered providers, by default MistralAI hedged with Google Document AI.
+
+        The secondary provider starts when the primary fails or is slower than its recent p90
+        latency, and the first successful result is used.
+
+        Results are cached per user by a perceptual hash of the image, so OCR of a page image
+        the user recently processed returns without a provider request; without a known user
+        nothing is cached. Images that miss the cache are uploaded in grayscale, trimmed,
+        downscaled and compressed (see ocr_preprocessing).
 
         Args:
             image_content: Either binary content (bytes) or a base64-encoded string
+            clean_ui_elements: Whether to clean UI elements like page numbers (default True for main text, False for page indicators)
+            cache_context: Optional {"user", "book", "position"} metadata stored with the cached
+                result, by default only the current request's user. Callers that know the book
+                pass it, which lets near matches within the book be used
 
         Returns:
             A tuple of (OCR text result or None if processing failed, error message if an error occurred)
         """
-        try:
-            # Determine if the input is already a base64 string or binary data
-            if isinstance(image_content, str):
-                # It's already a base64 string
-                base64_image = image_content
-                # Verify it's valid base64 by attempting to decode a small part
-                try:
-                    base64.b64decode(base64_image[:20])
-                except:
-                    error_msg = "Invalid base64 string provided for MistralAI"
-                    logger.error(error_msg, exc_info=True)
-                    return None, error_msg
-            else:
-                # It's binary data, encode it as base64
-                base64_image = base64.b64encode(image_content).decode("utf-8")
-
-            # Get API key from environment variables (loaded from .env)
-            api_key = os.getenv("MISTRAL_API_KEY")
-            if not api_key:
-                error_msg = (
-                    "MISTRAL_API_KEY not found in environment variables. Please add it to your .env file."
-                )
-                logger.error(error_msg, exc_info=True)
-                return None, error_msg
-
-            # Initialize Mistral client with timeout
-            TIMEOUT_SECONDS = 6
-            client = Mistral(api_key=api_key, timeout_ms=TIMEOUT_SECONDS * 1000)
-
-            # Process OCR directly without ThreadPoolExecutor since we have HTTP timeout
+        if isinstance(image_content, str):
             try:
-                ocr_response = client.ocr.process(
-                    model="mistral-ocr-latest",
-                    document={"type": "image_url", "image_url": f"data:image/jpeg;base64,{base64_image}"},
-                )
-
-                if ocr_response and hasattr(ocr_response, "pages") and len(ocr_response.pages) > 0:
-                    page = ocr_response.pages[0]
-                    ocr_text = page.markdown
-                    if ocr_text and ocr_text.strip():  # Check for non-empty text
-                        logger.info(
-                            f"MistralAI OCR processing successful, extracted text: '{ocr_text[:100]}'..."
-                        )
-                        return ocr_text, None
-                    else:
-                        # Log but don't treat empty text as error for page regions
-                        logger.info(f"MistralAI OCR returned empty text (markdown: '{ocr_text}')")
-                        return None, "No text extracted from MistralAI OCR response"
-                else:
-                    error_msg = f"No MistralAI OCR response or no pages found: {ocr_response}"
-                    logger.error(error_msg)
-                    return None, error_msg
-
-            except Exception as e:
-                # This will catch timeout errors from the HTTP client
-                error_msg = f"MistralAI OCR request failed: {str(e)}"
-                if "timeout" in str(e).lower() or "timed out" in str(e).lower():
-                    error_msg = f"MistralAI OCR request timed out after {TIMEOUT_SECONDS} seconds"
+                image_content = base64.b64decode(image_content)
+            except Exception:
+                error_msg = "Invalid base64 string provided for OCR"
                 logger.error(error_msg, exc_info=True)
                 return None, error_msg
 
-        except Exception as e:
-            error_msg = f"Error processing MistralAI OCR: {e}"
-            logger.error(error_msg, exc_info=True)
-            return None, error_msg
-
-    @staticmethod
-    def _clean_ocr_text(text: str) -> str:
-        """
-        Clean OCR text by removing Kindle UI elements like reading speed and progress.
-
-        Args:
-            text: Raw OCR text
-
-        Returns:
-            Cleaned text without UI elements
-        """
-        if not text:
-            return text
-
-        # Split text into lines
-        lines = text.strip().split("\n")
-
-        # Filter out lines that match common Kindle UI patterns
-        cleaned_lines = []
-        for line in lines:
-            # Skip lines that match reading speed pattern (e.g., "Learning reading speed")
-            if re.search(r"learning\s+reading\s+speed", line, re.IGNORECASE):
-                continue
-
-            # Skip lines that are just percentages (e.g., "87%")
-            if re.match(r"^\s*\d{1,3}%\s*$", line):
-                continue
-
-            # Skip lines that match location/page patterns (e.g., "Location 123 of 456")
-            if re.search(r"location\s+\d+\s+of\s+\d+", line, re.IGNORECASE):
-                continue
-
-            # Skip lines that are just page numbers or locations
-            if re.match(r"^\s*(page\s+)?\d+\s*$", line, re.IGNORECASE):
-                continue
-
-            # Skip lines that match time left patterns (e.g., "5 min left in chapter", "2 mins left in chapter")
-            if re.search(r"\d+\s*mins?\s*left\s*in\s*(chapter|book)", line, re.IGNORECASE):
-                continue
-
-            cleaned_lines.append(line)
-
-        # Join the lines back together
-        cleaned_text = "\n".join(cleaned_lines)
-
-        # Handle hyphenated words at end of lines
-        # Replace hyphen+newline with just the word (removing the hyphen)
-        cleaned_text = re.sub(r"-\n([a-zA-Z])", r"\1", cleaned_text)
-
-        # Replace single newlines with spaces, but preserve multiple newlines
-        # First, temporarily replace 2+ newlines with a placeholder
-        cleaned_text = re.sub(r"\n\n+", "\x00", cleaned_text)
-        # Replace remaining single newlines with spaces
-        cleaned_text = re.sub(r"\n", " ", cleaned_text)
-        # Restore the multiple newlines
-        cleaned_text = cleaned_text.replace("\x00", "\n\n")
-
-        # Clean up any multiple spaces that may have been created
-        cleaned_text = re.sub(r" +", " ", cleaned_text)
-
-        # Remove any trailing whitespace
-        cleaned_text = cleaned_text.strip()
-
-        return cleaned_text
+        providers = get_ocr_providers()
+        if not providers:
+            return None, "No OCR providers configured"
+
+        cache = get_ocr_cache()
+        if cache_context is None:
+            cache_context = KindleOCR._current_cache_context()
+        # Entries are scoped to a user, so without one nothing is cached
+        image_hash = perceptual_hash(image_content) if (cache_context or {}).get("user") else None
+
+        if image_hash is not None:
+            cached_text = cache.get_by_hash(image_hash, variant="raw", context=cache_context)
+            if cached_text is not None:
+                logger.info(
+                    f"OCR cache hit, skipping provider request ({cache.stats()['hit_rate']:.0%} hit rate)"
+                )
+                return (KindleOCR._clean_ocr_text(cached_text) if clean_ui_elements else cached_text), None
+
+        upload = preprocess_for_upload(image_content)
+        started = time.time()
+        calls = [
+            (provider.name, lambda provider=provider: provider.recognize(upload))
+            for provider in providers[:2]
+        ]
+        ocr_text, errors, provider = run_hedged(
+            *calls, timeout=sum(provider.timeout for provider in providers[:2])
+        )
 
-    @staticmethod
-    def process_ocr(image_content, clean_ui_elements=True) -> Tuple[Optional[str], Optional[str]]:
-        """
-        Process an image with OCR, trying Google Document AI first, then falling back to MistralAI.
+        if not ocr_text:
+            # Every provider failed, return combined error message
+            failures = "; ".join(f"{p.label}: {errors.get(p.name)}" for p in providers[:2])
+            combined_error = f"{'Both' if len(calls) == 2 else 'All'} OCR services failed. {failures}"
+            return None, combined_error
+        logger.info(f"OCR result from {provider} in {time.time() - started:.2f}s")
 
-        Args:
-            image_content: Either binary content (bytes) or a base64-encoded string
-            clean_ui_elements: Whether to clean UI elements like page numbers (default True for main text, False for page indicators)
+        if image_hash is not None:
+            cache.put_by_hash(
+                image_hash, ocr_text, variant="raw", context=cache_context, latency=time.time() - started
+            )
 
-        Returns:
-            A tuple of (OCR text result or None if processing failed, error message if an error occurred)
-        """
-        # Try Google Document AI first
-        logger.info("Attempting OCR with MistralAI...")
-        ocr_text, mistral_error = KindleOCR._process_with_mistral(image_content)
-
-        if ocr_text:
-            # Only clean UI elements if requested (not for page indicator regions)
-            if clean_ui_elements:
-                cleaned_text = KindleOCR._clean_ocr_text(ocr_text)
-                return cleaned_text, None
-            else:
-                return ocr_text, None
-
-        # If Google fails, try MistralAI as fallback
-        logger.warning(f"MistralAI failed: {mistral_error}. Falling back to Google Document AI...")
-        ocr_text, google_error = KindleOCR._process_with_google_document_ai(image_content)
-
-        if ocr_text:
-            # Only clean UI elements if requested (not for page indicator regions)
-            if clean_ui_elements:
-                cleaned_text = KindleOCR._clean_ocr_text(ocr_text)
-                return cleaned_text, None
-            else:
-                return ocr_text, None
-
-        # Both failed, return combined error message
-        combined_error = f"Both OCR services failed. Google: {google_error}; MistralAI: {mistral_error}"
-        return None, combined_error
+        # Only clean UI elements if requested (not for page indicator regions)
+        if clean_ui_elements:
+            return KindleOCR._clean_ocr_text(ocr_text), None
+        return ocr_text, None
 
 
 def is_base64_requested():
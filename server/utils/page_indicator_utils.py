@@ -6,17 +6,24 @@ import re
 logger = logging.getLogger(__name__)
 
 
-def parse_page_indicators(page_indicator_text):
+def parse_page_indicators(page_indicator_text, page_indicator_image=None):
     """Parse page indicator text to extract structured progress data.
 
     Args:
         page_indicator_text: OCR text from page indicator region (e.g., "Page 123 of 456", "8 mins left in chapter")
+        page_indicator_image: Optional page indicator region bytes, read with the footer recognizer
+            when no text is given
 
     Returns:
         dict: Progress information with current_page/location, total_pages/locations, and/or time_left
     """
     progress = {}
 
+    if not page_indicator_text and page_indicator_image:
+        from server.utils.footer_recognizer import read_page_indicator
+
+        page_indicator_text, _ = read_page_indicator(page_indicator_image)
+
     # Parse page indicator text
     if page_indicator_text:
         # Check for "Learning reading speed" - Kindle's initial state before showing time/page
@@ -49,18 +56,19 @@ def parse_page_indicators(page_indicator_text):
     return progress
 
 
-def cycle_page_indicator_if_needed(driver, page_indicator_text):
+def cycle_page_indicator_if_needed(driver, page_indicator_text, page_indicator_image=None):
     """If time-based indicator is detected, tap to cycle through formats to get page/location.
 
     Args:
         driver: The Appium driver instance
         page_indicator_text: The OCR'd text from the page indicator region
+        page_indicator_image: Optional page indicator region bytes, used when no text is given
 
     Returns:
         dict: Updated progress information with page/location data if found
     """
     # First parse what we have
-    progress = parse_page_indicators(page_indicator_text)
+    progress = parse_page_indicators(page_indicator_text, page_indicator_image)
 
     # Check if we got a time-based indicator or "Learning reading speed" instead of page/location
     if (
@@ -0,0 +1,162 @@
+"""
+Cache of OCR'd page text by reading position.
+
+Positions are the server-tracked page positions of a user's open book, which restart at
+0 whenever the book is opened with a new session. Every page OCR'd by navigation, preview
+or read-ahead is stored, so a following /navigate only turns the page on the device and
+previews of cached pages need no page turns at all.
+
+Usage:
+    cache = get_page_text_cache()
+    cache.put(email, book, position, text, progress)
+    entry = cache.get(email, book, position + 1)
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Pages kept per user across all their books
+MAX_PAGES_PER_USER = int(os.getenv("PAGE_TEXT_CACHE_PAGES", 500))
+
+
+class PageTextCache:
+    """In-memory LRU of page text keyed by (user, book, position)."""
+
+    def __init__(self, max_pages_per_user: int = MAX_PAGES_PER_USER):
+        self.max_pages_per_user = max_pages_per_user
+        self._pages: Dict[str, "OrderedDict[Tuple[str, int], Dict]"] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0}
+
+    def get(self, email: str, book: str, position: int) -> Optional[Dict]:
+        """
+        Look up a page.
+
+        Args:
+            email: The user's email address
+            book: The book title
+            position: The server-tracked page position
+
+        Returns:
+            dict or None: {"text", "progress", "source", "captured_at"} or None on a miss
+        """
+        key = (book, position)
+        with self._lock:
+            pages = self._pages.get(email)
+            entry = pages.get(key) if pages else None
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            pages.move_to_end(key)
+            self._stats["hits"] += 1
+            return dict(entry)
+
+    def contains(self, email: str, book: str, position: int) -> bool:
+        """Check whether a page is cached without counting a lookup."""
+        with self._lock:
+            return (book, position) in self._pages.get(email, {})
+
+    def put(
+        self,
+        email: str,
+        book: str,
+        position: int,
+        text: str,
+        progress: Optional[Dict] = None,
+        source: str = "navigate",
+    ) -> None:
+        """
+        Store the text of a page.
+
+        Args:
+            email: The user's email address
+            book: The book title
+            position: The server-tracked page position
+            text: The page's OCR text
+            progress: Optional progress parsed from the page indicator
+            source: What captured the page, for logging
+        """
+        if not (email and book and text):
+            return
+        entry = {"text": text, "progress": progress or {}, "source": source, "captured_at": time.time()}
+        with self._lock:
+            pages = self._pages.setdefault(email, OrderedDict())
+            pages[(book, position)] = entry
+            pages.move_to_end((book, position))
+            while len(pages) > self.max_pages_per_user:
+                pages.popitem(last=False)
+            self._stats["stores"] += 1
+
+    def indicator_values(self, email: str, book: str, key: str = "current_page") -> Dict[int, int]:
+        """
+        Map cached positions of a book to a value read from their page indicator.
+
+        Args:
+            email: The user's email address
+            book: The book title
+            key: The progress field to collect, such as "current_page" or "current_location"
+
+        Returns:
+            dict: {position: value} for every cached page whose progress has the field
+        """
+        with self._lock:
+            pages = list(self._pages.get(email, {}).items())
+        return {
+            position: entry["progress"][key]
+            for (title, position), entry in pages
+            if title == book and entry["progress"].get(key)
+        }
+
+    def discard(self, email: str, book: str, position: int) -> None:
+        """Drop one page, for example when it no longer matches the device."""
+        with self._lock:
+            self._pages.get(email, {}).pop((book, position), None)
+
+    def forget(self, email: str, book: Optional[str] = None) -> int:
+        """
+        Drop a user's cached pages, for one book or all of them.
+
+        Called when positions restart, since cached positions no longer refer to the same pages.
+
+        Returns:
+            int: Number of pages dropped
+        """
+        with self._lock:
+            pages = self._pages.get(email)
+            if not pages:
+                return 0
+            if book is None:
+                del self._pages[email]
+                return len(pages)
+            stale = [key for key in pages if key[0] == book]
+            for key in stale:
+                del pages[key]
+            return len(stale)
+
+    def stats(self) -> Dict:
+        """Return hit and store counters and the number of cached pages."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["pages"] = sum(len(pages) for pages in self._pages.values())
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        return stats
+
+
+_cache: Optional[PageTextCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_page_text_cache() -> PageTextCache:
+    """Return the process-wide page text cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = PageTextCache()
+        return _cache
@@ -0,0 +1,405 @@
+"""
+Write-behind tracking of reading positions and sessions.
+
+Every page turn updated the book position, the book session, the reading session and
+the reading session's activity time in Postgres before /navigate responded, each in its
+own round trips. The position tracker keeps each active user's positions in memory as
+the authoritative state, answers position reads from memory and writes changes behind:
+
+1. Each change is appended to a journal file and merged into the pending writes, so a
+   run of page turns coalesces into one write of each row
+2. A worker writes all pending changes every POSITION_FLUSH_INTERVAL_SECONDS using one
+   database session, then rewrites the journal with what is still pending
+3. On startup the journal is replayed, so changes that were not written when the
+   server stopped or crashed are written then
+
+Code that reads book or reading sessions from the database calls flush(email) first;
+it returns at once when the user has nothing pending. With POSITION_WRITE_BEHIND=false
+each change is written before the call recording it returns.
+
+Positions stay in memory only while they are in use: switching books forgets the user's
+other books, and closing the book or shutting down their emulator forgets all of theirs,
+once their changes are written.
+
+A crash while a batch is being written can replay navigation totals that were already
+written, counting those page turns twice in the reading statistics. Positions are
+written as absolute values and are not affected.
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+POSITION_WRITE_BEHIND = os.getenv("POSITION_WRITE_BEHIND", "true").lower() == "true"
+FLUSH_INTERVAL_SECONDS = float(os.getenv("POSITION_FLUSH_INTERVAL_SECONDS", 0.5))
+
+JOURNAL_DIR = Path(
+    os.getenv("POSITION_JOURNAL_DIR", Path(__file__).resolve().parent.parent.parent / "position_journal")
+)
+JOURNAL_PATH = JOURNAL_DIR / "position_journal.jsonl"
+# fsync each journal append, so changes survive power loss and not only process crashes
+JOURNAL_FSYNC = os.getenv("POSITION_JOURNAL_FSYNC", "false").lower() == "true"
+
+# Longest stop() waits for the worker to finish its current batch
+STOP_TIMEOUT_SECONDS = 10
+
+# Kinds of pending writes
+POSITION = "position"  # BookPosition.current_position
+BOOK_SESSION = "book_session"  # BookSession.position
+NAVIGATION = "navigation"  # ReadingSession position and navigation totals
+ACTIVITY = "activity"  # ReadingSession.last_activity_at
+
+# (kind, email, book title, session key)
+PendingKey = Tuple[str, str, Optional[str], Optional[str]]
+
+
+def _combine(kind: str, older: Any, newer: Any) -> Any:
+    """Merge two pending values of a kind, the newer one recorded last."""
+    if older is None:
+        return newer
+    if newer is None:
+        return older
+    if kind != NAVIGATION:
+        return newer
+    return {
+        "position": newer["position"],
+        "max_position": max(older["max_position"], newer["max_position"]),
+        "count": older["count"] + newer["count"],
+        "forward": older["forward"] + newer["forward"],
+        "backward": older["backward"] + newer["backward"],
+        "at": newer["at"],
+    }
+
+
+class PositionTracker:
+    """In-memory reading positions with journaled, write-behind persistence."""
+
+    def __init__(
+        self,
+        journal_path: Path = JOURNAL_PATH,
+        write_behind: bool = POSITION_WRITE_BEHIND,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+    ):
+        self.journal_path = Path(journal_path)
+        self.write_behind = write_behind
+        self.flush_interval = flush_interval
+        self._positions: Dict[Tuple[str, str], int] = {}
+        self._pending: Dict[PendingKey, Any] = {}
+        self._lock = threading.Lock()
+        # Held while writing to the database, so batches are written one at a time
+        self._flush_lock = threading.Lock()
+        self._journal = None
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._replay_journal()
+
+    # Journal
+
+    @staticmethod
+    def _journal_line(key: PendingKey, value: Any) -> str:
+        kind, email, book, session_key = key
+        return (
+            json.dumps(
+                {"kind": kind, "email": email, "book": book, "session_key": session_key, "value": value}
+            )
+            + "\n"
+        )
+
+    def _replay_journal(self):
+        """Merge the changes journaled by a previous run into the pending writes."""
+        try:
+            with open(self.journal_path, encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.error(f"Could not read position journal {self.journal_path}: {e}")
+            return
+
+        for line in lines:
+            try:
+                entry = json.loads(line)
+                key = (entry["kind"], entry["email"], entry["book"], entry["session_key"])
+                value = entry["value"]
+            except (ValueError, KeyError, TypeError):
+                # A crash can leave the last line half written
+                logger.warning(f"Skipping unreadable position journal line: {line.strip()[:100]}")
+                continue
+            self._pending[key] = _combine(key[0], self._pending.get(key), value)
+            if key[0] == POSITION:
+                self._positions[(key[1], key[2])] = value
+
+        if self._pending:
+            logger.info(f"Replayed {len(self._pending)} unwritten position changes from {self.journal_path}")
+
+    def _append_to_journal(self, key: PendingKey, value: Any):
+        """Journal a change. Call with the lock held."""
+        try:
+            if self._journal is None:
+                self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+                self._journal = open(self.journal_path, "a", encoding="utf-8")
+            self._journal.write(self._journal_line(key, value))
+            self._journal.flush()
+            if JOURNAL_FSYNC:
+                os.fsync(self._journal.fileno())
+        except OSError as e:
+            logger.error(f"Could not journal position change {key}: {e}")
+
+    def _compact_journal(self):
+        """Rewrite the journal with only the pending writes. Call with the lock held."""
+        try:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+            if not self._pending:
+                if self.journal_path.exists():
+                    self.journal_path.unlink()
+                return
+            tmp_path = self.journal_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.writelines(self._journal_line(key, value) for key, value in self._pending.items())
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.journal_path)
+        except OSError as e:
+            logger.error(f"Could not compact position journal {self.journal_path}: {e}")
+
+    # Recording changes
+
+    def _record(self, key: PendingKey, value: Any):
+        """Merge a change into the pending writes and journal it. Call with the lock held."""
+        self._pending[key] = _combine(key[0], self._pending.get(key), value)
+        self._append_to_journal(key, value)
+
+    def _recorded(self):
+        """Write recorded changes, now or in the background. Call without the lock held."""
+        if self.write_behind:
+            self.start()
+        else:
+            self.flush()
+
+    def _load_position(self, email: str, book_title: str) -> int:
+        from database.connection import get_db
+        from database.repositories.book_position_repository import (
+            BookPositionRepository,
+        )
+
+        with get_db() as session:
+            return BookPositionRepository(session).get_position(email, book_title)
+
+    def get_position(self, email: str, book_title: str) -> int:
+        """Get a book's position, reading it from the database only the first time.
+
+        Args:
+            email: The user's email
+            book_title: The book title
+
+        Returns:
+            int: The current page position (0 = start of book)
+        """
+        key = (email, book_title)
+        with self._lock:
+            if key in self._positions:
+                return self._positions[key]
+        position = self._load_position(email, book_title)
+        with self._lock:
+            return self._positions.setdefault(key, position)
+
+    def update_position(self, email: str, book_title: str, delta: int) -> int:
+        """Move a book's position by a relative amount, returning the new position."""
+        self.get_position(email, book_title)
+        with self._lock:
+            position = self._positions[(email, book_title)] + delta
+            self._positions[(email, book_title)] = position
+            self._record((POSITION, email, book_title, None), position)
+        self._recorded()
+        return position
+
+    def set_position(self, email: str, book_title: str, position: int):
+        """Set a book's absolute position."""
+        with self._lock:
+            self._positions[(email, book_title)] = position
+            self._record((POSITION, email, book_title, None), position)
+        self._recorded()
+
+    def record_navigation(
+        self,
+        email: str,
+        book_title: str,
+        position: int,
+        pages_navigated: int,
+        session_key: Optional[str] = None,
+    ):
+        """Record a navigation in the book session and, if pages were turned, the reading session.
+
+        Args:
+            email: The user's email
+            book_title: The book title
+            position: Position after the navigation, from the client's perspective
+            pages_navigated: Pages navigated, negative for backward
+            session_key: Client's session key to find the right reading session
+        """
+        now = datetime.now(timezone.utc).timestamp()
+        with self._lock:
+            self._record((BOOK_SESSION, email, book_title, None), position)
+            if pages_navigated != 0:
+                totals = {
+                    "position": position,
+                    "max_position": position,
+                    "count": 1,
+                    "forward": max(pages_navigated, 0),
+                    "backward": max(-pages_navigated, 0),
+                    "at": now,
+                }
+                self._record((NAVIGATION, email, book_title, session_key), totals)
+        self._recorded()
+
+    def record_activity(self, email: str):
+        """Record activity of a user in their open reading session."""
+        with self._lock:
+            self._record((ACTIVITY, email, None, None), datetime.now(timezone.utc).timestamp())
+        self._recorded()
+
+    def forget(self, email: str, keep: Optional[str] = None):
+        """Drop a user's positions from memory once their changes are written.
+
+        Args:
+            email: The user's email
+            keep: A book whose position stays in memory, e.g. the one being opened
+        """
+        self.flush(email)
+        with self._lock:
+            for key in [key for key in self._positions if key[0] == email and key[1] != keep]:
+                # A change recorded since the flush keeps its position until it is written
+                if (POSITION, email, key[1], None) not in self._pending:
+                    del self._positions[key]
+
+    # Writing changes
+
+    def _write_batch(self, batch: Dict[PendingKey, Any]) -> Dict[PendingKey, Any]:
+        """Write pending changes to the database, returning those that failed."""
+        from database.connection import get_db
+        from database.repositories.book_position_repository import (
+            BookPositionRepository,
+        )
+        from database.repositories.book_session_repository import BookSessionRepository
+        from database.repositories.reading_session_repository import (
+            ReadingSessionRepository,
+        )
+
+        failed = {}
+        with get_db() as session:
+            book_positions = BookPositionRepository(session)
+            book_sessions = BookSessionRepository(session)
+            reading_sessions = ReadingSessionRepository(session)
+
+            for key, value in batch.items():
+                kind, email, book_title, session_key = key
+                try:
+                    if kind == POSITION:
+                        book_positions.set_position(email, book_title, value)
+                    elif kind == BOOK_SESSION:
+                        book_sessions.update_position(email, book_title, value)
+                    elif kind == NAVIGATION:
+                        reading_sessions.apply_navigation_totals(
+                            email,
+                            book_title,
+                            value["position"],
+                            value["max_position"],
+                            value["count"],
+                            value["forward"],
+                            value["backward"],
+                            datetime.fromtimestamp(value["at"], timezone.utc),
+                            session_key,
+                        )
+                    elif kind == ACTIVITY:
+                        reading_sessions.update_last_activity(
+                            email, datetime.fromtimestamp(value, timezone.utc)
+                        )
+                except Exception as e:
+                    session.rollback()
+                    logger.error(f"Error writing {kind} change for {email}/{book_title}: {e}", exc_info=True)
+                    failed[key] = value
+        return failed
+
+    def flush(self, email: Optional[str] = None) -> bool:
+        """Write pending changes to the database now.
+
+        Args:
+            email: Only write this user's changes
+
+        Returns:
+            bool: True if nothing is left pending for the user, or for anyone without email
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch = {
+                    key: value for key, value in self._pending.items() if email is None or key[1] == email
+                }
+                for key in batch:
+                    del self._pending[key]
+            if not batch:
+                return True
+
+            try:
+                failed = self._write_batch(batch)
+            except Exception as e:
+                logger.error(f"Error writing {len(batch)} position changes, will retry: {e}", exc_info=True)
+                failed = batch
+
+            with self._lock:
+                # Changes recorded while the batch was written are newer than the failed ones
+                for key, value in failed.items():
+                    self._pending[key] = _combine(key[0], value, self._pending.get(key))
+                self._compact_journal()
+
+            if not failed:
+                logger.debug(f"Wrote {len(batch)} position changes")
+            return not failed
+
+    def start(self):
+        """Start writing pending changes in the background, including any replayed from the journal."""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name="position-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._stopping.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Error in position writer: {e}", exc_info=True)
+
+    def stop(self):
+        """Stop the background writer and write what is still pending."""
+        self._stopping.set()
+        thread = self._thread
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout=STOP_TIMEOUT_SECONDS)
+        self.flush()
+        with self._lock:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+
+
+_tracker: Optional[PositionTracker] = None
+_tracker_lock = threading.Lock()
+
+
+def get_position_tracker() -> PositionTracker:
+    """Return the process-wide position tracker."""
+    global _tracker
+    with _tracker_lock:
+        if _tracker is None:
+            _tracker = PositionTracker()
+        return _tracker
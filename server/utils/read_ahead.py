@@ -0,0 +1,304 @@
+"""
+Read-ahead of the pages after a reader's position.
+
+Sequential readers call /navigate?ocr=1 page after page, and each call turned the page,
+took a screenshot and blocked on OCR before responding. With read-ahead enabled for a
+book (read_ahead=N on /navigate), the server uses the time between requests to:
+
+1. Turn forward through the next N pages that are not cached yet
+2. Screenshot each one and OCR it in the background into the page text cache
+3. Turn back, so the device shows the user's position again
+
+The next /navigate then only turns the page and answers from the cache.
+
+Read-ahead registers as the user's active request with the lowest priority and checks
+for cancellation before every page turn. Requests that drive the device settle it
+first: the worker is stopped and the device is turned back to the user's position, or,
+for navigation requests, the number of pages the device is ahead is handed over so the
+navigation turns fewer pages.
+"""
+
+import concurrent.futures
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+from server.core.request_manager import RequestManager
+from server.logging_config import clear_email_context, set_email_context
+from server.utils.cancellation_utils import get_active_request_info, should_cancel
+from server.utils.ocr_executor import submit_in_context
+from server.utils.page_text_cache import get_page_text_cache
+from server.utils.request_utils import email_override
+from server.utils.screenshot_utils import capture_screen
+
+logger = logging.getLogger(__name__)
+
+READ_AHEAD_PATH = "/read-ahead"
+
+# Paths whose handler accounts for the pages the device is ahead instead of needing a rewind
+NAVIGATION_PATHS = {"/navigate", "/navigate-next", "/navigate-previous", "/preview-next", "/preview-previous"}
+
+# Pages read ahead when a session has not chosen, and the most a session may choose
+DEFAULT_PAGES = int(os.getenv("READ_AHEAD_PAGES", 0))
+MAX_PAGES = int(os.getenv("READ_AHEAD_MAX_PAGES", 5))
+
+# Time for a turned page to render before it is captured
+PAGE_SETTLE_SECONDS = 0.5
+
+# Longest read-ahead waits for the request that scheduled it to finish
+START_TIMEOUT_SECONDS = 10
+
+# Longest a request waits for read-ahead to stop and turn back
+SETTLE_TIMEOUT_SECONDS = 30
+
+OCR_WORKERS = int(os.getenv("READ_AHEAD_OCR_WORKERS", 2))
+
+_ocr_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=OCR_WORKERS, thread_name_prefix="read-ahead-ocr"
+)
+
+
+class _ReadAheadState:
+    """Read-ahead bookkeeping for one user."""
+
+    def __init__(self, email: str):
+        self.email = email
+        self.depths: Dict[str, int] = {}
+        self.thread: Optional[threading.Thread] = None
+        self.cancel = threading.Event()
+        self.keep_offset = False
+        # Pages the device is ahead of the user's position
+        self.offset = 0
+        # Held while the worker or a rewind drives the device
+        self.device_lock = threading.Lock()
+
+
+def _ocr_page(email: str, book: str, position: int, screenshot) -> bool:
+    """OCR a captured page into the page text cache."""
+    from handlers.reader_page_handler import (
+        parse_page_indicators,
+        process_screenshot_with_regions,
+    )
+
+    result = process_screenshot_with_regions(
+        screenshot, cache_context={"user": email, "book": book, "position": position}
+    )
+    if not result.get("main_text"):
+        logger.info(f"Read-ahead OCR failed for {book} position {position}: {result.get('errors')}")
+        return False
+    progress = parse_page_indicators(result.get("page_indicator_text"))
+    get_page_text_cache().put(email, book, position, result["main_text"], progress, source="read_ahead")
+    logger.info(f"Read ahead {book} position {position} for {email}")
+    return True
+
+
+class ReadAheadManager:
+    """Schedules read-ahead per user and keeps the device in step with the user's position."""
+
+    def __init__(self):
+        self._states: Dict[str, _ReadAheadState] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, email: str) -> _ReadAheadState:
+        with self._lock:
+            if email not in self._states:
+                self._states[email] = _ReadAheadState(email)
+            return self._states[email]
+
+    def configure(self, email: str, book: str, pages: int) -> int:
+        """
+        Set how many pages to read ahead for a user's book.
+
+        Args:
+            email: The user's email address
+            book: The book title
+            pages: Pages to read ahead, 0 to disable; clamped to MAX_PAGES
+
+        Returns:
+            int: The depth that was set
+        """
+        pages = max(0, min(int(pages), MAX_PAGES))
+        self._state(email).depths[book] = pages
+        logger.info(f"Read-ahead for {email} in {book} set to {pages} pages")
+        return pages
+
+    def get_depth(self, email: str, book: str) -> int:
+        """Return how many pages are read ahead for a user's book."""
+        return self._state(email).depths.get(book, min(DEFAULT_PAGES, MAX_PAGES))
+
+    def is_running(self, email: str) -> bool:
+        """Check whether read-ahead is driving the user's device."""
+        thread = self._state(email).thread
+        return bool(thread and thread.is_alive())
+
+    def schedule(self, server, email: str, book: str, position: int) -> bool:
+        """
+        Start reading ahead from a position once the current request has finished.
+
+        Args:
+            server: The AutomationServer instance
+            email: The user's email address
+            book: The open book's title
+            position: The user's server-tracked position
+
+        Returns:
+            bool: True if read-ahead was started
+        """
+        depth = self.get_depth(email, book)
+        if depth <= 0:
+            return False
+
+        cache = get_page_text_cache()
+        missing = [i for i in range(1, depth + 1) if not cache.contains(email, book, position + i)]
+        if not missing:
+            logger.debug(f"Next {depth} pages of {book} already cached for {email}")
+            return False
+
+        state = self._state(email)
+        if self.is_running(email) or state.offset:
+            return False
+
+        state.cancel.clear()
+        state.keep_offset = False
+        state.thread = threading.Thread(
+            target=self._run,
+            args=(server, state, book, position, missing[-1]),
+            name=f"read-ahead-{email}",
+            daemon=True,
+        )
+        state.thread.start()
+        return True
+
+    def settle(self, email: str, keep_offset: bool = False) -> int:
+        """
+        Stop read-ahead before a request uses the device.
+
+        Args:
+            email: The user's email address
+            keep_offset: Leave the device ahead of the user's position, for a caller that
+                takes the offset with take_offset(); otherwise turn back
+
+        Returns:
+            int: Pages the device is still ahead of the user's position
+        """
+        with self._lock:
+            state = self._states.get(email)
+        if not state:
+            return 0
+
+        thread = state.thread
+        if thread and thread.is_alive():
+            logger.info(f"Stopping read-ahead for {email} before the next request")
+            state.keep_offset = keep_offset
+            state.cancel.set()
+            thread.join(timeout=SETTLE_TIMEOUT_SECONDS)
+            if thread.is_alive():
+                logger.warning(f"Read-ahead for {email} did not stop within {SETTLE_TIMEOUT_SECONDS}s")
+
+        if state.offset and not keep_offset:
+            from server.core.automation_server import AutomationServer
+
+            automator = AutomationServer.get_instance().automators.get(email)
+            if automator:
+                with state.device_lock:
+                    self._rewind(state, automator.state_machine.reader_handler)
+        return state.offset
+
+    def take_offset(self, email: str) -> int:
+        """
+        Take responsibility for the pages the device is ahead of the user's position.
+
+        Returns:
+            int: Pages the device is ahead; the caller must account for them when navigating
+        """
+        with self._lock:
+            state = self._states.get(email)
+        if not state:
+            return 0
+        with state.device_lock:
+            offset, state.offset = state.offset, 0
+        if offset:
+            logger.info(f"Device for {email} is {offset} pages ahead after read-ahead")
+        return offset
+
+    def _rewind(self, state: _ReadAheadState, reader) -> None:
+        while state.offset > 0:
+            if not reader.turn_page_backward():
+                logger.error(
+                    f"Failed to turn back after read-ahead for {state.email}, {state.offset} pages ahead"
+                )
+                return
+            state.offset -= 1
+
+    def _run(self, server, state: _ReadAheadState, book: str, position: int, pages: int) -> None:
+        email = state.email
+        deadline = time.time() + START_TIMEOUT_SECONDS
+        while get_active_request_info(email) and time.time() < deadline:
+            if state.cancel.wait(0.2):
+                return
+        if state.cancel.is_set() or get_active_request_info(email):
+            logger.debug(f"Skipping read-ahead for {email}: another request is in progress")
+            return
+
+        automator = server.automators.get(email)
+        if not automator or not getattr(automator, "driver", None):
+            return
+
+        manager = RequestManager(email, READ_AHEAD_PATH, "GET")
+        if not manager.claim_background_request():
+            return
+
+        def cancelled():
+            return state.cancel.is_set() or should_cancel(email, manager.request_key)
+
+        reader = automator.state_machine.reader_handler
+        cache = get_page_text_cache()
+        captured = 0
+        started = time.time()
+        set_email_context(email)
+        try:
+            with email_override(email), state.device_lock:
+                for i in range(1, pages + 1):
+                    if cancelled():
+                        break
+                    if not reader.turn_page_forward():
+                        logger.warning(f"Read-ahead for {email} could not turn to position {position + i}")
+                        break
+                    state.offset += 1
+                    if cache.contains(email, book, position + i):
+                        continue
+                    # A turn seen to settle is ready to capture
+                    if not reader.last_turn_verified:
+                        time.sleep(PAGE_SETTLE_SECONDS)
+                    screenshot = capture_screen(automator.driver)
+                    if screenshot is None:
+                        break
+                    submit_in_context(_ocr_executor, _ocr_page, email, book, position + i, screenshot)
+                    captured += 1
+
+                if not (state.cancel.is_set() and state.keep_offset):
+                    self._rewind(state, reader)
+            logger.info(
+                f"Read-ahead for {email} captured {captured} pages after position {position} "
+                f"in {time.time() - started:.1f}s{' (cancelled)' if cancelled() else ''}"
+            )
+        except Exception as e:
+            logger.warning(f"Read-ahead failed for {email}: {e}", exc_info=True)
+        finally:
+            manager.release_background_request()
+            clear_email_context()
+
+
+_manager: Optional[ReadAheadManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_read_ahead_manager() -> ReadAheadManager:
+    """Return the process-wide read-ahead manager."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = ReadAheadManager()
+        return _manager
@@ -2,17 +2,181 @@
 
 This module provides functions for taking screenshots through various methods,
 including secure screenshots that bypass FLAG_SECURE restrictions.
+
+Screens that are only processed in memory, such as pages to OCR, are captured with
+capture_screen(). It streams the raw framebuffer from `adb exec-out screencap` into a
+PIL image, skipping PNG compression on the device, the disk round trip and the decode,
+and crops to a region before anything is encoded. While a book is being read its frames
+come from a persistent frame source (see frame_source.py) instead of one adb process
+per capture; other captures never start one.
 """
 
+import io
 import logging
 import os
+import struct
 import subprocess
 import tempfile
 import time
-from typing import Optional
+from typing import Optional, Tuple, Union
+
+from PIL import Image
 
 logger = logging.getLogger(__name__)
 
+# Raw screencap pixel formats, from android.graphics.PixelFormat, and their PIL raw modes
+RAW_PIXEL_FORMATS = {1: "RGBA", 2: "RGBX", 5: "BGRA"}
+
+# Screen region as fractions of width and height: (left, top, right, bottom)
+Region = Tuple[float, float, float, float]
+
+SCREENCAP_TIMEOUT_SECONDS = 5
+
+
+def raw_screencap_header_size(data: bytes) -> int:
+    """Return the header size of one raw screencap frame, 12 bytes or 16 with a color space.
+
+    Raises:
+        ValueError: If the output is not a single complete frame
+    """
+    if len(data) < 12:
+        raise ValueError(f"Raw screencap too short: {len(data)} bytes")
+    width, height, _ = struct.unpack_from("<III", data)
+    header = len(data) - width * height * 4
+    if header not in (12, 16):
+        raise ValueError(f"Raw screencap of {width}x{height} has {len(data)} bytes")
+    return header
+
+
+def parse_raw_screencap(data: bytes) -> Image.Image:
+    """Convert raw `screencap` output to an image.
+
+    The output is a header of width, height and pixel format, followed on newer Android
+    versions by a color space, then 4 bytes per pixel.
+
+    Args:
+        data: Raw screencap output
+
+    Returns:
+        Image.Image: The screen as an RGBA image
+
+    Raises:
+        ValueError: If the output is truncated or in an unsupported pixel format
+    """
+    header = raw_screencap_header_size(data)
+    width, height, pixel_format = struct.unpack_from("<III", data)
+    if pixel_format not in RAW_PIXEL_FORMATS:
+        raise ValueError(f"Unsupported raw screencap pixel format {pixel_format}")
+    return Image.frombuffer(
+        "RGBA", (width, height), data[header:], "raw", RAW_PIXEL_FORMATS[pixel_format], 0, 1
+    )
+
+
+def crop_region(image: Image.Image, region: Optional[Region]) -> Image.Image:
+    """Crop an image to a region given as fractions of its width and height."""
+    if not region:
+        return image
+    width, height = image.size
+    left, top, right, bottom = region
+    return image.crop((int(width * left), int(height * top), int(width * right), int(height * bottom)))
+
+
+def image_to_bytes(image: Image.Image, format: str = "PNG") -> bytes:
+    """Encode an image, for OCR providers and responses that need encoded bytes."""
+    if format.upper() in ("JPEG", "JPG") and image.mode != "RGB":
+        image = image.convert("RGB")
+    buffer = io.BytesIO()
+    image.save(buffer, format=format)
+    return buffer.getvalue()
+
+
+def get_driver_device_id(driver) -> Optional[str]:
+    """Find the device ID of the emulator an Appium driver controls."""
+    automator = getattr(driver, "automator", None)
+    device_id = getattr(automator, "device_id", None)
+    if isinstance(device_id, str) and device_id:
+        return device_id
+    caps = getattr(driver, "_caps", None) or {}
+    udid = caps.get("udid") if isinstance(caps, dict) else None
+    return udid if isinstance(udid, str) and udid else None
+
+
+def capture_raw_screen(device_id: str, timeout: float = SCREENCAP_TIMEOUT_SECONDS) -> Optional[Image.Image]:
+    """Capture the screen as an image from the raw framebuffer, without a shell or temp files.
+
+    Args:
+        device_id: The Android device/emulator ID
+        timeout: Seconds to wait for screencap
+
+    Returns:
+        Image.Image or None: The screen, or None if capture failed
+    """
+    try:
+        result = subprocess.run(
+            ["adb", "-s", device_id, "exec-out", "screencap"],
+            capture_output=True,
+            timeout=timeout,
+            check=True,
+        )
+        return parse_raw_screencap(result.stdout)
+    except Exception as e:
+        logger.warning(f"Raw screencap failed for {device_id}: {e}")
+        return None
+
+
+def grab_screen(device_id: str) -> Optional[Image.Image]:
+    """Grab the screen as it is now from the device's running frame source, or with a one-off screencap.
+
+    Args:
+        device_id: The Android device/emulator ID
+
+    Returns:
+        Image.Image or None: A frame grabbed after the call, or None if capture failed
+    """
+    from server.utils.frame_source import get_frame_source
+
+    requested_at = time.time()
+    source = get_frame_source(device_id, start=False)
+    if source:
+        frame = source.wait_for_frame(requested_at)
+        if frame:
+            return frame.image
+    return capture_raw_screen(device_id)
+
+
+def capture_screen(driver, region: Optional[Region] = None) -> Optional[Image.Image]:
+    """Capture the current screen in memory, optionally cropped to a region.
+
+    Uses the emulator's frame source or raw adb framebuffer when its device ID is known
+    and falls back to an Appium screenshot.
+
+    Args:
+        driver: The Appium WebDriver
+        region: Optional (left, top, right, bottom) fractions of the screen to keep
+
+    Returns:
+        Image.Image or None: The captured screen or region, or None if capture failed
+    """
+    device_id = get_driver_device_id(driver)
+    image = grab_screen(device_id) if device_id else None
+    if image is None:
+        try:
+            image = Image.open(io.BytesIO(driver.get_screenshot_as_png()))
+            image.load()
+        except Exception as e:
+            logger.error(f"Error capturing screen: {e}", exc_info=True)
+            return None
+    return crop_region(image, region)
+
+
+def load_image(image: Union[Image.Image, bytes, str]) -> Image.Image:
+    """Return an image given as a PIL image, encoded bytes or a file path."""
+    if isinstance(image, Image.Image):
+        return image
+    if isinstance(image, (bytes, bytearray)):
+        return Image.open(io.BytesIO(image))
+    return Image.open(image)
+
 
 def take_adb_screenshot(device_id: str, output_path: str) -> Optional[str]:
     """Take a fast screenshot using ADB screencap.
@@ -27,15 +191,14 @@ def take_adb_screenshot(device_id: str, output_path: str) -> Optional[str]:
     try:
         logger.info("Using fast ADB screenshot for non-secure screen")
 
-        # Direct ADB screencap method - much faster
-        cmd = f"adb -s {device_id} exec-out screencap -p > {output_path}"
-        subprocess.run(cmd, shell=True, timeout=5, check=True)
-
-        if os.path.exists(output_path) and os.path.getsize(output_path) > 1000:
+        # Raw framebuffer capture, encoded on the host instead of the device
+        image = grab_screen(device_id)
+        if image is not None:
+            image.save(output_path, format="PNG")
             logger.info(f"Screenshot saved to {output_path} using fast ADB method")
             return output_path
         else:
-            logger.warning("Fast ADB screenshot failed or produced empty file")
+            logger.warning("Fast ADB screenshot failed")
     except Exception as e:
         logger.error(f"Error with fast ADB screenshot: {e}", exc_info=True)
 
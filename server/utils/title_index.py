@@ -0,0 +1,662 @@
+"""
+Per-user index of normalized book titles for fast library lookups.
+
+Finding a book used to mean comparing the requested title against every title
+on screen, often after scrolling the whole library. This module keeps every
+title seen on a user's device, normalized for case, punctuation, diacritics and
+subtitles, together with a trigram inverted index for fuzzy lookups.
+
+The index lives in memory and is persisted to a small JSON file per user so
+that it survives server restarts. It is populated from library scans and is
+consulted by the library handler before touching the UI.
+
+Usage:
+    index = get_title_index(sindarin_email)
+    resolution = index.resolve("the hobbit")
+    # {"title": "The Hobbit: Illustrated Edition", "score": 0.92, "strategy": "search", ...}
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Strategies suggested by TitleIndex.resolve()
+STRATEGY_VISIBLE = "visible"  # Book was on the first screen of the library
+STRATEGY_SCROLL = "scroll"  # Book was a few screens down, scrolling is cheaper than searching
+STRATEGY_SEARCH = "search"  # Book is far down the list (or position unknown), use the search box
+
+# Books seen on this many screens from the top are cheaper to reach by scrolling than by searching
+MAX_SCROLL_STRATEGY_PAGE = 4
+
+# Books reachable with this many blind flings from the top are cheaper to reach than by searching
+MAX_SCROLL_STRATEGY_FLINGS = 6
+
+# Library sort modes. With "recent" the app moves a book to the top of the list when it is opened.
+SORT_RECENT = "recent"
+
+# Minimum similarity score for a fuzzy match to be accepted
+FUZZY_MATCH_THRESHOLD = 0.6
+
+# Lead a fuzzy match needs over the next best candidate to be picked without an exact match
+FUZZY_MATCH_MARGIN = 0.1
+
+# Words that carry no signal for token containment matching
+STOP_WORDS = {"a", "an", "and", "the", "of", "to", "in", "on", "for", "with", "by"}
+
+INDEX_DIR = Path(__file__).resolve().parent.parent.parent / "title_index"
+
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+# Subtitles start at a colon, a spaced dash, or an opening parenthesis/bracket
+_SUBTITLE_START = re.compile(r"\s*(?::|\s[-–—]\s|[(\[])")
+
+
+def normalize_title(title: Optional[str]) -> str:
+    """
+    Normalize a title for comparison.
+
+    Strips diacritics, lowercases, expands '&' and collapses punctuation and
+    whitespace, so that "Café & Crème: A Novel" becomes "cafe and creme a novel".
+
+    Args:
+        title: The title to normalize
+
+    Returns:
+        The normalized title, or an empty string for empty input
+    """
+    if not title:
+        return ""
+
+    text = unicodedata.normalize("NFKD", title)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    text = text.lower().replace("&", " and ").replace("'", "").replace("’", "")
+    text = _NON_WORD.sub(" ", text)
+    return " ".join(text.split())
+
+
+def strip_subtitle(title: Optional[str]) -> str:
+    """
+    Remove a trailing subtitle or parenthetical from a title.
+
+    "Dune: Deluxe Edition" and "Dune (Dune Chronicles, Book 1)" both become "Dune".
+    Titles that start with a separator are returned unchanged.
+
+    Args:
+        title: The title to strip
+
+    Returns:
+        The title without its subtitle
+    """
+    if not title:
+        return ""
+
+    match = _SUBTITLE_START.search(title)
+    if match and match.start() > 0:
+        return title[: match.start()].strip()
+    return title.strip()
+
+
+def title_trigrams(normalized: str) -> Set[str]:
+    """Return the set of character trigrams for an already-normalized title."""
+    if not normalized:
+        return set()
+    padded = f"  {normalized} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _significant_tokens(normalized: str) -> Set[str]:
+    """Return the tokens of a normalized title minus stop words."""
+    return {token for token in normalized.split() if token not in STOP_WORDS}
+
+
+def title_similarity(title1: Optional[str], title2: Optional[str]) -> float:
+    """
+    Score how similar two titles are, from 0.0 to 1.0.
+
+    Combines the Dice coefficient over character trigrams with token containment,
+    so that a short query like "hobbit" still scores well against "The Hobbit".
+
+    Args:
+        title1: First title (raw or normalized)
+        title2: Second title (raw or normalized)
+
+    Returns:
+        float: Similarity score
+    """
+    norm1 = normalize_title(title1)
+    norm2 = normalize_title(title2)
+    if not norm1 or not norm2:
+        return 0.0
+    if norm1 == norm2:
+        return 1.0
+    if normalize_title(strip_subtitle(title1)) == normalize_title(strip_subtitle(title2)):
+        return 0.95
+
+    return _score_normalized(norm1, title_trigrams(norm1), norm2, title_trigrams(norm2))
+
+
+def _score_normalized(query: str, query_grams: Set[str], candidate: str, candidate_grams: Set[str]) -> float:
+    """Score two normalized titles whose trigrams are already known."""
+    if not query_grams or not candidate_grams:
+        return 0.0
+
+    dice = 2.0 * len(query_grams & candidate_grams) / (len(query_grams) + len(candidate_grams))
+
+    query_tokens = _significant_tokens(query)
+    candidate_tokens = _significant_tokens(candidate)
+    containment = 0.0
+    if query_tokens and candidate_tokens:
+        containment = len(query_tokens & candidate_tokens) / len(query_tokens)
+
+    return max(dice, 0.9 * containment)
+
+
+class TitleIndex:
+    """
+    Index of the titles on one user's device.
+
+    Each entry is keyed by the exact on-device title and remembers the author, the
+    library screen (1-based, counted from the top) the book was last seen on, its
+    row position in the list, the titles on either side of it and whether it is
+    downloaded. The index also keeps the number of rows one blind fling moves the
+    list, so that a book can be reached without parsing every screen on the way.
+    """
+
+    def __init__(self, email: str, path: Optional[Path] = None):
+        self.email = email
+        self.path = path
+        self._lock = threading.RLock()
+        self._entries: Dict[str, Dict] = {}
+        self._by_normalized: Dict[str, Set[str]] = {}
+        self._by_base: Dict[str, Set[str]] = {}
+        self._trigrams: Dict[str, Set[str]] = {}
+        self._dirty = False
+        self.complete_scan_at: Optional[float] = None
+        self.sort_mode = SORT_RECENT
+        self.rows_per_fling: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, title: str) -> bool:
+        return title in self._entries
+
+    def titles(self) -> List[str]:
+        """Return all exact titles in the index."""
+        with self._lock:
+            return list(self._entries.keys())
+
+    def get(self, title: str) -> Optional[Dict]:
+        """Return a copy of the entry for an exact on-device title."""
+        with self._lock:
+            entry = self._entries.get(title)
+            return dict(entry) if entry else None
+
+    def add(self, title: str, author: Optional[str] = None, page_index: Optional[int] = None) -> bool:
+        """
+        Add or refresh a title.
+
+        Args:
+            title: The exact on-device title
+            author: Optional author
+            page_index: Optional library screen (1-based, from the top) the title was seen on
+
+        Returns:
+            bool: True if the title was new to the index
+        """
+        if not title:
+            return False
+
+        with self._lock:
+            entry = self._entries.get(title)
+            is_new = entry is None
+            if is_new:
+                normalized = normalize_title(title)
+                entry = {"title": title, "normalized": normalized}
+                self._entries[title] = entry
+                self._add_to_lookups(title, normalized)
+
+            if author:
+                entry["author"] = author
+            if page_index is not None:
+                entry["page_index"] = page_index
+            entry["last_seen"] = time.time()
+            self._dirty = True
+            return is_new
+
+    def add_books(self, books: Iterable[Dict], page_index: Optional[int] = None) -> int:
+        """
+        Add a batch of book info dicts as produced by the library scroll handler.
+
+        Returns:
+            int: Number of titles that were new to the index
+        """
+        added = 0
+        for book in books or []:
+            if isinstance(book, dict) and self.add(book.get("title"), book.get("author"), page_index):
+                added += 1
+        return added
+
+    def record_scan_page(self, books: List[Dict], start: int, page_index: int) -> int:
+        """
+        Record the books a library scan found on one screen, with their list positions.
+
+        Args:
+            books: Every book found so far in the scan, in list order
+            start: Index into books of the first book found on this screen
+            page_index: The library screen (1-based, from the top) being recorded
+
+        Returns:
+            int: Number of titles that were new to the index
+        """
+        added = 0
+        with self._lock:
+            for position in range(start, len(books)):
+                book = books[position]
+                title = book.get("title") if isinstance(book, dict) else None
+                if not title:
+                    continue
+                if self.add(title, book.get("author"), page_index):
+                    added += 1
+
+                entry = self._entries[title]
+                entry["position"] = position
+                if book.get("downloaded") is not None:
+                    entry["downloaded"] = book["downloaded"]
+
+                previous = books[position - 1].get("title") if position > 0 else None
+                entry["prev_title"] = previous
+                if previous in self._entries:
+                    self._entries[previous]["next_title"] = title
+        return added
+
+    def set_downloaded(self, title: str, downloaded: bool) -> None:
+        """Record whether a title is downloaded on the device."""
+        with self._lock:
+            entry = self._entries.get(title)
+            if entry and entry.get("downloaded") != downloaded:
+                entry["downloaded"] = downloaded
+                self._dirty = True
+
+    def forget_downloads(self) -> None:
+        """Forget which titles are downloaded, e.g. after the device is replaced."""
+        with self._lock:
+            for entry in self._entries.values():
+                if entry.pop("downloaded", None) is not None:
+                    self._dirty = True
+        self.save()
+
+    def note_opened(self, title: str) -> None:
+        """
+        Record that a book was opened.
+
+        Opening a book downloads it, and with the "recent" sort mode moves it to the
+        top of the library, shifting the books that were above it down one row.
+        """
+        with self._lock:
+            entry = self._entries.get(title)
+            if not entry:
+                return
+
+            entry["downloaded"] = True
+            old_position = entry.get("position")
+            if self.sort_mode == SORT_RECENT and old_position:
+                first = next((e for e in self._entries.values() if e.get("position") == 0), None)
+                for other in self._entries.values():
+                    if other is not entry and other.get("position") is not None:
+                        if other["position"] < old_position:
+                            other["position"] += 1
+
+                # Stitch the neighbours together where the book used to be
+                prev_entry = self._entries.get(entry.get("prev_title"))
+                next_entry = self._entries.get(entry.get("next_title"))
+                if prev_entry:
+                    prev_entry["next_title"] = entry.get("next_title")
+                if next_entry:
+                    next_entry["prev_title"] = entry.get("prev_title")
+                if first and first is not entry:
+                    first["prev_title"] = title
+
+                entry["position"] = 0
+                entry["page_index"] = 1
+                entry["prev_title"] = None
+                entry["next_title"] = first["title"] if first and first is not entry else None
+            self._dirty = True
+
+    def flings_for(self, position: int, page_index: Optional[int] = None) -> int:
+        """
+        Estimate how many blind flings from the top bring a list position on screen.
+
+        Args:
+            position: The 0-based row position in the library list
+            page_index: Screen the book was last seen on, used until flings are calibrated
+
+        Returns:
+            int: Number of flings
+        """
+        if self.rows_per_fling:
+            return max(0, int(position // self.rows_per_fling))
+        if page_index:
+            return max(0, page_index - 1)
+        return 0
+
+    def calibrate_flings(self, flings: int, first_visible_position: int) -> None:
+        """
+        Update the rows-per-fling estimate from an observed jump.
+
+        Args:
+            flings: Number of flings performed from the top of the list
+            first_visible_position: List position of the topmost fully visible book afterwards
+        """
+        if flings <= 0 or first_visible_position <= 0:
+            return
+        observed = first_visible_position / flings
+        with self._lock:
+            if self.rows_per_fling:
+                # Smooth out one-off variations in scroll distance
+                self.rows_per_fling = 0.7 * self.rows_per_fling + 0.3 * observed
+            else:
+                self.rows_per_fling = observed
+            self._dirty = True
+        logger.debug(f"Calibrated flings for {self.email}: {self.rows_per_fling:.2f} rows per fling")
+
+    def remove(self, title: str) -> bool:
+        """Remove a title from the index. Returns True if it was present."""
+        with self._lock:
+            entry = self._entries.pop(title, None)
+            if not entry:
+                return False
+            self._remove_from_lookups(title, entry["normalized"])
+            self._dirty = True
+            return True
+
+    def mark_complete_scan(self, seen_titles: Iterable[str]) -> List[str]:
+        """
+        Record that a full library scan finished and drop titles it did not see.
+
+        Args:
+            seen_titles: Every title seen during the scan
+
+        Returns:
+            list: Titles that were removed from the index
+        """
+        seen = set(seen_titles)
+        with self._lock:
+            removed = [title for title in self._entries if title not in seen]
+            for title in removed:
+                self.remove(title)
+            self.complete_scan_at = time.time()
+            self._dirty = True
+        if removed:
+            logger.info(
+                f"Title index for {self.email} dropped {len(removed)} titles no longer in the library"
+            )
+        return removed
+
+    def search(
+        self, query: str, limit: int = 5, threshold: float = FUZZY_MATCH_THRESHOLD
+    ) -> List[Tuple[str, float]]:
+        """
+        Find the titles most similar to a query.
+
+        Only titles sharing at least one trigram with the query are scored, so the
+        cost is proportional to the number of plausible candidates, not the library size.
+
+        Args:
+            query: The requested title
+            limit: Maximum number of results
+            threshold: Minimum score for a result
+
+        Returns:
+            list: (exact_title, score) tuples, best first
+        """
+        normalized = normalize_title(query)
+        if not normalized:
+            return []
+
+        query_grams = title_trigrams(normalized)
+        query_base = normalize_title(strip_subtitle(query))
+
+        with self._lock:
+            candidates: Set[str] = set()
+            for gram in query_grams:
+                candidates.update(self._trigrams.get(gram, ()))
+
+            scored = []
+            for title in candidates:
+                entry = self._entries[title]
+                if entry["normalized"] == normalized:
+                    score = 1.0
+                elif query_base and normalize_title(strip_subtitle(title)) == query_base:
+                    score = 0.95
+                else:
+                    score = _score_normalized(
+                        normalized, query_grams, entry["normalized"], title_trigrams(entry["normalized"])
+                    )
+                if score >= threshold:
+                    scored.append((title, score))
+
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored[:limit]
+
+    def resolve(self, query: str, threshold: float = FUZZY_MATCH_THRESHOLD) -> Optional[Dict]:
+        """
+        Resolve a requested title to the exact on-device title and a lookup strategy.
+
+        Args:
+            query: The requested title
+            threshold: Minimum score for a fuzzy match
+
+        Returns:
+            dict or None: {"title", "author", "score", "match", "strategy", "page_index"}
+        """
+        if not query:
+            return None
+
+        with self._lock:
+            title = None
+            score = 0.0
+            match = None
+
+            if query in self._entries:
+                title, score, match = query, 1.0, "exact"
+            else:
+                normalized = normalize_title(query)
+                normalized_matches = self._by_normalized.get(normalized, set())
+                if len(normalized_matches) > 1:
+                    # Library titles that only differ in case or punctuation; leave it to a search
+                    logger.info(f"'{query}' matches {len(normalized_matches)} titles, not resolving it")
+                    return None
+                if normalized_matches:
+                    title, score, match = next(iter(normalized_matches)), 1.0, "normalized"
+                else:
+                    base_matches = self._by_base.get(normalize_title(strip_subtitle(query)), set())
+                    if len(base_matches) == 1:
+                        title, score, match = next(iter(base_matches)), 0.95, "subtitle"
+                    else:
+                        results = self.search(query, limit=2, threshold=threshold)
+                        # Refuse to guess between two equally good candidates
+                        if results and (len(results) == 1 or results[0][1] > results[1][1]):
+                            title, score = results[0]
+                            match = "fuzzy"
+
+            if not title:
+                return None
+
+            entry = self._entries[title]
+            page_index = entry.get("page_index")
+            position = entry.get("position")
+            return {
+                "title": title,
+                "author": entry.get("author"),
+                "score": score,
+                "match": match,
+                "strategy": self._strategy_for(page_index, position),
+                "page_index": page_index,
+                "position": position,
+                "prev_title": entry.get("prev_title"),
+                "next_title": entry.get("next_title"),
+                "downloaded": entry.get("downloaded"),
+            }
+
+    def _strategy_for(self, page_index: Optional[int], position: Optional[int] = None) -> str:
+        """Pick the cheapest way to reach a book seen at the given place in the library."""
+        if position is not None and self.rows_per_fling:
+            flings = self.flings_for(position)
+            if flings == 0:
+                return STRATEGY_VISIBLE
+            if flings <= MAX_SCROLL_STRATEGY_FLINGS:
+                return STRATEGY_SCROLL
+            return STRATEGY_SEARCH
+
+        if not page_index:
+            return STRATEGY_SEARCH
+        if page_index <= 1:
+            return STRATEGY_VISIBLE
+        if page_index <= MAX_SCROLL_STRATEGY_PAGE:
+            return STRATEGY_SCROLL
+        return STRATEGY_SEARCH
+
+    def titles_at_positions(self, titles: Iterable[str]) -> Dict[str, int]:
+        """Return the known list positions of the given exact titles."""
+        with self._lock:
+            positions = {}
+            for title in titles:
+                entry = self._entries.get(title)
+                if entry and entry.get("position") is not None:
+                    positions[title] = entry["position"]
+            return positions
+
+    def _add_to_lookups(self, title: str, normalized: str) -> None:
+        self._by_normalized.setdefault(normalized, set()).add(title)
+        self._by_base.setdefault(normalize_title(strip_subtitle(title)), set()).add(title)
+        for gram in title_trigrams(normalized):
+            self._trigrams.setdefault(gram, set()).add(title)
+
+    def _remove_from_lookups(self, title: str, normalized: str) -> None:
+        titles = self._by_normalized.get(normalized)
+        if titles:
+            titles.discard(title)
+            if not titles:
+                del self._by_normalized[normalized]
+        base = normalize_title(strip_subtitle(title))
+        titles = self._by_base.get(base)
+        if titles:
+            titles.discard(title)
+            if not titles:
+                del self._by_base[base]
+        for gram in title_trigrams(normalized):
+            titles = self._trigrams.get(gram)
+            if titles:
+                titles.discard(title)
+                if not titles:
+                    del self._trigrams[gram]
+
+    def to_dict(self) -> Dict:
+        """Serialize the index to a JSON-compatible dict."""
+        with self._lock:
+            entries = [
+                {key: value for key, value in entry.items() if key != "normalized"}
+                for entry in self._entries.values()
+            ]
+            return {
+                "email": self.email,
+                "complete_scan_at": self.complete_scan_at,
+                "sort_mode": self.sort_mode,
+                "rows_per_fling": self.rows_per_fling,
+                "entries": entries,
+            }
+
+    def load(self) -> bool:
+        """
+        Load the index from its JSON file.
+
+        Returns:
+            bool: True if a file was loaded
+        """
+        if not self.path or not self.path.exists():
+            return False
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load title index from {self.path}: {e}")
+            return False
+
+        with self._lock:
+            for entry in data.get("entries", []):
+                title = entry.get("title")
+                if not title:
+                    continue
+                self.add(title, entry.get("author"), entry.get("page_index"))
+                self._entries[title].update(
+                    {key: value for key, value in entry.items() if key not in ("title", "normalized")}
+                )
+            self.complete_scan_at = data.get("complete_scan_at")
+            self.sort_mode = data.get("sort_mode") or SORT_RECENT
+            self.rows_per_fling = data.get("rows_per_fling")
+            self._dirty = False
+
+        logger.debug(f"Loaded {len(self._entries)} titles into title index for {self.email}")
+        return True
+
+    def save(self, force: bool = False) -> bool:
+        """
+        Persist the index to its JSON file if it changed.
+
+        Args:
+            force: Write even if nothing changed
+
+        Returns:
+            bool: True if the file was written
+        """
+        if not self.path or (not self._dirty and not force):
+            return False
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+            return True
+        except OSError as e:
+            logger.warning(f"Could not save title index to {self.path}: {e}")
+            return False
+
+
+_indexes: Dict[str, TitleIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_title_index(email: Optional[str]) -> Optional[TitleIndex]:
+    """
+    Get the title index for a user, loading it from disk on first use.
+
+    Args:
+        email: The user's email
+
+    Returns:
+        TitleIndex or None if no email was given
+    """
+    if not email:
+        return None
+
+    with _indexes_lock:
+        index = _indexes.get(email)
+        if index is None:
+            from server.utils.cover_utils import slugify
+
+            index = TitleIndex(email, INDEX_DIR / f"{slugify(email)}.json")
+            index.load()
+            _indexes[email] = index
+        return index
@@ -0,0 +1,142 @@
+"""
+Persistent cache of each book's Table of Contents.
+
+Reading the Table of Contents opens it and scrolls it up to 20 times, reading entries
+element by element, yet a book's ToC never changes. The chapters collected for a book
+are kept per user and book, with the Kindle app version they were read with so an app
+update that renders the ToC differently starts over. Each chapter keeps the number of
+swipes down from the top of the ToC at which it came into view, which lets chapter
+navigation swipe straight to it instead of searching.
+
+Entries live in memory and in one JSON file per user under toc_cache/, kept apart from
+the disposable ocr_cache/.
+
+Usage:
+    cache = get_toc_cache()
+    chapters = cache.get(email, book, app_version)
+    if chapters is None:
+        chapters = collect_chapters()
+        cache.put(email, book, app_version, chapters)
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from server.utils.cover_utils import slugify
+
+logger = logging.getLogger(__name__)
+
+TOC_CACHE_DIR = Path(os.getenv("TOC_CACHE_DIR", Path(__file__).resolve().parent.parent.parent / "toc_cache"))
+
+
+def normalize_chapter_title(title: str) -> str:
+    """Normalize a chapter title for comparison, keeping only letters, digits and spaces."""
+    return "".join(c for c in title if c.isalnum() or c.isspace()).lower().strip()
+
+
+class TocCache:
+    """Table of Contents chapters per user and book, kept in memory and on disk."""
+
+    def __init__(self, root: Path = TOC_CACHE_DIR):
+        self.root = Path(root)
+        self._users: Dict[str, Dict[str, Dict]] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, email: str) -> Path:
+        return self.root / f"{slugify(email)}.json"
+
+    def _load(self, email: str) -> Dict[str, Dict]:
+        """Return a user's entries, reading them from disk the first time. Call with the lock held."""
+        if email not in self._users:
+            entries = {}
+            try:
+                with open(self._path(email), encoding="utf-8") as f:
+                    entries = json.load(f)
+            except FileNotFoundError:
+                pass
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Ignoring unreadable ToC cache for {email}: {e}")
+            self._users[email] = entries
+        return self._users[email]
+
+    def _save(self, email: str) -> None:
+        """Write a user's entries atomically. Call with the lock held."""
+        path = self._path(email)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._users.get(email, {}), f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not save ToC cache for {email}: {e}")
+
+    def get(self, email: str, book: str, app_version: Optional[str] = None) -> Optional[List[Dict]]:
+        """
+        Return the cached chapters of a book.
+
+        Args:
+            email: The user's email
+            book: The book title
+            app_version: Kindle app version the chapters must have been read with
+
+        Returns:
+            list or None: Chapters with title, optional page and scroll offset, or None on a miss
+        """
+        with self._lock:
+            entry = self._load(email).get(book)
+        if not entry or entry.get("app_version") != app_version:
+            return None
+        return [dict(chapter) for chapter in entry["chapters"]]
+
+    def put(self, email: str, book: str, app_version: Optional[str], chapters: List[Dict]) -> None:
+        """Store the chapters of a book, replacing any read with another app version."""
+        if not chapters:
+            return
+        with self._lock:
+            self._load(email)[book] = {
+                "app_version": app_version,
+                "chapters": [dict(chapter) for chapter in chapters],
+                "saved_at": time.time(),
+            }
+            self._save(email)
+        logger.info(f"Cached {len(chapters)} ToC chapters of '{book}' for {email}")
+
+    def find_chapter(
+        self, email: str, book: str, app_version: Optional[str], chapter_name: str
+    ) -> Optional[Dict]:
+        """Return the cached chapter whose normalized title matches, or None."""
+        normalized = normalize_chapter_title(chapter_name)
+        for chapter in self.get(email, book, app_version) or []:
+            if normalize_chapter_title(chapter["title"]) == normalized:
+                return chapter
+        return None
+
+    def invalidate(self, email: str, book: Optional[str] = None) -> None:
+        """Forget one book's chapters, or all of a user's."""
+        with self._lock:
+            entries = self._load(email)
+            if book is None:
+                entries.clear()
+            else:
+                entries.pop(book, None)
+            self._save(email)
+
+
+_toc_cache: Optional[TocCache] = None
+_toc_cache_lock = threading.Lock()
+
+
+def get_toc_cache() -> TocCache:
+    """Return the process-wide ToC cache."""
+    global _toc_cache
+    if _toc_cache is None:
+        with _toc_cache_lock:
+            if _toc_cache is None:
+                _toc_cache = TocCache()
+    return _toc_cache
@@ -138,6 +138,29 @@ class TestRequestDeduplication(unittest.TestCase):
         cancel_key = f"{active_request['request_key']}:cancelled"
         self.redis_client.set.assert_called_with(cancel_key, "1", ex=130)
 
+    @patch("server.core.request_manager.get_redis_client")
+    def test_background_request_is_cancelled_by_default_priority_requests(self, mock_get_redis):
+        """Test that background jobs never displace a request and yield to any client request."""
+        mock_get_redis.return_value = self.redis_client
+
+        background = RequestManager(self.user_email, "/library-rescan", "GET")
+        self.redis_client.set.return_value = None  # A client request is active
+        self.assertFalse(background.claim_background_request())
+
+        self.redis_client.set.return_value = True
+        self.assertTrue(background.claim_background_request())
+        active_request = json.loads(self.redis_client.set.call_args.args[1])
+        self.assertLess(active_request["priority"], 0)
+        self.assertTrue(self.redis_client.set.call_args.kwargs["nx"])
+
+        # A client request on an endpoint with the default priority cancels it
+        self.redis_client.get.return_value = json.dumps(active_request).encode()
+        RequestManager(self.user_email, "/screenshot", "GET")._check_and_cancel_lower_priority_requests()
+        self.redis_client.set.assert_called_with(f"{background.request_key}:cancelled", "1", ex=130)
+
+        background.release_background_request()
+        self.redis_client.delete.assert_any_call(f"kindle:user:{self.user_email}:active_request")
+
 
 class TestCancellationUtils(unittest.TestCase):
     """Test cancellation utility functions."""
@@ -0,0 +1,197 @@
+"""Unit tests for the per-user title index."""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from handlers import library_handler_search
+from server.utils.title_index import (
+    STRATEGY_SCROLL,
+    STRATEGY_SEARCH,
+    STRATEGY_VISIBLE,
+    TitleIndex,
+    normalize_title,
+    strip_subtitle,
+    title_similarity,
+)
+
+
+@pytest.fixture
+def index(tmp_path):
+    """Create a title index with a handful of titles."""
+    index = TitleIndex("test@example.com", tmp_path / "test.json")
+    index.add_books(
+        [
+            {"title": "The Hobbit: Illustrated Edition", "author": "J.R.R. Tolkien"},
+            {"title": "Café Society"},
+        ],
+        page_index=1,
+    )
+    index.add_books([{"title": "Dune (Dune Chronicles, Book 1)", "author": "Frank Herbert"}], page_index=3)
+    index.add_books([{"title": "Harry Potter and the Sorcerer's Stone"}], page_index=12)
+    index.add("The Lord of the Rings")
+    return index
+
+
+class TestNormalization:
+    """Test title normalization helpers."""
+
+    def test_normalize_title(self):
+        assert normalize_title("Café & Crème: A Novel!") == "cafe and creme a novel"
+        assert normalize_title("  The   HOBBIT ") == "the hobbit"
+        assert normalize_title("Sorcerer’s Stone") == "sorcerers stone"
+        assert normalize_title(None) == ""
+
+    def test_strip_subtitle(self):
+        assert strip_subtitle("Dune: Deluxe Edition") == "Dune"
+        assert strip_subtitle("Dune (Dune Chronicles, Book 1)") == "Dune"
+        assert strip_subtitle("Sapiens - A Brief History") == "Sapiens"
+        assert strip_subtitle("Spider-Man") == "Spider-Man"
+        assert strip_subtitle("(Untitled)") == "(Untitled)"
+
+    def test_title_similarity(self):
+        assert title_similarity("The Hobbit", "the hobbit") == 1.0
+        assert title_similarity("Dune", "Dune: Deluxe Edition") == 0.95
+        assert title_similarity("hobbit", "The Hobbit") > 0.6
+        assert title_similarity("Dune", "Emma") < 0.6
+
+
+class TestTitleIndex:
+    """Test TitleIndex lookups and persistence."""
+
+    def test_resolve_exact_and_normalized(self, index):
+        resolution = index.resolve("Café Society")
+        assert resolution["title"] == "Café Society"
+        assert resolution["match"] == "exact"
+
+        resolution = index.resolve("cafe society")
+        assert resolution["title"] == "Café Society"
+        assert resolution["match"] == "normalized"
+
+    def test_titles_that_normalize_alike_are_not_resolved_by_guessing(self, index):
+        index.add("Cafe Society")
+        assert index.resolve("Café Society")["title"] == "Café Society"
+        assert index.resolve("Cafe Society")["title"] == "Cafe Society"
+        assert index.resolve("CAFE SOCIETY") is None
+
+        index.remove("Café Society")
+        assert index.resolve("CAFE SOCIETY")["title"] == "Cafe Society"
+
+    def test_resolve_subtitle_and_fuzzy(self, index):
+        resolution = index.resolve("Dune")
+        assert resolution["title"] == "Dune (Dune Chronicles, Book 1)"
+        assert resolution["match"] == "subtitle"
+
+        resolution = index.resolve("Harry Potter and the Sorcerers Stone (Book 1)")
+        assert resolution["title"] == "Harry Potter and the Sorcerer's Stone"
+
+        resolution = index.resolve("harry potter sorcerer stone")
+        assert resolution["title"] == "Harry Potter and the Sorcerer's Stone"
+        assert resolution["match"] == "fuzzy"
+
+        assert index.resolve("Pride and Prejudice") is None
+
+    def test_resolve_strategy(self, index):
+        assert index.resolve("The Hobbit")["strategy"] == STRATEGY_VISIBLE
+        assert index.resolve("Dune")["strategy"] == STRATEGY_SCROLL
+        assert index.resolve("Harry Potter and the Sorcerer's Stone")["strategy"] == STRATEGY_SEARCH
+        assert index.resolve("The Lord of the Rings")["strategy"] == STRATEGY_SEARCH
+
+    def test_search_ranks_best_first(self, index):
+        results = index.search("the hobbit illustrated")
+        assert results[0][0] == "The Hobbit: Illustrated Edition"
+        assert all(score >= 0.6 for _, score in results)
+
+    def test_mark_complete_scan_drops_missing_titles(self, index):
+        removed = index.mark_complete_scan(index.titles()[1:])
+        assert removed == ["The Hobbit: Illustrated Edition"]
+        assert index.resolve("The Hobbit") is None
+        assert index.search("hobbit") == []
+
+    def test_save_and_load(self, index, tmp_path):
+        assert index.save()
+        assert not index.save()  # Nothing changed since the last save
+
+        loaded = TitleIndex("test@example.com", tmp_path / "test.json")
+        assert loaded.load()
+        assert sorted(loaded.titles()) == sorted(index.titles())
+        assert loaded.get("Dune (Dune Chronicles, Book 1)")["author"] == "Frank Herbert"
+        assert loaded.resolve("dune")["page_index"] == 3
+
+    def test_record_scan_page_tracks_positions_and_neighbours(self, tmp_path):
+        index = TitleIndex("test@example.com", tmp_path / "test.json")
+        books = [{"title": "Alpha"}, {"title": "Bravo", "downloaded": False}]
+        index.record_scan_page(books, 0, 1)
+        books += [{"title": "Charlie", "downloaded": True}]
+        index.record_scan_page(books, 2, 2)
+
+        bravo = index.resolve("Bravo")
+        assert bravo["position"] == 1
+        assert bravo["prev_title"] == "Alpha"
+        assert bravo["next_title"] == "Charlie"
+        assert bravo["downloaded"] is False
+        assert index.resolve("Charlie")["page_index"] == 2
+
+    def test_note_opened_moves_book_to_top(self, tmp_path):
+        index = TitleIndex("test@example.com", tmp_path / "test.json")
+        books = [{"title": "Alpha"}, {"title": "Bravo"}, {"title": "Charlie", "downloaded": False}]
+        index.record_scan_page(books, 0, 1)
+
+        index.note_opened("Charlie")
+
+        charlie = index.resolve("Charlie")
+        assert charlie["position"] == 0
+        assert charlie["downloaded"] is True
+        assert charlie["next_title"] == "Alpha"
+        assert index.titles_at_positions(["Alpha", "Bravo"]) == {"Alpha": 1, "Bravo": 2}
+        assert index.get("Bravo")["next_title"] is None
+
+    def test_fling_calibration(self, tmp_path):
+        index = TitleIndex("test@example.com", tmp_path / "test.json")
+        index.record_scan_page([{"title": f"Book {i}"} for i in range(40)], 0, 1)
+
+        # Uncalibrated estimates fall back to the screen the book was seen on
+        assert index.flings_for(20, page_index=5) == 4
+
+        index.calibrate_flings(2, 10)
+        assert index.rows_per_fling == 5
+        assert index.flings_for(20) == 4
+        assert index.resolve("Book 3")["strategy"] == STRATEGY_VISIBLE
+        assert index.resolve("Book 12")["strategy"] == STRATEGY_SCROLL
+        assert index.resolve("Book 39")["strategy"] == STRATEGY_SEARCH
+
+        index.save()
+        loaded = TitleIndex("test@example.com", tmp_path / "test.json")
+        loaded.load()
+        assert loaded.rows_per_fling == 5
+
+
+@pytest.fixture
+def search_handler():
+    with patch.object(library_handler_search.os, "makedirs"):
+        return library_handler_search.LibraryHandlerSearch(MagicMock())
+
+
+def rows(*titles):
+    return [(title, f"{title}, Frank Herbert, Book downloaded.") for title in titles]
+
+
+def test_search_results_prefer_the_exact_title_over_containment(search_handler):
+    match = search_handler._match_book_by_exact_content_desc
+    assert match(rows("Dune Messiah", "Dune"), "Dune")[0] == "Dune"
+    assert match(rows("Dune Messiah", "Dune: Deluxe Edition"), "Dune")[0] == "Dune: Deluxe Edition"
+    # Containment alone is only trusted when a single row contains the title
+    assert match(rows("Dune Messiah", "Children of Dune"), "Dune") == (None, None, None)
+
+
+def test_relaxed_search_matches_need_a_clear_winner(search_handler):
+    match = search_handler._match_book_by_relaxed_content_desc
+    assert match(rows("Messiah Dune"), "Dune Messiah")[0] == "Messiah Dune"
+    assert match(rows("Dune Messiahs", "Emma"), "Dune Messiah")[0] == "Dune Messiahs"
+    assert match(rows("Dune Messiah", "Children of Dune"), "Dune Chronicles") == (None, None, None)
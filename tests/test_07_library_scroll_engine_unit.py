@@ -0,0 +1,138 @@
+"""Unit tests for the adaptive library scroll engine."""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from handlers import library_handler_scroll
+from handlers.library_handler_scroll import LibraryHandlerScroll
+from handlers.library_scroll_engine import (
+    AdaptiveLibraryScroller,
+    parse_bounds,
+    parse_library_screen,
+)
+
+ROW_HEIGHT = 300
+LIST_TOP = 352
+LIST_BOTTOM = 2177
+
+
+def build_page_source(titles, first_top=LIST_TOP, not_downloaded=()):
+    """Build a minimal library hierarchy with one list row per title."""
+    rows = []
+    for i, title in enumerate(titles):
+        top = first_top + i * ROW_HEIGHT
+        status = "Book not downloaded., " if title in not_downloaded else ""
+        rows.append(
+            f'<android.widget.RelativeLayout content-desc="{title}, Author {i}, {status}" '
+            f'bounds="[0,{top}][1079,{top + ROW_HEIGHT}]">'
+            f'<android.widget.TextView resource-id="com.amazon.kindle:id/lib_book_row_title" text="{title}" />'
+            f'<android.widget.TextView resource-id="com.amazon.kindle:id/lib_book_row_author" text="Author {i}" />'
+            "</android.widget.RelativeLayout>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><hierarchy>'
+        '<androidx.recyclerview.widget.RecyclerView resource-id="com.amazon.kindle:id/recycler_view" '
+        f'bounds="[0,{LIST_TOP}][1079,{LIST_BOTTOM}]">'
+        + "".join(rows)
+        + "</androidx.recyclerview.widget.RecyclerView>"
+        "</hierarchy>"
+    )
+
+
+class FakeScroller:
+    """Records hook scrolls instead of performing them."""
+
+    def __init__(self):
+        self.scrolls = []
+
+    def _perform_hook_scroll(self, center_x, start_y, end_y, duration_ms):
+        self.scrolls.append((center_x, start_y, end_y))
+
+
+def test_parse_bounds():
+    assert parse_bounds("[0,352][1079,2177]") == (0, 352, 1079, 2177)
+    assert parse_bounds("") is None
+    assert parse_bounds("garbage") is None
+
+
+def test_parse_library_screen():
+    screen = parse_library_screen(build_page_source(["Alpha", "Bravo"], not_downloaded={"Bravo"}))
+    assert screen["list_top"] == LIST_TOP
+    assert screen["list_bottom"] == LIST_BOTTOM
+    assert [row["title"] for row in screen["rows"]] == ["Alpha", "Bravo"]
+    assert screen["rows"][0]["author"] == "Author 0"
+    assert screen["rows"][0]["downloaded"] is True
+    assert screen["rows"][1]["downloaded"] is False
+    assert screen["rows"][1]["index"] == 2
+
+    assert parse_library_screen("<hierarchy />") is None
+    assert parse_library_screen("not xml") is None
+
+
+def test_scroll_keeps_one_row_of_overlap():
+    titles = [f"Book {i}" for i in range(7)]
+    screen = parse_library_screen(build_page_source(titles))
+    engine = AdaptiveLibraryScroller(FakeScroller())
+
+    # Six rows fit fully (352..2152); the seventh is cut off by the list bottom
+    visible = engine.fully_visible_rows(screen)
+    assert [row["title"] for row in visible] == titles[:6]
+
+    start_y, end_y, anchor = engine.plan(screen)
+    assert anchor["title"] == "Book 5"
+    assert start_y - end_y == anchor["top"] - LIST_TOP
+
+
+def test_measure_calibrates_efficiency():
+    titles = [f"Book {i}" for i in range(12)]
+    screen = parse_library_screen(build_page_source(titles[:7]))
+    scroller = FakeScroller()
+    engine = AdaptiveLibraryScroller(scroller)
+    assert engine.scroll(screen)
+    requested = scroller.scrolls[0][1] - scroller.scrolls[0][2]
+
+    # The gesture only moved the list 80% of the requested distance
+    travelled = int(requested * 0.8)
+    next_screen = parse_library_screen(build_page_source(titles[5:12], first_top=1852 - travelled))
+    overlap = engine.measure(screen, next_screen)
+
+    assert overlap == 2
+    assert 0.85 < engine.efficiency < 0.95
+
+
+def test_end_of_list_detection():
+    engine = AdaptiveLibraryScroller(FakeScroller())
+    full = parse_library_screen(build_page_source([f"Book {i}" for i in range(7)]))
+    short = parse_library_screen(build_page_source(["Book 5", "Book 6"]))
+
+    assert not engine.is_end_of_list(None, full)
+    assert engine.is_end_of_list(full, full)
+    assert engine.is_end_of_list(full, short)
+
+
+def test_scan_stopped_at_a_stale_book_count_is_not_complete():
+    titles = [f"Book {i}" for i in range(10)]
+    driver = MagicMock()
+    driver.page_source = build_page_source(titles[:7])
+    driver.automator.profile_manager.get_style_setting.return_value = 5
+    with patch.object(library_handler_scroll.os, "makedirs"):
+        handler = LibraryHandlerScroll(driver)
+    handler._check_for_cancellation = MagicMock(return_value=False)
+    handler._record_scan_page = MagicMock()
+    handler._record_complete_scan = MagicMock()
+    callback = MagicMock()
+
+    with (
+        patch.object(library_handler_scroll, "get_sindarin_email", return_value="reader@example.com"),
+        patch.object(library_handler_scroll, "get_title_index"),
+    ):
+        books = handler._scan_library_adaptive(callback=callback)
+
+    assert len(books) == 6
+    handler._record_complete_scan.assert_not_called()
+    callback.assert_called_with(None, done=True, total_books=6, complete=False)
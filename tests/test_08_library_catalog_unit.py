@@ -0,0 +1,168 @@
+"""Unit tests for library catalog cursors, paging and change detection helpers."""
+
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import Flask
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from database.repositories.library_book_repository import (
+    CHANGE_ADDED,
+    CHANGE_PROGRESS,
+    CHANGE_REMOVED,
+    CHANGE_RENAMED,
+    SORT_AUTHOR,
+    SORT_DEVICE,
+    SORT_TITLE,
+    LibraryBookRepository,
+    detect_page_changes,
+    pair_renames,
+)
+from server.utils.library_catalog import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    InvalidCursorError,
+    _is_rename,
+    book_to_dict,
+    clamp_page_size,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+def make_book(title, author=None, position=None, progress=None, downloaded=None):
+    return SimpleNamespace(
+        title=title, author=author, position=position, progress=progress, size=None, downloaded=downloaded
+    )
+
+
+class TestCursor:
+    """Test opaque cursor encoding."""
+
+    def test_round_trip(self):
+        cursor = encode_cursor(SORT_DEVICE, [12, "Café Society"])
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == {"sort": SORT_DEVICE, "key": [12, "Café Society"]}
+
+    def test_empty_cursor_starts_at_the_top(self):
+        assert decode_cursor(None) == {"sort": SORT_DEVICE, "key": None}
+        assert decode_cursor("") == {"sort": SORT_DEVICE, "key": None}
+        assert decode_cursor(encode_cursor(SORT_TITLE, None)) == {"sort": SORT_TITLE, "key": None}
+
+    @pytest.mark.parametrize("cursor", ["not a cursor!", "e30", encode_cursor("shelf", ["x"])])
+    def test_invalid_cursor(self, cursor):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor)
+
+    def test_clamp_page_size(self):
+        assert clamp_page_size(None) == DEFAULT_PAGE_SIZE
+        assert clamp_page_size("abc") == DEFAULT_PAGE_SIZE
+        assert clamp_page_size("25") == 25
+        assert clamp_page_size(0) == 1
+        assert clamp_page_size(MAX_PAGE_SIZE * 10) == MAX_PAGE_SIZE
+
+
+class TestCatalogRows:
+    """Test conversion of catalog rows."""
+
+    def test_sort_key(self):
+        book = make_book("Dune", author="Frank Herbert", position=3)
+        assert LibraryBookRepository.sort_key(book, SORT_DEVICE) == [3, "Dune"]
+        assert LibraryBookRepository.sort_key(book, SORT_TITLE) == ["Dune"]
+        assert LibraryBookRepository.sort_key(book, SORT_AUTHOR) == ["Frank Herbert", "Dune"]
+
+        # Unpositioned books sort last and authorless books sort first
+        unknown = make_book("Emma")
+        assert LibraryBookRepository.sort_key(unknown, SORT_DEVICE)[0] > 3
+        assert LibraryBookRepository.sort_key(unknown, SORT_AUTHOR) == ["", "Emma"]
+
+    def test_book_to_dict(self):
+        book = make_book("Dune", author="Frank Herbert", progress="12%", downloaded=False)
+        assert book_to_dict(book, "nobody@example.com") == {
+            "title": "Dune",
+            "author": "Frank Herbert",
+            "progress": "12%",
+            "downloaded": False,
+        }
+
+
+class TestChangeDetection:
+    """Test change log diffing."""
+
+    def test_detect_page_changes(self):
+        existing = {
+            "Dune": SimpleNamespace(progress="10%", removed_at=None),
+            "Emma": SimpleNamespace(progress="50%", removed_at=None),
+            "Ulysses": SimpleNamespace(progress=None, removed_at=datetime(2026, 1, 1, tzinfo=timezone.utc)),
+        }
+        rows = [
+            {"title": "Dune", "progress": "25%"},
+            {"title": "Emma", "progress": "50%"},
+            {"title": "Ulysses", "progress": None},
+            {"title": "Beloved", "progress": "0%"},
+        ]
+
+        changes = detect_page_changes(existing, rows)
+
+        assert [(c["change_type"], c["title"]) for c in changes] == [
+            (CHANGE_PROGRESS, "Dune"),
+            (CHANGE_ADDED, "Ulysses"),
+            (CHANGE_ADDED, "Beloved"),
+        ]
+        assert changes[0]["old_value"] == "10%"
+        assert changes[0]["new_value"] == "25%"
+
+    def test_pair_renames(self):
+        earlier = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        later = datetime(2026, 2, 1, tzinfo=timezone.utc)
+        missing = [
+            SimpleNamespace(title="Dune", author="Frank Herbert", last_seen_at=earlier),
+            SimpleNamespace(title="Emma", author="Jane Austen", last_seen_at=earlier),
+        ]
+        arrivals = [
+            SimpleNamespace(title="Dune: Deluxe Edition", author="Frank Herbert", first_seen_at=later),
+            SimpleNamespace(title="Emma (Annotated)", author="Jane Austen", first_seen_at=earlier),
+        ]
+
+        changes = pair_renames(missing, arrivals, _is_rename)
+
+        assert changes == [
+            {"change_type": CHANGE_RENAMED, "title": "Dune: Deluxe Edition", "old_title": "Dune"},
+            {"change_type": CHANGE_REMOVED, "title": "Emma"},
+        ]
+        assert [c["change_type"] for c in pair_renames(missing, arrivals)] == [CHANGE_REMOVED, CHANGE_REMOVED]
+
+
+def test_catalog_streams_skip_the_automator_health_check():
+    from server.middleware.automator_middleware import ensure_automator_healthy
+    from server.resources import books_resources
+
+    handler = MagicMock(return_value="streamed")
+    guarded = ensure_automator_healthy(handler, skip_if=books_resources._streams_from_catalog)
+    app = Flask(__name__)
+
+    with (
+        patch.object(books_resources, "get_sindarin_email", return_value="reader@example.com"),
+        patch.object(books_resources, "get_catalog_titles", return_value={"Emma"}) as titles,
+        patch("server.middleware.automator_middleware.AutomationServer.get_instance") as server,
+    ):
+        for query in ("?cursor=abc", "?cursor="):
+            with app.test_request_context(f"/books-stream{query}"):
+                assert guarded() == "streamed"
+                assert books_resources._streams_from_catalog()
+        titles.assert_called_once()
+        server.assert_not_called()
+
+        # An empty catalog needs a first scan of the device
+        titles.return_value = set()
+        with app.test_request_context("/books-stream?cursor="):
+            assert not books_resources._streams_from_catalog()
+        with app.test_request_context("/books-stream"):
+            assert not books_resources._streams_from_catalog()
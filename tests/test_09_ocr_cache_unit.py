@@ -0,0 +1,105 @@
+"""Unit tests for the perceptual-hash OCR cache."""
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+from PIL import Image, ImageDraw
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from server.utils.ocr_cache import (
+    OcrCache,
+    hamming_distance,
+    is_near_match,
+    perceptual_hash,
+)
+
+
+def render_page(lines, marker=None, fmt="PNG"):
+    """Render a page of text lines to encoded image bytes."""
+    image = Image.new("RGB", (600, 900), "white")
+    draw = ImageDraw.Draw(image)
+    for i, line in enumerate(lines):
+        draw.text((30, 30 + i * 40), line, fill="black")
+    if marker:
+        draw.rectangle(marker, fill="black")
+    buffer = io.BytesIO()
+    image.save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+PAGE_ONE = [f"It was a bright cold day in April, line {i}" for i in range(20)]
+PAGE_TWO = [f"and the clocks were striking thirteen, line {i}" for i in range(20)]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return OcrCache(cache_dir=tmp_path, memory_max_entries=2)
+
+
+def test_hash_is_stable_across_encodings():
+    png = perceptual_hash(render_page(PAGE_ONE))
+    jpeg = perceptual_hash(render_page(PAGE_ONE, fmt="JPEG"))
+    other = perceptual_hash(render_page(PAGE_TWO))
+
+    assert png is not None
+    assert is_near_match(png, jpeg)
+    assert not is_near_match(png, other)
+    assert hamming_distance(png, other) > 20 * hamming_distance(png, jpeg)
+    assert perceptual_hash(b"not an image") is None
+
+
+def test_memory_and_disk_tiers(cache, tmp_path):
+    page_one = render_page(PAGE_ONE)
+    assert cache.get(page_one) is None
+
+    cache.put(page_one, "page one text", latency=2.5)
+    assert cache.get(page_one) == "page one text"
+    assert cache.get(page_one, variant="footer") is None
+
+    # A fresh process only has the disk tier
+    reloaded = OcrCache(cache_dir=tmp_path)
+    assert reloaded.get(page_one) == "page one text"
+
+    stats = reloaded.stats()
+    assert stats["disk_hits"] == 1
+    assert stats["saved_seconds"] == 2.5
+    assert stats["hit_rate"] == 1.0
+
+
+def test_near_match_requires_same_book(cache):
+    page = render_page(PAGE_ONE)
+    highlighted = render_page(PAGE_ONE, marker=(560, 860, 570, 870))
+    assert perceptual_hash(page) != perceptual_hash(highlighted)
+
+    cache.put(page, "page one text", context={"book": "1984", "position": 10})
+    assert cache.get(highlighted) is None
+    assert cache.get(highlighted, context={"book": "Emma"}) is None
+    assert cache.get(highlighted, context={"book": "1984"}) == "page one text"
+    assert cache.stats()["near_hits"] == 1
+
+
+def test_entries_are_scoped_to_the_user(cache, tmp_path):
+    page = render_page(PAGE_ONE)
+    highlighted = render_page(PAGE_ONE, marker=(560, 860, 570, 870))
+
+    cache.put(page, "page one text", context={"user": "reader@example.com", "book": "1984"})
+    assert cache.get(page, context={"user": "reader@example.com"}) == "page one text"
+    assert cache.get(page, context={"user": "other@example.com"}) is None
+    assert cache.get(page) is None
+    assert cache.get(highlighted, context={"user": "other@example.com", "book": "1984"}) is None
+    assert OcrCache(cache_dir=tmp_path).get(page, context={"user": "other@example.com"}) is None
+
+
+def test_memory_lru_and_disk_eviction(tmp_path):
+    cache = OcrCache(cache_dir=tmp_path, memory_max_entries=1, disk_max_bytes=1)
+    cache.put(render_page(PAGE_ONE), "one")
+    cache.put(render_page(PAGE_TWO), "two")
+    assert cache.stats()["memory_entries"] == 1
+
+    assert cache.evict() == 2
+    assert list(tmp_path.glob("*/*.zlib")) == []
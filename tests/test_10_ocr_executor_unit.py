@@ -0,0 +1,118 @@
+"""Unit tests for hedged OCR provider execution."""
+
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from server.utils import ocr_executor
+from server.utils.ocr_executor import (
+    MAX_HEDGE_DELAY,
+    MIN_HEDGE_DELAY,
+    ProviderStats,
+    get_provider_stats,
+    run_hedged,
+    submit_region,
+)
+
+
+def provider(text, delay=0.0, error="failed"):
+    """Build a fake provider call returning text after a delay."""
+
+    def call():
+        time.sleep(delay)
+        return (text, None) if text else (None, error)
+
+    return call
+
+
+def warm(name, latency, count=10):
+    """Seed a provider's latency window so its p90 is known."""
+    stats = get_provider_stats(name)
+    for _ in range(count):
+        stats.record(latency, True)
+
+
+def test_provider_stats_percentiles_and_hedge_delay():
+    stats = ProviderStats("test")
+    assert stats.percentile(90) is None
+    assert stats.hedge_delay() == ocr_executor.DEFAULT_HEDGE_DELAY
+
+    for latency in [0.1 * i for i in range(1, 11)]:
+        stats.record(latency, True)
+    stats.record(9.0, False)
+
+    assert abs(stats.percentile(90) - 0.9) < 1e-9
+    assert abs(stats.hedge_delay() - 0.9) < 1e-9
+    snapshot = stats.snapshot()
+    assert snapshot["calls"] == 11
+    assert snapshot["errors"] == 1
+
+    fast = ProviderStats("fast")
+    for _ in range(10):
+        fast.record(0.01, True)
+    assert fast.hedge_delay() == MIN_HEDGE_DELAY
+    slow = ProviderStats("slow")
+    for _ in range(10):
+        slow.record(60, True)
+    assert slow.hedge_delay() == MAX_HEDGE_DELAY
+
+
+def test_fast_primary_does_not_hedge():
+    warm("primary-fast", 1.0)
+    text, errors, winner = run_hedged(
+        ("primary-fast", provider("page")), ("secondary-unused", provider("other"))
+    )
+    assert (text, errors, winner) == ("page", {}, "primary-fast")
+    assert get_provider_stats("secondary-unused").calls == 0
+
+
+def test_failed_primary_falls_back():
+    text, errors, winner = run_hedged(("primary-broken", provider(None)), ("secondary-ok", provider("page")))
+    assert text == "page"
+    assert winner == "secondary-ok"
+    assert errors == {"primary-broken": "failed"}
+
+
+def test_slow_primary_is_hedged():
+    warm("primary-slow", 0.1)
+    started = time.time()
+    text, _, winner = run_hedged(
+        ("primary-slow", provider("late", delay=2.0)), ("secondary-fast", provider("page"))
+    )
+    assert winner == "secondary-fast"
+    assert text == "page"
+    assert time.time() - started < 1.5
+    assert get_provider_stats("secondary-fast").hedged == 1
+
+
+def test_all_providers_fail():
+    text, errors, winner = run_hedged(
+        ("a-broken", provider(None, error="a")), ("b-broken", provider(None, error="b"))
+    )
+    assert text is None and winner is None
+    assert errors == {"a-broken": "a", "b-broken": "b"}
+
+
+def test_submit_region_runs_concurrently():
+    started = time.time()
+    futures = [submit_region(time.sleep, 0.3) for _ in range(3)]
+    for future in futures:
+        future.result()
+    assert time.time() - started < 0.8
+
+
+def test_overall_timeout_gives_up_on_slow_providers():
+    started = time.time()
+    text, errors, winner = run_hedged(
+        ("a-stuck", provider("late", delay=1.5)), ("b-stuck", provider("late", delay=1.5)), timeout=0.3
+    )
+    assert text is None and winner is None
+    assert errors == {
+        "a-stuck": "a-stuck timed out after 0.3 seconds",
+        "b-stuck": "b-stuck timed out after 0.3 seconds",
+    }
+    assert time.time() - started < 1.0
@@ -0,0 +1,85 @@
+"""Unit tests for local page indicator recognition."""
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+from PIL import Image, ImageDraw, ImageFont
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from server.utils.footer_recognizer import MIN_CONFIDENCE, FooterRecognizer
+from server.utils.page_indicator_utils import parse_page_indicators
+
+TRAINING = ["Page 1234 of 5678", "Page 90 of 123", "Location 1652 of 8148", "12 mins left in chapter"]
+
+
+def render_footer(text, size=26, ink=110, background=255, body_text=None):
+    """Render a page indicator strip to encoded image bytes."""
+    image = Image.new("RGB", (540, 84), (background,) * 3)
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default(size=size)
+    if body_text:
+        draw.text((40, -20), body_text, fill=(ink,) * 3, font=font)
+    draw.text((40, 30), text, fill=(ink,) * 3, font=font)
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def recognizer(tmp_path):
+    recognizer = FooterRecognizer(path=tmp_path / "footer_glyphs.json")
+    for text in TRAINING:
+        assert recognizer.learn(render_footer(text), text)
+    return recognizer
+
+
+def test_unknown_font_is_not_read_locally(tmp_path):
+    recognizer = FooterRecognizer(path=tmp_path / "footer_glyphs.json")
+    assert recognizer.recognize(render_footer("Page 47 of 389")) == (None, 0.0)
+
+    # Digits 4, 7 and 9 are missing, so the recognizer is not trusted yet
+    recognizer.learn(render_footer("Page 12 of 356"), "Page 12 of 356")
+    assert recognizer.recognize(render_footer("Page 12 of 356"))[0] is None
+
+
+@pytest.mark.parametrize("text", ["Page 47 of 389", "Location 77 of 9010", "3 mins left in chapter"])
+def test_learned_templates_read_new_footers(recognizer, text):
+    recognized, confidence = recognizer.recognize(render_footer(text))
+
+    assert recognized == text
+    assert confidence >= MIN_CONFIDENCE
+    assert parse_page_indicators(recognized)
+
+
+def test_reads_dark_theme_and_ignores_page_text_above(recognizer):
+    text, confidence = recognizer.recognize(render_footer("Page 47 of 389", ink=200, background=30))
+    assert text == "Page 47 of 389"
+    assert confidence >= MIN_CONFIDENCE
+
+    text, _ = recognizer.recognize(render_footer("Page 47 of 389", body_text="the end of the chapter"))
+    assert text == "Page 47 of 389"
+
+
+def test_other_font_size_falls_back(recognizer):
+    assert recognizer.recognize(render_footer("Page 47 of 389", size=40))[0] is None
+
+
+def test_learning_requires_one_glyph_per_character(recognizer):
+    assert not recognizer.learn(render_footer("Page 47 of 389"), "Page 47 of 3890")
+    assert not recognizer.learn(render_footer("Page 47 of 389"), "")
+    assert recognizer.stats()["skipped"] == 2
+
+
+def test_templates_persist_and_can_be_forgotten(recognizer, tmp_path):
+    reloaded = FooterRecognizer(path=tmp_path / "footer_glyphs.json")
+    assert reloaded.recognize(render_footer("Page 47 of 389"))[0] == "Page 47 of 389"
+    assert reloaded.stats()["font_sizes"] == 1
+
+    reloaded.forget(render_footer("Page 47 of 389"))
+    assert reloaded.recognize(render_footer("Page 47 of 389"))[0] is None
+    assert FooterRecognizer(path=tmp_path / "footer_glyphs.json").stats()["font_sizes"] == 0
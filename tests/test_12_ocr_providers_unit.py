@@ -0,0 +1,150 @@
+"""Unit tests for the OCR provider registry."""
+
+import io
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from PIL import Image, ImageDraw
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from server.utils import ocr_cache
+from server.utils.ocr_cache import OcrCache
+from server.utils.ocr_providers import (
+    LocalOcrProvider,
+    MistralOcrProvider,
+    get_ocr_providers,
+    get_provider,
+    register_provider,
+    unregister_provider,
+)
+from server.utils.ocr_utils import KindleOCR
+
+
+def render_page(text):
+    """Render a line of text to encoded image bytes."""
+    image = Image.new("RGB", (400, 200), "white")
+    ImageDraw.Draw(image).text((20, 20), text, fill="black")
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def local_providers(monkeypatch, tmp_path):
+    """Register stand-in providers for the duration of a test."""
+    monkeypatch.setattr(ocr_cache, "_cache", OcrCache(cache_dir=tmp_path))
+    registered = []
+
+    def register(name, fn, **kwargs):
+        provider = LocalOcrProvider(name, fn, **kwargs)
+        register_provider(provider)
+        registered.append(name)
+        return provider
+
+    yield register
+    for name in registered:
+        unregister_provider(name)
+
+
+def test_client_is_created_once():
+    created = []
+
+    class CountingProvider(LocalOcrProvider):
+        def _create_client(self):
+            created.append(1)
+            return lambda image: ("text", None)
+
+    provider = CountingProvider("counting", None)
+    for _ in range(3):
+        assert provider.recognize(b"image") == ("text", None)
+    assert len(created) == 1
+    assert provider.describe()["client_ready"]
+
+
+def test_concurrency_limit_is_enforced():
+    release = threading.Event()
+    provider = LocalOcrProvider(
+        "limited", lambda image: (release.wait(2), None), max_concurrency=1, timeout=0.2
+    )
+
+    worker = threading.Thread(target=provider.recognize, args=(b"image",))
+    worker.start()
+    time.sleep(0.05)
+    assert provider.describe()["in_flight"] == 1
+
+    text, error = provider.recognize(b"image")
+    assert text is None
+    assert "concurrency limit of 1" in error
+
+    release.set()
+    worker.join()
+    assert provider.describe()["in_flight"] == 0
+
+
+def test_provider_errors_are_returned_not_raised():
+    def broken(image):
+        raise RuntimeError("offline")
+
+    text, error = LocalOcrProvider("broken", broken).recognize(b"image")
+    assert text is None
+    assert "offline" in error
+
+
+def test_mistral_without_api_key_reports_error(monkeypatch):
+    monkeypatch.delenv("MISTRAL_API_KEY", raising=False)
+    text, error = MistralOcrProvider().recognize(b"image")
+    assert text is None
+    assert "MISTRAL_API_KEY" in error
+
+
+def test_provider_order(local_providers):
+    local_providers("local-a", lambda image: ("a", None))
+    local_providers("local-b", lambda image: ("b", None))
+
+    assert [p.name for p in get_ocr_providers("local-b, local-a, missing")] == ["local-b", "local-a"]
+    assert isinstance(get_provider("mistral"), MistralOcrProvider)
+    assert get_provider("missing") is None
+
+
+def test_process_ocr_uses_registered_providers(local_providers, monkeypatch):
+    calls = []
+
+    def primary(image):
+        calls.append(image)
+        return "Registered provider text\n\n87%", None
+
+    local_providers("local-primary", primary)
+    local_providers("local-secondary", lambda image: (None, "unused"))
+    monkeypatch.setattr("server.utils.ocr_providers.PROVIDER_ORDER", "local-primary,local-secondary")
+
+    image = render_page("registered provider")
+    reader = {"user": "reader@example.com"}
+    assert KindleOCR.process_ocr(image, cache_context=reader) == ("Registered provider text", None)
+    # The provider gets the preprocessed upload rather than the PNG
+    assert len(calls) == 1 and calls[0].startswith(b"\xff\xd8")
+
+    # The second request is answered from the OCR cache
+    raw = KindleOCR.process_ocr(image, clean_ui_elements=False, cache_context=reader)
+    assert raw[0] == "Registered provider text\n\n87%"
+    assert len(calls) == 1
+
+    # Other users and requests without a user are not
+    KindleOCR.process_ocr(image, cache_context={"user": "other@example.com"})
+    KindleOCR.process_ocr(image, cache_context={})
+    assert len(calls) == 3
+
+
+def test_process_ocr_combines_provider_errors(local_providers, monkeypatch):
+    local_providers("local-x", lambda image: (None, "x down"))
+    local_providers("local-y", lambda image: (None, "y down"))
+    monkeypatch.setattr("server.utils.ocr_providers.PROVIDER_ORDER", "local-x,local-y")
+
+    text, error = KindleOCR.process_ocr(render_page("nothing readable"))
+    assert text is None
+    assert error == "Both OCR services failed. local-x: x down; local-y: y down"
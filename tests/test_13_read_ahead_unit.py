@@ -0,0 +1,223 @@
+"""Unit tests for the page text cache, cached previews and read-ahead scheduling."""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from server.utils import read_ahead
+from server.utils.page_text_cache import PageTextCache
+
+EMAIL = "reader@example.com"
+BOOK = "Moby Dick"
+
+
+class FakeReader:
+    """Reader handler that counts page turns and can stall on a given turn."""
+
+    def __init__(self, stall_on=None):
+        self.page = 0
+        self.last_turn_verified = None
+        self.forward_turns = 0
+        self.stall_on = stall_on
+        self.stalled = threading.Event()
+
+    def turn_page_forward(self):
+        self.page += 1
+        self.forward_turns += 1
+        if self.forward_turns == self.stall_on:
+            self.stalled.set()
+            time.sleep(0.2)
+        return True
+
+    def turn_page_backward(self):
+        self.page -= 1
+        return True
+
+
+def make_server(reader):
+    automator = MagicMock()
+    automator.state_machine.reader_handler = reader
+    automator.driver.get_screenshot_as_png.side_effect = lambda: f"page-{reader.page}".encode()
+    server = MagicMock()
+    server.automators = {EMAIL: automator}
+    return server
+
+
+@pytest.fixture
+def cache():
+    cache = PageTextCache(max_pages_per_user=3)
+    with patch.object(read_ahead, "get_page_text_cache", return_value=cache):
+        yield cache
+
+
+@pytest.fixture
+def manager(cache):
+    def fake_ocr(email, book, position, screenshot):
+        cache.put(email, book, position, screenshot.decode(), source="read_ahead")
+        return True
+
+    with (
+        patch.object(read_ahead, "get_active_request_info", return_value=None),
+        patch.object(read_ahead, "should_cancel", return_value=False),
+        patch.object(read_ahead, "RequestManager"),
+        patch.object(read_ahead, "_ocr_page", side_effect=fake_ocr),
+        patch.object(read_ahead, "PAGE_SETTLE_SECONDS", 0),
+        patch.object(read_ahead, "capture_screen", side_effect=lambda driver: driver.get_screenshot_as_png()),
+    ):
+        yield read_ahead.ReadAheadManager()
+
+
+def wait_for_thread(manager):
+    thread = manager._state(EMAIL).thread
+    if thread:
+        thread.join(timeout=5)
+    read_ahead._ocr_executor.submit(lambda: None).result(timeout=5)
+
+
+def test_cache_evicts_oldest_page_and_forgets_by_book(cache):
+    for position in range(4):
+        cache.put(EMAIL, BOOK, position, f"text {position}")
+    cache.put(EMAIL, "Other Book", 0, "other")
+
+    assert cache.get(EMAIL, BOOK, 0) is None
+    assert cache.get(EMAIL, BOOK, 3)["text"] == "text 3"
+    assert cache.forget(EMAIL, BOOK) == 2
+    assert cache.contains(EMAIL, "Other Book", 0)
+    assert cache.stats() == {"hits": 1, "misses": 1, "stores": 5, "pages": 1, "hit_rate": 0.5}
+
+
+def test_configure_clamps_depth_and_zero_disables(manager):
+    assert manager.configure(EMAIL, BOOK, 50) == read_ahead.MAX_PAGES
+    assert manager.configure(EMAIL, BOOK, 0) == 0
+    assert not manager.schedule(make_server(FakeReader()), EMAIL, BOOK, 10)
+
+
+def test_reads_missing_pages_and_returns_to_position(manager, cache):
+    reader = FakeReader()
+    cache.put(EMAIL, BOOK, 12, "already cached")
+    manager.configure(EMAIL, BOOK, 3)
+
+    assert manager.schedule(make_server(reader), EMAIL, BOOK, 10)
+    wait_for_thread(manager)
+
+    assert reader.page == 0
+    assert reader.forward_turns == 3
+    assert cache.get(EMAIL, BOOK, 11)["text"] == "page-1"
+    assert cache.get(EMAIL, BOOK, 12)["text"] == "already cached"
+    assert cache.get(EMAIL, BOOK, 13)["text"] == "page-3"
+
+    # Nothing is left to read ahead from the same position
+    assert not manager.schedule(make_server(reader), EMAIL, BOOK, 10)
+
+
+def test_navigation_takes_over_the_offset_of_an_interrupted_read_ahead(manager):
+    reader = FakeReader(stall_on=2)
+    server = make_server(reader)
+    manager.configure(EMAIL, BOOK, 4)
+
+    with patch("server.core.automation_server.AutomationServer.get_instance", return_value=server):
+        assert manager.schedule(server, EMAIL, BOOK, 0)
+        assert reader.stalled.wait(timeout=5)
+        assert manager.settle(EMAIL, keep_offset=True) == 2
+
+        # The device stays ahead until navigation accounts for it
+        assert reader.page == 2
+        assert not manager.schedule(server, EMAIL, BOOK, 0)
+        assert manager.take_offset(EMAIL) == 2
+        assert manager.take_offset(EMAIL) == 0
+
+
+def test_other_requests_get_the_users_page_back(manager):
+    reader = FakeReader(stall_on=2)
+    server = make_server(reader)
+    manager.configure(EMAIL, BOOK, 4)
+
+    with patch("server.core.automation_server.AutomationServer.get_instance", return_value=server):
+        assert manager.schedule(server, EMAIL, BOOK, 0)
+        assert reader.stalled.wait(timeout=5)
+        assert manager.settle(EMAIL) == 0
+
+    assert reader.page == 0
+    assert not manager.is_running(EMAIL)
+
+
+@pytest.fixture
+def nav_handler(cache, tmp_path):
+    from handlers import navigation_handler
+
+    reader = FakeReader()
+    automator = make_server(reader).automators[EMAIL]
+    automator.profile_manager.get_current_profile.return_value = {"email": EMAIL}
+    server = MagicMock()
+    server.get_current_book.return_value = BOOK
+    server.get_position.return_value = 20
+
+    with (
+        patch.object(navigation_handler, "get_page_text_cache", return_value=cache),
+        patch("server.core.automation_server.AutomationServer.get_instance", return_value=server),
+        patch.object(navigation_handler.time, "sleep"),
+    ):
+        handler = navigation_handler.NavigationResourceHandler(automator, screenshots_dir=str(tmp_path))
+        handler._handle_last_read_page_dialog = MagicMock(return_value=False)
+        yield handler, reader
+
+
+def test_cached_previews_turn_no_pages(nav_handler, cache):
+    handler, reader = nav_handler
+    cache.put(EMAIL, BOOK, 20, "current page", {"current_page": 40})
+    cache.put(EMAIL, BOOK, 22, "two pages on", {"current_page": 41})
+    cache.put(EMAIL, BOOK, 19, "one page back")
+    handler._read_page_indicator = MagicMock(return_value={"current_page": 40})
+
+    assert handler._preview_multiple_pages_forward(2) == (True, "two pages on", None)
+    assert handler._preview_multiple_pages_backward(1) == (True, "one page back", None)
+    assert reader.forward_turns == 0 and reader.page == 0
+
+
+def test_cached_previews_are_not_served_when_the_device_has_drifted(nav_handler, cache):
+    handler, reader = nav_handler
+    handler._extract_text_only_for_preview = MagicMock(return_value=("ocr text", None))
+    cache.put(EMAIL, BOOK, 20, "current page", {"current_page": 40})
+    cache.put(EMAIL, BOOK, 22, "two pages on", {"current_page": 41})
+    handler._read_page_indicator = MagicMock(return_value={"current_page": 45})
+
+    assert handler._preview_multiple_pages_forward(2) == (True, "ocr text", None)
+    assert reader.forward_turns == 2
+    assert cache.get(EMAIL, BOOK, 20) is None
+
+    # Without a cached record of the current page there is nothing to confirm the position
+    handler._read_page_indicator.return_value = {"current_page": 40}
+    cache.put(EMAIL, BOOK, 22, "two pages on", {"current_page": 41})
+    assert handler._preview_multiple_pages_forward(2) == (True, "ocr text", None)
+    assert reader.forward_turns == 4 and reader.page == 0
+
+
+def test_cached_page_is_only_served_at_a_confirmed_position(nav_handler, cache):
+    handler, _ = nav_handler
+    cache.put(EMAIL, BOOK, 20, "current page", {"current_page": 40})
+
+    # An unreadable page indicator confirms nothing, but is no reason to drop the page either
+    handler._read_page_indicator = MagicMock(return_value={})
+    assert handler._response_from_page_cache(EMAIL, 0) is None
+    assert cache.get(EMAIL, BOOK, 20)["text"] == "current page"
+
+    handler._read_page_indicator.return_value = {"current_page": 40}
+    response = handler._response_from_page_cache(EMAIL, 0)
+    assert response == {"success": True, "progress": {"current_page": 40}, "ocr_text": "current page"}
+
+
+def test_preview_miss_turns_pages_and_caches_the_text(nav_handler, cache):
+    handler, reader = nav_handler
+    handler._extract_text_only_for_preview = MagicMock(return_value=("ocr text", None))
+
+    assert handler._preview_multiple_pages_forward(1, position_offset=1) == (True, "ocr text", None)
+    assert reader.forward_turns == 1 and reader.page == 0
+    assert cache.get(EMAIL, BOOK, 22)["source"] == "preview"
@@ -0,0 +1,112 @@
+"""Unit tests for page scrubber jump planning."""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from handlers import page_jump_handler
+from handlers.page_jump_handler import PageJumpHandler, estimate_units_per_turn
+from server.utils.page_text_cache import PageTextCache
+
+EMAIL = "reader@example.com"
+BOOK = "Moby Dick"
+
+
+def test_estimate_needs_pages_far_enough_apart():
+    assert estimate_units_per_turn({}) is None
+    assert estimate_units_per_turn({4: 10, 5: 11}) is None
+    assert estimate_units_per_turn({0: 12, 3: 12, 8: 16}) == 0.5
+    assert estimate_units_per_turn({0: 20, 8: 16}) is None
+
+
+def test_plan_uses_locations_when_pages_are_unknown():
+    cache = PageTextCache()
+    for position in range(0, 12, 4):
+        cache.put(EMAIL, BOOK, position, "text", {"current_location": 100 + 15 * position})
+
+    handler = PageJumpHandler(MagicMock())
+    with patch.object(page_jump_handler, "get_page_text_cache", return_value=cache):
+        assert handler.plan(EMAIL, BOOK, 5) is None
+        assert handler.plan(EMAIL, BOOK, -40) == ("current_location", 15.0)
+        assert handler.plan(EMAIL, "Other Book", 40) is None
+
+
+@pytest.fixture
+def jump_handler():
+    handler = PageJumpHandler(MagicMock())
+    handler.toc_handler = MagicMock()
+    seekbar = MagicMock()
+    seekbar.rect = {"x": 100, "y": 1500, "width": 801, "height": 40}
+    handler._find_seekbar = MagicMock(return_value=seekbar)
+    with patch.object(page_jump_handler, "SCRUB_SETTLE_SECONDS", 0):
+        yield handler
+
+
+def test_jump_corrects_scrubber_taps_until_close(jump_handler):
+    jump_handler.toc_handler._get_popover_page_position.side_effect = [
+        {"current_page": 100, "total_pages": 801},
+        {"current_page": 130},
+        {"current_page": 149},
+    ]
+
+    # 100 page turns at half a page each is 50 pages on, page 150
+    assert jump_handler.jump(100, "current_page", 0.5) == 2
+
+    taps = [call.args[0][0] for call in jump_handler.driver.tap.call_args_list]
+    assert taps == [(249, 1520), (269, 1520)]
+    jump_handler.toc_handler._hide_reading_controls.assert_called_once()
+
+
+def test_jump_without_scrubber_position_moves_nothing(jump_handler):
+    jump_handler.toc_handler._get_popover_page_position.return_value = {"percentage": 40}
+
+    assert jump_handler.jump(100, "current_page", 0.5) is None
+    jump_handler.driver.tap.assert_not_called()
+
+
+def test_unreadable_landing_is_not_assumed_to_reach_the_target(jump_handler):
+    jump_handler.toc_handler._get_popover_page_position.side_effect = [
+        {"current_page": 100, "total_pages": 801},
+        {"percentage": 20},
+    ]
+
+    assert jump_handler.jump(100, "current_page", 0.5) is None
+    assert jump_handler.moved is True
+    jump_handler.driver.tap.assert_called_once()
+    jump_handler.toc_handler._hide_reading_controls.assert_called_once()
+
+
+def test_jumps_forget_the_books_cached_pages():
+    from handlers import navigation_handler
+
+    with patch.object(navigation_handler.os, "makedirs"):
+        handler = navigation_handler.NavigationResourceHandler(MagicMock())
+    handler._page_position = MagicMock(return_value=(EMAIL, BOOK, 40))
+    handler._navigate_pages = MagicMock(return_value=True)
+    cache = PageTextCache()
+    cache.put(EMAIL, BOOK, 41, "text", {"current_page": 21})
+
+    def jump(self, turns, unit, units_per_turn):
+        self.moved = True
+        return landing
+
+    with (
+        patch.object(navigation_handler, "get_page_text_cache", return_value=cache),
+        patch.object(PageJumpHandler, "plan", return_value=("current_page", 0.5)),
+        patch.object(PageJumpHandler, "jump", jump),
+        patch.object(navigation_handler, "BATCH_NAVIGATION", False),
+    ):
+        landing = 2
+        assert handler._navigate_by(100) is True
+        handler._navigate_pages.assert_called_once_with(True, 2)
+        assert not cache.contains(EMAIL, BOOK, 41)
+
+        landing = None
+        assert handler._navigate_by(100) is False
+        assert handler._navigate_pages.call_count == 1
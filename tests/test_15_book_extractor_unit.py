@@ -0,0 +1,175 @@
+"""Unit tests for resumable book text extraction."""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from server.utils import book_extractor
+from server.utils.book_extractor import BookExtractor, ExtractionStore
+
+EMAIL = "reader@example.com"
+BOOK = "Moby Dick"
+
+
+class FakeBook:
+    """Reader handler over a list of pages that stays on the last page at the end."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.index = 0
+        self.last_turn_verified = None
+
+    def turn_page_forward(self):
+        self.index = min(self.index + 1, len(self.pages) - 1)
+        return True
+
+    def screenshot(self):
+        return self.pages[self.index].encode()
+
+
+def fake_ocr(screenshot, cache_context=None):
+    assert cache_context == {"user": EMAIL, "book": BOOK}
+    text = screenshot.decode()
+    return {"main_text": text, "page_indicator_text": f"Location {len(text)} of 900", "errors": []}
+
+
+def make_server(reader):
+    automator = MagicMock()
+    automator.state_machine.reader_handler = reader
+    automator.driver.get_screenshot_as_png.side_effect = reader.screenshot
+    server = MagicMock()
+    server.automators = {EMAIL: automator}
+    return server
+
+
+@pytest.fixture
+def extractor(tmp_path):
+    with (
+        patch.object(book_extractor, "get_active_request_info", return_value=None),
+        patch.object(book_extractor, "should_cancel", return_value=False),
+        patch.object(book_extractor, "RequestManager"),
+        patch.object(book_extractor, "PAGE_SETTLE_SECONDS", 0),
+        patch.object(
+            book_extractor, "capture_screen", side_effect=lambda driver: driver.get_screenshot_as_png()
+        ),
+        patch("handlers.reader_page_handler.process_screenshot_with_regions", side_effect=fake_ocr),
+    ):
+        yield BookExtractor(root=tmp_path)
+
+
+def run(extractor, server, **kwargs):
+    extractor.start(server, EMAIL, BOOK, **kwargs)
+    extractor._jobs[EMAIL].thread.join(timeout=5)
+    return extractor.get_progress(EMAIL)
+
+
+def test_store_ignores_record_cut_off_by_a_crash(tmp_path):
+    store = ExtractionStore(EMAIL, BOOK, tmp_path)
+    store.append_page({"page": 0, "text": "one"})
+    store.append_page({"page": 1, "text": "two"})
+    with open(store.pages_path, "ab") as f:
+        f.write(b"\x1f\x8b\x08\x00partial")
+
+    assert [page["text"] for page in store.read_pages()] == ["one", "two"]
+
+
+def test_extracts_whole_book_in_order_and_stops_at_the_end(extractor):
+    pages = [f"page {i} " + "x" * i for i in range(12)]
+
+    progress = run(extractor, make_server(FakeBook(pages)))
+
+    assert progress["status"] == "finished"
+    assert progress["pages"] == 12
+    records = extractor.get_pages(EMAIL, BOOK)
+    assert [record["text"] for record in records] == pages
+    assert records[3]["progress"]["current_location"] == len(pages[3])
+
+
+def test_resumes_from_checkpoint_after_interruption(extractor, tmp_path):
+    pages = [f"page {i}" for i in range(10)]
+    reader = FakeBook(pages)
+
+    assert run(extractor, make_server(reader), max_pages=4)["status"] == "stopped"
+
+    # A restarted server picks up the stored pages and the device's last page
+    resumed = BookExtractor(root=tmp_path)
+    progress = run(resumed, make_server(reader))
+
+    assert progress["status"] == "finished"
+    assert progress["pages"] == 10 and progress["pages_this_run"] == 6
+    assert [record["text"] for record in resumed.get_pages(EMAIL, BOOK)] == pages
+
+
+def test_pause_keeps_captured_pages(extractor):
+    reader = FakeBook([f"page {i}" for i in range(500)])
+    with patch.object(book_extractor, "should_cancel", side_effect=lambda *args: reader.index >= 20):
+        progress = run(extractor, make_server(reader))
+
+    # The device stopped on page 20, which was captured before the pause was seen
+    assert progress["status"] == "paused"
+    assert progress["pages"] == 21
+    assert ExtractionStore(EMAIL, BOOK, extractor.root).load_checkpoint()["pages"] == 21
+    assert reader.index == 20
+
+
+def test_resume_is_refused_after_the_user_moved_the_book(extractor, tmp_path):
+    pages = [f"page {i}" for i in range(10)]
+    reader = FakeBook(pages)
+    run(extractor, make_server(reader), max_pages=4)
+
+    reader.index = 7
+    progress = run(BookExtractor(root=tmp_path), make_server(reader))
+
+    assert progress["status"] == "paused"
+    assert "last extracted page" in progress["error"]
+    assert progress["pages"] == 4 and reader.index == 7
+
+
+def test_captured_pages_are_written_when_the_job_fails(extractor):
+    reader = FakeBook([f"page {i}" for i in range(50)])
+    server = make_server(reader)
+    screenshots = server.automators[EMAIL].driver.get_screenshot_as_png
+    screenshots.side_effect = lambda: reader.screenshot() if reader.index < 5 else None
+
+    progress = run(extractor, server)
+
+    assert progress["status"] == "failed"
+    assert [record["text"] for record in extractor.get_pages(EMAIL, BOOK)] == [f"page {i}" for i in range(5)]
+
+
+def test_requests_pause_without_waiting_for_ocr_and_idle_users_resume(extractor):
+    reader = FakeBook([f"page {i}" for i in range(500)])
+    server = make_server(reader)
+    release_ocr = threading.Event()
+
+    def slow_ocr(screenshot, cache_context=None):
+        release_ocr.wait(5)
+        return fake_ocr(screenshot, cache_context)
+
+    with patch("handlers.reader_page_handler.process_screenshot_with_regions", side_effect=slow_ocr):
+        extractor.start(server, EMAIL, BOOK)
+        while reader.index < 3:
+            time.sleep(0.01)
+        assert extractor.pause(EMAIL, by_request=True) is True
+        job = extractor._jobs[EMAIL]
+        assert job.device_released.is_set() and job.thread.is_alive()
+        release_ocr.set()
+        job.thread.join(timeout=5)
+
+    assert job.status == "paused" and job.pages == reader.index + 1
+    server.get_current_book.return_value = BOOK
+    server.get_last_activity_time.return_value = time.time()
+    assert extractor.resume_idle(server) == 0
+
+    server.get_last_activity_time.return_value = time.time() - book_extractor.RESUME_IDLE_SECONDS - 1
+    with patch.object(BookExtractor, "start") as start:
+        assert extractor.resume_idle(server) == 1
+    start.assert_called_once_with(server, EMAIL, BOOK, None)
@@ -0,0 +1,125 @@
+"""Unit tests for in-memory screen capture."""
+
+import io
+import struct
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from server.utils import frame_source, screenshot_utils
+from server.utils.frame_source import FrameSource, get_frame_source
+from server.utils.screenshot_utils import (
+    capture_screen,
+    crop_region,
+    parse_raw_screencap,
+)
+
+
+def raw_screencap(pixels, width, height, pixel_format=1, color_space=None):
+    header = struct.pack("<III", width, height, pixel_format)
+    if color_space is not None:
+        header += struct.pack("<I", color_space)
+    return header + bytes(pixels)
+
+
+def test_parse_raw_screencap_with_and_without_color_space():
+    pixels = [255, 0, 0, 255, 0, 0, 255, 255]
+
+    for color_space in (None, 1):
+        image = parse_raw_screencap(raw_screencap(pixels, 2, 1, color_space=color_space))
+        assert image.size == (2, 1)
+        assert image.getpixel((0, 0)) == (255, 0, 0, 255)
+        assert image.getpixel((1, 0)) == (0, 0, 255, 255)
+
+
+def test_parse_raw_screencap_reorders_bgra():
+    image = parse_raw_screencap(raw_screencap([10, 20, 30, 255], 1, 1, pixel_format=5))
+
+    assert image.getpixel((0, 0)) == (30, 20, 10, 255)
+
+
+def test_parse_raw_screencap_rejects_bad_output():
+    with pytest.raises(ValueError):
+        parse_raw_screencap(b"\x00" * 8)
+    with pytest.raises(ValueError):
+        parse_raw_screencap(raw_screencap([0] * 7, 2, 1))
+    with pytest.raises(ValueError):
+        parse_raw_screencap(raw_screencap([0] * 4, 1, 1, pixel_format=4))
+
+
+def test_crop_region_uses_fractions_of_the_screen():
+    image = Image.new("RGB", (1000, 1400))
+
+    assert crop_region(image, (0, 0.94, 0.5, 1)).size == (500, 84)
+    assert crop_region(image, None) is image
+
+
+def test_capture_screen_falls_back_to_appium_screenshot():
+    buffer = io.BytesIO()
+    Image.new("RGB", (100, 200), "white").save(buffer, format="PNG")
+    driver = MagicMock()
+    driver.automator.device_id = "emulator-5554"
+    driver.get_screenshot_as_png.return_value = buffer.getvalue()
+
+    with patch.object(screenshot_utils, "grab_screen", return_value=None) as grab:
+        image = capture_screen(driver, region=(0, 0.5, 1, 1))
+
+    grab.assert_called_once_with("emulator-5554")
+    assert image.size == (100, 100)
+
+
+class FakeStream:
+    """adb process whose output is a fixed set of frames."""
+
+    def __init__(self, data):
+        self.stdout = io.BytesIO(data)
+
+    def poll(self):
+        return 0
+
+
+def test_frame_source_decodes_streamed_frames():
+    frames = raw_screencap([1, 2, 3, 255], 1, 1, color_space=0) + raw_screencap(
+        [4, 5, 6, 255], 1, 1, color_space=0
+    )
+    source = FrameSource("emulator-5554")
+    source._streaming = True
+
+    source._run(FakeStream(frames), header_size=16)
+
+    assert source.frames == 2
+    assert source.latest().image.getpixel((0, 0)) == (4, 5, 6, 255)
+    assert not source.is_running()
+    # A stopped source has no newer frame to wait for
+    assert source.wait_for_frame(source.latest().captured_at + 1, timeout=5) is None
+
+
+def test_failed_frame_source_is_not_restarted_right_away():
+    with (
+        patch.object(frame_source, "_sources", {}),
+        patch.object(frame_source.subprocess, "run", side_effect=OSError("adb not found")) as run,
+    ):
+        assert get_frame_source("emulator-5554") is None
+        assert get_frame_source("emulator-5554") is None
+
+    run.assert_called_once()
+
+
+def test_grab_screen_does_not_start_a_frame_source():
+    with (
+        patch.object(frame_source, "_sources", {}),
+        patch.object(frame_source.subprocess, "run") as run,
+        patch.object(screenshot_utils, "capture_raw_screen", return_value="frame") as capture_raw_screen,
+    ):
+        assert screenshot_utils.grab_screen("emulator-5554") == "frame"
+        assert frame_source._sources == {}
+
+    run.assert_not_called()
+    capture_raw_screen.assert_called_once_with("emulator-5554")
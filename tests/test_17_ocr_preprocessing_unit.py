@@ -0,0 +1,79 @@
+"""Unit tests for OCR upload preprocessing."""
+
+import io
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from PIL import Image, ImageDraw
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from server.utils import ocr_preprocessing
+from server.utils.ocr_preprocessing import (
+    image_mime_type,
+    prepare_ocr_image,
+    preprocess_for_upload,
+    trim_margins,
+)
+from server.utils.ocr_providers import MistralOcrProvider
+
+
+def render_page(background="white", ink="black"):
+    """A sepia or white page with one block of text in its middle."""
+    image = Image.new("RGB", (1080, 1800), background)
+    draw = ImageDraw.Draw(image)
+    for line in range(10):
+        draw.text((300, 600 + 30 * line), f"Line {line} of the page text", fill=ink)
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_mime_type_follows_the_bytes():
+    assert image_mime_type(prepare_ocr_image(render_page(), "JPEG")[0]) == "image/jpeg"
+    assert image_mime_type(prepare_ocr_image(render_page(), "WEBP")[0]) == "image/webp"
+    assert image_mime_type(render_page()) == "image/png"
+
+
+def test_margins_are_trimmed_on_any_page_color():
+    for background, ink in (("white", "black"), ((251, 240, 217), (60, 50, 40)), ("black", "white")):
+        gray = Image.open(io.BytesIO(render_page(background, ink))).convert("L")
+        trimmed = trim_margins(gray)
+        assert trimmed.width < 500 and trimmed.height < 400
+
+    blank = Image.new("L", (100, 100), 255)
+    assert trim_margins(blank) is blank
+
+
+def test_prepared_upload_is_grayscale_downscaled_and_smaller():
+    page = render_page()
+    upload, mime_type = prepare_ocr_image(page, "JPEG", quality=85, target_dpi=210)
+
+    image = Image.open(io.BytesIO(upload))
+    assert mime_type == "image/jpeg"
+    assert image.mode == "L"
+    # Half the 420 DPI screen density
+    trimmed = trim_margins(Image.open(io.BytesIO(page)).convert("L"))
+    assert image.size == (round(trimmed.width / 2), round(trimmed.height / 2))
+    assert len(upload) < len(page)
+
+
+def test_upload_falls_back_to_original_bytes():
+    assert preprocess_for_upload(b"not an image") == b"not an image"
+    with patch.object(ocr_preprocessing, "OCR_PREPROCESS", False):
+        page = render_page()
+        assert preprocess_for_upload(page) is page
+
+
+def test_mistral_sends_the_mime_type_of_the_upload():
+    provider = MistralOcrProvider()
+    provider._client = MagicMock()
+    provider._client.ocr.process.return_value.pages = [MagicMock(markdown="Page text")]
+    upload, _ = prepare_ocr_image(render_page(), "WEBP")
+
+    assert provider.recognize(upload) == ("Page text", None)
+    document = provider._client.ocr.process.call_args.kwargs["document"]
+    assert document["image_url"].startswith("data:image/webp;base64,")
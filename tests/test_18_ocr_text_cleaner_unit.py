@@ -0,0 +1,37 @@
+"""Unit tests for the single-pass OCR text cleaner."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from server.utils import ocr_text_cleaner
+from server.utils.ocr_text_cleaner import clean_ocr_text, register_ui_patterns
+from server.utils.ocr_utils import KindleOCR
+
+GOLDEN = json.loads((project_root / "fixtures" / "ocr" / "clean_ocr_text_golden.json").read_text())
+
+
+@pytest.mark.parametrize("sample", GOLDEN, ids=range(len(GOLDEN)))
+def test_output_matches_golden(sample):
+    assert KindleOCR._clean_ocr_text(sample["input"]) == sample["output"]
+
+
+def test_empty_text_is_returned_as_is():
+    assert clean_ocr_text(None) is None
+    assert clean_ocr_text("") == ""
+
+
+def test_locale_patterns_apply_only_to_their_locale(monkeypatch):
+    monkeypatch.setitem(ocr_text_cleaner.UI_PATTERNS, "de", [])
+    monkeypatch.setattr(ocr_text_cleaner, "_compiled", {})
+    register_ui_patterns("de", [r"position\s+\d+\s+von\s+\d+"])
+    text = "Er ging nach Hau-\nse.\nPosition 12 von 340"
+
+    assert clean_ocr_text(text, locales=("en", "de")) == "Er ging nach Hause."
+    assert clean_ocr_text(text) == "Er ging nach Hause. Position 12 von 340"
@@ -0,0 +1,108 @@
+"""Unit tests for the per-book Table of Contents cache."""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from handlers import table_of_contents_handler
+from handlers.table_of_contents_handler import TableOfContentsHandler
+from server.utils.toc_cache import TocCache
+
+EMAIL = "reader@example.com"
+BOOK = "The Book"
+CHAPTERS = [
+    {"title": "Prologue", "page": 1, "scroll": 0},
+    {"title": "Chapter 1: The Start", "page": 9, "scroll": 0},
+    {"title": "Chapter 12", "page": 180, "scroll": 4},
+]
+
+
+def test_chapters_survive_a_restart(tmp_path):
+    TocCache(tmp_path).put(EMAIL, BOOK, "8.100", CHAPTERS)
+
+    cache = TocCache(tmp_path)
+    assert cache.get(EMAIL, BOOK, "8.100") == CHAPTERS
+    assert cache.find_chapter(EMAIL, BOOK, "8.100", "chapter 1 the start!")["page"] == 9
+    assert cache.find_chapter(EMAIL, BOOK, "8.100", "Epilogue") is None
+
+
+def test_other_app_versions_books_and_empty_lists_miss(tmp_path):
+    cache = TocCache(tmp_path)
+    cache.put(EMAIL, BOOK, "8.100", CHAPTERS)
+    cache.put(EMAIL, "Empty Book", "8.100", [])
+
+    assert cache.get(EMAIL, BOOK, "8.101") is None
+    assert cache.get(EMAIL, "Other Book", "8.100") is None
+    assert cache.get(EMAIL, "Empty Book", "8.100") is None
+    assert cache.get("other@example.com", BOOK, "8.100") is None
+
+    cache.invalidate(EMAIL, BOOK)
+    assert TocCache(tmp_path).get(EMAIL, BOOK, "8.100") is None
+
+
+def make_handler():
+    automator = MagicMock()
+    automator.profile_manager.get_current_profile.return_value = {"email": EMAIL}
+    automator.profile_manager.get_user_field.return_value = "8.100"
+    automator.server_ref.get_current_book.return_value = BOOK
+    automator.state_machine.is_reading_view.return_value = True
+    automator.driver.get_window_size.return_value = {"width": 1000, "height": 2000}
+    handler = TableOfContentsHandler(automator)
+    handler._is_table_of_contents_open = MagicMock(return_value=False)
+    handler._get_current_page_position = MagicMock(return_value={"current_page": 42})
+    handler._open_table_of_contents = MagicMock(return_value=True)
+    handler._close_table_of_contents = MagicMock(return_value=True)
+    handler._ensure_reading_controls_visible = MagicMock(return_value=True)
+    handler._open_page_position_popover = MagicMock(return_value=True)
+    handler._get_popover_page_position = MagicMock(return_value=None)
+    handler._hide_reading_controls = MagicMock()
+    handler._scroll_to_top_of_toc = MagicMock()
+    return handler
+
+
+def test_table_of_contents_is_read_once_then_served_from_cache(tmp_path):
+    cache = TocCache(tmp_path)
+    handler = make_handler()
+    handler._collect_all_chapters = MagicMock(return_value=[dict(chapter) for chapter in CHAPTERS])
+
+    with (
+        patch.object(table_of_contents_handler, "get_toc_cache", return_value=cache),
+        patch.object(table_of_contents_handler, "store_page_source"),
+    ):
+        first, status = handler.get_table_of_contents()
+        second, _ = handler.get_table_of_contents()
+        handler.get_table_of_contents(refresh=True)
+
+    assert status == 200
+    assert first["chapters"][2] == {"title": "Chapter 12", "page": 180}
+    assert second["cached"] is True
+    assert second["chapters"] == first["chapters"]
+    assert second["position"] == {"current_page": 42}
+    assert handler._collect_all_chapters.call_count == 2
+    assert handler._open_table_of_contents.call_count == 2
+
+
+def test_chapter_navigation_scrolls_to_the_cached_offset(tmp_path):
+    cache = TocCache(tmp_path)
+    cache.put(EMAIL, BOOK, "8.100", CHAPTERS)
+    handler = make_handler()
+    visible = {"swipes": 0}
+    handler.driver.swipe.side_effect = lambda *args, **kwargs: visible.update(swipes=visible["swipes"] + 1)
+    handler._try_find_and_click_chapter = MagicMock(side_effect=lambda *args: visible["swipes"] == 4)
+
+    with (
+        patch.object(table_of_contents_handler, "get_toc_cache", return_value=cache),
+        patch.object(table_of_contents_handler, "store_page_source"),
+        patch.object(table_of_contents_handler.time, "sleep"),
+    ):
+        result = handler.navigate_to_chapter("Chapter 12")
+
+    assert result["success"] is True
+    handler._scroll_to_top_of_toc.assert_called_once()
+    assert handler.driver.swipe.call_count == 4
+    # Once before scrolling and once at the cached offset
+    assert handler._try_find_and_click_chapter.call_count == 2
@@ -0,0 +1,144 @@
+"""Unit tests for write-behind position and session tracking."""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from server.utils.position_tracker import (
+    ACTIVITY,
+    BOOK_SESSION,
+    NAVIGATION,
+    POSITION,
+    PositionTracker,
+)
+
+EMAIL = "reader@example.com"
+BOOK = "The Book"
+
+
+def make_tracker(journal_path, stored_position=10):
+    # A long interval keeps the background writer from flushing during a test
+    tracker = PositionTracker(journal_path, write_behind=True, flush_interval=3600)
+    tracker._load_position = MagicMock(return_value=stored_position)
+    tracker._write_batch = MagicMock(return_value={})
+    return tracker
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    return tmp_path / "position_journal.jsonl"
+
+
+def test_page_turns_are_read_from_memory_and_coalesced(journal_path):
+    tracker = make_tracker(journal_path)
+
+    assert tracker.update_position(EMAIL, BOOK, 1) == 11
+    tracker.record_navigation(EMAIL, BOOK, 11, 1, "key")
+    assert tracker.update_position(EMAIL, BOOK, 1) == 12
+    tracker.record_navigation(EMAIL, BOOK, 12, 1, "key")
+    assert tracker.update_position(EMAIL, BOOK, -3) == 9
+    tracker.record_navigation(EMAIL, BOOK, 9, -3, "key")
+    tracker.record_activity(EMAIL)
+    assert tracker.get_position(EMAIL, BOOK) == 9
+
+    tracker._load_position.assert_called_once_with(EMAIL, BOOK)
+    tracker._write_batch.assert_not_called()
+
+    assert tracker.flush() is True
+    batch = tracker._write_batch.call_args.args[0]
+    assert batch[(POSITION, EMAIL, BOOK, None)] == 9
+    assert batch[(BOOK_SESSION, EMAIL, BOOK, None)] == 9
+    totals = batch[(NAVIGATION, EMAIL, BOOK, "key")]
+    assert (totals["position"], totals["max_position"], totals["count"]) == (9, 12, 3)
+    assert (totals["forward"], totals["backward"]) == (2, 3)
+    assert (ACTIVITY, EMAIL, None, None) in batch
+    assert not journal_path.exists()
+    tracker.stop()
+
+
+def test_unwritten_changes_are_replayed_after_a_crash(journal_path):
+    crashed = make_tracker(journal_path)
+    crashed.update_position(EMAIL, BOOK, 5)
+    crashed.record_navigation(EMAIL, BOOK, 15, 5)
+    crashed.record_navigation(EMAIL, BOOK, 16, 1)
+    # A write cut short by the crash
+    with open(journal_path, "a") as f:
+        f.write('{"kind": "position", "ema')
+
+    restarted = make_tracker(journal_path)
+    assert restarted.get_position(EMAIL, BOOK) == 15
+    restarted._load_position.assert_not_called()
+
+    restarted.flush()
+    batch = restarted._write_batch.call_args.args[0]
+    assert batch[(BOOK_SESSION, EMAIL, BOOK, None)] == 16
+    assert batch[(NAVIGATION, EMAIL, BOOK, None)]["count"] == 2
+    crashed.stop()
+    restarted.stop()
+
+
+def test_failed_writes_are_retried_with_newer_changes(journal_path):
+    tracker = make_tracker(journal_path)
+    tracker._write_batch.side_effect = ConnectionError("database unavailable")
+    tracker.record_navigation(EMAIL, BOOK, 11, 1)
+    assert tracker.flush() is False
+
+    tracker._write_batch.side_effect = None
+    tracker.record_navigation(EMAIL, BOOK, 12, 1)
+    assert make_tracker(journal_path)._pending[(NAVIGATION, EMAIL, BOOK, None)]["count"] == 2
+
+    assert tracker.flush() is True
+    batch = tracker._write_batch.call_args.args[0]
+    assert batch[(BOOK_SESSION, EMAIL, BOOK, None)] == 12
+    assert batch[(NAVIGATION, EMAIL, BOOK, None)]["count"] == 2
+    tracker.stop()
+
+
+def test_flush_for_one_user_leaves_others_pending(journal_path):
+    tracker = make_tracker(journal_path)
+    tracker.set_position(EMAIL, BOOK, 3)
+    tracker.set_position("other@example.com", BOOK, 7)
+
+    tracker.flush(EMAIL)
+    assert list(tracker._write_batch.call_args.args[0]) == [(POSITION, EMAIL, BOOK, None)]
+    assert list(make_tracker(journal_path)._pending) == [(POSITION, "other@example.com", BOOK, None)]
+    assert tracker.flush(EMAIL) is True
+    assert tracker._write_batch.call_count == 1
+    tracker.stop()
+
+
+def test_changes_are_written_immediately_without_write_behind(journal_path):
+    tracker = PositionTracker(journal_path, write_behind=False)
+    tracker._load_position = MagicMock(return_value=0)
+    tracker._write_batch = MagicMock(return_value={})
+
+    tracker.update_position(EMAIL, BOOK, 1)
+    tracker._write_batch.assert_called_once_with({(POSITION, EMAIL, BOOK, None): 1})
+    assert tracker._thread is None
+
+
+def test_positions_are_forgotten_once_written(journal_path):
+    tracker = make_tracker(journal_path)
+    tracker.set_position(EMAIL, BOOK, 5)
+    tracker.set_position(EMAIL, "Other Book", 7)
+    tracker.set_position("other@example.com", BOOK, 3)
+
+    tracker.forget(EMAIL, keep=BOOK)
+    tracker._write_batch.assert_called_once()
+    assert set(tracker._positions) == {(EMAIL, BOOK), ("other@example.com", BOOK)}
+
+    # A position that could not be written stays in memory until it is
+    tracker._write_batch.side_effect = lambda batch: batch
+    tracker.forget(EMAIL)
+    assert (EMAIL, BOOK) not in tracker._positions
+    tracker.set_position(EMAIL, BOOK, 6)
+    tracker.forget(EMAIL)
+    assert tracker.get_position(EMAIL, BOOK) == 6
+    tracker.stop()
+
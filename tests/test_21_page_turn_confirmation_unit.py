@@ -0,0 +1,182 @@
+"""Unit tests for confirming page turns by frame differences."""
+
+import random
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from PIL import Image, ImageDraw, ImageFont
+from selenium.common.exceptions import NoSuchElementException
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from handlers import reader_handler
+from handlers.reader_handler import ReaderHandler
+from server.utils.frame_diff import (
+    CHANGE_THRESHOLD,
+    STABLE_THRESHOLD,
+    fingerprint,
+    frame_difference,
+    wait_for_change,
+)
+
+FONT = ImageFont.load_default(size=40)
+WORDS = ["the", "house", "of", "ravens", "quietly", "spoke", "a", "moment"]
+
+
+def render_page(number, offset=0):
+    """A page of text, shifted sideways by offset pixels as during a page turn animation."""
+    rng = random.Random(number)
+    image = Image.new("RGB", (1080, 1920), "white")
+    draw = ImageDraw.Draw(image)
+    for line in range(30):
+        draw.text((60 - offset, 100 + 55 * line), " ".join(rng.choices(WORDS, k=6)), fill="black", font=FONT)
+    return image
+
+
+def test_fingerprints_tell_pages_apart():
+    first, second = fingerprint(render_page(1)), fingerprint(render_page(2))
+    assert first.mode == "L" and first.width == 96
+    assert frame_difference(first, fingerprint(render_page(1))) < STABLE_THRESHOLD
+    assert frame_difference(first, second) > CHANGE_THRESHOLD
+
+
+def test_wait_returns_once_the_new_page_settles():
+    frames = iter(
+        [render_page(1), render_page(2, offset=400), render_page(2), render_page(2), render_page(3)]
+    )
+    grab = MagicMock(side_effect=lambda: next(frames))
+
+    changed, frame = wait_for_change(grab, fingerprint(render_page(1)), timeout=5)
+
+    assert changed is True
+    assert grab.call_count == 4
+    assert frame_difference(fingerprint(frame), fingerprint(render_page(2))) == 0
+
+
+def test_wait_times_out_without_a_change():
+    page = render_page(1)
+    changed, frame = wait_for_change(lambda: page, fingerprint(page), timeout=0.05)
+    assert changed is False and frame is page
+
+    changed, frame = wait_for_change(lambda: None, fingerprint(page), timeout=5)
+    assert changed is False and frame is None
+
+
+def make_reader(screen):
+    driver = MagicMock()
+    driver.get_window_size.return_value = {"width": 1080, "height": 1920}
+    driver.find_element.side_effect = NoSuchElementException()
+    with patch.object(reader_handler.os, "makedirs"):
+        reader = ReaderHandler(driver)
+    reader._check_element_visibility = MagicMock(return_value=(False, None))
+    # The page indicator reads the same page until told otherwise
+    reader._footer_progress = MagicMock(return_value={"current_page": 10})
+    reader.swipe = MagicMock(side_effect=lambda *args: screen.update(page=screen["page"] + 1))
+    return reader
+
+
+def turn_page(reader, screen, direction=1):
+    with (
+        patch.object(reader_handler, "get_driver_device_id", return_value="emulator-5554"),
+        patch.object(reader_handler, "get_frame_source") as get_frame_source,
+        patch.object(
+            reader_handler, "grab_screen", side_effect=lambda device_id: render_page(screen["page"])
+        ),
+        patch.object(reader_handler, "PAGE_TURN_TIMEOUT_SECONDS", 0.5),
+        patch.object(reader_handler.time, "sleep") as sleep,
+    ):
+        turned = reader.turn_page(direction)
+    # Turning pages streams the screen
+    get_frame_source.assert_called_with("emulator-5554")
+    return turned, sleep
+
+
+def test_page_turn_is_confirmed_without_a_fixed_sleep():
+    screen = {"page": 1}
+    reader = make_reader(screen)
+
+    turned, sleep = turn_page(reader, screen)
+
+    assert turned is True
+    assert reader.last_turn_verified is True
+    assert reader.swipe.call_count == 1
+    sleep.assert_not_called()
+
+
+def test_swipe_is_retried_when_the_page_does_not_change():
+    screen = {"page": 1}
+    reader = make_reader(screen)
+    # The first swipe is lost
+    reader.swipe.side_effect = lambda *args: screen.update(page=min(reader.swipe.call_count, 2))
+
+    turned, _ = turn_page(reader, screen)
+
+    assert turned is True
+    assert reader.last_turn_verified is True
+    assert reader.swipe.call_count == 2
+
+
+def test_page_turn_fails_when_no_swipe_changes_the_page():
+    screen = {"page": 1}
+    reader = make_reader(screen)
+    reader.swipe.side_effect = None
+
+    turned, _ = turn_page(reader, screen)
+
+    assert turned is False
+    assert reader.last_turn_verified is False
+    assert reader.swipe.call_count == 1 + reader_handler.PAGE_TURN_RETRIES
+
+
+def test_swipe_is_not_repeated_when_the_indicator_cannot_confirm_the_page_stayed():
+    screen = {"page": 1}
+    reader = make_reader(screen)
+    reader.swipe.side_effect = None
+    reader._footer_progress.return_value = {}
+
+    turned, _ = turn_page(reader, screen)
+
+    assert turned is True
+    assert reader.last_turn_verified is None
+    assert reader.swipe.call_count == 1
+
+
+def test_last_swipe_with_an_unreadable_indicator_is_left_unverified():
+    screen = {"page": 1}
+    reader = make_reader(screen)
+    reader.swipe.side_effect = None
+    # The page stays the same, then the indicator can no longer be read
+    reader._footer_progress.side_effect = [{"current_page": 10}] * (
+        1 + reader_handler.PAGE_TURN_RETRIES * 2
+    ) + [{}]
+
+    turned, _ = turn_page(reader, screen)
+
+    assert turned is True
+    assert reader.last_turn_verified is None
+    assert reader.swipe.call_count == 1 + reader_handler.PAGE_TURN_RETRIES
+
+    reader = make_reader(screen)
+    reader.swipe.side_effect = None
+    reader._footer_progress.return_value = {}
+    with patch.object(reader_handler, "PAGE_TURN_RETRIES", 0):
+        turned, _ = turn_page(reader, screen)
+
+    assert turned is True
+    assert reader.last_turn_verified is None
+
+
+def test_page_turn_is_confirmed_by_the_indicator_when_the_text_looks_the_same():
+    screen = {"page": 1}
+    reader = make_reader(screen)
+    reader.swipe.side_effect = None
+    reader._footer_progress.side_effect = [{"current_page": 10}, {"current_page": 11}]
+
+    turned, _ = turn_page(reader, screen)
+
+    assert turned is True
+    assert reader.last_turn_verified is True
+    assert reader.swipe.call_count == 1
@@ -0,0 +1,115 @@
+"""Unit tests for tracking the reader's chrome between page turns."""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import NoSuchElementException
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from handlers import reader_handler
+from handlers.reader_chrome_state import ReaderChromeState, union_xpath
+from tests.test_21_page_turn_confirmation_unit import (
+    make_reader,
+    render_page,
+    turn_page,
+)
+
+
+def test_union_xpath_matches_ids_and_xpaths():
+    xpath = union_xpath(
+        [
+            (AppiumBy.ID, "com.amazon.kindle:id/menu_toolbar"),
+            (AppiumBy.XPATH, "//android.widget.TextView[@text='Bookmark']"),
+        ]
+    )
+    assert xpath == (
+        "//*[@resource-id='com.amazon.kindle:id/menu_toolbar'] | //android.widget.TextView[@text='Bookmark']"
+    )
+
+
+def test_window_size_is_read_once_per_session():
+    chrome = ReaderChromeState()
+    driver = MagicMock(session_id="first")
+    driver.get_window_size.return_value = {"width": 1080, "height": 1920}
+
+    assert chrome.window_size(driver) == {"width": 1080, "height": 1920}
+    assert chrome.window_size(driver) == {"width": 1080, "height": 1920}
+    assert driver.get_window_size.call_count == 1
+
+    driver.session_id = "second"
+    chrome.window_size(driver)
+    assert driver.get_window_size.call_count == 2
+
+
+def test_consecutive_page_turns_only_swipe():
+    screen = {"page": 1}
+    reader = make_reader(screen)
+    reader.driver.find_elements.return_value = []
+
+    turn_page(reader, screen)
+    assert reader.driver.find_elements.call_count == 1
+    for _ in range(3):
+        turned, _ = turn_page(reader, screen)
+        assert turned is True
+
+    assert screen["page"] == 5
+    assert reader.swipe.call_count == 4
+    assert reader.driver.find_elements.call_count == 1
+    reader.driver.find_element.assert_not_called()
+    reader._check_element_visibility.assert_not_called()
+    assert reader.driver.get_window_size.call_count == 1
+
+
+def test_chrome_is_dismissed_when_the_page_changed_since_the_last_turn():
+    screen = {"page": 1}
+    reader = make_reader(screen)
+    reader.driver.find_elements.return_value = []
+    turn_page(reader, screen)
+
+    # The toolbar was opened by a tap, which changes the screen
+    toolbar = MagicMock()
+    toolbar.is_displayed.return_value = True
+    reader.driver.find_elements.return_value = [toolbar]
+    reader.driver.find_element.side_effect = lambda *args: toolbar
+    screen["page"] = 10
+
+    turned, _ = turn_page(reader, screen)
+
+    assert turned is True
+    reader.driver.tap.assert_called_once()
+    reader._check_element_visibility.assert_called_once()
+    assert screen["page"] == 11
+
+
+def test_chrome_is_assumed_visible_when_the_hierarchy_cannot_be_read():
+    driver = MagicMock()
+    driver.find_elements.side_effect = NoSuchElementException()
+    chrome = ReaderChromeState()
+
+    assert chrome.chrome_visible(driver) is True
+    assert chrome.is_unchanged(None) is False
+    chrome.page_settled(reader_handler.fingerprint(render_page(1), reader_handler.MAIN_TEXT_REGION))
+    assert chrome.is_unchanged(reader_handler.fingerprint(render_page(1), reader_handler.MAIN_TEXT_REGION))
+    chrome.forget()
+    assert chrome.settled_page is None
+
+
+def test_turns_without_frames_still_check_for_chrome():
+    screen = {"page": 1}
+    reader = make_reader(screen)
+    reader.driver.find_elements.return_value = []
+
+    with (
+        patch.object(reader_handler, "get_driver_device_id", return_value=None),
+        patch.object(reader_handler.time, "sleep"),
+    ):
+        reader.turn_page(1)
+        reader.turn_page(1)
+
+    assert reader.driver.find_elements.call_count == 2
+    assert reader.swipe.call_count == 2
@@ -0,0 +1,126 @@
+"""Unit tests for batched multi-page navigation."""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from handlers import navigation_handler, reader_handler
+from handlers.navigation_handler import NavigationResourceHandler
+from handlers.reader_handler import ReaderHandler
+
+EMAIL = "reader@example.com"
+BOOK = "Moby Dick"
+
+
+@pytest.fixture
+def handler():
+    with patch.object(navigation_handler.os, "makedirs"):
+        handler = NavigationResourceHandler(MagicMock())
+    handler._page_position = MagicMock(return_value=(EMAIL, BOOK, 40))
+    handler._handle_last_read_page_dialog = MagicMock()
+    handler._navigate_pages = MagicMock(return_value=True)
+    reader = handler.automator.state_machine.reader_handler
+    reader.swipe_pages.return_value = True
+    with (
+        patch.object(
+            navigation_handler.PageJumpHandler, "units_per_turn", return_value=("current_page", 0.5)
+        ),
+        patch.object(navigation_handler, "JUMP_MIN_TURNS", 1000),
+        patch.object(navigation_handler.time, "sleep"),
+    ):
+        yield handler
+
+
+def test_batch_is_verified_once_without_corrections(handler):
+    handler._read_page_indicator = MagicMock(side_effect=[{"current_page": 100}, {"current_page": 110}])
+
+    assert handler._navigate_by(20) is True
+
+    handler.automator.state_machine.reader_handler.swipe_pages.assert_called_once_with(1, 20)
+    assert handler._read_page_indicator.call_count == 2
+    handler._navigate_pages.assert_not_called()
+
+
+def test_missed_and_extra_swipes_are_corrected(handler):
+    handler._read_page_indicator = MagicMock(side_effect=[{"current_page": 100}, {"current_page": 92}])
+    assert handler._navigate_by(-20) is True
+    handler._navigate_pages.assert_called_once_with(False, 4)
+
+    handler._navigate_pages.reset_mock()
+    handler._read_page_indicator = MagicMock(side_effect=[{"current_page": 100}, {"current_page": 111}])
+    assert handler._navigate_by(20) is True
+    handler._navigate_pages.assert_called_once_with(False, 2)
+
+
+def test_implausible_landings_are_read_again_and_otherwise_unverified(handler):
+    handler._read_page_indicator = MagicMock(
+        side_effect=[{"current_page": 100}, {"current_page": 300}, {"current_page": 110}]
+    )
+    assert handler._navigate_by(20) is True
+    assert handler._read_page_indicator.call_count == 3
+    handler._navigate_pages.assert_not_called()
+
+    handler._read_page_indicator = MagicMock(
+        side_effect=[{"current_page": 100}, {"current_page": 300}, {"current_page": 300}]
+    )
+    assert handler._navigate_by(20) is False
+    handler._navigate_pages.assert_not_called()
+
+
+def test_short_or_unverifiable_navigations_turn_pages_one_at_a_time(handler):
+    handler._read_page_indicator = MagicMock(return_value={"time_left": "8 mins"})
+    reader = handler.automator.state_machine.reader_handler
+
+    assert handler._navigate_by(2) is True
+    handler._navigate_pages.assert_called_with(True, 2)
+    handler._read_page_indicator.assert_not_called()
+
+    assert handler._navigate_by(-20) is True
+    handler._navigate_pages.assert_called_with(False, 20)
+    reader.swipe_pages.assert_not_called()
+
+
+def test_swipe_pages_swipes_back_to_back():
+    driver = MagicMock()
+    driver.get_window_size.return_value = {"width": 1080, "height": 1920}
+    driver.find_elements.return_value = []
+    with patch.object(reader_handler.os, "makedirs"):
+        reader = ReaderHandler(driver)
+    reader.swipe = MagicMock()
+
+    with (
+        patch.object(reader_handler, "get_driver_device_id", return_value=None),
+        patch.object(reader_handler.time, "sleep") as sleep,
+    ):
+        assert reader.swipe_pages(-1, 5) is True
+
+    assert reader.swipe.call_count == 5
+    start_x, _, end_x, _, _ = reader.swipe.call_args.args
+    assert start_x < end_x
+    assert sleep.call_count == 4
+    sleep.assert_called_with(reader_handler.BATCH_SWIPE_INTERVAL_SECONDS)
+    driver.find_elements.assert_called_once()
+    assert reader.last_turn_verified is None
+
+
+def test_location_books_and_unreadable_landings_are_not_corrected(handler):
+    reader = handler.automator.state_machine.reader_handler
+    with patch.object(
+        navigation_handler.PageJumpHandler, "units_per_turn", return_value=("current_location", 7)
+    ):
+        handler._read_page_indicator = MagicMock(return_value={"current_location": 1000})
+        assert handler._navigate_by(20) is True
+        handler._navigate_pages.assert_called_once_with(True, 20)
+        reader.swipe_pages.assert_not_called()
+
+    handler._navigate_pages.reset_mock()
+    handler._read_page_indicator = MagicMock(side_effect=[{"current_page": 100}, {}])
+    assert handler._navigate_by(20) is False
+    reader.swipe_pages.assert_called_once_with(1, 20)
+    handler._navigate_pages.assert_not_called()
@@ -0,0 +1,147 @@
+"""Unit tests for memoized reading settings in the style handler."""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from handlers import style_handler
+from handlers.style_handler import (
+    DEFAULT_READING_SETTINGS,
+    READING_TOGGLES,
+    StyleHandler,
+    parse_toggle_states,
+    reading_settings_fingerprint,
+)
+
+EMAIL = "reader@example.com"
+TOGGLES = {name: strategies for name, (strategies, _) in READING_TOGGLES.items()}
+
+
+def slideover_source(**checked):
+    nodes = "".join(
+        f'<node resource-id="com.amazon.kindle:id/{resource_id}" checked="{str(value).lower()}" />'
+        for resource_id, value in checked.items()
+    )
+    return f'<hierarchy><node resource-id="com.amazon.kindle:id/aa_menu_v2_root">{nodes}</node></hierarchy>'
+
+
+def test_fingerprint_changes_with_settings_app_version_avd_and_boot():
+    fingerprint = reading_settings_fingerprint(DEFAULT_READING_SETTINGS, "8.1", "avd_reader", "boot-1")
+    assert fingerprint == reading_settings_fingerprint(
+        dict(DEFAULT_READING_SETTINGS), "8.1", "avd_reader", "boot-1"
+    )
+    assert fingerprint != reading_settings_fingerprint(
+        DEFAULT_READING_SETTINGS, "8.2", "avd_reader", "boot-1"
+    )
+    assert fingerprint != reading_settings_fingerprint(DEFAULT_READING_SETTINGS, "8.1", "avd_other", "boot-1")
+    assert fingerprint != reading_settings_fingerprint(
+        DEFAULT_READING_SETTINGS, "8.1", "avd_reader", "boot-2"
+    )
+    assert fingerprint != reading_settings_fingerprint(
+        {**DEFAULT_READING_SETTINGS, "about_book": True}, "8.1", "avd_reader", "boot-1"
+    )
+
+
+def test_toggle_states_are_read_from_one_snapshot():
+    source = slideover_source(
+        aa_menu_v2_real_time_text_highlighting_toggle=False,
+        aa_menu_v2_about_book_toggle=True,
+    )
+    assert parse_toggle_states(source, TOGGLES) == {"real_time_highlighting": False, "about_book": True}
+    assert parse_toggle_states("<hierarchy", TOGGLES) == {}
+
+
+@pytest.fixture
+def handler():
+    style_handler._applied_fingerprints.clear()
+    driver = MagicMock()
+    driver.get_window_size.return_value = {"width": 1080, "height": 1920}
+    with patch.object(style_handler.os, "makedirs"):
+        handler = StyleHandler(driver)
+    handler.user_fields = {"kindle_version_name": "8.1"}
+    handler.profile_manager.get_user_field.side_effect = lambda email, field, default=None, section=None: (
+        handler.user_fields.get(field)
+    )
+    handler.profile_manager.get_avd_for_email.return_value = "avd_reader"
+    handler._boot_id = MagicMock(return_value="boot-1")
+    with (
+        patch("server.utils.request_utils.get_sindarin_email", return_value=EMAIL),
+        patch.object(style_handler, "store_page_source"),
+        patch.object(style_handler, "DialogHandler") as dialog_handler,
+        patch.object(style_handler.time, "sleep"),
+    ):
+        dialog_handler.return_value.check_all_dialogs.return_value = (False, None)
+        yield handler
+    style_handler._applied_fingerprints.clear()
+
+
+def test_settings_are_applied_once_and_then_skipped(handler):
+    handler.apply_reading_settings = MagicMock(return_value=True)
+
+    assert handler.update_reading_style() is True
+    handler.apply_reading_settings.assert_called_once_with(**DEFAULT_READING_SETTINGS, show_placemark=False)
+
+    style_handler._applied_fingerprints[EMAIL] = reading_settings_fingerprint(
+        DEFAULT_READING_SETTINGS, "8.1", "avd_reader", "boot-1"
+    )
+    assert handler.update_reading_style() is True
+    assert handler.apply_reading_settings.call_count == 1
+
+    # A cold boot or a recreated AVD may have lost them
+    handler._boot_id.return_value = "boot-2"
+    assert handler.update_reading_style() is True
+    assert handler.apply_reading_settings.call_count == 2
+
+
+def test_profiles_styled_before_fingerprints_are_not_restyled(handler):
+    handler.apply_reading_settings = MagicMock(return_value=True)
+    handler.user_fields["styles_updated"] = True
+
+    assert handler.update_reading_style() is True
+
+    handler.apply_reading_settings.assert_not_called()
+    expected = reading_settings_fingerprint(DEFAULT_READING_SETTINGS, "8.1", "avd_reader", "boot-1")
+    handler.profile_manager.set_user_field.assert_called_once_with(
+        EMAIL, style_handler.SETTINGS_FINGERPRINT_PREFERENCE, expected, section="preferences"
+    )
+
+
+def test_matching_toggles_are_neither_scrolled_to_nor_toggled(handler):
+    handler.driver.page_source = slideover_source(
+        aa_menu_v2_real_time_text_highlighting_toggle=False,
+        aa_menu_v2_about_book_toggle=False,
+        aa_menu_v2_page_turn_animation_toggle=False,
+        aa_menu_v2_popular_highlight_toggle=False,
+        aa_menu_v2_highlight_menu_toggle=False,
+    )
+    handler._adjust_font_size = MagicMock()
+    handler._expand_style_slideover = MagicMock()
+    handler._close_style_slideover = MagicMock()
+    handler._scroll_for_more_options = MagicMock()
+    handler._toggle_checkbox = MagicMock()
+    handler._record_applied_settings = MagicMock()
+
+    assert handler.apply_reading_settings() is True
+
+    handler._scroll_for_more_options.assert_not_called()
+    handler._toggle_checkbox.assert_not_called()
+    handler._record_applied_settings.assert_called_once_with(DEFAULT_READING_SETTINGS)
+
+    # A toggle below the fold that is on is scrolled to and turned off
+    handler.driver.page_source = slideover_source(aa_menu_v2_popular_highlight_toggle=True)
+    assert handler.apply_reading_settings() is True
+    handler._scroll_for_more_options.assert_called_once()
+    toggled = [call.args[2] for call in handler._toggle_checkbox.call_args_list]
+    assert toggled == [
+        "Real-time Text Highlighting",
+        "About this Book",
+        "Page Turn Animation",
+        "Popular Highlights",
+        "Highlight Menu",
+    ]
@@ -0,0 +1,193 @@
+"""Unit tests for prefetching downloads of recently read books."""
+
+import sys
+import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from handlers import library_handler
+from handlers.library_handler import (
+    DOWNLOAD_ALREADY_DOWNLOADED,
+    DOWNLOAD_NOT_FOUND,
+    DOWNLOAD_STARTED,
+    LibraryHandler,
+)
+from server.utils import download_prefetcher, library_catalog
+from server.utils.download_prefetcher import (
+    parse_size_mb,
+    plan_prefetch,
+    prefetch_downloads,
+    recent_titles,
+)
+from server.utils.title_index import STRATEGY_SCROLL, STRATEGY_SEARCH, TitleIndex
+from views.library.interaction_strategies import SELECTION_DOWNLOAD_STRATEGIES
+from views.state_machine import KindleStateMachine
+
+EMAIL = "reader@example.com"
+FIXTURES_DIR = project_root / "fixtures" / "views"
+
+
+def at(hour):
+    return datetime(2026, 10, 1, hour, tzinfo=timezone.utc)
+
+
+def test_sizes_are_parsed_into_megabytes():
+    assert parse_size_mb("1.5 MB") == 1.5
+    assert parse_size_mb("512 KB") == 0.5
+    assert parse_size_mb("1,024.0 MB") == 1024
+    assert parse_size_mb("2 GB") == 2048
+    assert parse_size_mb(None) is None
+    assert parse_size_mb("Sample") is None
+
+
+def test_recent_titles_merge_sessions_and_positions():
+    @contextmanager
+    def fake_db():
+        yield MagicMock()
+
+    with (
+        patch("database.connection.get_db", fake_db),
+        patch(
+            "database.repositories.reading_session_repository.ReadingSessionRepository.get_recent_book_titles",
+            return_value=[("Dune", at(9)), ("Emma", at(7))],
+        ),
+        patch(
+            "database.repositories.book_position_repository.BookPositionRepository.get_recent_book_titles",
+            return_value=[("Emma", at(10)), ("Ulysses", datetime(2026, 10, 1, 8)), ("Beloved", at(1))],
+        ),
+    ):
+        assert recent_titles(EMAIL, limit=3) == ["Emma", "Dune", "Ulysses"]
+
+
+def test_plan_skips_downloaded_books_and_respects_limits():
+    title_index = MagicMock()
+    title_index.resolve.side_effect = lambda title: (
+        None if title == "Unknown" else {"title": f"{title}: A Novel"}
+    )
+    info = {
+        "Dune: A Novel": {"downloaded": True, "size": "2 MB"},
+        "Emma: A Novel": {"downloaded": False, "size": "150 MB"},
+        "Ulysses: A Novel": {"downloaded": None, "size": "3 MB"},
+        "Beloved: A Novel": {"downloaded": False, "size": None},
+        "Walden: A Novel": {"downloaded": False, "size": "1 MB"},
+    }
+    with (
+        patch.object(download_prefetcher, "get_title_index", return_value=title_index),
+        patch.object(download_prefetcher, "get_download_info", return_value=info),
+    ):
+        planned = plan_prefetch(EMAIL, ["Unknown", "Dune", "Emma", "Ulysses", "Beloved", "Walden"])
+
+    assert planned == ["Ulysses", "Beloved"]
+
+
+def make_library_handler(content_desc):
+    with patch.object(library_handler.os, "makedirs"):
+        handler = LibraryHandler(MagicMock())
+    handler.scroll_handler = MagicMock()
+    handler.scroll_handler.is_in_book_selection_mode.return_value = True
+    handler._resolve_device_title = MagicMock(return_value={"title": "Emma", "strategy": STRATEGY_SCROLL})
+    row = MagicMock()
+    row.get_attribute.return_value = content_desc
+    handler._find_book_at_known_offset = MagicMock(return_value=(row, MagicMock(id="row-1"), {}))
+    handler._check_unable_to_download_dialog = MagicMock(return_value=False)
+    return handler
+
+
+def test_background_download_selects_the_book_and_downloads_it():
+    handler = make_library_handler("Emma, Jane Austen, Book not downloaded.")
+    with (
+        patch.object(library_handler, "get_sindarin_email", return_value=EMAIL),
+        patch.object(library_handler, "set_book_downloaded") as set_book_downloaded,
+        patch.object(library_handler.time, "sleep"),
+    ):
+        assert handler.start_background_download("Emma") == DOWNLOAD_STARTED
+
+    handler.driver.execute_script.assert_called_once_with(
+        "mobile: longClickGesture", {"elementId": "row-1", "duration": 1000}
+    )
+    handler.driver.find_element.return_value.click.assert_called_once()
+    handler.scroll_handler.exit_book_selection_mode.assert_called_once()
+    set_book_downloaded.assert_called_once_with(EMAIL, "Emma", False)
+
+
+def test_background_download_skips_downloaded_and_unplaced_books():
+    handler = make_library_handler("Emma, Jane Austen, Book downloaded.")
+    with (
+        patch.object(library_handler, "get_sindarin_email", return_value=EMAIL),
+        patch.object(library_handler, "set_book_downloaded") as set_book_downloaded,
+    ):
+        assert handler.start_background_download("Emma") == DOWNLOAD_ALREADY_DOWNLOADED
+        set_book_downloaded.assert_called_once_with(EMAIL, "Emma", True)
+
+        handler._resolve_device_title.return_value = {"title": "Emma", "strategy": STRATEGY_SEARCH}
+        assert handler.start_background_download("Emma") == DOWNLOAD_NOT_FOUND
+
+    handler.driver.execute_script.assert_not_called()
+
+
+def test_selection_download_strategies_match_only_the_action_bar_button():
+    def matches(fixture):
+        root = ET.parse(FIXTURES_DIR / fixture).getroot()
+        return [
+            element for _, locator in SELECTION_DOWNLOAD_STRATEGIES for element in root.findall(f".{locator}")
+        ]
+
+    found = matches("library_selection.xml")
+    assert found and all(element.get("content-desc") == "Download" for element in found)
+    assert {element.get("bounds") for element in found} == {"[640,79][787,207]"}
+    assert matches("library.xml") == []
+    assert matches("home.xml") == []
+
+
+def test_device_reset_forgets_download_state():
+    title_index = TitleIndex(EMAIL)
+    title_index.add("Emma")
+    title_index.set_downloaded("Emma", True)
+
+    @contextmanager
+    def fake_db():
+        yield MagicMock()
+
+    with (
+        patch.object(library_catalog, "get_db", fake_db),
+        patch.object(library_catalog, "LibraryBookRepository") as repository,
+        patch.object(library_catalog, "get_title_index", return_value=title_index),
+    ):
+        library_catalog.reset_download_state(EMAIL)
+
+    repository.return_value.clear_downloaded.assert_called_once_with(EMAIL)
+    assert "downloaded" not in title_index.get("Emma")
+
+
+def test_prefetch_keeps_a_cancellation_check_set_by_a_client_request():
+    class FakeStateMachine:
+        _cancellation_check = None
+        set_cancellation_check = KindleStateMachine.set_cancellation_check
+        clear_cancellation_check = KindleStateMachine.clear_cancellation_check
+
+    def client_check():
+        return False
+
+    state_machine = FakeStateMachine()
+    state_machine.library_handler = MagicMock()
+    state_machine.library_handler.start_background_download.side_effect = (
+        lambda title: state_machine.set_cancellation_check(client_check)
+    )
+    server = MagicMock(automators={EMAIL: MagicMock(state_machine=state_machine)})
+
+    with (
+        patch.object(download_prefetcher, "get_redis_client", return_value=None),
+        patch.object(download_prefetcher, "recent_titles", return_value=["Emma"]),
+        patch.object(download_prefetcher, "plan_prefetch", return_value=["Emma"]),
+        patch.object(download_prefetcher, "RequestManager"),
+        patch.object(download_prefetcher, "should_cancel", return_value=False),
+    ):
+        prefetch_downloads(server, EMAIL)
+
+    assert state_machine._cancellation_check is client_check
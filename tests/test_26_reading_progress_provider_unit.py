@@ -0,0 +1,104 @@
+"""Unit tests for reading progress and titles from passive sources."""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from handlers import reader_handler, reading_progress_provider
+from handlers.reader_handler import ReaderHandler
+from handlers.reading_progress_provider import FOOTER_XPATH, all_source_stats
+
+EMAIL = "reader@example.com"
+
+
+def footer(text):
+    element = MagicMock(text=text)
+    element.is_displayed.return_value = True
+    return element
+
+
+@pytest.fixture
+def reader():
+    reading_progress_provider._stats.clear()
+    driver = MagicMock()
+    driver.automator.profile_manager.get_style_setting.return_value = None
+    driver.automator.server_ref.get_current_book.return_value = None
+    driver.find_elements.return_value = []
+    with patch.object(reader_handler.os, "makedirs"):
+        reader = ReaderHandler(driver)
+    reader._get_reading_progress_with_ui = MagicMock(return_value={"current_page": 7, "total_pages": 90})
+    reader._get_book_title_with_ui = MagicMock(return_value=None)
+    with (
+        patch.object(reading_progress_provider, "get_sindarin_email", return_value=EMAIL),
+        patch.object(reading_progress_provider, "capture_screen", return_value=None) as capture,
+        patch.object(reading_progress_provider, "get_footer_recognizer") as recognizer,
+    ):
+        reader.capture = capture
+        reader.recognizer = recognizer.return_value
+        yield reader
+    reading_progress_provider._stats.clear()
+
+
+def test_progress_is_read_from_the_hierarchy_without_ui(reader):
+    reader.driver.find_elements.return_value = [footer("12 mins left in chapter"), footer("Page 42 of 300")]
+
+    assert reader.get_reading_progress(show_placemark=True) == {"current_page": 42, "total_pages": 300}
+
+    reader.driver.find_elements.assert_called_once_with(
+        reading_progress_provider.AppiumBy.XPATH, FOOTER_XPATH
+    )
+    reader.capture.assert_not_called()
+    reader._get_reading_progress_with_ui.assert_not_called()
+    reader.driver.tap.assert_not_called()
+    stats = all_source_stats()
+    assert stats["progress.hierarchy"]["hits"] == 1
+    assert "progress.ui" not in stats
+
+
+def test_recognizer_is_used_before_the_ui_and_only_when_confident(reader):
+    reader.driver.find_elements.return_value = [footer("12 mins left in chapter")]
+    reader.capture.return_value = MagicMock()
+    reader.recognizer.recognize.return_value = ("Page 43 of 300", 0.95)
+
+    with patch.object(reading_progress_provider, "image_to_bytes", return_value=b"footer"):
+        assert reader.get_reading_progress() == {"current_page": 43, "total_pages": 300}
+        reader._get_reading_progress_with_ui.assert_not_called()
+
+        reader.recognizer.recognize.return_value = ("Page 43 of 300", 0.2)
+        assert reader.get_reading_progress(show_placemark=True) == {"current_page": 7, "total_pages": 90}
+
+    reader._get_reading_progress_with_ui.assert_called_once_with(show_placemark=True)
+    stats = all_source_stats()
+    assert stats["progress.hierarchy"] == {**stats["progress.hierarchy"], "calls": 2, "hits": 0}
+    assert stats["progress.recognizer"]["hits"] == 1
+    assert stats["progress.ui"]["hits"] == 1
+
+
+def test_title_comes_from_the_profile_or_book_session(reader):
+    automator = reader.driver.automator
+    automator.server_ref.get_current_book.return_value = "Moby Dick"
+    assert reader.get_book_title() == "Moby Dick"
+    automator.server_ref.get_current_book.assert_called_once_with(EMAIL)
+
+    automator.profile_manager.get_style_setting.return_value = "Emma"
+    assert reader.get_book_title() == "Emma"
+    assert automator.server_ref.get_current_book.call_count == 1
+    reader.driver.find_elements.assert_not_called()
+    reader._get_book_title_with_ui.assert_not_called()
+
+
+def test_title_falls_back_to_the_toolbar_then_the_menu(reader):
+    reader.driver.find_elements.return_value = [footer("Ulysses")]
+    assert reader.get_book_title() == "Ulysses"
+    reader._get_book_title_with_ui.assert_not_called()
+
+    reader.driver.find_elements.return_value = []
+    assert reader.get_book_title() is None
+    reader._get_book_title_with_ui.assert_called_once()
+    assert all_source_stats()["title.toolbar"]["hit_rate"] == 0.5
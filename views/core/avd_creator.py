@@ -261,12 +261,22 @@ class AVDCreator:
             avd_manager.set_user_field(email, "system_image", sys_img)
             logger.info(f"Updated profile for {email} with Android {android_version} ({sys_img})")
 
+            self._reset_download_state(email)
             return True, avd_name
 
         except Exception as e:
             logger.error(f"Error creating new AVD: {e}", exc_info=True)
             return False, str(e)
 
+    def _reset_download_state(self, email: str) -> None:
+        """Forget which books the user had downloaded, since a new AVD starts with none."""
+        try:
+            from server.utils.library_catalog import reset_download_state
+
+            reset_download_state(email)
+        except Exception as e:
+            logger.warning(f"Could not reset download state for {email}: {e}")
+
     def _configure_avd(self, avd_name: str, system_image: str, email: str) -> None:
         """Configure AVD settings for better performance."""
         config_path = os.path.join(self.avd_dir, f"{avd_name}.avd", "config.ini")
@@ -656,6 +666,7 @@ class AVDCreator:
             except Exception as e:
                 logger.warning(f"Could not mark AVD as created from seed clone: {e}")
 
+            self._reset_download_state(email)
             logger.info(f"Successfully created {new_avd_name} from seed clone using avdmanager")
             return True, new_avd_name
 
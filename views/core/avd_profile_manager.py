@@ -293,20 +293,6 @@ class AVDProfileManager:
             repo = UserRepository(session)
             return repo.update_last_used(email, emulator_id)
 
-    def update_style_preference(self, is_updated: bool, email: Optional[str] = None) -> Dict:
-        """Update style preference for a user."""
-        if not email:
-            email = get_sindarin_email()
-
-        if not email:
-            return {"error": "No email found"}
-
-        with self.db_connection.get_session() as session:
-            repo = UserRepository(session)
-            success = repo.update_user_field(email, "styles_updated", is_updated)
-
-            return {"success": success, "email": email, "styles_updated": is_updated}
-
     def save_style_setting(self, setting_name: str, setting_value, email: Optional[str] = None) -> Dict:
         """Save a library style setting for a user."""
         if not email:
@@ -674,18 +660,6 @@ class AVDProfileManager:
         else:
             return result
 
-    def is_styles_updated(self) -> bool:
-        """Check if styles have been updated for a profile."""
-        email = get_sindarin_email()
-        if not email:
-            logger.warning("No email available to check styles_updated")
-            return False
-
-        with self.db_connection.get_session() as session:
-            repo = UserRepository(session)
-            user = repo.get_user_by_email(email)
-            return user.styles_updated if user else False
-
     def get_style_setting(self, setting_name: str, email: str = None, default=None):
         """Get a style setting value from the profile."""
         if not email:
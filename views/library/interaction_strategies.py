@@ -85,6 +85,14 @@ DOWNLOADED_TAB_STRATEGIES = [
     (AppiumBy.XPATH, "//*[@resource-id='com.amazon.kindle:id/library_downloaded_tab']"),
 ]
 
+# Download action in the toolbar shown while a long-pressed book is selected
+# (see fixtures/views/library_selection.xml). Scoped to the action mode bar so it
+# can never match a "Download" label elsewhere on the library screen.
+SELECTION_DOWNLOAD_STRATEGIES = [
+    (AppiumBy.XPATH, "//*[@resource-id='com.amazon.kindle:id/action_mode_bar']//*[@content-desc='Download']"),
+    (AppiumBy.XPATH, "//*[@resource-id='com.amazon.kindle:id/action_mode_bar']//*[@text='Download']"),
+]
+
 # View options menu state detection
 VIEW_OPTIONS_MENU_STATE_STRATEGIES = [
     (AppiumBy.XPATH, "//*[@resource-id='com.amazon.kindle:id/view_and_sort_menu_dismiss']"),  # DONE button
@@ -57,6 +57,18 @@ class KindleStateMachine:
         """
         self._cancellation_check = check_func
 
+    def clear_cancellation_check(self, check_func):
+        """Clear the cancellation check, but only if it is still the given one.
+
+        Background jobs use this so they don't clobber a check that a client request
+        has set since.
+
+        Args:
+            check_func: The callable previously passed to set_cancellation_check
+        """
+        if self._cancellation_check is check_func:
+            self._cancellation_check = None
+
     def _get_current_state(self):
         """Get the current app state using the view inspector."""
         view = self.view_inspector.get_current_view()